@@ -0,0 +1,111 @@
+"""
+출력 메시지 형식 벤치마크
+
+json/1과 msgpack/1 형식별로 메시지 1건의 크기(XADD 필드 값 바이트 합)와
+인코딩/디코딩 시간을 측정합니다. 요약 길이는 실제 분석 결과와 비슷하게 맞춥니다.
+
+실행 예시:
+    python -m benchmarks.bench_codec --messages 20000
+    python -m benchmarks.bench_codec --messages 5000 --display-chars 600
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import List
+
+from src.infrastructure import message_codec
+from src.infrastructure.message_codec import (
+    FORMAT_JSON,
+    FORMAT_MSGPACK,
+    decode_analysis_message,
+    encode_analysis_message,
+)
+from src.models.analysis_message import AnalysisMessage
+
+
+def make_messages(args) -> List[AnalysisMessage]:
+    """측정용 메시지 생성 (영어 요약, 한국어 요약, 키워드 3개)"""
+    semantic = ("Trump announced new tariffs on steel and aluminum imports from allied countries. " * 10)
+    display = ("트럼프 대통령이 동맹국의 철강 및 알루미늄 수입품에 새 관세를 부과한다고 발표했습니다. " * 20)
+    return [
+        AnalysisMessage(
+            id=index + 1,
+            raw_data_id=index + 100_000,
+            semantic_summary=semantic[:args.semantic_chars],
+            display_summary=display[:args.display_chars],
+            keywords=["관세", "철강", "무역"],
+            prompt_version="1.0.1",
+            channel="truth_social",
+            original_link=f"https://truthsocial.com/@realDonaldTrump/posts/{113000000000000000 + index}",
+            published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        for index in range(args.messages)
+    ]
+
+
+def field_bytes(fields: dict) -> int:
+    """XADD 필드 이름 + 값 바이트 합"""
+    total = 0
+    for key, value in fields.items():
+        total += len(key.encode("utf-8"))
+        total += len(value) if isinstance(value, bytes) else len(value.encode("utf-8"))
+    return total
+
+
+def run_format(messages: List[AnalysisMessage], message_format: str) -> dict:
+    """형식 1개 측정"""
+    # 워밍업
+    for message in messages[:100]:
+        decode_analysis_message(encode_analysis_message(message, message_format))
+
+    started = time.perf_counter()
+    encoded = [encode_analysis_message(message, message_format) for message in messages]
+    encode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for fields in encoded:
+        decode_analysis_message(fields)
+    decode_elapsed = time.perf_counter() - started
+
+    return {
+        "format": message_format,
+        "bytes": sum(field_bytes(fields) for fields in encoded) / len(encoded),
+        "encode_us": encode_elapsed / len(messages) * 1_000_000,
+        "decode_us": decode_elapsed / len(messages) * 1_000_000,
+    }
+
+
+def print_report(results: List[dict]):
+    """결과 표 출력"""
+    header = f"{'format':<12} {'bytes/msg':>10} {'vs json':>8} {'encode us':>10} {'decode us':>10}"
+    print(header)
+    print("-" * len(header))
+    baseline = results[0]["bytes"]
+    for result in results:
+        print(
+            f"{result['format']:<12} {result['bytes']:>10.0f} {result['bytes'] / baseline:>8.2f}"
+            f" {result['encode_us']:>10.2f} {result['decode_us']:>10.2f}"
+        )
+    print("\nbytes/msg는 XADD 필드 이름과 값의 합이며, Redis의 항목별 오버헤드는 포함하지 않습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출력 메시지 형식 벤치마크")
+    parser.add_argument("--messages", type=int, default=20000, help="형식별 메시지 수")
+    parser.add_argument("--semantic-chars", type=int, default=400, help="semantic_summary 길이")
+    parser.add_argument("--display-chars", type=int, default=300, help="display_summary 길이")
+    args = parser.parse_args()
+
+    messages = make_messages(args)
+    results = [run_format(messages, FORMAT_JSON)]
+    if message_codec.msgpack is not None:
+        results.append(run_format(messages, FORMAT_MSGPACK))
+    else:
+        print("msgpack 패키지가 없어 msgpack/1 형식은 측정하지 않습니다.\n")
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
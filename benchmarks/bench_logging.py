@@ -0,0 +1,114 @@
+"""
+로깅 호출 비용 벤치마크
+
+출력 형식(console/json), 출력 방식(동기/큐), 레벨 필터링, 샘플링 조합별로
+로그 호출 1회가 호출 스레드에서 차지하는 시간을 측정합니다. 출력은 /dev/null로 보내며,
+--write-latency-us로 느린 stdout(로그 수집기 역압 등)을 흉내 낼 수 있습니다.
+
+실행 예시:
+    python -m benchmarks.bench_logging --calls 20000 --content-chars 1500
+    python -m benchmarks.bench_logging --calls 5000 --write-latency-us 200
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+from config.logger import LOG_CONFIG
+from src import logger as logger_module
+from src.logger import get_logger, setup_logging
+
+# (이름, 형식, 큐 출력 여부, 로그 레벨, 호출 메서드, 샘플링 비율)
+SCENARIOS = [
+    ("console / sync", "console", False, "INFO", "info", None),
+    ("console / queue", "console", True, "INFO", "info", None),
+    ("json / sync", "json", False, "INFO", "info", None),
+    ("json / queue", "json", True, "INFO", "info", None),
+    ("json / queue / 1% sampled", "json", True, "INFO", "info", 0.01),
+    ("debug filtered (INFO)", "json", True, "INFO", "debug", None),
+]
+
+EVENT = "메시지 처리 완료"
+
+
+class SlowSink:
+    """쓰기마다 지정한 시간만큼 블로킹되는 출력 대역"""
+
+    def __init__(self, target, write_latency: float):
+        self._target = target
+        self._write_latency = write_latency
+
+    def write(self, data: str) -> int:
+        if self._write_latency > 0:
+            time.sleep(self._write_latency)
+        return self._target.write(data)
+
+    def flush(self):
+        self._target.flush()
+
+
+def run_scenario(args, name: str, log_format: str, async_output: bool, level: str,
+                 method_name: str, sample_rate) -> dict:
+    """시나리오 1개 측정"""
+    LOG_CONFIG["sample_rates"] = {EVENT: sample_rate} if sample_rate is not None else {}
+
+    setup_logging(level=level, log_format=log_format, async_output=async_output)
+    log = getattr(get_logger(f"bench.{name}"), method_name)
+    content = "We will put tariffs on imported goods. " * (args.content_chars // 39 + 1)
+    content = content[:args.content_chars]
+
+    # 워밍업 (로거 캐시, 큐 스레드 기동)
+    for index in range(100):
+        log(EVENT, message_id=f"0-{index}", content=content, keywords=["관세", "무역"])
+
+    started = time.perf_counter()
+    for index in range(args.calls):
+        log(EVENT, message_id=f"1-{index}", content=content, keywords=["관세", "무역"])
+    elapsed = time.perf_counter() - started
+
+    # 큐에 남은 로그를 모두 기록할 때까지의 시간 (출력 스레드 처리량)
+    drain_started = time.perf_counter()
+    logger_module._stop_listener()
+    drain = time.perf_counter() - drain_started
+
+    return {
+        "name": name,
+        "per_call_us": elapsed / args.calls * 1_000_000,
+        "drain_ms": drain * 1000,
+    }
+
+
+def print_report(results: List[dict]):
+    """결과 표 출력"""
+    header = f"{'scenario':<28} {'us/call':>10} {'drain ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(f"{result['name']:<28} {result['per_call_us']:>10.2f} {result['drain_ms']:>10.1f}")
+    print("\nus/call은 호출 스레드가 로그 1건에 쓰는 시간, drain ms는 종료 시 큐를 비우는 데 걸린 시간입니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로깅 호출 비용 벤치마크")
+    parser.add_argument("--calls", type=int, default=20000, help="시나리오별 로그 호출 횟수")
+    parser.add_argument("--content-chars", type=int, default=1500, help="content 필드 길이 (축약 전)")
+    parser.add_argument("--write-latency-us", type=float, default=0.0, help="stdout 쓰기 1회당 지연 (마이크로초)")
+    args = parser.parse_args()
+
+    stdout = sys.stdout
+    results = []
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = SlowSink(devnull, args.write_latency_us / 1_000_000)
+        try:
+            for scenario in SCENARIOS:
+                results.append(run_scenario(args, *scenario))
+        finally:
+            sys.stdout = stdout
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Worker 처리량/지연 벤치마크
+
+로컬 대역(FakeRedis, FakeOraclePool, FakeGenaiClient)으로 Worker 전체 흐름을 실행하고
+동시 처리 수준별로 처리량, 종단 간 지연, 단계별 소요 시간, 최대 RSS를 측정합니다.
+
+실행 예시:
+    python -m benchmarks.bench_worker --messages 200 --concurrency 1 4 16 --llm-latency 0.5
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from benchmarks.fakes import FakeGenaiClient, FakeOraclePool, FakeRedis
+from config.redis import REDIS_CONFIG
+from config.worker import WORKER_CONFIG
+from src.infrastructure.database import Database
+from src.infrastructure.message_publisher import MessagePublisher
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import setup_logging
+from src.services.llm_service import LLMService
+from src.worker import Worker
+
+# 단계별 계측 대상: (단계 이름, 컴포넌트 속성, 메서드 이름)
+STAGES = [
+    ("receive", "subscriber", "receive"),
+    ("receive", "subscriber", "receive_batch"),
+    ("llm", "llm_service", "analyze"),
+    ("llm", "llm_service", "analyze_batch"),
+    ("db", "database", "save_analysis_data"),
+    ("db", "database", "save_analysis_data_batch"),
+    ("publish", "publisher", "publish"),
+    ("ack", "subscriber", "ack"),
+    ("ack", "subscriber", "ack_many"),
+]
+
+
+class StageTimer:
+    """컴포넌트 메서드를 감싸 단계별 소요 시간을 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    def wrap(self, stage: str, target, method_name: str):
+        method = getattr(target, method_name)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.durations[stage].append(elapsed)
+
+        setattr(target, method_name, timed)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """백분위수 (선형 보간)"""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def make_raw_message(index: int) -> dict:
+    """데이터 수집 레이어 형식의 원본 메시지"""
+    return {
+        "data": json.dumps({
+            "id": index,
+            "content": f"Benchmark post #{index}: We will put tariffs on imported goods. " * 3,
+            "link": f"https://example.com/posts/{index}",
+            "published_at": datetime.now(timezone.utc).isoformat(),
+            "channel": "truth_social",
+        })
+    }
+
+
+def run_level(args, concurrency: int) -> dict:
+    """동시 처리 수준 1개에 대한 벤치마크 실행"""
+    fake_redis = FakeRedis()
+    subscriber = MessageSubscriber(client=fake_redis)
+    publisher = MessagePublisher(client=fake_redis)
+    database = Database(pool=FakeOraclePool(commit_latency=args.db_latency))
+    llm_service = LLMService(client=FakeGenaiClient(latency=args.llm_latency, jitter=args.jitter))
+
+    worker = Worker(
+        message_subscriber=subscriber,
+        llm_service=llm_service,
+        database=database,
+        message_publisher=publisher,
+        max_in_flight=concurrency,
+        batch_size=args.batch_size,
+        batch_prompting=args.batch_prompting,
+    )
+
+    timer = StageTimer()
+    components = {"subscriber": subscriber, "llm_service": llm_service, "database": database, "publisher": publisher}
+    for stage, component, method_name in STAGES:
+        timer.wrap(stage, components[component], method_name)
+
+    # 메시지 투입 (rate=0이면 한꺼번에, 아니면 초당 rate건)
+    input_stream = REDIS_CONFIG["input_stream"]
+    message_ids = []
+
+    def produce():
+        for index in range(args.messages):
+            message_ids.append(fake_redis.xadd(input_stream, make_raw_message(index + 1)))
+            if args.rate > 0:
+                time.sleep(1 / args.rate)
+
+    producer = threading.Thread(target=produce)
+    worker_thread = threading.Thread(target=worker.run)
+
+    started = time.perf_counter()
+    producer.start()
+    worker_thread.start()
+
+    producer.join()
+    deadline = time.monotonic() + args.timeout
+    while len(fake_redis.acked_at) < args.messages and time.monotonic() < deadline:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    worker.shutdown()
+    worker_thread.join()
+
+    latencies = [
+        (fake_redis.acked_at[message_id] - fake_redis.added_at[message_id]) * 1000
+        for message_id in message_ids
+        if message_id in fake_redis.acked_at
+    ]
+
+    return {
+        "concurrency": concurrency,
+        "processed": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "stages": {stage: sum(values) * 1000 / max(1, len(latencies)) for stage, values in timer.durations.items()},
+        "llm_calls": llm_service._client.models.calls,
+        # Linux의 ru_maxrss 단위는 KB
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def print_report(results: List[dict]):
+    """결과 표 출력"""
+    stage_names = ["receive", "llm", "db", "publish", "ack"]
+    header = (
+        f"{'conc':>5} {'done':>6} {'msg/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        + " ".join(f"{name + ' ms':>11}" for name in stage_names)
+        + f" {'llm calls':>9} {'rss MB':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        stages = " ".join(f"{result['stages'].get(name, 0.0):>11.2f}" for name in stage_names)
+        print(
+            f"{result['concurrency']:>5} {result['processed']:>6} {result['throughput']:>8.2f} "
+            f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['p99']:>9.1f} "
+            f"{stages} {result['llm_calls']:>9} {result['peak_rss_mb']:>7.1f}"
+        )
+    print("\n단계별 시간은 메시지 1건당 평균 누적 시간(ms)입니다. 동시 처리 시 벽시계 시간보다 클 수 있습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker 처리량/지연 벤치마크 (로컬 대역 사용)")
+    parser.add_argument("--messages", type=int, default=200, help="투입 메시지 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="측정할 max_in_flight 목록")
+    parser.add_argument("--batch-size", type=int, default=1, help="XREADGROUP 1회당 수신 건수")
+    parser.add_argument("--batch-prompting", action="store_true", help="묶음 분석 사용")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="LLM 평균 응답 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="LLM 응답 시간 편차 (초, ±)")
+    parser.add_argument("--db-latency", type=float, default=0.005, help="DB 커밋 시간 (초)")
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 투입 건수 (0이면 한꺼번에 투입)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="수준별 최대 실행 시간 (초)")
+    args = parser.parse_args()
+
+    setup_logging("WARNING")
+
+    # 대역 환경에 맞춘 설정 (빠른 종료, Pending 회수 비활성화)
+    REDIS_CONFIG["block_timeout"] = 100
+    WORKER_CONFIG["reclaim_enabled"] = False
+
+    results = [run_level(args, concurrency) for concurrency in args.concurrency]
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""
+벤치마크용 로컬 대역
+
+Redis Streams, Oracle Connection Pool, Gemini Client를 메모리에서 흉내 냅니다.
+실제 서비스 없이 Worker 전체 흐름을 실행할 수 있도록 워커가 사용하는 API만 구현합니다.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import redis
+
+
+def _id_key(message_id: str):
+    """스트림 메시지 ID 정렬 키 ("ms-seq")"""
+    ms, _, sequence = message_id.partition("-")
+    return int(ms), int(sequence or 0)
+
+
+class FakeRedis:
+    """
+    메모리 Redis Streams 대역
+
+    XADD(MAXLEN/MINID)/XRANGE/XREADGROUP/XACK/XPENDING(요약, 범위)/XCLAIM/XINFO 및 캐시용 GET/SET을 지원합니다.
+    스레드 안전하며, XREADGROUP block은 새 메시지가 들어오면 즉시 깨어납니다.
+    값은 decode_responses=True와 같이 문자열로 다룹니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._streams: Dict[str, "OrderedDict[str, dict]"] = {}
+        self._groups: Dict[tuple, dict] = {}
+        self._values: Dict[str, str] = {}
+        self._sequence = 0
+
+        # 벤치마크 측정용 기록 (메시지 ID → 시각)
+        self.added_at: Dict[str, float] = {}
+        self.acked_at: Dict[str, float] = {}
+
+    # 연결
+
+    def ping(self):
+        return True
+
+    def close(self):
+        pass
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    # 스트림
+
+    def xadd(self, name: str, fields: dict, id: str = "*", maxlen=None, approximate=True, minid=None, **kwargs):
+        with self._condition:
+            self._sequence += 1
+            message_id = f"{int(time.time() * 1000)}-{self._sequence}"
+            stream = self._streams.setdefault(name, OrderedDict())
+            stream[message_id] = dict(fields)
+            self.added_at[message_id] = time.perf_counter()
+
+            if maxlen is not None:
+                while len(stream) > maxlen:
+                    stream.popitem(last=False)
+            if minid is not None:
+                while stream and _id_key(next(iter(stream))) < _id_key(minid):
+                    stream.popitem(last=False)
+
+            self._condition.notify_all()
+            return message_id
+
+    def xrange(self, name: str, min: str = "-", max: str = "+", count: Optional[int] = None):
+        with self._condition:
+            entries = list(self._streams.get(name, {}).items())
+            return [(message_id, dict(fields)) for message_id, fields in entries[:count]]
+
+    def xlen(self, name: str) -> int:
+        with self._condition:
+            return len(self._streams.get(name, {}))
+
+    def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False):
+        with self._condition:
+            if (name, groupname) in self._groups:
+                raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+            stream = self._streams.setdefault(name, OrderedDict())
+            self._groups[(name, groupname)] = {
+                "delivered": 0 if id == "0" else len(stream),
+                "pending": OrderedDict(),  # message_id → [consumer, delivered_at, count]
+                "consumers": set(),
+            }
+
+    def xreadgroup(self, groupname: str, consumername: str, streams: dict, count: int = 1, block: Optional[int] = None):
+        (name, _), = streams.items()
+        deadline = time.monotonic() + (block or 0) / 1000
+
+        with self._condition:
+            group = self._groups[(name, groupname)]
+            group["consumers"].add(consumername)
+            stream = self._streams[name]
+
+            while group["delivered"] >= len(stream):
+                remaining = deadline - time.monotonic()
+                if block is None or remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+
+            message_ids = list(stream.keys())[group["delivered"]:group["delivered"] + count]
+            group["delivered"] += len(message_ids)
+            now = time.monotonic()
+            for message_id in message_ids:
+                group["pending"][message_id] = [consumername, now, 1]
+
+            return [(name, [(message_id, dict(stream[message_id])) for message_id in message_ids])]
+
+    def xack(self, name: str, groupname: str, *ids):
+        with self._condition:
+            group = self._groups[(name, groupname)]
+            acked = 0
+            now = time.perf_counter()
+            for message_id in ids:
+                if group["pending"].pop(message_id, None) is not None:
+                    self.acked_at[message_id] = now
+                    acked += 1
+            self._condition.notify_all()
+            return acked
+
+    def xpending(self, name: str, groupname: str):
+        with self._condition:
+            pending = self._groups[(name, groupname)]["pending"]
+            message_ids = list(pending.keys())
+            return {
+                "pending": len(message_ids),
+                "min": message_ids[0] if message_ids else None,
+                "max": message_ids[-1] if message_ids else None,
+                "consumers": [],
+            }
+
+    def xpending_range(self, name: str, groupname: str, min: str, max: str, count: int,
+                       consumername: Optional[str] = None, idle: Optional[int] = None):
+        with self._condition:
+            group = self._groups[(name, groupname)]
+            now = time.monotonic()
+            entries = []
+            for message_id, (consumer, delivered_at, times_delivered) in group["pending"].items():
+                if len(entries) >= count:
+                    break
+                if min != "-" and _id_key(message_id) < _id_key(min):
+                    continue
+                if max != "+" and _id_key(message_id) > _id_key(max):
+                    continue
+                if consumername is not None and consumer != consumername:
+                    continue
+                if idle is not None and (now - delivered_at) * 1000 < idle:
+                    continue
+                entries.append({
+                    "message_id": message_id,
+                    "consumer": consumer,
+                    "time_since_delivered": int((now - delivered_at) * 1000),
+                    "times_delivered": times_delivered,
+                })
+            return entries
+
+    def xclaim(self, name: str, groupname: str, consumername: str, min_idle_time: int,
+               message_ids: List[str], justid: bool = False, **kwargs):
+        with self._condition:
+            group = self._groups[(name, groupname)]
+            stream = self._streams[name]
+            now = time.monotonic()
+            claimed = []
+            for message_id in message_ids:
+                entry = group["pending"].get(message_id)
+                if entry is not None and (now - entry[1]) * 1000 >= min_idle_time:
+                    entry[0], entry[1] = consumername, now
+                    if justid:
+                        claimed.append(message_id)
+                    else:
+                        entry[2] += 1
+                        claimed.append((message_id, dict(stream.get(message_id, {}))))
+            return claimed
+
+    def xinfo_groups(self, name: str) -> List[dict]:
+        with self._condition:
+            stream = self._streams.get(name, {})
+            return [
+                {
+                    "name": groupname,
+                    "consumers": len(group["consumers"]),
+                    "pending": len(group["pending"]),
+                    "lag": len(stream) - group["delivered"],
+                }
+                for (stream_name, groupname), group in self._groups.items()
+                if stream_name == name
+            ]
+
+    def xinfo_consumers(self, name: str, groupname: str) -> List[dict]:
+        with self._condition:
+            group = self._groups[(name, groupname)]
+            counts = {consumer: 0 for consumer in group["consumers"]}
+            for consumer, _, _ in group["pending"].values():
+                counts[consumer] = counts.get(consumer, 0) + 1
+            return [{"name": consumer, "pending": pending} for consumer, pending in counts.items()]
+
+    def xgroup_delconsumer(self, name: str, groupname: str, consumername: str):
+        with self._condition:
+            self._groups[(name, groupname)]["consumers"].discard(consumername)
+
+    # 문자열 (캐시용)
+
+    def get(self, key: str):
+        return self._values.get(key)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None, **kwargs):
+        self._values[key] = value
+        return True
+
+
+class FakePipeline:
+    """FakeRedis 파이프라인 (명령을 모아 두었다가 execute()에서 순서대로 실행)"""
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        results = [method(*args, **kwargs) for method, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeOraclePool:
+    """
+    Oracle Connection Pool 대역
+
+    INSERT ... RETURNING id INTO :id 형태의 execute/executemany와 커밋 지연을 흉내 냅니다.
+    """
+
+    def __init__(self, commit_latency: float = 0.005):
+        self.commit_latency = commit_latency
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.rows: List[dict] = []
+
+    def acquire(self):
+        return FakeOracleConnection(self)
+
+    def close(self):
+        pass
+
+    def allocate_ids(self, count: int) -> List[int]:
+        with self._lock:
+            ids = list(range(self._next_id + 1, self._next_id + count + 1))
+            self._next_id += count
+            return ids
+
+
+class FakeOracleConnection:
+    """Oracle Connection 대역"""
+
+    def __init__(self, pool: FakeOraclePool):
+        self._pool = pool
+        self._staged: List[dict] = []
+
+    def cursor(self):
+        return FakeOracleCursor(self)
+
+    def commit(self):
+        time.sleep(self._pool.commit_latency)
+        with self._pool._lock:
+            self._pool.rows.extend(self._staged)
+        self._staged = []
+
+    def rollback(self):
+        self._staged = []
+
+    def close(self):
+        pass
+
+
+class FakeOracleVar:
+    """cursor.var() 대역 (RETURNING 결과 보관)"""
+
+    def __init__(self):
+        self.values: List[list] = []
+
+    def getvalue(self, pos: int = 0):
+        return self.values[pos]
+
+
+class FakeOracleCursor:
+    """Oracle Cursor 대역"""
+
+    def __init__(self, connection: FakeOracleConnection):
+        self._connection = connection
+        self._input_vars: Dict[str, FakeOracleVar] = {}
+
+    def var(self, type_, arraysize: int = 1):
+        return FakeOracleVar()
+
+    def setinputsizes(self, **kwargs):
+        self._input_vars.update(kwargs)
+
+    def execute(self, statement: str, parameters: Optional[dict] = None):
+        self.executemany(statement, [parameters or {}])
+
+    def executemany(self, statement: str, parameters: List[dict]):
+        rows = [{k: v for k, v in params.items() if not isinstance(v, FakeOracleVar)} for params in parameters]
+        ids = self._connection._pool.allocate_ids(len(rows))
+        for row, record_id in zip(rows, ids):
+            row["id"] = record_id
+        self._connection._staged.extend(rows)
+
+        # RETURNING 변수에 행별 ID 바인딩
+        return_vars = list(self._input_vars.values())
+        for params in parameters:
+            return_vars += [v for v in params.values() if isinstance(v, FakeOracleVar)]
+        for return_var in return_vars:
+            return_var.values = [[record_id] for record_id in ids]
+
+    def close(self):
+        pass
+
+
+class FakeGenaiClient:
+    """
+    genai.Client 대역
+
+    models.generate_content 호출마다 latency ± jitter 만큼 지연한 뒤
+    스키마에 맞는 JSON을 돌려줍니다. 묶음 요청(JSON 배열 입력)도 처리합니다.
+    aio.models.generate_content는 같은 응답을 asyncio.sleep으로 지연하여 돌려줍니다.
+    """
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.2, seed: int = 0):
+        self.models = _FakeModels(latency, jitter, seed)
+        self.aio = SimpleNamespace(models=_FakeAsyncModels(self.models))
+
+
+class _FakeModels:
+    """genai.Client.models 대역"""
+
+    def __init__(self, latency: float, jitter: float, seed: int):
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def list(self):
+        return iter([SimpleNamespace(name="models/fake")])
+
+    def get(self, model: str):
+        return SimpleNamespace(name=f"models/{model}")
+
+    def generate_content(self, model: str, contents: str, config=None):
+        time.sleep(self._next_delay())
+        return self._response(contents)
+
+    def _next_delay(self) -> float:
+        """호출 수를 세고 이번 호출의 지연 시간 반환"""
+        with self._lock:
+            self.calls += 1
+            return max(0.0, self._latency + self._random.uniform(-self._jitter, self._jitter))
+
+    def _response(self, contents: str):
+        try:
+            items = json.loads(contents)
+        except ValueError:
+            items = None
+
+        if isinstance(items, list):
+            text = json.dumps([dict(self._result(item["content"]), index=item["index"]) for item in items])
+        else:
+            text = json.dumps(self._result(contents))
+
+        return SimpleNamespace(
+            text=text,
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=len(contents) // 4,
+                candidates_token_count=len(text) // 4,
+            ),
+        )
+
+    def _result(self, content: str) -> dict:
+        return {
+            "semantic_summary": content[:200],
+            "display_summary": "벤치마크 요약입니다.",
+            "keywords": ["벤치마크"],
+        }
+
+
+class _FakeAsyncModels:
+    """genai.Client.aio.models 대역 (호출 수와 응답은 동기 models와 공유)"""
+
+    def __init__(self, models: _FakeModels):
+        self._models = models
+
+    async def get(self, model: str):
+        return self._models.get(model)
+
+    async def generate_content(self, model: str, contents: str, config=None):
+        await asyncio.sleep(self._models._next_delay())
+        return self._models._response(contents)
@@ -13,4 +13,31 @@ DB_CONFIG = {
     "dsn": os.environ.get("DB_DSN", "YOUR_DSN"),
     "wallet_location": os.environ.get("DB_WALLET_LOCATION", "/path/to/wallet/directory"),
     "wallet_password": os.environ.get("DB_WALLET_PASSWORD", "YOUR_WALLET_PASSWORD"),
+    # Connection Pool 크기 (Worker 동시 처리 수에 맞춰 조정)
+    "pool_min": int(os.environ.get("DB_POOL_MIN", "1")),
+    "pool_max": int(os.environ.get("DB_POOL_MAX", "2")),
+    "pool_increment": int(os.environ.get("DB_POOL_INCREMENT", "1")),
+    # 대량 조회(iter_analysis_messages) 페이지 크기 (쿼리 1회 = 왕복 1회로 가져올 행 수)
+    "scan_batch_size": int(os.environ.get("DB_SCAN_BATCH_SIZE", "500")),
+}
+
+
+def _parse_keyword_aliases(value: str) -> dict:
+    """'표기=대표 표기;표기=대표 표기' 형식의 키워드 별칭 설정 파싱"""
+    aliases = {}
+    for entry in value.split(";"):
+        variant, _, canonical = entry.partition("=")
+        if variant.strip() and canonical.strip():
+            aliases[variant.strip()] = canonical.strip()
+    return aliases
+
+
+# 키워드 색인 설정 (keyword_dict/analysis_keyword 테이블, sql/ddl.sql 참고)
+KEYWORD_INDEX_CONFIG = {
+    # 분석 결과 저장 시 키워드 색인 기록 여부 (테이블 생성 후 활성화)
+    "enabled": os.environ.get("KEYWORD_INDEX_ENABLED", "false").lower() == "true",
+    # 프로세스 내 키워드 이름 → ID 캐시 최대 항목 수
+    "cache_size": int(os.environ.get("KEYWORD_CACHE_SIZE", "10000")),
+    # 같은 키워드로 묶을 표기 (예: "북대서양조약기구=NATO;나토=NATO")
+    "aliases": _parse_keyword_aliases(os.environ.get("KEYWORD_ALIASES", "")),
 }
@@ -10,4 +10,138 @@ import os
 LLM_CONFIG = {
     "api_key": os.environ.get("LLM_API_KEY"),
     "model_name": os.environ.get("LLM_MODEL_NAME"),
+    # 기동 시 API 연결 확인 방식
+    # (get: 사용할 모델 1건 조회, list: 전체 모델 목록 조회, lazy: 확인 생략 후 첫 호출에서 확인)
+    "verify_mode": os.environ.get("LLM_VERIFY_MODE", "get"),
+    # 응답이 스키마와 맞지 않고 로컬 복구도 실패했을 때 재요청 횟수
+    "max_reasks": int(os.environ.get("LLM_MAX_REASKS", "1")),
+}
+
+
+def _parse_channel_models(value: str) -> dict:
+    """'channel=model;channel=model' 형식의 채널별 모델 설정 파싱"""
+    channel_models = {}
+    for entry in value.split(";"):
+        channel, _, model_name = entry.partition("=")
+        if channel.strip() and model_name.strip():
+            channel_models[channel.strip()] = model_name.strip()
+    return channel_models
+
+
+# 모델 라우팅 설정 (미지정 모델은 LLM_MODEL_NAME 사용)
+MODEL_ROUTING_CONFIG = {
+    # 라우팅 사용 여부 (false면 LLM_MODEL_NAME만 사용)
+    "enabled": os.environ.get("LLM_ROUTING_ENABLED", "false").lower() == "true",
+    # 짧은 본문용 / 긴 본문용 모델
+    "short_model_name": os.environ.get("LLM_SHORT_MODEL_NAME"),
+    "long_model_name": os.environ.get("LLM_LONG_MODEL_NAME"),
+    # 채널별 모델 ('channel=model;...')
+    "channel_models": _parse_channel_models(os.environ.get("LLM_CHANNEL_MODELS", "")),
+    # 시간 초과/5xx 시 전환할 대체 모델 (쉼표 구분)
+    "fallback_model_names": [
+        name.strip() for name in os.environ.get("LLM_FALLBACK_MODEL_NAMES", "").split(",") if name.strip()
+    ],
+    # 짧은 본문 최대 길이 / 긴 본문 최소 길이 (글자 수)
+    "short_max_chars": int(os.environ.get("LLM_ROUTING_SHORT_MAX_CHARS", "280")),
+    "long_min_chars": int(os.environ.get("LLM_ROUTING_LONG_MIN_CHARS", "8000")),
+    # 요청 1회 시간 제한 (초, 초과 시 대체 모델로 전환)
+    "request_timeout": float(os.environ.get("LLM_REQUEST_TIMEOUT", "60")),
+    # 지연/오류 이동 평균 가중치
+    "ewma_alpha": float(os.environ.get("LLM_ROUTING_EWMA_ALPHA", "0.2")),
+    # 비정상 판단 기준: 오류율 / 평균 지연 (초)
+    "error_threshold": float(os.environ.get("LLM_ROUTING_ERROR_THRESHOLD", "0.5")),
+    "max_latency": float(os.environ.get("LLM_ROUTING_MAX_LATENCY", "30")),
+    # 비정상 모델 재시도 대기 시간 (초)
+    "cooldown": float(os.environ.get("LLM_ROUTING_COOLDOWN", "60")),
+}
+
+# 분석 결과 캐시 설정
+CACHE_CONFIG = {
+    # 캐시 사용 여부
+    "enabled": os.environ.get("LLM_CACHE_ENABLED", "true").lower() == "true",
+    # 프로세스 내 LRU 최대 항목 수
+    "local_max_size": int(os.environ.get("LLM_CACHE_LOCAL_MAX_SIZE", "1024")),
+    # 프로세스 내 LRU 만료 시간 (초)
+    "local_ttl": int(os.environ.get("LLM_CACHE_LOCAL_TTL", "3600")),
+    # Redis 공유 캐시 사용 여부
+    "shared_enabled": os.environ.get("LLM_CACHE_SHARED_ENABLED", "true").lower() == "true",
+    # Redis 공유 캐시 만료 시간 (초)
+    "shared_ttl": int(os.environ.get("LLM_CACHE_SHARED_TTL", str(7 * 24 * 3600))),
+}
+
+# 유사 본문(리포스트, 링크만 다른 게시물 등) 필터 설정
+NEAR_DUPLICATE_CONFIG = {
+    # 필터 사용 여부
+    "enabled": os.environ.get("LLM_NEAR_DUP_ENABLED", "false").lower() == "true",
+    # 같은 본문으로 볼 SimHash 해밍 거리 상한 (64비트 중)
+    "max_distance": int(os.environ.get("LLM_NEAR_DUP_MAX_DISTANCE", "3")),
+    # 지문 계산 단위 (연속 토큰 수, 클수록 어순/숫자 변화에 민감)
+    "shingle_size": int(os.environ.get("LLM_NEAR_DUP_SHINGLE_SIZE", "2")),
+    # 비교 대상 시간 창 (초)
+    "window_seconds": int(os.environ.get("LLM_NEAR_DUP_WINDOW", str(6 * 3600))),
+    # 프로세스 내 인덱스 최대 항목 수
+    "max_entries": int(os.environ.get("LLM_NEAR_DUP_MAX_ENTRIES", "10000")),
+    # Redis 공유 인덱스 사용 여부
+    "shared_enabled": os.environ.get("LLM_NEAR_DUP_SHARED_ENABLED", "false").lower() == "true",
+    # 필터를 적용할 최소 토큰 수 (짧은 본문은 제외)
+    "min_tokens": int(os.environ.get("LLM_NEAR_DUP_MIN_TOKENS", "5")),
+}
+
+# 요청 헤징 설정 (응답이 늦은 요청에 같은 요청을 하나 더 보냄)
+HEDGE_CONFIG = {
+    # 헤징 사용 여부
+    "enabled": os.environ.get("LLM_HEDGE_ENABLED", "false").lower() == "true",
+    # 헤지 요청을 보낼 기준 (최근 응답 시간의 백분위수)
+    "percentile": float(os.environ.get("LLM_HEDGE_PERCENTILE", "95")),
+    # 추가 호출 예산 (호출 수 대비 비율)
+    "budget_ratio": float(os.environ.get("LLM_HEDGE_BUDGET_RATIO", "0.05")),
+    # 예산 최대 적립량 (연속 헤지 횟수 상한)
+    "max_burst": float(os.environ.get("LLM_HEDGE_MAX_BURST", "5")),
+    # 백분위수 계산에 사용할 최근 응답 수 / 헤징 시작 전 최소 표본 수
+    "window": int(os.environ.get("LLM_HEDGE_WINDOW", "500")),
+    "min_samples": int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", "50")),
+    # 헤지 기준 시간 하한 (초)
+    "min_delay": float(os.environ.get("LLM_HEDGE_MIN_DELAY", "2")),
+    # 스레드 엔진에서 요청을 실행할 스레드 수 (0이면 WORKER_MAX_IN_FLIGHT × 2: 메시지마다 첫 요청 + 헤지 요청)
+    "max_workers": int(os.environ.get("LLM_HEDGE_MAX_WORKERS", "0")),
+}
+
+# 긴 본문(기사, 연설문 등) 분할 요약 설정
+LONG_CONTENT_CONFIG = {
+    # 단건 호출로 보낼 입력 토큰 상한 (추정치, 초과 시 구간별 요약 후 통합 분석)
+    "input_token_budget": int(os.environ.get("LLM_INPUT_TOKEN_BUDGET", "8000")),
+    # 구간 1개의 최대 토큰 수 (추정치)
+    "chunk_tokens": int(os.environ.get("LLM_CHUNK_TOKENS", "4000")),
+    # 구간 요약 동시 호출 수 (메시지 1건 기준)
+    "map_concurrency": int(os.environ.get("LLM_MAP_CONCURRENCY", "4")),
+    # 구간 요약 반복 횟수 상한 (요약 합계가 여전히 상한을 넘으면 다시 요약)
+    "max_reduce_rounds": int(os.environ.get("LLM_MAX_REDUCE_ROUNDS", "3")),
+}
+
+# 다건 묶음 분석 설정
+BATCH_CONFIG = {
+    # 요청 1회에 묶을 최대 항목 수
+    "max_items": int(os.environ.get("LLM_BATCH_MAX_ITEMS", "10")),
+    # 묶음 대상 항목의 최대 길이 (초과 시 단건 호출)
+    "max_item_chars": int(os.environ.get("LLM_BATCH_MAX_ITEM_CHARS", "1500")),
+    # 요청 1회의 최대 입력 토큰 추정치
+    "max_tokens": int(os.environ.get("LLM_BATCH_MAX_TOKENS", "8000")),
+}
+
+# 호출 속도 제한 설정 (프로세스 단위 - 여러 워커가 같은 키를 쓰면 나눠서 설정)
+RATE_LIMIT_CONFIG = {
+    # 속도 제한 사용 여부
+    "enabled": os.environ.get("LLM_RATE_LIMIT_ENABLED", "true").lower() == "true",
+    # 분당 요청 수 / 분당 토큰 수 한도
+    "requests_per_minute": int(os.environ.get("LLM_RPM_LIMIT", "1000")),
+    "tokens_per_minute": int(os.environ.get("LLM_TPM_LIMIT", "1000000")),
+    # 요청 1회의 예상 출력 토큰 수 (TPM 예약용)
+    "estimated_output_tokens": int(os.environ.get("LLM_ESTIMATED_OUTPUT_TOKENS", "512")),
+    # AIMD 동시 호출 한도
+    "initial_concurrency": int(os.environ.get("LLM_INITIAL_CONCURRENCY", "4")),
+    "min_concurrency": int(os.environ.get("LLM_MIN_CONCURRENCY", "1")),
+    "max_concurrency": int(os.environ.get("LLM_MAX_CONCURRENCY", "32")),
+    # 쿼터 초과(429) 시 재시도 횟수 및 기본 대기 시간 (초, 지수 증가)
+    "max_retries": int(os.environ.get("LLM_RATE_LIMIT_MAX_RETRIES", "5")),
+    "retry_base_delay": float(os.environ.get("LLM_RATE_LIMIT_RETRY_DELAY", "2")),
 }
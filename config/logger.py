@@ -0,0 +1,44 @@
+"""
+로깅 설정
+
+환경변수 기반으로 로그 레벨, 출력 형식, 비동기 출력, 샘플링/축약을 주입합니다.
+"""
+
+import os
+
+
+def _parse_sample_rates(value: str) -> dict:
+    """'이벤트=비율;이벤트=비율' 형식을 {이벤트: 비율}로 변환"""
+    rates = {}
+    for item in value.split(";"):
+        if "=" not in item:
+            continue
+        event, rate = item.rsplit("=", 1)
+        rates[event.strip()] = float(rate)
+    return rates
+
+
+# 로깅 설정
+LOG_CONFIG = {
+    # 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    "level": os.environ.get("LOG_LEVEL", "INFO"),
+    # 출력 형식 (console: 사람이 읽기 쉬운 한 줄, json: 한 줄 JSON)
+    "format": os.environ.get("LOG_FORMAT", "console"),
+    # 큐 + 별도 스레드로 출력할지 여부 (false면 호출 스레드에서 바로 stdout에 기록)
+    "async": os.environ.get("LOG_ASYNC", "true").lower() == "true",
+    # 비동기 출력 큐 최대 크기 (가득 차면 새 로그를 버리고 개수만 기록)
+    "queue_size": int(os.environ.get("LOG_QUEUE_SIZE", "10000")),
+    # 긴 필드 축약 대상과 최대 길이 (0이면 축약하지 않음)
+    "truncate_fields": [
+        field.strip()
+        for field in os.environ.get(
+            "LOG_TRUNCATE_FIELDS", "content,semantic_summary,display_summary,text"
+        ).split(",")
+        if field.strip()
+    ],
+    "max_field_chars": int(os.environ.get("LOG_MAX_FIELD_CHARS", "200")),
+    # 이벤트별 샘플링 비율 (예: "메시지 처리 시작=0.1;LLM 분석 시작=0.01")
+    "sample_rates": _parse_sample_rates(os.environ.get("LOG_SAMPLE_RATES", "")),
+    # DEBUG 로그 기본 샘플링 비율 (이벤트별 비율이 우선)
+    "debug_sample_rate": float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "1.0")),
+}
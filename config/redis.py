@@ -13,7 +13,17 @@ REDIS_CONFIG = {
     "db": int(os.environ.get("REDIS_DB", "0")),
     "input_stream": "trump-scan:data-collection:raw-data",
     "output_stream": "trump-scan:analysis:analysis-result",
+    # 최대 전달 횟수를 넘긴 입력 메시지를 옮겨 둘 스트림 (비어 있으면 로그만 남김)
+    "dead_letter_stream": os.environ.get("REDIS_DEAD_LETTER_STREAM", "trump-scan:analysis:dead-letter"),
+    # 출력 메시지 형식 (json, msgpack - msgpack은 소비자가 decode_responses=False로 읽어야 함)
+    "output_format": os.environ.get("REDIS_OUTPUT_FORMAT", "json"),
+    # 출력 스트림 근사 길이 상한 (XADD MAXLEN ~, 0이면 자르지 않음)
+    "output_maxlen": int(os.environ.get("REDIS_OUTPUT_MAXLEN", "0")),
+    # 출력 스트림 보관 시간 (초, XADD MINID ~, 0이면 자르지 않음, output_maxlen이 있으면 무시)
+    "output_retention_seconds": int(os.environ.get("REDIS_OUTPUT_RETENTION_SECONDS", "0")),
     "consumer_group": "analysis-workers",
     "consumer_name": os.environ.get("CONSUMER_NAME", "worker-1"),
     "block_timeout": 5000,
+    "cache_key_prefix": "trump-scan:analysis:llm-cache",
+    "near_duplicate_key_prefix": "trump-scan:analysis:near-dup",
 }
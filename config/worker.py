@@ -0,0 +1,120 @@
+"""
+워커 설정
+
+환경변수 기반으로 워커 동작 방식을 주입합니다.
+"""
+
+import os
+
+# Worker 설정
+WORKER_CONFIG = {
+    # 실행 엔진 (sync: 스레드 기반 Worker, async: asyncio 기반 AsyncWorker)
+    "engine": os.environ.get("WORKER_ENGINE", "sync"),
+    # 실행 모드 (single: 단일 워커, supervisor: 워커 프로세스 여러 개를 관리, relay: OutboxRelay만 실행,
+    #           batch: 적체 메시지를 모아 배치 작업으로 분석)
+    "mode": os.environ.get("WORKER_MODE", "single"),
+    # 동시에 처리할 수 있는 최대 메시지 수 (1이면 순차 처리)
+    "max_in_flight": int(os.environ.get("WORKER_MAX_IN_FLIGHT", "1")),
+    # XREADGROUP 1회당 최대 수신 건수 (1보다 크면 일괄 수신 및 일괄 ACK)
+    "batch_size": int(os.environ.get("WORKER_BATCH_SIZE", "1")),
+    # 일괄 수신한 메시지를 LLM 요청 1회로 묶어 분석할지 여부
+    "batch_prompting": os.environ.get("WORKER_BATCH_PROMPTING", "false").lower() == "true",
+    # 방치된 Pending 메시지 회수 (XPENDING + XCLAIM) 사용 여부
+    # (저장이 raw_data_id 기준으로 멱등하지 않아 저장 후 ACK 전에 종료된 메시지는 다시 저장될 수 있으므로 기본값 off)
+    "reclaim_enabled": os.environ.get("WORKER_RECLAIM_ENABLED", "false").lower() == "true",
+    # 회수 대상 최소 유휴 시간 (밀리초)
+    "reclaim_min_idle_ms": int(os.environ.get("WORKER_RECLAIM_MIN_IDLE_MS", "300000")),
+    # 회수 주기 (초) 및 주기당 최대 회수 건수
+    "reclaim_interval": float(os.environ.get("WORKER_RECLAIM_INTERVAL", "5")),
+    "reclaim_count": int(os.environ.get("WORKER_RECLAIM_COUNT", "10")),
+    # 최대 전달 횟수 (회수 시 넘긴 메시지는 처리하지 않고 ACK 후 dead-letter 스트림에 기록, 0이면 제한 없음)
+    "reclaim_max_deliveries": int(os.environ.get("WORKER_RECLAIM_MAX_DELIVERIES", "5")),
+    # 발행을 outbox 테이블에 기록하고 OutboxRelay에 맡길지 여부 (false면 워커가 직접 발행)
+    "outbox_enabled": os.environ.get("WORKER_OUTBOX_ENABLED", "false").lower() == "true",
+}
+
+# 하위 레이어(중복 제거) 적체 기반 백프레셔 설정
+BACKPRESSURE_CONFIG = {
+    # 출력 스트림 Consumer Group 적체를 보고 수신을 늦추거나 멈출지 여부
+    "enabled": os.environ.get("DOWNSTREAM_BACKPRESSURE_ENABLED", "false").lower() == "true",
+    # 기준 Consumer Group (비어 있으면 출력 스트림의 그룹 중 적체가 가장 큰 그룹)
+    "consumer_group": os.environ.get("DOWNSTREAM_CONSUMER_GROUP", ""),
+    # 적체(lag + pending) 상한: 이상이면 수신 중지, 하한 이하로 내려오면 정상 수신
+    "high_watermark": int(os.environ.get("DOWNSTREAM_HIGH_WATERMARK", "10000")),
+    "low_watermark": int(os.environ.get("DOWNSTREAM_LOW_WATERMARK", "2000")),
+    # XINFO GROUPS 조회 주기 (초)
+    "sample_interval": float(os.environ.get("DOWNSTREAM_SAMPLE_INTERVAL", "5")),
+    # 하한과 상한 사이일 때 수신 1회마다 기다릴 시간 (초)
+    "slow_delay": float(os.environ.get("DOWNSTREAM_SLOW_DELAY", "0.5")),
+}
+
+# OutboxRelay 설정 (WORKER_OUTBOX_ENABLED=true)
+OUTBOX_CONFIG = {
+    # 워커 프로세스 안에서 Relay 스레드를 함께 실행할지 여부 (false면 WORKER_MODE=relay 프로세스를 따로 실행)
+    "relay_embedded": os.environ.get("OUTBOX_RELAY_EMBEDDED", "true").lower() == "true",
+    # 1회 최대 발행 건수 (파이프라인 1회)
+    "batch_size": int(os.environ.get("OUTBOX_BATCH_SIZE", "100")),
+    # 미발행 행이 없을 때 조회 주기 (초)
+    "poll_interval": float(os.environ.get("OUTBOX_POLL_INTERVAL", "0.5")),
+    # 발행 완료 행 보관 시간 및 정리 주기 (초)
+    "retention_hours": float(os.environ.get("OUTBOX_RETENTION_HOURS", "72")),
+    "purge_interval": float(os.environ.get("OUTBOX_PURGE_INTERVAL", "3600")),
+}
+
+# 배치 작업 설정 (WORKER_MODE=batch)
+BATCH_JOB_CONFIG = {
+    # 요청/결과 JSONL과 체크포인트를 두는 디렉터리 (재시작 후에도 유지되어야 함)
+    "work_dir": os.environ.get("BATCH_JOB_DIR", "batch_jobs"),
+    # 작업 1개의 최대 메시지 수
+    "max_items": int(os.environ.get("BATCH_JOB_MAX_ITEMS", "10000")),
+    # 작업을 제출할 최소 메시지 수 (새 메시지가 끊기면 이보다 적어도 제출)
+    "min_items": int(os.environ.get("BATCH_JOB_MIN_ITEMS", "100")),
+    # 작업 상태 조회 주기 (초)
+    "poll_interval": float(os.environ.get("BATCH_JOB_POLL_INTERVAL", "30")),
+    # 결과 저장/발행/ACK 단위 (단일 커밋 + 파이프라인 1회)
+    "save_chunk_size": int(os.environ.get("BATCH_JOB_SAVE_CHUNK_SIZE", "500")),
+}
+
+# 재분석(backfill) 설정 (python -m src.backfill)
+BACKFILL_CONFIG = {
+    # 키셋 체크포인트 파일 (마지막으로 반영한 analysis_data.id)
+    "checkpoint_file": os.environ.get("BACKFILL_CHECKPOINT_FILE", "backfill_checkpoint.json"),
+    # 동시 분석 수 (스레드 풀 크기)
+    "concurrency": int(os.environ.get("BACKFILL_CONCURRENCY", "4")),
+    # 서버 측 커서 왕복 1회에 가져올 행 수 (arraysize/prefetchrows)
+    "fetch_size": int(os.environ.get("BACKFILL_FETCH_SIZE", "500")),
+    # 일괄 UPDATE 및 체크포인트 기록 단위
+    "write_batch_size": int(os.environ.get("BACKFILL_WRITE_BATCH_SIZE", "100")),
+    # 재분석 전용 분당 요청 수 / 토큰 수 한도 (실시간 워커의 쿼터를 남겨 둘 만큼만 사용)
+    "requests_per_minute": int(os.environ.get("BACKFILL_RPM_LIMIT", "60")),
+    "tokens_per_minute": int(os.environ.get("BACKFILL_TPM_LIMIT", "100000")),
+}
+
+# Supervisor 설정 (WORKER_MODE=supervisor)
+SUPERVISOR_CONFIG = {
+    # 워커 프로세스 수 범위
+    "min_workers": int(os.environ.get("SUPERVISOR_MIN_WORKERS", "1")),
+    "max_workers": int(os.environ.get("SUPERVISOR_MAX_WORKERS", "4")),
+    # 적체량 확인 주기 (초)
+    "check_interval": float(os.environ.get("SUPERVISOR_CHECK_INTERVAL", "10")),
+    # 워커 1개가 감당할 적체 메시지 수 (lag + pending 기준)
+    "messages_per_worker": int(os.environ.get("SUPERVISOR_MESSAGES_PER_WORKER", "20")),
+    # 축소 후 다음 축소까지 최소 대기 시간 (초)
+    "scale_in_cooldown": float(os.environ.get("SUPERVISOR_SCALE_IN_COOLDOWN", "60")),
+    # 이 시간(초) 안에 종료된 워커는 시작 실패로 보고 재시작을 지수적으로 늦춤
+    "min_uptime": float(os.environ.get("SUPERVISOR_MIN_UPTIME", "30")),
+    # 재시작 대기 시간 초기값 / 최대값 (초)
+    "restart_backoff": float(os.environ.get("SUPERVISOR_RESTART_BACKOFF", "1")),
+    "restart_backoff_max": float(os.environ.get("SUPERVISOR_RESTART_BACKOFF_MAX", "300")),
+    # 종료 시 워커별 대기 시간 (초, 지나면 SIGKILL)
+    "stop_timeout": float(os.environ.get("SUPERVISOR_STOP_TIMEOUT", "30")),
+}
+
+# 메트릭 엔드포인트 설정 (Prometheus 텍스트 형식, GET /metrics)
+METRICS_CONFIG = {
+    "enabled": os.environ.get("METRICS_ENABLED", "true").lower() == "true",
+    # 기본은 로컬에서만 접근 가능 (컨테이너 밖에서 수집하려면 0.0.0.0)
+    "host": os.environ.get("METRICS_HOST", "127.0.0.1"),
+    # Supervisor 모드에서는 워커마다 port + 슬롯 번호를 사용
+    "port": int(os.environ.get("METRICS_PORT", "9100")),
+}
@@ -2,34 +2,131 @@
 분석 레이어 진입점
 
 트럼프 스캔 서비스의 분석 워커를 실행합니다.
+
+google-genai, oracledb, redis처럼 무거운 라이브러리는 실행 모드에 필요한 시점에만 import합니다.
 """
 
+import asyncio
 import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 
-from src.infrastructure.database import Database
-from src.infrastructure.message_publisher import MessagePublisher
-from src.infrastructure.message_subscriber import MessageSubscriber
+from config.llm import CACHE_CONFIG, HEDGE_CONFIG, MODEL_ROUTING_CONFIG, NEAR_DUPLICATE_CONFIG, RATE_LIMIT_CONFIG
+from config.worker import METRICS_CONFIG, OUTBOX_CONFIG, WORKER_CONFIG
 from src.logger import setup_logging, get_logger
-from src.services.llm_service import LLMService
-from src.worker import Worker
+from src.metrics import MetricsServer
 
 # 로깅 초기화
 setup_logging()
 logger = get_logger("main")
 
 
-def main():
-    """애플리케이션 진입점"""
-    logger.info("분석 레이어 시작")
+def uses_embedded_relay() -> bool:
+    """워커 프로세스 안에서 OutboxRelay 스레드를 실행할지 여부"""
+    return WORKER_CONFIG["outbox_enabled"] and OUTBOX_CONFIG["relay_embedded"]
 
-    # 인프라 컴포넌트 생성
-    message_subscriber = MessageSubscriber()
-    database = Database()
-    message_publisher = MessagePublisher()
 
-    # 서비스 생성
-    llm_service = LLMService()
+def initialize_components(factories: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    컴포넌트 병렬 생성
+
+    Redis ping, Oracle Pool 생성, Gemini 연결 확인처럼 네트워크 왕복이 있는 생성자를
+    동시에 실행하여 기동 시간을 가장 느린 컴포넌트 하나 수준으로 줄입니다.
+    하나라도 실패하면 생성된 컴포넌트를 닫고 첫 예외를 다시 발생시킵니다.
+
+    Args:
+        factories: 컴포넌트 이름 → 생성 함수
+
+    Returns:
+        컴포넌트 이름 → 생성된 컴포넌트
+    """
+    durations: Dict[str, float] = {}
+
+    def build(name: str, factory: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        component = factory()
+        durations[name] = round(time.perf_counter() - started, 3)
+        return component
+
+    with ThreadPoolExecutor(max_workers=len(factories), thread_name_prefix="init") as executor:
+        futures = {name: executor.submit(build, name, factory) for name, factory in factories.items()}
+
+    components: Dict[str, Any] = {}
+    errors = []
+    for name, future in futures.items():
+        try:
+            components[name] = future.result()
+        except Exception as e:
+            logger.error("컴포넌트 초기화 실패", component=name, error=str(e), error_type=type(e).__name__)
+            errors.append(e)
+
+    if errors:
+        for component in components.values():
+            close = getattr(component, "close", None)
+            if close is not None:
+                close()
+        raise errors[0]
+
+    logger.info("컴포넌트 초기화 완료", durations=durations)
+    return components
+
+
+def create_llm_service():
+    """캐시/유사 본문 필터/속도 제한기/요청 헤징/모델 라우팅을 포함한 LLMService 생성"""
+    from src.services.analysis_cache import AnalysisCache
+    from src.services.llm_service import LLMService
+    from src.services.model_router import ModelRouter
+    from src.services.near_duplicate_filter import NearDuplicateFilter
+    from src.services.rate_limiter import RateLimiter
+    from src.services.request_hedger import RequestHedger
+
+    analysis_cache = AnalysisCache() if CACHE_CONFIG["enabled"] else None
+    near_duplicate_filter = NearDuplicateFilter() if NEAR_DUPLICATE_CONFIG["enabled"] else None
+    rate_limiter = RateLimiter() if RATE_LIMIT_CONFIG["enabled"] else None
+    request_hedger = RequestHedger() if HEDGE_CONFIG["enabled"] else None
+    model_router = ModelRouter() if MODEL_ROUTING_CONFIG["enabled"] else None
+    return LLMService(
+        cache=analysis_cache,
+        rate_limiter=rate_limiter,
+        near_duplicate_filter=near_duplicate_filter,
+        request_hedger=request_hedger,
+        model_router=model_router,
+    )
+
+
+def close_llm_service(llm_service):
+    """LLMService에 주입한 캐시/유사 본문 필터 연결, 헤징 스레드 풀 종료"""
+    if llm_service.cache is not None:
+        llm_service.cache.close()
+    if llm_service.near_duplicate_filter is not None:
+        llm_service.near_duplicate_filter.close()
+    if llm_service.request_hedger is not None:
+        llm_service.request_hedger.close()
+
+
+def run_sync(consumer_name: Optional[str] = None):
+    """스레드 기반 Worker 실행"""
+    started = time.perf_counter()
+
+    from src.infrastructure.database import Database
+    from src.infrastructure.message_publisher import MessagePublisher
+    from src.infrastructure.message_subscriber import MessageSubscriber
+    from src.outbox_relay import OutboxRelay
+    from src.worker import Worker
+
+    # 인프라/서비스 컴포넌트 병렬 생성
+    components = initialize_components({
+        "message_subscriber": lambda: MessageSubscriber(consumer_name=consumer_name),
+        "database": Database,
+        "message_publisher": MessagePublisher,
+        "llm_service": create_llm_service,
+    })
+    message_subscriber = components["message_subscriber"]
+    database = components["database"]
+    message_publisher = components["message_publisher"]
+    llm_service = components["llm_service"]
 
     # Worker 생성
     worker = Worker(
@@ -39,6 +136,9 @@ def main():
         message_publisher=message_publisher,
     )
 
+    # Outbox 발행 스레드 (Worker와 DB Pool, Redis 연결 공유)
+    outbox_relay = OutboxRelay(database, message_publisher) if uses_embedded_relay() else None
+
     def signal_handler(signum, frame):
         """시그널 핸들러: SIGINT/SIGTERM 처리"""
         sig_name = signal.Signals(signum).name
@@ -49,13 +149,265 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    logger.info("Worker 기동 완료", startup_seconds=round(time.perf_counter() - started, 3))
+
     # Worker 실행
+    if outbox_relay is not None:
+        outbox_relay.start()
     try:
         worker.run()
     finally:
+        if outbox_relay is not None:
+            outbox_relay.stop()
+        message_subscriber.close()
+        database.close()
+        message_publisher.close()
+        close_llm_service(llm_service)
+
+
+async def run_async(consumer_name: Optional[str] = None):
+    """asyncio 기반 AsyncWorker 실행"""
+    started = time.perf_counter()
+
+    from src.async_worker import AsyncWorker
+    from src.infrastructure.async_database import AsyncDatabase
+    from src.infrastructure.async_message_publisher import AsyncMessagePublisher
+    from src.infrastructure.async_message_subscriber import AsyncMessageSubscriber
+
+    # 인프라 컴포넌트 생성
+    message_subscriber = AsyncMessageSubscriber(consumer_name=consumer_name)
+    database = AsyncDatabase()
+    message_publisher = AsyncMessagePublisher()
+
+    # Redis 연결 확인과 LLMService 생성(Gemini 연결 확인)을 동시에 진행
+    llm_service, _, _ = await asyncio.gather(
+        asyncio.to_thread(create_llm_service),
+        message_subscriber.initialize(),
+        message_publisher.initialize(),
+    )
+
+    # Worker 생성
+    worker = AsyncWorker(
+        message_subscriber=message_subscriber,
+        llm_service=llm_service,
+        database=database,
+        message_publisher=message_publisher,
+    )
+
+    # Outbox 발행 스레드 (동기 DB Pool, Redis 연결을 따로 사용)
+    outbox_relay = None
+    if uses_embedded_relay():
+        from src.infrastructure.database import Database
+        from src.infrastructure.message_publisher import MessagePublisher
+        from src.outbox_relay import OutboxRelay
+
+        relay_components = await asyncio.to_thread(initialize_components, {
+            "database": Database,
+            "message_publisher": MessagePublisher,
+        })
+        relay_database = relay_components["database"]
+        relay_publisher = relay_components["message_publisher"]
+        outbox_relay = OutboxRelay(relay_database, relay_publisher)
+
+    def signal_handler(sig: signal.Signals):
+        """시그널 핸들러: SIGINT/SIGTERM 처리"""
+        logger.info("종료 시그널 수신", signal=sig.name)
+        worker.shutdown()
+
+    # 시그널 핸들러 등록 (이벤트 루프에서 처리)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler, sig)
+
+    logger.info("AsyncWorker 기동 완료", startup_seconds=round(time.perf_counter() - started, 3))
+
+    # Worker 실행
+    if outbox_relay is not None:
+        outbox_relay.start()
+    try:
+        await worker.run()
+    finally:
+        if outbox_relay is not None:
+            # 종료 직전 커밋된 outbox까지 발행하도록 이벤트 루프 밖에서 대기
+            await asyncio.to_thread(outbox_relay.stop)
+            relay_database.close()
+            relay_publisher.close()
+        await message_subscriber.close()
+        await database.close()
+        await message_publisher.close()
+        close_llm_service(llm_service)
+
+
+def start_metrics_server(slot: int = 0) -> Optional[MetricsServer]:
+    """
+    메트릭 엔드포인트 시작
+
+    포트를 사용할 수 없으면 경고만 남기고 메트릭 없이 계속 실행합니다.
+
+    Args:
+        slot: Supervisor 워커 슬롯 번호 (METRICS_PORT + slot 포트 사용)
+    """
+    if not METRICS_CONFIG["enabled"]:
+        return None
+
+    port = METRICS_CONFIG["port"] + slot
+    try:
+        metrics_server = MetricsServer(port=port, host=METRICS_CONFIG["host"])
+    except OSError as e:
+        logger.warning("메트릭 엔드포인트 시작 실패", port=port, error=str(e))
+        return None
+
+    metrics_server.start()
+    return metrics_server
+
+
+def run_worker(consumer_name: Optional[str] = None, slot: int = 0):
+    """설정된 엔진으로 워커 실행"""
+    # Supervisor에서 fork된 경우 물려받은 Supervisor용 시그널 핸들러 해제
+    # (run_sync/run_async가 워커용 핸들러를 등록하기 전까지 기본 동작으로 종료)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    engine = WORKER_CONFIG["engine"]
+    metrics_server = start_metrics_server(slot)
+
+    try:
+        if engine == "async":
+            asyncio.run(run_async(consumer_name))
+        elif engine == "sync":
+            run_sync(consumer_name)
+        else:
+            logger.error("알 수 없는 실행 엔진", engine=engine)
+            sys.exit(1)
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+
+
+def run_relay():
+    """OutboxRelay만 단독 프로세스로 실행"""
+    from src.infrastructure.database import Database
+    from src.infrastructure.message_publisher import MessagePublisher
+    from src.outbox_relay import OutboxRelay
+
+    components = initialize_components({
+        "database": Database,
+        "message_publisher": MessagePublisher,
+    })
+    database = components["database"]
+    message_publisher = components["message_publisher"]
+    outbox_relay = OutboxRelay(database, message_publisher)
+
+    def signal_handler(signum, frame):
+        """시그널 핸들러: SIGINT/SIGTERM 처리"""
+        sig_name = signal.Signals(signum).name
+        logger.info("종료 시그널 수신", signal=sig_name)
+        outbox_relay.shutdown()
+
+    # 시그널 핸들러 등록
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    metrics_server = start_metrics_server()
+    try:
+        outbox_relay.run()
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+        database.close()
+        message_publisher.close()
+
+
+def run_batch():
+    """적체 메시지를 배치 작업으로 분석하는 BatchJobRunner 실행"""
+    from src.batch_job import BatchJobRunner
+    from src.infrastructure.database import Database
+    from src.infrastructure.message_publisher import MessagePublisher
+    from src.infrastructure.message_subscriber import MessageSubscriber
+    from src.services.batch_adapter import GeminiBatchAdapter
+
+    components = initialize_components({
+        "message_subscriber": MessageSubscriber,
+        "database": Database,
+        "message_publisher": MessagePublisher,
+        "llm_service": create_llm_service,
+    })
+    message_subscriber = components["message_subscriber"]
+    database = components["database"]
+    message_publisher = components["message_publisher"]
+    llm_service = components["llm_service"]
+
+    batch_job_runner = BatchJobRunner(
+        message_subscriber=message_subscriber,
+        llm_service=llm_service,
+        database=database,
+        message_publisher=message_publisher,
+        adapter=GeminiBatchAdapter(),
+    )
+
+    def signal_handler(signum, frame):
+        """시그널 핸들러: SIGINT/SIGTERM 처리"""
+        sig_name = signal.Signals(signum).name
+        logger.info("종료 시그널 수신", signal=sig_name)
+        batch_job_runner.shutdown()
+
+    # 시그널 핸들러 등록
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    metrics_server = start_metrics_server()
+    try:
+        batch_job_runner.run()
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
         message_subscriber.close()
         database.close()
         message_publisher.close()
+        close_llm_service(llm_service)
+
+
+def run_supervisor():
+    """워커 프로세스 여러 개를 Supervisor로 실행"""
+    # Supervisor 프로세스는 Redis만 사용 (워커 의존성은 각 워커 프로세스에서 import)
+    from src.infrastructure.message_subscriber import MessageSubscriber
+    from src.supervisor import Supervisor
+
+    message_subscriber = MessageSubscriber()
+    supervisor = Supervisor(
+        message_subscriber=message_subscriber,
+        worker_target=run_worker,
+    )
+
+    def signal_handler(signum, frame):
+        """시그널 핸들러: SIGINT/SIGTERM 처리"""
+        sig_name = signal.Signals(signum).name
+        logger.info("종료 시그널 수신", signal=sig_name)
+        supervisor.shutdown()
+
+    # 시그널 핸들러 등록
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    try:
+        supervisor.run()
+    finally:
+        message_subscriber.close()
+
+
+def main():
+    """애플리케이션 진입점"""
+    mode = WORKER_CONFIG["mode"]
+    logger.info("분석 레이어 시작", mode=mode, engine=WORKER_CONFIG["engine"])
+
+    if mode == "supervisor":
+        run_supervisor()
+    elif mode == "relay":
+        run_relay()
+    elif mode == "batch":
+        run_batch()
+    else:
+        run_worker()
 
     logger.info("분석 레이어 종료 완료")
     sys.exit(0)
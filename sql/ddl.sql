@@ -11,6 +11,7 @@ CREATE TABLE analysis_data (
     display_summary VARCHAR2(2000) NOT NULL,    -- 사용자용 한국어 요약
     keywords VARCHAR2(500) NOT NULL,            -- 키워드 목록 (JSON 배열)
     prompt_version VARCHAR2(20) NOT NULL,       -- 프롬프트 버전
+    model_name VARCHAR2(100),                   -- 분석 모델 (NULL 허용)
 
     -- 메타 데이터
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
@@ -28,4 +29,80 @@ COMMENT ON COLUMN analysis_data.semantic_summary IS '중복 제거용 영어 요
 COMMENT ON COLUMN analysis_data.display_summary IS '사용자용 한국어 요약';
 COMMENT ON COLUMN analysis_data.keywords IS '핵심 키워드 목록 (JSON 배열)';
 COMMENT ON COLUMN analysis_data.prompt_version IS '분석에 사용된 프롬프트 버전';
+COMMENT ON COLUMN analysis_data.model_name IS '분석에 사용된 Gemini 모델 (기존 행은 NULL)';
 COMMENT ON COLUMN analysis_data.created_at IS '분석 결과 생성 시간';
+
+-- 기존 테이블 변경 (model_name 컬럼 추가 전 생성한 경우): sql/migrations/001_add_analysis_data_model_name.sql 적용
+
+-- 키워드 사전 테이블 (표기를 정규화한 키워드 1개당 1행)
+CREATE TABLE keyword_dict (
+    -- 기본 키
+    id NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+
+    -- 키워드
+    name VARCHAR2(200 CHAR) NOT NULL,   -- 정규화한 키워드 (NFKC, 한글 사이 공백 제거, 소문자, 별칭 적용)
+
+    -- 메타 데이터
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+-- 인덱스 생성 (이름 → ID 조회, 동시 추가 시 중복 방지)
+CREATE UNIQUE INDEX uq_keyword_dict_name ON keyword_dict(name);
+
+-- 테이블 코멘트
+COMMENT ON TABLE keyword_dict IS '정규화한 분석 결과 키워드 사전';
+COMMENT ON COLUMN keyword_dict.id IS '키워드 고유 ID (자동 생성)';
+COMMENT ON COLUMN keyword_dict.name IS '정규화한 키워드';
+COMMENT ON COLUMN keyword_dict.created_at IS '키워드 최초 등록 시간';
+
+-- 분석 결과 ↔ 키워드 연결 테이블 (키워드별 조회는 기본 키 범위 탐색)
+CREATE TABLE analysis_keyword (
+    keyword_id NUMBER NOT NULL,         -- 키워드 ID (keyword_dict.id 참조)
+    analysis_data_id NUMBER NOT NULL,   -- 분석 결과 ID (analysis_data.id 참조)
+
+    -- 메타 데이터 (기간별 집계용, analysis_data와 같은 트랜잭션에서 기록)
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
+
+    CONSTRAINT pk_analysis_keyword PRIMARY KEY (keyword_id, analysis_data_id)
+) ORGANIZATION INDEX;
+
+-- 인덱스 생성 (기간별 상위 키워드 집계, 재분석 시 연결 교체)
+CREATE INDEX idx_analysis_keyword_created_at ON analysis_keyword(created_at, keyword_id);
+CREATE INDEX idx_analysis_keyword_analysis_data_id ON analysis_keyword(analysis_data_id);
+
+-- 테이블 코멘트
+COMMENT ON TABLE analysis_keyword IS '분석 결과와 키워드 연결 (KEYWORD_INDEX_ENABLED=true일 때 기록)';
+COMMENT ON COLUMN analysis_keyword.keyword_id IS '키워드 ID (keyword_dict.id 참조)';
+COMMENT ON COLUMN analysis_keyword.analysis_data_id IS '분석 결과 ID (analysis_data.id 참조)';
+COMMENT ON COLUMN analysis_keyword.created_at IS '연결 생성 시간 (기간별 집계용)';
+
+-- 발행 대기 메시지 테이블 (Transactional Outbox)
+CREATE TABLE analysis_outbox (
+    -- 기본 키 (발행 순서)
+    id NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+
+    -- 참조 필드
+    analysis_data_id NUMBER NOT NULL,   -- 분석 결과 ID (analysis_data.id 참조)
+
+    -- 발행 메시지
+    payload CLOB NOT NULL,              -- AnalysisMessage JSON
+
+    -- 발행 상태
+    published_at TIMESTAMP WITH TIME ZONE,  -- 발행 완료 시간 (NULL이면 미발행)
+    stream_message_id VARCHAR2(64),         -- 발행된 Redis Stream 메시지 ID
+
+    -- 메타 데이터
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+-- 인덱스 생성 (미발행 행 조회 및 발행 완료 행 정리용)
+CREATE INDEX idx_analysis_outbox_published_at ON analysis_outbox(published_at, id);
+
+-- 테이블 코멘트
+COMMENT ON TABLE analysis_outbox IS '분석 결과 발행 대기 메시지 (analysis_data와 같은 트랜잭션으로 기록)';
+COMMENT ON COLUMN analysis_outbox.id IS '발행 대기 메시지 고유 ID (자동 생성, 발행 순서)';
+COMMENT ON COLUMN analysis_outbox.analysis_data_id IS '분석 결과 ID (analysis_data.id 참조)';
+COMMENT ON COLUMN analysis_outbox.payload IS '발행할 AnalysisMessage JSON';
+COMMENT ON COLUMN analysis_outbox.published_at IS 'Redis Streams 발행 완료 시간 (NULL이면 미발행)';
+COMMENT ON COLUMN analysis_outbox.stream_message_id IS '발행된 Redis Stream 메시지 ID';
+COMMENT ON COLUMN analysis_outbox.created_at IS '발행 대기 메시지 생성 시간';
@@ -0,0 +1,18 @@
+-- analysis_data.model_name 컬럼 추가
+-- model_name 컬럼 추가 전 ddl.sql로 생성한 DB에 적용 (이미 있으면 건너뜀, 여러 번 실행해도 안전)
+-- 이 버전의 워커는 INSERT/UPDATE에 model_name을 사용하므로 워커 배포 전에 적용해야 함
+DECLARE
+    column_exists NUMBER;
+BEGIN
+    SELECT COUNT(*)
+    INTO column_exists
+    FROM user_tab_columns
+    WHERE table_name = 'ANALYSIS_DATA'
+      AND column_name = 'MODEL_NAME';
+
+    IF column_exists = 0 THEN
+        EXECUTE IMMEDIATE 'ALTER TABLE analysis_data ADD (model_name VARCHAR2(100))';
+        EXECUTE IMMEDIATE q'[COMMENT ON COLUMN analysis_data.model_name IS '분석에 사용된 Gemini 모델 (기존 행은 NULL)']';
+    END IF;
+END;
+/
@@ -0,0 +1,243 @@
+"""
+비동기 분석 워커
+
+asyncio 이벤트 루프 하나에서 여러 메시지를 동시에 처리합니다.
+"""
+
+import asyncio
+import time
+from typing import List, Optional, Set
+
+from config.worker import BACKPRESSURE_CONFIG, WORKER_CONFIG
+from src.infrastructure.async_database import AsyncDatabase
+from src.infrastructure.async_message_publisher import AsyncMessagePublisher
+from src.infrastructure.message_publisher import DOWNSTREAM_PAUSED, DOWNSTREAM_SLOW
+from src.infrastructure.async_message_subscriber import AsyncMessageSubscriber
+from src.logger import get_logger
+from src.metrics import IN_FLIGHT, MESSAGES_FAILED, MESSAGES_PROCESSED, STAGE_DURATION
+from src.models.analysis_message import AnalysisMessage
+from src.models.raw_data import RawData
+from src.services.llm_service import LLMService
+
+logger = get_logger("async_worker")
+
+
+class AsyncWorker:
+    """
+    비동기 분석 워커
+
+    Worker와 같은 흐름(수신 → LLM 분석 → DB 저장 → 발행 → ACK)을 메시지마다
+    asyncio Task로 실행합니다. 모든 Task가 Redis/Oracle/Gemini 연결을 공유하며,
+    동시에 처리 중인 메시지가 max_in_flight에 도달하면 수신을 멈춥니다.
+    outbox가 켜져 있으면 발행 메시지를 분석 결과와 한 트랜잭션으로 저장하고 발행은 OutboxRelay에 맡깁니다.
+    """
+
+    def __init__(
+        self,
+        message_subscriber: AsyncMessageSubscriber,
+        llm_service: LLMService,
+        database: AsyncDatabase,
+        message_publisher: AsyncMessagePublisher,
+        max_in_flight: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self._message_subscriber = message_subscriber
+        self._llm_service = llm_service
+        self._database = database
+        self._message_publisher = message_publisher
+        self._shutdown = False
+
+        # 동시 처리 설정
+        if max_in_flight is None:
+            max_in_flight = WORKER_CONFIG["max_in_flight"]
+        self._max_in_flight = max(1, max_in_flight)
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight_ids: Set[str] = set()  # 처리 중인 메시지 ID (회수 대상에서 제외)
+
+        # 일괄 수신/ACK 설정
+        if batch_size is None:
+            batch_size = WORKER_CONFIG["batch_size"]
+        self._batch_size = max(1, batch_size)
+        self._pending_acks: List[str] = []
+
+        # Pending 메시지 회수 설정
+        self._reclaim_enabled = WORKER_CONFIG["reclaim_enabled"]
+        self._reclaim_min_idle_ms = WORKER_CONFIG["reclaim_min_idle_ms"]
+        self._reclaim_interval = WORKER_CONFIG["reclaim_interval"]
+        self._reclaim_count = WORKER_CONFIG["reclaim_count"]
+        self._reclaim_max_deliveries = WORKER_CONFIG["reclaim_max_deliveries"]
+        self._next_reclaim_at = 0.0
+
+        # Outbox 설정
+        self._outbox_enabled = WORKER_CONFIG["outbox_enabled"]
+
+        # 하위 레이어 백프레셔 설정
+        self._downstream_slow_delay = BACKPRESSURE_CONFIG["slow_delay"]
+
+        logger.info(
+            "AsyncWorker 초기화 완료",
+            max_in_flight=self._max_in_flight,
+            batch_size=self._batch_size,
+            outbox_enabled=self._outbox_enabled,
+        )
+
+    async def run(self):
+        """
+        메인 처리 루프
+
+        종료 요청이 올 때까지 메시지를 처리하고, 종료 시 처리 중인 메시지를 모두 마친 뒤 반환합니다.
+        """
+        logger.info(
+            "AsyncWorker 시작",
+            max_in_flight=self._max_in_flight,
+            batch_size=self._batch_size,
+        )
+
+        try:
+            while not self._shutdown:
+                await self._flush_acks()
+
+                # 백프레셔: 처리 슬롯이 빌 때까지 대기
+                if len(self._tasks) >= self._max_in_flight:
+                    await asyncio.wait(self._tasks, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                # 하위 레이어 백프레셔: 적체가 풀릴 때까지 수신 중지 (처리 중인 메시지는 계속 진행)
+                state = await self._message_publisher.downstream_state()
+                if state == DOWNSTREAM_PAUSED:
+                    await asyncio.sleep(1.0)
+                    continue
+                if state == DOWNSTREAM_SLOW:
+                    await asyncio.sleep(self._downstream_slow_delay)
+
+                free_slots = self._max_in_flight - len(self._tasks)
+
+                # 방치된 메시지 회수, 없으면 새 메시지 수신 - 빈 슬롯 수만큼만 수신
+                raw_data_list = await self._reclaim(min(self._reclaim_count, free_slots))
+                if not raw_data_list:
+                    with STAGE_DURATION.labels("receive").time():
+                        raw_data_list = await self._message_subscriber.receive_batch(
+                            min(self._batch_size, free_slots)
+                        )
+
+                for raw_data in raw_data_list:
+                    self._in_flight_ids.add(raw_data.message_id)
+                    task = asyncio.create_task(self._process(raw_data))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        finally:
+            logger.info("처리 중인 메시지 완료 대기", in_flight=len(self._tasks))
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            await self._flush_acks()
+
+        logger.info("AsyncWorker 종료")
+
+    async def _reclaim(self, count: int) -> List[RawData]:
+        """
+        방치된 Pending 메시지 회수
+
+        reclaim_interval마다 최대 count건을 XCLAIM으로 가져옵니다.
+        처리 중이거나 ACK 대기 중인 메시지는 제외하고, 최대 전달 횟수를 넘긴 메시지는 dead-letter 처리합니다.
+        """
+        if not self._reclaim_enabled:
+            return []
+
+        now = time.monotonic()
+        if now < self._next_reclaim_at:
+            return []
+        self._next_reclaim_at = now + self._reclaim_interval
+
+        try:
+            if (
+                self._message_subscriber.is_claim_scan_complete()
+                and await self._message_subscriber.pending_count() == 0
+            ):
+                return []
+            return await self._message_subscriber.claim_stale(
+                self._reclaim_min_idle_ms,
+                count,
+                max_deliveries=self._reclaim_max_deliveries,
+                exclude_ids=self._in_flight_ids | set(self._pending_acks),
+            )
+        except Exception as e:
+            # 회수 실패는 새 메시지 처리를 막지 않음
+            logger.warning("Pending 메시지 회수 실패", error=str(e), error_type=type(e).__name__)
+            return []
+
+    async def _process(self, raw_data: RawData):
+        """
+        메시지 1건 처리
+
+        발행까지 성공한 메시지만 ACK 대상에 추가하고, 실패한 메시지는 Pending 상태로 남깁니다.
+        """
+        logger.info("메시지 처리 시작", message_id=raw_data.message_id)
+        IN_FLIGHT.inc()
+
+        try:
+            # LLM 분석 (llm 단계 시간은 LLMService가 요청마다 기록)
+            analysis_result = await self._llm_service.analyze_async(raw_data.content, raw_data.channel)
+
+            if self._outbox_enabled:
+                # DB 저장 (발행 메시지 포함, 발행은 OutboxRelay가 처리)
+                with STAGE_DURATION.labels("db").time():
+                    await self._database.save_analysis_data_with_outbox(raw_data, analysis_result)
+            else:
+                # DB 저장
+                with STAGE_DURATION.labels("db").time():
+                    analysis_data = await self._database.save_analysis_data(raw_data.id, analysis_result)
+
+                # 메시지 모델 생성 (DB 모델 + 원본 메타정보)
+                analysis_message = AnalysisMessage.from_analysis_data(analysis_data, raw_data)
+
+                # 메시지 발행
+                with STAGE_DURATION.labels("publish").time():
+                    await self._message_publisher.publish(analysis_message)
+
+        except Exception as e:
+            logger.error(
+                "메시지 처리 실패 (ACK 보류)",
+                message_id=raw_data.message_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            MESSAGES_FAILED.inc()
+            return
+        finally:
+            IN_FLIGHT.dec()
+            self._in_flight_ids.discard(raw_data.message_id)
+
+        # 처리 완료 ACK (일괄 처리)
+        MESSAGES_PROCESSED.inc()
+        self._pending_acks.append(raw_data.message_id)
+        logger.info("메시지 처리 완료", message_id=raw_data.message_id)
+
+        if len(self._pending_acks) >= self._batch_size:
+            await self._flush_acks()
+
+    async def _flush_acks(self):
+        """
+        모아 둔 ACK 일괄 처리
+
+        실패하면 메시지를 모아 둔 목록 앞에 돌려 두고 로그만 남깁니다 (다음 호출에서 재시도, 워커는 계속 실행).
+        """
+        message_ids, self._pending_acks = self._pending_acks, []
+        if not message_ids:
+            return
+
+        try:
+            with STAGE_DURATION.labels("ack").time():
+                await self._message_subscriber.ack_many(message_ids)
+        except Exception as e:
+            self._pending_acks[:0] = message_ids
+            logger.error(
+                "메시지 ACK 실패 (다음에 재시도)",
+                count=len(message_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    def shutdown(self):
+        """종료 요청"""
+        logger.info("AsyncWorker 종료 요청")
+        self._shutdown = True
@@ -0,0 +1,220 @@
+"""
+재분석(backfill)
+
+ANALYSIS_PROMPT.VERSION이 바뀐 뒤 이전 버전으로 분석된 analysis_data를 현재 프롬프트로 다시 분석합니다.
+
+실행 예시:
+    python -m src.backfill
+    python -m src.backfill --concurrency 8 --rpm-limit 120 --limit 1000
+    python -m src.backfill --restart
+"""
+
+import argparse
+import json
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from config.worker import BACKFILL_CONFIG
+from src.infrastructure.database import Database
+from src.logger import get_logger, setup_logging
+from src.models.analysis_result import AnalysisResult
+from src.models.raw_data import RawData
+from src.services.llm_service import LLMService
+from src.services.prompts import ANALYSIS_PROMPT
+
+logger = get_logger("backfill")
+
+
+class Backfill:
+    """
+    재분석 실행기
+
+    - 조회: 프롬프트 버전이 다른 행을 analysis_data.id 순으로 서버 측 커서 1개에서 스트리밍
+    - 분석: write_batch_size건씩 concurrency개 스레드로 동시에 분석 (주입된 LLMService의 속도 제한 적용)
+    - 반영: 묶음마다 executemany UPDATE 1회 + 단일 커밋 후 마지막 id를 체크포인트에 기록
+    중단 후 다시 실행하면 체크포인트 다음 id부터 이어서 진행합니다. 분석에 실패한 행은 이전 버전으로
+    남으므로 --restart로 처음부터 다시 실행하면 다시 대상이 됩니다.
+    갱신한 행은 다시 발행하지 않습니다 (하위 레이어에는 새 메시지로 전달되지 않음).
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        llm_service: LLMService,
+        checkpoint_file: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        write_batch_size: Optional[int] = None,
+    ):
+        self._database = database
+        self._llm_service = llm_service
+        self._checkpoint_file = checkpoint_file or BACKFILL_CONFIG["checkpoint_file"]
+        self._concurrency = max(1, concurrency or BACKFILL_CONFIG["concurrency"])
+        self._fetch_size = max(1, fetch_size or BACKFILL_CONFIG["fetch_size"])
+        self._write_batch_size = max(1, write_batch_size or BACKFILL_CONFIG["write_batch_size"])
+        self._prompt_version = ANALYSIS_PROMPT.VERSION
+        self._shutdown = threading.Event()
+
+        logger.info(
+            "Backfill 초기화 완료",
+            prompt_version=self._prompt_version,
+            concurrency=self._concurrency,
+            fetch_size=self._fetch_size,
+            write_batch_size=self._write_batch_size,
+        )
+
+    def run(self, limit: Optional[int] = None, restart: bool = False) -> dict:
+        """
+        재분석 실행
+
+        Args:
+            limit: 이번 실행에서 처리할 최대 행 수 (None이면 전체)
+            restart: 체크포인트를 무시하고 처음부터 실행
+
+        Returns:
+            체크포인트 (last_id, processed, updated, failed)
+        """
+        checkpoint = None if restart else self._load_checkpoint()
+        if checkpoint is None:
+            checkpoint = {"prompt_version": self._prompt_version, "last_id": 0, "processed": 0, "updated": 0, "failed": 0}
+        logger.info("재분석 시작", last_id=checkpoint["last_id"], limit=limit)
+
+        started = time.monotonic()
+        handled = 0
+        batch: List[Tuple[int, RawData]] = []
+        rows = self._database.iter_reanalysis_targets(self._prompt_version, checkpoint["last_id"], self._fetch_size)
+        with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="backfill") as executor:
+            try:
+                for fetched in rows:
+                    for row in fetched:
+                        batch.append(row)
+                        if len(batch) >= self._write_batch_size:
+                            self._process(executor, batch, checkpoint)
+                            handled += len(batch)
+                            batch = []
+                            self._log_progress(checkpoint, handled, started)
+                        if self._shutdown.is_set() or (limit is not None and handled + len(batch) >= limit):
+                            break
+                    else:
+                        continue
+                    break
+
+                if batch:
+                    self._process(executor, batch, checkpoint)
+                    handled += len(batch)
+            finally:
+                # 커서/연결 반환
+                rows.close()
+
+        self._log_progress(checkpoint, handled, started)
+        logger.info("재분석 종료", **checkpoint)
+        return checkpoint
+
+    def _process(self, executor: ThreadPoolExecutor, batch: List[Tuple[int, RawData]], checkpoint: dict):
+        """묶음 1개 분석 → 일괄 UPDATE → 체크포인트 기록"""
+        results = list(executor.map(self._analyze, batch))
+        items = [
+            (analysis_data_id, result)
+            for (analysis_data_id, _), result in zip(batch, results)
+            if result is not None
+        ]
+        updated = self._database.update_analysis_data_batch(items)
+
+        checkpoint["last_id"] = batch[-1][0]
+        checkpoint["processed"] += len(batch)
+        checkpoint["updated"] += updated
+        checkpoint["failed"] += len(batch) - len(items)
+        self._save_checkpoint(checkpoint)
+
+    def _analyze(self, row: Tuple[int, RawData]) -> Optional[AnalysisResult]:
+        """행 1개 분석 (실패하면 None, 해당 행은 이전 버전으로 남김)"""
+        analysis_data_id, raw_data = row
+        try:
+            return self._llm_service.analyze(raw_data.content, raw_data.channel)
+        except Exception as e:
+            logger.warning(
+                "재분석 실패",
+                analysis_data_id=analysis_data_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+    def _log_progress(self, checkpoint: dict, handled: int, started: float):
+        elapsed = time.monotonic() - started
+        logger.info(
+            "재분석 진행",
+            last_id=checkpoint["last_id"],
+            processed=checkpoint["processed"],
+            failed=checkpoint["failed"],
+            rows_per_second=round(handled / elapsed, 2) if elapsed > 0 else 0.0,
+        )
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        """체크포인트 읽기 (프롬프트 버전이 다르면 None - 새 버전은 처음부터)"""
+        if not os.path.exists(self._checkpoint_file):
+            return None
+        with open(self._checkpoint_file, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("prompt_version") != self._prompt_version:
+            logger.info("프롬프트 버전이 바뀌어 체크포인트 무시", checkpoint_version=checkpoint.get("prompt_version"))
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: dict):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않게 함)"""
+        temp_path = f"{self._checkpoint_file}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._checkpoint_file)
+
+    def shutdown(self):
+        """종료 요청 (진행 중인 묶음을 반영한 뒤 멈춤)"""
+        logger.info("Backfill 종료 요청")
+        self._shutdown.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이전 프롬프트 버전 분석 결과 재분석")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 행 수")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 분석 수")
+    parser.add_argument("--rpm-limit", type=int, default=None, help="분당 요청 수 한도")
+    parser.add_argument("--tpm-limit", type=int, default=None, help="분당 토큰 수 한도")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    args = parser.parse_args()
+
+    setup_logging()
+
+    from src.services.rate_limiter import RateLimiter
+
+    # 실시간 워커와 별도의 낮은 한도 (워커 프로세스의 한도와 합쳐 쿼터 안에 들도록 설정)
+    rate_limiter = RateLimiter(
+        requests_per_minute=args.rpm_limit or BACKFILL_CONFIG["requests_per_minute"],
+        tokens_per_minute=args.tpm_limit or BACKFILL_CONFIG["tokens_per_minute"],
+    )
+    database = Database()
+    llm_service = LLMService(rate_limiter=rate_limiter)
+    backfill = Backfill(database, llm_service, concurrency=args.concurrency)
+
+    def signal_handler(signum, frame):
+        """시그널 핸들러: SIGINT/SIGTERM 처리"""
+        logger.info("종료 시그널 수신", signal=signal.Signals(signum).name)
+        backfill.shutdown()
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    try:
+        backfill.run(limit=args.limit, restart=args.restart)
+    finally:
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
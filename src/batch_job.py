@@ -0,0 +1,347 @@
+"""
+배치 작업 모드
+
+적체된 메시지를 모아 JSONL 요청 파일로 만들고 배치 예측 작업으로 분석합니다.
+응답은 늦지만 요청당 비용이 낮아 대량 적체나 재분석에 사용합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from config.worker import BATCH_JOB_CONFIG, WORKER_CONFIG
+from src.infrastructure.database import Database
+from src.infrastructure.message_publisher import MessagePublisher
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import get_logger
+from src.metrics import BATCH_JOB_ITEMS, MESSAGES_FAILED, MESSAGES_PROCESSED
+from src.models.analysis_message import AnalysisMessage
+from src.models.analysis_result import AnalysisResult
+from src.models.raw_data import RawData
+from src.services.batch_adapter import JOB_RUNNING, JOB_SUCCEEDED, BatchAdapter
+from src.services.llm_service import LLMService
+
+logger = get_logger("batch_job")
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+# 작업 단계 (체크포인트에 기록)
+STAGE_COLLECTED = "collected"
+STAGE_SUBMITTED = "submitted"
+STAGE_DOWNLOADED = "downloaded"
+
+
+class BatchJobRunner:
+    """
+    배치 작업 실행기
+
+    수집 → 제출 → 완료 대기 → 저장/발행/ACK 순으로 작업을 1개씩 처리하고,
+    단계마다 체크포인트를 남겨 재시작하면 이어서 진행합니다.
+    - 제출 후 재시작하면 다시 제출하지 않고 같은 작업의 상태를 조회합니다.
+    - 저장은 save_chunk_size건씩 단일 커밋 + 일괄 발행 + 일괄 ACK로 처리하고 진행 위치를 기록합니다.
+      기록 직전에 종료되면 해당 묶음은 다시 저장/발행될 수 있습니다 (at-least-once).
+    - 작업이 끝날 때까지 메시지는 Pending 상태이므로, 상태 조회 때마다 유휴 시간을 초기화하여
+      다른 워커의 회수(XCLAIM) 대상이 되지 않게 합니다.
+    - 배치 응답이 없거나 스키마와 맞지 않는 항목, 긴 본문, 실패한 작업의 항목은 단건 분석으로 처리합니다.
+    - 새 메시지가 끊겼을 때 모은 메시지가 min_items보다 적으면 작업을 만들지 않고 바로 단건 분석합니다.
+    """
+
+    def __init__(
+        self,
+        message_subscriber: MessageSubscriber,
+        llm_service: LLMService,
+        database: Database,
+        message_publisher: MessagePublisher,
+        adapter: BatchAdapter,
+        work_dir: Optional[str] = None,
+        max_items: Optional[int] = None,
+        min_items: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self._message_subscriber = message_subscriber
+        self._llm_service = llm_service
+        self._database = database
+        self._message_publisher = message_publisher
+        self._adapter = adapter
+
+        self._work_dir = work_dir or BATCH_JOB_CONFIG["work_dir"]
+        self._max_items = max(1, max_items or BATCH_JOB_CONFIG["max_items"])
+        self._min_items = min_items if min_items is not None else BATCH_JOB_CONFIG["min_items"]
+        self._poll_interval = poll_interval if poll_interval is not None else BATCH_JOB_CONFIG["poll_interval"]
+        self._chunk_size = max(1, BATCH_JOB_CONFIG["save_chunk_size"])
+        self._outbox_enabled = WORKER_CONFIG["outbox_enabled"]
+
+        self._shutdown = False
+        self._wakeup = threading.Event()
+        os.makedirs(self._work_dir, exist_ok=True)
+
+        logger.info(
+            "BatchJobRunner 초기화 완료",
+            work_dir=self._work_dir,
+            max_items=self._max_items,
+            min_items=self._min_items,
+            poll_interval=self._poll_interval,
+        )
+
+    def run(self):
+        """
+        처리 루프
+
+        체크포인트가 있으면 해당 작업부터 마치고, 종료 요청이 올 때까지 새 작업을 처리합니다.
+        작업 완료를 기다리는 중에 종료하면 체크포인트를 남겨 두고 반환합니다.
+        """
+        logger.info("BatchJobRunner 시작")
+
+        checkpoint = self._load_checkpoint()
+        if checkpoint is not None:
+            logger.info("체크포인트에서 배치 작업 재개", job_id=checkpoint["job_id"], stage=checkpoint["stage"])
+            self._run_job(checkpoint)
+
+        while not self._shutdown:
+            raw_data_list = self._collect()
+            if not raw_data_list:
+                continue
+
+            if len(raw_data_list) < self._min_items:
+                logger.info("수집 메시지가 적어 단건 분석으로 처리", count=len(raw_data_list))
+                self._complete_chunk(raw_data_list, None)
+                continue
+
+            self._run_job(self._create_job(raw_data_list))
+
+        logger.info("BatchJobRunner 종료")
+
+    def _collect(self) -> List[RawData]:
+        """
+        작업 대상 메시지 수집
+
+        max_items건이 모이거나 새 메시지 수신이 타임아웃될 때까지 일괄 수신합니다.
+        """
+        collected: List[RawData] = []
+        while not self._shutdown and len(collected) < self._max_items:
+            received = self._message_subscriber.receive_batch(min(self._chunk_size, self._max_items - len(collected)))
+            if not received:
+                break
+            collected.extend(received)
+        return collected
+
+    def _create_job(self, raw_data_list: List[RawData]) -> dict:
+        """원본 데이터/요청 JSONL 작성 및 체크포인트 생성"""
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+        requests = 0
+        with open(self._path(job_id, "items"), "w", encoding="utf-8") as items_file, \
+                open(self._path(job_id, "requests"), "w", encoding="utf-8") as request_file:
+            for raw_data in raw_data_list:
+                items_file.write(raw_data.model_dump_json() + "\n")
+
+                # 구간 요약이 필요한 긴 본문은 요청에서 제외 (완료 후 단건 분석)
+                request = self._llm_service.build_batch_request(raw_data.content)
+                if request is None:
+                    continue
+                entry = {"key": raw_data.message_id, "request": request}
+                request_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                requests += 1
+
+        checkpoint = {
+            "job_id": job_id,
+            "stage": STAGE_COLLECTED,
+            "job_name": None,
+            "items": len(raw_data_list),
+            "requests": requests,
+            "completed": 0,
+        }
+        self._save_checkpoint(checkpoint)
+        logger.info("배치 작업 생성", job_id=job_id, items=len(raw_data_list), requests=requests)
+        return checkpoint
+
+    def _run_job(self, checkpoint: dict):
+        """체크포인트 단계부터 작업 진행"""
+        job_id = checkpoint["job_id"]
+
+        if checkpoint["stage"] == STAGE_COLLECTED:
+            if checkpoint["requests"] > 0:
+                checkpoint["job_name"] = self._adapter.submit(self._path(job_id, "requests"), job_id)
+            checkpoint["stage"] = STAGE_SUBMITTED
+            self._save_checkpoint(checkpoint)
+
+        if checkpoint["stage"] == STAGE_SUBMITTED:
+            if checkpoint["job_name"] is not None:
+                status = self._wait(checkpoint)
+                if status is None:
+                    # 종료 요청: 재시작 후 같은 작업의 상태 조회부터 재개
+                    return
+                if status == JOB_SUCCEEDED:
+                    self._adapter.download(checkpoint["job_name"], self._path(job_id, "results"))
+                else:
+                    logger.error("배치 작업 실패, 전체 단건 분석으로 대체", job_id=job_id, job_name=checkpoint["job_name"])
+            checkpoint["stage"] = STAGE_DOWNLOADED
+            self._save_checkpoint(checkpoint)
+
+        self._complete(checkpoint)
+        if self._shutdown and checkpoint["completed"] < checkpoint["items"]:
+            return
+
+        self._remove_job(job_id)
+        logger.info("배치 작업 완료", job_id=job_id, items=checkpoint["items"])
+
+    def _wait(self, checkpoint: dict) -> Optional[str]:
+        """
+        작업 완료 대기
+
+        Returns:
+            JOB_SUCCEEDED 또는 JOB_FAILED, 종료 요청으로 대기를 멈추면 None
+        """
+        message_ids = [raw_data.message_id for raw_data in self._load_items(checkpoint["job_id"])]
+        started = time.monotonic()
+        while not self._shutdown:
+            status = self._adapter.status(checkpoint["job_name"])
+            if status != JOB_RUNNING:
+                logger.info(
+                    "배치 작업 종료 확인",
+                    job_id=checkpoint["job_id"],
+                    status=status,
+                    waited=round(time.monotonic() - started, 1),
+                )
+                return status
+
+            self._message_subscriber.touch(message_ids)
+            self._wakeup.wait(self._poll_interval)
+        return None
+
+    def _complete(self, checkpoint: dict):
+        """결과를 save_chunk_size건씩 저장/발행/ACK (완료 위치를 체크포인트에 기록)"""
+        raw_data_list = self._load_items(checkpoint["job_id"])
+        responses = self._load_results(checkpoint["job_id"])
+
+        for start in range(checkpoint["completed"], len(raw_data_list), self._chunk_size):
+            if self._shutdown:
+                return
+            chunk = raw_data_list[start:start + self._chunk_size]
+            self._complete_chunk(chunk, responses)
+            checkpoint["completed"] = start + len(chunk)
+            self._save_checkpoint(checkpoint)
+
+    def _complete_chunk(self, raw_data_list: List[RawData], responses: Optional[Dict[str, dict]]):
+        """
+        메시지 묶음 저장/발행/ACK
+
+        Args:
+            responses: 메시지 ID → 결과 JSONL 항목 (None이면 배치 작업 없이 단건 분석)
+        """
+        analyzed: List[Tuple[RawData, AnalysisResult]] = []
+        for raw_data in raw_data_list:
+            entry = responses.get(raw_data.message_id) if responses is not None else None
+            analysis_result = self._result_for(raw_data, entry, direct=responses is None)
+            if analysis_result is not None:
+                analyzed.append((raw_data, analysis_result))
+
+        if not analyzed:
+            return
+
+        if self._outbox_enabled:
+            analysis_data_list = self._database.save_analysis_data_with_outbox(analyzed)
+        else:
+            analysis_data_list = self._database.save_analysis_data_batch(
+                [(raw_data.id, analysis_result) for raw_data, analysis_result in analyzed]
+            )
+            self._message_publisher.publish_many([
+                AnalysisMessage.from_analysis_data(analysis_data, raw_data)
+                for (raw_data, _), analysis_data in zip(analyzed, analysis_data_list)
+            ])
+
+        self._message_subscriber.ack_many([raw_data.message_id for raw_data, _ in analyzed])
+        MESSAGES_PROCESSED.inc(len(analyzed))
+
+    def _result_for(self, raw_data: RawData, entry: Optional[dict], direct: bool) -> Optional[AnalysisResult]:
+        """
+        메시지 1건의 분석 결과
+
+        배치 응답을 검증하고, 응답이 없거나 맞지 않으면 단건 분석으로 대체합니다.
+
+        Returns:
+            분석 결과, 단건 분석도 실패하면 None (ACK 보류)
+        """
+        if entry is not None and "response" in entry:
+            try:
+                analysis_result = self._llm_service.parse_batch_response(entry["response"])
+                BATCH_JOB_ITEMS.labels("batched").inc()
+                return analysis_result
+            except ValidationError as e:
+                logger.warning("배치 응답 검증 실패, 단건 분석으로 대체", message_id=raw_data.message_id, error=str(e))
+        elif entry is not None:
+            logger.warning("배치 요청 실패, 단건 분석으로 대체", message_id=raw_data.message_id, error=entry.get("error"))
+
+        try:
+            analysis_result = self._llm_service.analyze(raw_data.content, raw_data.channel)
+            BATCH_JOB_ITEMS.labels("direct" if direct else "fallback").inc()
+            return analysis_result
+        except Exception as e:
+            logger.error(
+                "메시지 분석 실패 (ACK 보류)",
+                message_id=raw_data.message_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            BATCH_JOB_ITEMS.labels("failed").inc()
+            MESSAGES_FAILED.inc()
+            return None
+
+    def _path(self, job_id: str, kind: str) -> str:
+        """작업 파일 경로 (items, requests, results)"""
+        return os.path.join(self._work_dir, f"{job_id}.{kind}.jsonl")
+
+    def _load_items(self, job_id: str) -> List[RawData]:
+        with open(self._path(job_id, "items"), encoding="utf-8") as f:
+            return [RawData.model_validate_json(line) for line in f if line.strip()]
+
+    def _load_results(self, job_id: str) -> Dict[str, dict]:
+        """결과 JSONL 읽기 (결과 파일이 없으면 빈 딕셔너리)"""
+        path = self._path(job_id, "results")
+        if not os.path.exists(path):
+            return {}
+
+        results = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                results[entry.get("key")] = entry
+        return results
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        path = os.path.join(self._work_dir, CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, checkpoint: dict):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않게 함)"""
+        path = os.path.join(self._work_dir, CHECKPOINT_FILE)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _remove_job(self, job_id: str):
+        """완료된 작업의 파일과 체크포인트 삭제"""
+        os.remove(os.path.join(self._work_dir, CHECKPOINT_FILE))
+        for kind in ("items", "requests", "results"):
+            path = self._path(job_id, kind)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def shutdown(self):
+        """종료 요청"""
+        logger.info("BatchJobRunner 종료 요청")
+        self._shutdown = True
+        self._wakeup.set()
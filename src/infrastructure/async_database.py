@@ -0,0 +1,223 @@
+"""
+비동기 데이터베이스 서비스
+
+python-oracledb의 asyncio 지원(Thin 모드)으로 분석 결과를 저장합니다.
+"""
+
+import json
+from typing import List, Tuple
+
+import oracledb
+
+from config.database import DB_CONFIG, KEYWORD_INDEX_CONFIG
+from src.infrastructure.database import INSERT_ANALYSIS_DATA_SQL, INSERT_OUTBOX_SQL, to_insert_params
+from src.infrastructure.keyword_index import KeywordIndex
+from src.logger import get_logger
+from src.models.analysis_data import AnalysisData
+from src.models.analysis_message import AnalysisMessage
+from src.models.analysis_result import AnalysisResult
+from src.models.raw_data import RawData
+
+logger = get_logger("async_database")
+
+
+class AsyncDatabase:
+    """
+    Oracle 비동기 데이터베이스 서비스
+
+    AsyncConnectionPool을 사용하며, 이벤트 루프 하나의 모든 작업이 Pool을 공유합니다.
+    """
+
+    def __init__(self):
+        # 키워드 색인 (KEYWORD_INDEX_ENABLED일 때 저장과 같은 트랜잭션으로 기록)
+        self._keyword_index = KeywordIndex() if KEYWORD_INDEX_CONFIG["enabled"] else None
+
+        dsn = DB_CONFIG["dsn"]
+
+        try:
+            logger.info("Oracle DB Async Connection Pool 생성 중...", dsn=dsn)
+
+            self._pool = oracledb.create_pool_async(
+                user=DB_CONFIG["username"],
+                password=DB_CONFIG["password"],
+                dsn=dsn,
+                config_dir=DB_CONFIG["wallet_location"],
+                wallet_location=DB_CONFIG["wallet_location"],
+                wallet_password=DB_CONFIG["wallet_password"],
+                min=DB_CONFIG["pool_min"],
+                max=DB_CONFIG["pool_max"],
+                increment=DB_CONFIG["pool_increment"],
+            )
+
+            logger.info(
+                "Database Async Connection Pool 생성 완료",
+                dsn=dsn,
+                pool_min=DB_CONFIG["pool_min"],
+                pool_max=DB_CONFIG["pool_max"],
+            )
+
+        except oracledb.Error as e:
+            error_obj, = e.args
+            logger.error(
+                "DB Async Connection Pool 생성 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+            )
+            raise
+
+    async def save_analysis_data(self, raw_data_id: int, result: AnalysisResult) -> AnalysisData:
+        """
+        분석 데이터 저장
+
+        Args:
+            raw_data_id: 원본 데이터 ID
+            result: LLM 분석 결과
+
+        Returns:
+            ID가 할당된 AnalysisData
+        """
+        analysis_data_list = await self.save_analysis_data_batch([(raw_data_id, result)])
+        return analysis_data_list[0]
+
+    async def save_analysis_data_batch(self, items: List[Tuple[int, AnalysisResult]]) -> List[AnalysisData]:
+        """
+        분석 데이터 일괄 저장
+
+        executemany 1회와 단일 커밋으로 저장합니다.
+
+        Args:
+            items: (원본 데이터 ID, LLM 분석 결과) 목록
+
+        Returns:
+            입력 순서와 동일한 ID가 할당된 AnalysisData 목록
+        """
+        if not items:
+            return []
+
+        async with self._pool.acquire() as connection:
+            try:
+                cursor = connection.cursor()
+                id_var = cursor.var(oracledb.NUMBER, arraysize=len(items))
+                cursor.setinputsizes(id=id_var)
+
+                await cursor.executemany(
+                    INSERT_ANALYSIS_DATA_SQL,
+                    [to_insert_params(raw_data_id, result) for raw_data_id, result in items],
+                )
+
+                # executemany + RETURNING: 행마다 반환값 리스트가 바인딩됨
+                record_ids = [int(id_var.getvalue(i)[0]) for i in range(len(items))]
+                cursor.close()
+                keyword_ids = {}
+                if self._keyword_index is not None:
+                    keyword_ids = await self._keyword_index.write_async(
+                        connection,
+                        [(record_id, result.keywords) for record_id, (_, result) in zip(record_ids, items)],
+                    )
+                await connection.commit()
+                if self._keyword_index is not None:
+                    self._keyword_index.remember(keyword_ids)
+
+            except oracledb.Error as e:
+                try:
+                    await connection.rollback()
+                except oracledb.Error:
+                    pass  # 연결 끊긴 경우 rollback 무시
+                error_obj, = e.args
+                logger.error(
+                    "분석 데이터 저장 실패",
+                    error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                    error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                    raw_data_ids=[raw_data_id for raw_data_id, _ in items],
+                )
+                raise
+
+        analysis_data_list = [
+            AnalysisData(
+                id=record_id,
+                raw_data_id=raw_data_id,
+                semantic_summary=result.semantic_summary,
+                display_summary=result.display_summary,
+                keywords=result.keywords,
+                prompt_version=result.prompt_version,
+                model_name=result.model_name,
+            )
+            for record_id, (raw_data_id, result) in zip(record_ids, items)
+        ]
+
+        logger.debug("분석 데이터 저장 완료", count=len(analysis_data_list))
+        return analysis_data_list
+
+    async def save_analysis_data_with_outbox(self, raw_data: RawData, result: AnalysisResult) -> AnalysisData:
+        """
+        분석 데이터와 발행 대기 메시지를 한 트랜잭션으로 저장
+
+        Args:
+            raw_data: 원본 데이터
+            result: LLM 분석 결과
+
+        Returns:
+            ID가 할당된 AnalysisData
+        """
+        async with self._pool.acquire() as connection:
+            try:
+                cursor = connection.cursor()
+                id_var = cursor.var(oracledb.NUMBER)
+
+                await cursor.execute(
+                    INSERT_ANALYSIS_DATA_SQL,
+                    {**to_insert_params(raw_data.id, result), "id": id_var},
+                )
+
+                analysis_data = AnalysisData(
+                    id=int(id_var.getvalue()[0]),
+                    raw_data_id=raw_data.id,
+                    semantic_summary=result.semantic_summary,
+                    display_summary=result.display_summary,
+                    keywords=result.keywords,
+                    prompt_version=result.prompt_version,
+                    model_name=result.model_name,
+                )
+
+                await cursor.execute(
+                    INSERT_OUTBOX_SQL,
+                    {
+                        "analysis_data_id": analysis_data.id,
+                        "payload": json.dumps(
+                            AnalysisMessage.from_analysis_data(analysis_data, raw_data).to_dict(),
+                            ensure_ascii=False,
+                        ),
+                    },
+                )
+                cursor.close()
+                keyword_ids = {}
+                if self._keyword_index is not None:
+                    keyword_ids = await self._keyword_index.write_async(
+                        connection,
+                        [(analysis_data.id, analysis_data.keywords)],
+                    )
+                await connection.commit()
+                if self._keyword_index is not None:
+                    self._keyword_index.remember(keyword_ids)
+
+            except oracledb.Error as e:
+                try:
+                    await connection.rollback()
+                except oracledb.Error:
+                    pass  # 연결 끊긴 경우 rollback 무시
+                error_obj, = e.args
+                logger.error(
+                    "분석 데이터 및 outbox 저장 실패",
+                    error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                    error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                    raw_data_id=raw_data.id,
+                )
+                raise
+
+        logger.debug("분석 데이터 및 outbox 저장 완료", id=analysis_data.id, raw_data_id=raw_data.id)
+        return analysis_data
+
+    async def close(self):
+        """Connection Pool 종료"""
+        await self._pool.close()
+        logger.info("Database Async Connection Pool 종료")
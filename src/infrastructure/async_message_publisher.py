@@ -0,0 +1,93 @@
+"""
+비동기 메시지 발행자
+
+redis.asyncio를 사용하여 Redis Streams로 메시지를 발행합니다.
+"""
+
+import redis
+import redis.asyncio as aioredis
+
+from config.redis import REDIS_CONFIG
+from config.worker import BACKPRESSURE_CONFIG
+from src.infrastructure.message_codec import encode_analysis_message, resolve_format
+from src.infrastructure.message_publisher import DOWNSTREAM_NORMAL, DownstreamBackpressure, stream_trim_options
+from src.logger import get_logger
+from src.models.analysis_message import AnalysisMessage
+
+logger = get_logger("async_message_publisher")
+
+
+class AsyncMessagePublisher:
+    """
+    Redis Streams 비동기 메시지 발행자
+
+    사용 전 initialize()로 연결을 확인해야 합니다.
+    """
+
+    def __init__(self):
+        self._client = aioredis.Redis(
+            host=REDIS_CONFIG["host"],
+            port=REDIS_CONFIG["port"],
+            db=REDIS_CONFIG["db"],
+            decode_responses=True,
+        )
+        self._stream = REDIS_CONFIG["output_stream"]
+        self._format = resolve_format(REDIS_CONFIG["output_format"])
+        self._backpressure = DownstreamBackpressure() if BACKPRESSURE_CONFIG["enabled"] else None
+
+    async def initialize(self):
+        """연결 테스트"""
+        try:
+            await self._client.ping()
+            logger.info("AsyncMessagePublisher 연결 성공", host=REDIS_CONFIG["host"])
+        except redis.ConnectionError as e:
+            logger.error("AsyncMessagePublisher 연결 실패", error=str(e))
+            raise
+
+    async def publish(self, analysis_message: AnalysisMessage) -> str:
+        """
+        분석 결과 발행
+
+        Args:
+            analysis_message: 발행할 분석 메시지
+
+        Returns:
+            발행된 메시지 ID
+        """
+        try:
+            message_id = await self._client.xadd(
+                self._stream,
+                encode_analysis_message(analysis_message, self._format),
+                **stream_trim_options(),
+            )
+
+            logger.debug(
+                "메시지 발행 완료",
+                message_id=message_id,
+                analysis_id=analysis_message.id,
+            )
+
+            return message_id
+
+        except redis.RedisError as e:
+            logger.error("메시지 발행 실패", error=str(e), analysis_id=analysis_message.id)
+            raise
+
+    async def downstream_state(self) -> str:
+        """하위 레이어 적체 상태 조회 (MessagePublisher.downstream_state와 같음)"""
+        if self._backpressure is None:
+            return DOWNSTREAM_NORMAL
+        if self._backpressure.due():
+            try:
+                self._backpressure.update(await self._client.xinfo_groups(self._stream))
+            except redis.ResponseError:
+                # 출력 스트림이 아직 없음
+                self._backpressure.update([])
+            except redis.RedisError as e:
+                logger.warning("하위 레이어 적체 조회 실패", error=str(e), state=self._backpressure.state)
+        return self._backpressure.state
+
+    async def close(self):
+        """연결 종료"""
+        await self._client.aclose()
+        logger.info("AsyncMessagePublisher 연결 종료")
@@ -0,0 +1,209 @@
+"""
+비동기 메시지 구독자
+
+redis.asyncio를 사용하여 Redis Streams에서 메시지를 수신합니다.
+"""
+
+from typing import Collection, Dict, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from config.redis import REDIS_CONFIG
+from src.infrastructure.message_subscriber import (
+    DEAD_LETTER_INVALID_PAYLOAD,
+    DEAD_LETTER_MAX_DELIVERIES,
+    dead_letter_fields,
+    next_claim_cursor,
+    parse_messages,
+    split_exhausted,
+)
+from src.logger import get_logger
+from src.metrics import MESSAGES_DEAD_LETTERED
+from src.models.raw_data import RawData
+
+logger = get_logger("async_message_subscriber")
+
+
+class AsyncMessageSubscriber:
+    """
+    Redis Streams 비동기 메시지 구독자
+
+    MessageSubscriber와 같은 Consumer Group을 사용하며, 이벤트 루프 하나에서
+    연결 풀을 공유합니다. 사용 전 initialize()를 호출해야 합니다.
+    """
+
+    def __init__(self, consumer_name: Optional[str] = None):
+        self._client = aioredis.Redis(
+            host=REDIS_CONFIG["host"],
+            port=REDIS_CONFIG["port"],
+            db=REDIS_CONFIG["db"],
+            decode_responses=True,
+        )
+        self._stream = REDIS_CONFIG["input_stream"]
+        self._group = REDIS_CONFIG["consumer_group"]
+        self._consumer = consumer_name or REDIS_CONFIG["consumer_name"]
+        self._block_timeout = REDIS_CONFIG["block_timeout"]
+        self._dead_letter_stream = REDIS_CONFIG["dead_letter_stream"]
+        self._claim_cursor = "0-0"
+
+    async def initialize(self):
+        """Consumer Group 확인 및 생성"""
+        try:
+            await self._client.xgroup_create(
+                self._stream,
+                self._group,
+                id="0",
+                mkstream=True,
+            )
+            logger.info("Consumer Group 생성", group=self._group)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" in str(e):
+                logger.debug("Consumer Group 이미 존재", group=self._group)
+            else:
+                raise
+
+        logger.info(
+            "AsyncMessageSubscriber 초기화 완료",
+            stream=self._stream,
+            group=self._group,
+            consumer=self._consumer,
+        )
+
+    async def receive_batch(self, count: int) -> List[RawData]:
+        """
+        메시지 일괄 수신 (이벤트 루프는 막지 않음)
+
+        Args:
+            count: 최대 수신 건수
+
+        Returns:
+            수신된 메시지 목록, 타임아웃 시 빈 리스트
+        """
+        messages = await self._client.xreadgroup(
+            groupname=self._group,
+            consumername=self._consumer,
+            streams={self._stream: ">"},
+            count=count,
+            block=self._block_timeout,
+        )
+
+        if not messages:
+            return []
+
+        # messages: [(stream_name, [(message_id, {field: value})])]
+        stream_name, stream_messages = messages[0]
+        logger.debug("메시지 수신", count=len(stream_messages))
+
+        raw_data_list, invalid = parse_messages(stream_messages)
+        if invalid:
+            await self._dead_letter(invalid, {}, DEAD_LETTER_INVALID_PAYLOAD)
+        return raw_data_list
+
+    async def ack_many(self, message_ids: List[str]):
+        """
+        메시지 일괄 처리 완료 확인
+
+        Args:
+            message_ids: 처리 완료된 메시지 ID 목록
+        """
+        if not message_ids:
+            return
+
+        await self._client.xack(self._stream, self._group, *message_ids)
+        logger.debug("메시지 일괄 ACK", count=len(message_ids))
+
+    async def pending_count(self) -> int:
+        """Consumer Group 전체의 Pending 메시지 수 조회 (XPENDING 요약)"""
+        summary = await self._client.xpending(self._stream, self._group)
+        return int(summary["pending"])
+
+    async def claim_stale(
+        self,
+        min_idle_ms: int,
+        count: int,
+        max_deliveries: int = 0,
+        exclude_ids: Collection[str] = (),
+    ) -> List[RawData]:
+        """
+        오래 방치된 Pending 메시지 회수 (XPENDING IDLE + XCLAIM)
+
+        MessageSubscriber.claim_stale과 같이 이 프로세스에서 처리 중인 메시지는 XCLAIM하지 않고,
+        최대 전달 횟수를 넘긴 메시지와 파싱할 수 없는 메시지는 dead-letter 처리합니다.
+
+        Args:
+            min_idle_ms: 회수 대상 최소 유휴 시간 (밀리초)
+            count: 최대 회수 건수
+            max_deliveries: 최대 전달 횟수 (0이면 제한 없음)
+            exclude_ids: 이 프로세스에서 처리 중이거나 ACK 대기 중인 메시지 ID (XCLAIM하지 않음)
+
+        Returns:
+            회수한 메시지 목록
+        """
+        entries = await self._client.xpending_range(
+            self._stream,
+            self._group,
+            min=self._claim_cursor,
+            max="+",
+            count=count,
+            idle=min_idle_ms,
+        )
+        self._claim_cursor = next_claim_cursor(entries, count)
+
+        message_ids = [entry["message_id"] for entry in entries if entry["message_id"] not in exclude_ids]
+        if not message_ids:
+            return []
+
+        stream_messages = await self._client.xclaim(
+            self._stream,
+            self._group,
+            self._consumer,
+            min_idle_time=min_idle_ms,
+            message_ids=message_ids,
+        )
+        stream_messages = [(message_id, data) for message_id, data in stream_messages if message_id is not None and data]
+
+        delivery_counts = {entry["message_id"]: int(entry["times_delivered"]) + 1 for entry in entries}
+        stream_messages, exhausted = split_exhausted(stream_messages, delivery_counts, max_deliveries)
+        if exhausted:
+            await self._dead_letter(exhausted, delivery_counts, DEAD_LETTER_MAX_DELIVERIES)
+
+        claimed, invalid = parse_messages(stream_messages)
+        if invalid:
+            await self._dead_letter(invalid, delivery_counts, DEAD_LETTER_INVALID_PAYLOAD)
+
+        if claimed:
+            logger.info("Pending 메시지 회수", count=len(claimed))
+        return claimed
+
+    async def _dead_letter(self, stream_messages: List[tuple], delivery_counts: Dict[str, int], reason: str):
+        """처리하지 않을 메시지를 dead-letter 스트림에 기록하고 ACK (MessageSubscriber._dead_letter와 같음)"""
+        message_ids = [message_id for message_id, _ in stream_messages]
+        times_delivered = [delivery_counts.get(message_id, 1) for message_id in message_ids]
+        pipeline = self._client.pipeline(transaction=True)
+        if self._dead_letter_stream:
+            for (message_id, data), delivered in zip(stream_messages, times_delivered):
+                pipeline.xadd(
+                    self._dead_letter_stream,
+                    dead_letter_fields(message_id, data, delivered, self._group, reason),
+                )
+        pipeline.xack(self._stream, self._group, *message_ids)
+        await pipeline.execute()
+
+        MESSAGES_DEAD_LETTERED.labels(reason).inc(len(message_ids))
+        logger.error(
+            "메시지 dead-letter 처리",
+            reason=reason,
+            message_ids=message_ids,
+            times_delivered=times_delivered,
+            dead_letter_stream=self._dead_letter_stream or None,
+        )
+
+    def is_claim_scan_complete(self) -> bool:
+        """PEL 스캔이 한 바퀴 끝났는지 여부"""
+        return self._claim_cursor == "0-0"
+
+    async def close(self):
+        """연결 종료"""
+        await self._client.aclose()
+        logger.info("AsyncMessageSubscriber 연결 종료")
@@ -5,17 +5,180 @@ Oracle DB에 분석 결과를 저장합니다.
 """
 
 import json
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import oracledb
 
-from config.database import DB_CONFIG
+from config.database import DB_CONFIG, KEYWORD_INDEX_CONFIG
+from src.infrastructure.keyword_index import KeywordIndex
 from src.logger import get_logger
+from src.metrics import STAGE_DURATION
 from src.models.analysis_data import AnalysisData
-from src.models.analysis_message import AnalysisMessage
+from src.models.analysis_message import AnalysisMessage, AnalysisMessageRecord
 from src.models.analysis_result import AnalysisResult
+from src.models.raw_data import RawData
 
 logger = get_logger("database")
 
+# analysis_data INSERT (RETURNING으로 생성된 ID 반환)
+INSERT_ANALYSIS_DATA_SQL = """
+    INSERT INTO analysis_data (
+        raw_data_id, semantic_summary, display_summary, keywords, prompt_version, model_name
+    ) VALUES (
+        :raw_data_id, :semantic_summary, :display_summary, :keywords, :prompt_version, :model_name
+    )
+    RETURNING id INTO :id
+"""
+
+# analysis_outbox INSERT (analysis_data와 같은 트랜잭션)
+INSERT_OUTBOX_SQL = """
+    INSERT INTO analysis_outbox (analysis_data_id, payload)
+    VALUES (:analysis_data_id, :payload)
+"""
+
+# 미발행 outbox 조회 (다른 Relay가 잠근 행은 건너뜀)
+SELECT_UNPUBLISHED_OUTBOX_SQL = """
+    SELECT id, payload
+    FROM analysis_outbox
+    WHERE published_at IS NULL
+    ORDER BY id
+    FOR UPDATE SKIP LOCKED
+"""
+
+# outbox 발행 완료 표시
+MARK_OUTBOX_PUBLISHED_SQL = """
+    UPDATE analysis_outbox
+    SET published_at = SYSTIMESTAMP, stream_message_id = :stream_message_id
+    WHERE id = :id
+"""
+
+# 재분석 대상 조회 (프롬프트 버전이 다른 행, analysis_data.id 키셋 순서)
+SELECT_REANALYSIS_TARGETS_SQL = """
+    SELECT a.id, r.id, r.content, r.link, r.published_at, r.channel
+    FROM analysis_data a
+    JOIN raw_data r ON a.raw_data_id = r.id
+    WHERE a.prompt_version <> :prompt_version
+      AND a.id > :after_id
+    ORDER BY a.id
+"""
+
+# 분석 결과 조회 컬럼 (to_analysis_message_record 순서)
+ANALYSIS_MESSAGE_COLUMNS = """
+        a.id, a.raw_data_id, a.semantic_summary, a.display_summary,
+        a.keywords, a.prompt_version, a.model_name, a.created_at,
+        r.channel, r.link, r.published_at
+"""
+
+# 분석 결과 페이지 조회 (analysis_data.id 키셋 페이지네이션, until이 NULL이면 상한 없음)
+SELECT_ANALYSIS_MESSAGES_PAGE_SQL = f"""
+    SELECT {ANALYSIS_MESSAGE_COLUMNS}
+    FROM analysis_data a
+    JOIN raw_data r ON a.raw_data_id = r.id
+    WHERE a.id > :after_id
+      AND (:until IS NULL OR a.created_at < :until)
+    ORDER BY a.id
+    FETCH FIRST :batch_size ROWS ONLY
+"""
+
+# 키워드별 분석 결과 조회 (analysis_keyword 기본 키 범위 탐색, 최신순 키셋 페이지네이션)
+SELECT_ANALYSIS_BY_KEYWORD_SQL = f"""
+    SELECT {ANALYSIS_MESSAGE_COLUMNS}
+    FROM analysis_keyword ak
+    JOIN analysis_data a ON a.id = ak.analysis_data_id
+    JOIN raw_data r ON a.raw_data_id = r.id
+    WHERE ak.keyword_id = :keyword_id
+      AND (:before_id IS NULL OR ak.analysis_data_id < :before_id)
+    ORDER BY ak.analysis_data_id DESC
+    FETCH FIRST :limit ROWS ONLY
+"""
+
+# 기간 내 상위 키워드 (analysis_keyword(created_at, keyword_id) 인덱스만 범위 탐색)
+SELECT_TOP_KEYWORDS_SQL = """
+    SELECT k.name, t.item_count
+    FROM (
+        SELECT keyword_id, COUNT(*) AS item_count
+        FROM analysis_keyword
+        WHERE created_at >= :since
+          AND created_at < :until
+        GROUP BY keyword_id
+        ORDER BY item_count DESC
+        FETCH FIRST :limit ROWS ONLY
+    ) t
+    JOIN keyword_dict k ON k.id = t.keyword_id
+    ORDER BY t.item_count DESC, k.name
+"""
+
+# 재분석 결과 반영
+UPDATE_ANALYSIS_DATA_SQL = """
+    UPDATE analysis_data
+    SET semantic_summary = :semantic_summary,
+        display_summary = :display_summary,
+        keywords = :keywords,
+        prompt_version = :prompt_version,
+        model_name = :model_name
+    WHERE id = :id
+"""
+
+# 보관 기간이 지난 발행 완료 outbox 삭제
+PURGE_OUTBOX_SQL = """
+    DELETE FROM analysis_outbox
+    WHERE published_at < SYSTIMESTAMP - NUMTODSINTERVAL(:retention_hours, 'HOUR')
+"""
+
+
+def to_insert_params(raw_data_id: int, result: AnalysisResult) -> dict:
+    """analysis_data INSERT 바인드 파라미터 생성 (RETURNING 변수 제외)"""
+    return {
+        "raw_data_id": raw_data_id,
+        "semantic_summary": result.semantic_summary,
+        "display_summary": result.display_summary,
+        "keywords": json.dumps(result.keywords, ensure_ascii=False),
+        "prompt_version": result.prompt_version,
+        "model_name": result.model_name,
+    }
+
+
+def clob_as_str(cursor, metadata):
+    """
+    출력 형식 처리기: CLOB 열을 LOB 로케이터 대신 문자열로 가져옴
+
+    LOB 로케이터는 행마다 read() 왕복이 추가되므로 fetch 왕복에 값을 함께 싣습니다.
+    (execute의 fetch_lobs 인자와 같은 효과이며 python-oracledb 버전에 관계없이 동작)
+    """
+    if metadata.type_code is oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+
+
+def to_analysis_message_record(row: tuple) -> AnalysisMessageRecord:
+    """조회 행(ANALYSIS_MESSAGE_COLUMNS 순서) → AnalysisMessageRecord (DB에서 읽은 값이므로 검증 생략)"""
+    (
+        db_id, raw_data_id, semantic_summary, display_summary,
+        keywords_str, prompt_version, model_name, created_at,
+        channel, link, published_at
+    ) = row
+    return AnalysisMessageRecord.model_construct(
+        id=int(db_id),
+        raw_data_id=int(raw_data_id),
+        semantic_summary=semantic_summary,
+        display_summary=display_summary,
+        keywords_json=keywords_str,
+        prompt_version=prompt_version,
+        model_name=model_name,
+        created_at=created_at,
+        channel=channel,
+        original_link=link,
+        published_at=published_at,
+    )
+
+
+def to_update_params(analysis_data_id: int, result: AnalysisResult) -> dict:
+    """analysis_data UPDATE 바인드 파라미터 생성"""
+    params = to_insert_params(0, result)
+    del params["raw_data_id"]
+    params["id"] = analysis_data_id
+    return params
+
 
 class Database:
     """
@@ -24,13 +187,22 @@ class Database:
     Connection Pool을 사용하여 분석 결과를 저장합니다.
     """
 
-    def __init__(self):
+    def __init__(self, pool: Optional[oracledb.ConnectionPool] = None, keyword_index: Optional[KeywordIndex] = None):
+        # 키워드 색인 (조회 API는 항상 사용, 저장 시 기록은 KEYWORD_INDEX_ENABLED일 때만)
+        self._keyword_index = keyword_index or KeywordIndex()
+        self._keyword_index_enabled = KEYWORD_INDEX_CONFIG["enabled"]
+
         username = DB_CONFIG["username"]
         password = DB_CONFIG["password"]
         dsn = DB_CONFIG["dsn"]
         wallet_location = DB_CONFIG["wallet_location"]
         wallet_password = DB_CONFIG["wallet_password"]
 
+        # 외부에서 주입된 Pool 사용 (테스트 등)
+        if pool is not None:
+            self._pool = pool
+            return
+
         try:
             logger.info("Oracle DB Connection Pool 생성 중...", dsn=dsn)
 
@@ -41,12 +213,17 @@ class Database:
                 config_dir=wallet_location,
                 wallet_location=wallet_location,
                 wallet_password=wallet_password,
-                min=1,
-                max=2,
-                increment=1,
+                min=DB_CONFIG["pool_min"],
+                max=DB_CONFIG["pool_max"],
+                increment=DB_CONFIG["pool_increment"],
             )
 
-            logger.info("Database Connection Pool 생성 완료", dsn=dsn)
+            logger.info(
+                "Database Connection Pool 생성 완료",
+                dsn=dsn,
+                pool_min=DB_CONFIG["pool_min"],
+                pool_max=DB_CONFIG["pool_max"],
+            )
 
         except oracledb.Error as e:
             error_obj, = e.args
@@ -61,6 +238,7 @@ class Database:
         """Pool에서 connection 획득"""
         return self._pool.acquire()
 
+    @STAGE_DURATION.labels("db").time()
     def save_analysis_data(self, raw_data_id: int, result: AnalysisResult) -> AnalysisData:
         """
         분석 데이터 저장
@@ -78,27 +256,15 @@ class Database:
             id_var = cursor.var(oracledb.NUMBER)
 
             cursor.execute(
-                """
-                INSERT INTO analysis_data (
-                    raw_data_id, semantic_summary, display_summary, keywords, prompt_version
-                ) VALUES (
-                    :raw_data_id, :semantic_summary, :display_summary, :keywords, :prompt_version
-                )
-                RETURNING id INTO :id
-                """,
-                {
-                    "raw_data_id": raw_data_id,
-                    "semantic_summary": result.semantic_summary,
-                    "display_summary": result.display_summary,
-                    "keywords": json.dumps(result.keywords, ensure_ascii=False),
-                    "prompt_version": result.prompt_version,
-                    "id": id_var,
-                },
+                INSERT_ANALYSIS_DATA_SQL,
+                {**to_insert_params(raw_data_id, result), "id": id_var},
             )
 
             record_id = int(id_var.getvalue()[0])
-            connection.commit()
             cursor.close()
+            keyword_ids = self._write_keywords(connection, [(record_id, result.keywords)])
+            connection.commit()
+            self._keyword_index.remember(keyword_ids)
 
             analysis_data = AnalysisData(
                 id=record_id,
@@ -107,6 +273,7 @@ class Database:
                 display_summary=result.display_summary,
                 keywords=result.keywords,
                 prompt_version=result.prompt_version,
+                model_name=result.model_name,
             )
 
             logger.debug("분석 데이터 저장 완료", id=record_id, raw_data_id=raw_data_id)
@@ -128,6 +295,526 @@ class Database:
         finally:
             connection.close()  # pool에 반환
 
+    @STAGE_DURATION.labels("db").time()
+    def save_analysis_data_batch(self, items: List[Tuple[int, AnalysisResult]]) -> List[AnalysisData]:
+        """
+        분석 데이터 일괄 저장
+
+        executemany 1회로 전체 행을 INSERT하고 RETURNING으로 ID를 배열 바인딩하여
+        단일 커밋으로 저장합니다.
+
+        Args:
+            items: (원본 데이터 ID, LLM 분석 결과) 목록
+
+        Returns:
+            입력 순서와 동일한 ID가 할당된 AnalysisData 목록
+        """
+        if not items:
+            return []
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            analysis_data_list = self._insert_analysis_data(cursor, items)
+            cursor.close()
+            keyword_ids = self._write_keywords(connection, [(data.id, data.keywords) for data in analysis_data_list])
+            connection.commit()
+            self._keyword_index.remember(keyword_ids)
+
+            logger.debug("분석 데이터 일괄 저장 완료", count=len(analysis_data_list))
+            return analysis_data_list
+
+        except oracledb.Error as e:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # 연결 끊긴 경우 rollback 무시
+            error_obj, = e.args
+            logger.error(
+                "분석 데이터 일괄 저장 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                raw_data_ids=[raw_data_id for raw_data_id, _ in items],
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def _insert_analysis_data(self, cursor, items: List[Tuple[int, AnalysisResult]]) -> List[AnalysisData]:
+        """
+        analysis_data 일괄 INSERT (커밋은 호출자가 처리)
+
+        executemany 1회로 전체 행을 INSERT하고 RETURNING으로 ID를 배열 바인딩합니다.
+
+        Returns:
+            입력 순서와 동일한 ID가 할당된 AnalysisData 목록
+        """
+        id_var = cursor.var(oracledb.NUMBER, arraysize=len(items))
+        cursor.setinputsizes(id=id_var)
+
+        cursor.executemany(
+            INSERT_ANALYSIS_DATA_SQL,
+            [to_insert_params(raw_data_id, result) for raw_data_id, result in items],
+        )
+
+        # executemany + RETURNING: 행마다 반환값 리스트가 바인딩됨
+        record_ids = [int(id_var.getvalue(i)[0]) for i in range(len(items))]
+
+        return [
+            AnalysisData(
+                id=record_id,
+                raw_data_id=raw_data_id,
+                semantic_summary=result.semantic_summary,
+                display_summary=result.display_summary,
+                keywords=result.keywords,
+                prompt_version=result.prompt_version,
+                model_name=result.model_name,
+            )
+            for record_id, (raw_data_id, result) in zip(record_ids, items)
+        ]
+
+    def _write_keywords(self, connection, items: List[Tuple[int, List[str]]]) -> Dict[str, int]:
+        """
+        키워드 색인 기록 (KEYWORD_INDEX_ENABLED일 때만, 커밋은 호출자가 처리)
+
+        Args:
+            items: (analysis_data ID, 키워드 목록) 목록
+
+        Returns:
+            새로 조회한 키워드 ID (커밋 성공 후 KeywordIndex.remember()에 넘김)
+        """
+        if not self._keyword_index_enabled:
+            return {}
+        return self._keyword_index.write(connection, items)
+
+    @STAGE_DURATION.labels("db").time()
+    def save_analysis_data_with_outbox(self, items: List[Tuple[RawData, AnalysisResult]]) -> List[AnalysisData]:
+        """
+        분석 데이터와 발행 대기 메시지를 한 트랜잭션으로 저장
+
+        analysis_data INSERT와 같은 커밋으로 analysis_outbox에 AnalysisMessage JSON을 기록합니다.
+        커밋되면 발행은 OutboxRelay가 보장하므로 호출자는 바로 ACK할 수 있습니다.
+
+        Args:
+            items: (원본 데이터, LLM 분석 결과) 목록
+
+        Returns:
+            입력 순서와 동일한 ID가 할당된 AnalysisData 목록
+        """
+        if not items:
+            return []
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            analysis_data_list = self._insert_analysis_data(
+                cursor,
+                [(raw_data.id, result) for raw_data, result in items],
+            )
+            cursor.close()
+
+            # RETURNING 바인딩이 없는 별도 커서로 outbox INSERT
+            outbox_cursor = connection.cursor()
+            outbox_cursor.executemany(
+                INSERT_OUTBOX_SQL,
+                [
+                    {
+                        "analysis_data_id": analysis_data.id,
+                        "payload": json.dumps(
+                            AnalysisMessage.from_analysis_data(analysis_data, raw_data).to_dict(),
+                            ensure_ascii=False,
+                        ),
+                    }
+                    for analysis_data, (raw_data, _) in zip(analysis_data_list, items)
+                ],
+            )
+            outbox_cursor.close()
+            keyword_ids = self._write_keywords(connection, [(data.id, data.keywords) for data in analysis_data_list])
+            connection.commit()
+            self._keyword_index.remember(keyword_ids)
+
+            logger.debug("분석 데이터 및 outbox 저장 완료", count=len(analysis_data_list))
+            return analysis_data_list
+
+        except oracledb.Error as e:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # 연결 끊긴 경우 rollback 무시
+            error_obj, = e.args
+            logger.error(
+                "분석 데이터 및 outbox 저장 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                raw_data_ids=[raw_data.id for raw_data, _ in items],
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def publish_outbox(
+        self,
+        limit: int,
+        publish: Callable[[List[AnalysisMessage]], List[str]],
+    ) -> int:
+        """
+        미발행 outbox 일괄 발행
+
+        미발행 행을 최대 limit건 잠근 채(FOR UPDATE SKIP LOCKED) publish로 발행하고,
+        같은 트랜잭션에서 발행 완료로 표시합니다. 발행이 실패하면 롤백하여 다음 주기에 재시도합니다.
+        여러 Relay가 동시에 실행되어도 서로 다른 행을 가져갑니다.
+
+        Args:
+            limit: 1회 최대 발행 건수
+            publish: AnalysisMessage 목록을 발행하고 입력 순서대로 Stream 메시지 ID를 돌려주는 함수
+
+        Returns:
+            발행한 건수
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.outputtypehandler = clob_as_str
+
+            # SKIP LOCKED는 fetch 시점에 행을 잠그므로 limit건만 가져옴
+            # (prefetchrows를 limit보다 크게 두면 발행하지 않을 행까지 잠김)
+            cursor.arraysize = limit
+            cursor.prefetchrows = limit
+            cursor.execute(SELECT_UNPUBLISHED_OUTBOX_SQL)
+            rows = cursor.fetchmany(limit)
+
+            if not rows:
+                connection.rollback()
+                cursor.close()
+                return 0
+
+            analysis_messages = [AnalysisMessage.model_validate_json(payload) for _, payload in rows]
+            stream_message_ids = publish(analysis_messages)
+
+            cursor.executemany(
+                MARK_OUTBOX_PUBLISHED_SQL,
+                [
+                    {"id": outbox_id, "stream_message_id": stream_message_id}
+                    for (outbox_id, _), stream_message_id in zip(rows, stream_message_ids)
+                ],
+            )
+            connection.commit()
+            cursor.close()
+
+            logger.debug("outbox 발행 완료", count=len(rows))
+            return len(rows)
+
+        except Exception as e:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # 연결 끊긴 경우 rollback 무시
+            logger.error("outbox 발행 실패", error=str(e), error_type=type(e).__name__)
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def purge_outbox(self, retention_hours: float) -> int:
+        """
+        발행 완료 outbox 정리
+
+        Args:
+            retention_hours: 발행 완료 후 보관 시간
+
+        Returns:
+            삭제한 건수
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(PURGE_OUTBOX_SQL, {"retention_hours": retention_hours})
+            deleted = cursor.rowcount
+            connection.commit()
+            cursor.close()
+
+            logger.debug("발행 완료 outbox 정리", deleted=deleted)
+            return deleted
+
+        except oracledb.Error as e:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # 연결 끊긴 경우 rollback 무시
+            error_obj, = e.args
+            logger.error(
+                "outbox 정리 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def iter_reanalysis_targets(
+        self,
+        prompt_version: str,
+        after_id: int = 0,
+        fetch_size: int = 500,
+    ) -> Iterator[List[Tuple[int, RawData]]]:
+        """
+        재분석 대상 스트리밍 조회
+
+        프롬프트 버전이 다른 analysis_data와 원본 raw_data를 id 순으로 서버 측 커서 1개에서 읽습니다.
+        arraysize/prefetchrows를 fetch_size로 맞춰 왕복 1회에 fetch_size행씩 가져오며,
+        전체 결과를 메모리에 올리지 않습니다. 생성기를 끝까지 소비하거나 닫을 때까지 연결을 점유합니다.
+
+        Args:
+            prompt_version: 현재 프롬프트 버전 (이 버전이 아닌 행이 대상)
+            after_id: 이 analysis_data.id 다음 행부터 조회 (키셋 체크포인트)
+            fetch_size: 왕복 1회에 가져올 행 수
+
+        Yields:
+            (analysis_data ID, 원본 데이터) 목록 (최대 fetch_size건, message_id는 빈 문자열)
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = fetch_size
+            cursor.prefetchrows = fetch_size
+            cursor.execute(SELECT_REANALYSIS_TARGETS_SQL, {"prompt_version": prompt_version, "after_id": after_id})
+
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield [
+                    (
+                        int(analysis_data_id),
+                        RawData(
+                            message_id="",
+                            id=int(raw_data_id),
+                            # CLOB 컬럼이면 LOB 객체로 반환됨
+                            content=content.read() if hasattr(content, "read") else content,
+                            link=link,
+                            published_at=published_at,
+                            channel=channel,
+                        ),
+                    )
+                    for analysis_data_id, raw_data_id, content, link, published_at, channel in rows
+                ]
+
+            cursor.close()
+
+        except oracledb.Error as e:
+            error_obj, = e.args
+            logger.error(
+                "재분석 대상 조회 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                after_id=after_id,
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    @STAGE_DURATION.labels("db").time()
+    def update_analysis_data_batch(self, items: List[Tuple[int, AnalysisResult]]) -> int:
+        """
+        재분석 결과 일괄 반영
+
+        executemany 1회로 전체 행을 UPDATE하고 단일 커밋으로 반영합니다.
+
+        Args:
+            items: (analysis_data ID, LLM 분석 결과) 목록
+
+        Returns:
+            갱신한 행 수
+        """
+        if not items:
+            return 0
+
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.executemany(
+                UPDATE_ANALYSIS_DATA_SQL,
+                [to_update_params(analysis_data_id, result) for analysis_data_id, result in items],
+            )
+            updated = cursor.rowcount
+            cursor.close()
+            keyword_ids = {}
+            if self._keyword_index_enabled:
+                keyword_ids = self._keyword_index.replace(
+                    connection,
+                    [(analysis_data_id, result.keywords) for analysis_data_id, result in items],
+                )
+            connection.commit()
+            self._keyword_index.remember(keyword_ids)
+
+            logger.debug("재분석 결과 반영 완료", count=updated)
+            return updated
+
+        except oracledb.Error as e:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # 연결 끊긴 경우 rollback 무시
+            error_obj, = e.args
+            logger.error(
+                "재분석 결과 반영 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                analysis_data_ids=[analysis_data_id for analysis_data_id, _ in items],
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def iter_analysis_messages(
+        self,
+        since_id: int = 0,
+        until: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[AnalysisMessageRecord]:
+        """
+        분석 결과 순차 조회
+
+        analysis_data.id 키셋 페이지네이션으로 batch_size행씩 쿼리하여 id 순으로 하나씩 돌려줍니다.
+        OFFSET 없이 직전 페이지의 마지막 id 다음부터 조회하므로 뒤쪽 페이지도 인덱스 범위 탐색 1회이고,
+        페이지마다 연결을 반환하므로 소비하는 동안 연결을 점유하지 않습니다.
+        메모리에는 한 페이지만 올라가며, keywords는 레코드의 keywords에 접근할 때 디코딩합니다.
+
+        Args:
+            since_id: 이 analysis_data.id 다음 행부터 조회 (이전 조회의 마지막 id를 넘기면 이어서 조회)
+            until: 이 시각 이전에 생성된 행만 조회 (None이면 상한 없음)
+            batch_size: 페이지 크기 (None이면 DB_CONFIG["scan_batch_size"])
+
+        Yields:
+            AnalysisMessageRecord (id 오름차순)
+        """
+        batch_size = max(1, batch_size or DB_CONFIG["scan_batch_size"])
+        after_id = since_id
+
+        while True:
+            rows = self._fetch_analysis_messages_page(after_id, until, batch_size)
+            for row in rows:
+                yield to_analysis_message_record(row)
+
+            if len(rows) < batch_size:
+                break
+            after_id = int(rows[-1][0])
+
+    def _fetch_analysis_messages_page(self, after_id: int, until: Optional[datetime], batch_size: int) -> list:
+        """분석 결과 1페이지 조회 (after_id 다음부터 최대 batch_size행)"""
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            # 페이지 전체를 왕복 1회로 가져오도록 설정 (prefetchrows가 행 수보다 크면 추가 fetch 왕복 없음)
+            cursor.arraysize = batch_size
+            cursor.prefetchrows = batch_size + 1
+            cursor.execute(
+                SELECT_ANALYSIS_MESSAGES_PAGE_SQL,
+                {"after_id": after_id, "until": until, "batch_size": batch_size},
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+
+        except oracledb.Error as e:
+            error_obj, = e.args
+            logger.error(
+                "분석 결과 페이지 조회 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                after_id=after_id,
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def find_analysis_by_keyword(
+        self,
+        keyword: str,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[AnalysisMessageRecord]:
+        """
+        키워드로 분석 결과 조회
+
+        키워드를 저장할 때와 같은 방식으로 정규화하여 찾으므로 표기가 달라도 ("NATO", "나토" 별칭 등) 같은 결과를 돌려줍니다.
+
+        Args:
+            keyword: 찾을 키워드
+            before_id: 이 analysis_data.id 이전 행부터 조회 (이전 결과의 마지막 id를 넘기면 다음 페이지)
+            limit: 최대 건수
+
+        Returns:
+            AnalysisMessageRecord 목록 (최신순, 키워드가 색인에 없으면 빈 목록)
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            keyword_id = self._keyword_index.lookup(cursor, keyword)
+            if keyword_id is None:
+                cursor.close()
+                return []
+
+            cursor.arraysize = limit
+            cursor.prefetchrows = limit + 1
+            cursor.execute(
+                SELECT_ANALYSIS_BY_KEYWORD_SQL,
+                {"keyword_id": keyword_id, "before_id": before_id, "limit": limit},
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return [to_analysis_message_record(row) for row in rows]
+
+        except oracledb.Error as e:
+            error_obj, = e.args
+            logger.error(
+                "키워드별 분석 결과 조회 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+                keyword=keyword,
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
+    def get_top_keywords(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        limit: int = 20,
+    ) -> List[Tuple[str, int]]:
+        """
+        기간 내 상위 키워드 조회
+
+        Args:
+            since: 시작 시각 (포함)
+            until: 끝 시각 (제외, None이면 현재)
+            limit: 최대 키워드 수
+
+        Returns:
+            (정규화한 키워드, 분석 결과 수) 목록 (많은 순)
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                SELECT_TOP_KEYWORDS_SQL,
+                {"since": since, "until": until or datetime.now(timezone.utc), "limit": limit},
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return [(name, int(item_count)) for name, item_count in rows]
+
+        except oracledb.Error as e:
+            error_obj, = e.args
+            logger.error(
+                "상위 키워드 조회 실패",
+                error_code=error_obj.code if hasattr(error_obj, "code") else None,
+                error_message=str(error_obj.message) if hasattr(error_obj, "message") else str(e),
+            )
+            raise
+        finally:
+            connection.close()  # pool에 반환
+
     def get_latest_analysis_data(self) -> AnalysisData:
         """
         가장 최근 analysis_data 1건 조회
@@ -141,7 +828,7 @@ class Database:
 
             cursor.execute(
                 """
-                SELECT id, raw_data_id, semantic_summary, display_summary, keywords, prompt_version
+                SELECT id, raw_data_id, semantic_summary, display_summary, keywords, prompt_version, model_name
                 FROM analysis_data
                 ORDER BY id DESC
                 FETCH FIRST 1 ROW ONLY
@@ -154,7 +841,7 @@ class Database:
             if row is None:
                 return None
 
-            db_id, raw_data_id, semantic_summary, display_summary, keywords_str, prompt_version = row
+            db_id, raw_data_id, semantic_summary, display_summary, keywords_str, prompt_version, model_name = row
 
             return AnalysisData(
                 id=int(db_id),
@@ -163,6 +850,7 @@ class Database:
                 display_summary=display_summary,
                 keywords=json.loads(keywords_str),
                 prompt_version=prompt_version,
+                model_name=model_name,
             )
 
         except oracledb.Error as e:
@@ -0,0 +1,261 @@
+"""
+키워드 색인
+
+analysis_data.keywords(JSON 문자열)를 정규화된 테이블로 나눠 저장합니다.
+- keyword_dict: 표기를 정규화한 키워드 이름 1개당 1행
+- analysis_keyword: (keyword_id, analysis_data_id) 쌍 (키워드별/기간별 조회가 인덱스 범위 탐색이 되도록 함)
+
+기록은 Database/AsyncDatabase가 analysis_data INSERT와 같은 트랜잭션에서 호출합니다.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import oracledb
+
+from config.database import KEYWORD_INDEX_CONFIG
+from src.logger import get_logger
+
+logger = get_logger("keyword_index")
+
+# keyword_dict.name 최대 길이 (VARCHAR2(200 CHAR))
+MAX_KEYWORD_LENGTH = 200
+
+# 중복 키 오류 (다른 세션이 같은 키워드를 먼저 추가한 경우)
+_UNIQUE_VIOLATION = 1
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_HANGUL_SPACE_PATTERN = re.compile(r"(?<=[가-힣])\s+(?=[가-힣])")
+_SURROUNDING_CHARS = "\"'`“”‘’「」『』()[]{}<>#.,·!?:;"
+
+# 키워드 추가 (이미 있으면 무시)
+MERGE_KEYWORD_SQL = """
+    MERGE INTO keyword_dict k
+    USING (SELECT :name AS name FROM dual) s
+    ON (k.name = s.name)
+    WHEN NOT MATCHED THEN INSERT (name) VALUES (s.name)
+"""
+
+# 분석 결과 ↔ 키워드 연결
+INSERT_ANALYSIS_KEYWORD_SQL = """
+    INSERT INTO analysis_keyword (keyword_id, analysis_data_id)
+    VALUES (:keyword_id, :analysis_data_id)
+"""
+
+# 분석 결과의 키워드 연결 삭제 (재분석 시 교체)
+DELETE_ANALYSIS_KEYWORDS_SQL = """
+    DELETE FROM analysis_keyword
+    WHERE analysis_data_id = :analysis_data_id
+"""
+
+
+def select_keyword_ids_sql(count: int) -> str:
+    """
+    키워드 이름 → ID 조회 SQL
+
+    바인드 개수를 2의 거듭제곱으로 올려 SQL 문장 종류(파싱/커서 캐시 항목)를 줄입니다.
+    남는 바인드에는 None을 넘깁니다 (keyword_params_for_select 참고).
+    """
+    size = 1
+    while size < count:
+        size *= 2
+    binds = ", ".join(f":name{i}" for i in range(size))
+    return f"SELECT id, name FROM keyword_dict WHERE name IN ({binds})"
+
+
+def keyword_params_for_select(names: List[str]) -> dict:
+    """select_keyword_ids_sql 바인드 파라미터 생성"""
+    size = 1
+    while size < len(names):
+        size *= 2
+    padded = list(names) + [None] * (size - len(names))
+    return {f"name{i}": name for i, name in enumerate(padded)}
+
+
+def canonicalize_keyword(keyword: str) -> str:
+    """
+    키워드 표기 정규화
+
+    - 유니코드 정규화(NFKC), 앞뒤 공백/따옴표/괄호/'#' 등 제거, 연속 공백 합치기
+    - 한글 사이 공백 제거 ("무역 전쟁" → "무역전쟁")
+    - 라틴 문자 소문자화 ("NATO", "Nato" → "nato")
+
+    Returns:
+        정규화한 이름 (내용이 없으면 빈 문자열)
+    """
+    normalized = unicodedata.normalize("NFKC", keyword)
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip().strip(_SURROUNDING_CHARS).strip()
+    normalized = _HANGUL_SPACE_PATTERN.sub("", normalized).casefold()
+    return normalized[:MAX_KEYWORD_LENGTH]
+
+
+class KeywordIndex:
+    """
+    키워드 색인 기록/조회 도우미
+
+    키워드 이름 → keyword_dict.id를 프로세스 내 LRU로 캐시하여, 이미 본 키워드는 DB 조회 없이
+    analysis_keyword만 INSERT합니다. 처음 보는 키워드만 MERGE 1회(executemany) + SELECT 1회로 ID를 얻습니다.
+    커밋은 호출자가 처리하며, 새로 얻은 ID는 커밋이 성공한 뒤 호출자가 remember()로 캐시에 넣습니다
+    (롤백된 keyword_dict 행의 ID가 캐시에 남지 않도록 함).
+    """
+
+    def __init__(self, cache_size: Optional[int] = None, aliases: Optional[Dict[str, str]] = None):
+        self._cache_size = cache_size or KEYWORD_INDEX_CONFIG["cache_size"]
+        # 별칭은 정규화한 표기 기준으로 비교
+        self._aliases = {
+            canonicalize_keyword(variant): canonicalize_keyword(canonical)
+            for variant, canonical in (aliases if aliases is not None else KEYWORD_INDEX_CONFIG["aliases"]).items()
+        }
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def canonicalize(self, keyword: str) -> str:
+        """키워드 표기 정규화 (설정된 별칭 적용)"""
+        name = canonicalize_keyword(keyword)
+        return self._aliases.get(name, name)
+
+    def pairs(self, items: Iterable[Tuple[int, List[str]]]) -> List[Tuple[int, str]]:
+        """(analysis_data ID, 키워드 목록) → 중복 없는 (analysis_data ID, 정규화한 이름) 목록"""
+        pairs = []
+        for analysis_data_id, keywords in items:
+            seen = set()
+            for keyword in keywords:
+                name = self.canonicalize(keyword)
+                if name and name not in seen:
+                    seen.add(name)
+                    pairs.append((analysis_data_id, name))
+        return pairs
+
+    def write(self, connection, items: List[Tuple[int, List[str]]]) -> Dict[str, int]:
+        """
+        분석 결과의 키워드 연결 기록
+
+        Args:
+            connection: analysis_data를 INSERT한 연결 (같은 트랜잭션)
+            items: (analysis_data ID, 키워드 목록) 목록
+
+        Returns:
+            이번 트랜잭션에서 새로 조회한 키워드 이름 → ID (커밋 후 remember()에 넘김)
+        """
+        pairs = self.pairs(items)
+        if not pairs:
+            return {}
+
+        cursor = connection.cursor()
+        try:
+            keyword_ids = self._cached_ids([name for _, name in pairs])
+            missing = sorted({name for _, name in pairs if name not in keyword_ids})
+            if missing:
+                cursor.executemany(MERGE_KEYWORD_SQL, [{"name": name} for name in missing], batcherrors=True)
+                self._check_batch_errors(cursor.getbatcherrors())
+                cursor.execute(select_keyword_ids_sql(len(missing)), keyword_params_for_select(missing))
+                new_ids = self._to_ids(cursor.fetchall())
+                keyword_ids.update(new_ids)
+            else:
+                new_ids = {}
+
+            cursor.executemany(INSERT_ANALYSIS_KEYWORD_SQL, self._link_params(pairs, keyword_ids))
+            return new_ids
+        finally:
+            cursor.close()
+
+    async def write_async(self, connection, items: List[Tuple[int, List[str]]]) -> Dict[str, int]:
+        """write의 asyncio 버전 (AsyncConnection 사용)"""
+        pairs = self.pairs(items)
+        if not pairs:
+            return {}
+
+        cursor = connection.cursor()
+        try:
+            keyword_ids = self._cached_ids([name for _, name in pairs])
+            missing = sorted({name for _, name in pairs if name not in keyword_ids})
+            if missing:
+                await cursor.executemany(MERGE_KEYWORD_SQL, [{"name": name} for name in missing], batcherrors=True)
+                self._check_batch_errors(cursor.getbatcherrors())
+                await cursor.execute(select_keyword_ids_sql(len(missing)), keyword_params_for_select(missing))
+                new_ids = self._to_ids(await cursor.fetchall())
+                keyword_ids.update(new_ids)
+            else:
+                new_ids = {}
+
+            await cursor.executemany(INSERT_ANALYSIS_KEYWORD_SQL, self._link_params(pairs, keyword_ids))
+            return new_ids
+        finally:
+            cursor.close()
+
+    def replace(self, connection, items: List[Tuple[int, List[str]]]) -> Dict[str, int]:
+        """기존 키워드 연결을 지우고 다시 기록 (재분석 결과 반영용, 같은 트랜잭션, 반환값은 write와 같음)"""
+        if not items:
+            return {}
+
+        cursor = connection.cursor()
+        try:
+            cursor.executemany(
+                DELETE_ANALYSIS_KEYWORDS_SQL,
+                [{"analysis_data_id": analysis_data_id} for analysis_data_id, _ in items],
+            )
+        finally:
+            cursor.close()
+        return self.write(connection, items)
+
+    def lookup(self, cursor, keyword: str) -> Optional[int]:
+        """키워드 → keyword_dict.id (정규화 후 조회, 없으면 None)"""
+        name = self.canonicalize(keyword)
+        if not name:
+            return None
+
+        keyword_id = self._cached_ids([name]).get(name)
+        if keyword_id is None:
+            cursor.execute(select_keyword_ids_sql(1), keyword_params_for_select([name]))
+            # 커밋된 행만 조회되므로 바로 캐시
+            keyword_ids = self._to_ids(cursor.fetchall())
+            self.remember(keyword_ids)
+            keyword_id = keyword_ids.get(name)
+        return keyword_id
+
+    def remember(self, keyword_ids: Dict[str, int]):
+        """커밋된 키워드 ID를 캐시에 추가 (write/replace 결과를 커밋 성공 후 넘김)"""
+        if not keyword_ids:
+            return
+        with self._lock:
+            for name, keyword_id in keyword_ids.items():
+                self._cache[name] = keyword_id
+                self._cache.move_to_end(name)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _cached_ids(self, names: List[str]) -> Dict[str, int]:
+        with self._lock:
+            found = {}
+            for name in names:
+                keyword_id = self._cache.get(name)
+                if keyword_id is not None:
+                    self._cache.move_to_end(name)
+                    found[name] = keyword_id
+            return found
+
+    @staticmethod
+    def _to_ids(rows) -> Dict[str, int]:
+        return {name: int(keyword_id) for keyword_id, name in rows}
+
+    @staticmethod
+    def _check_batch_errors(errors):
+        """MERGE 배치 오류 확인 (동시에 추가된 키워드의 중복 키 오류만 무시)"""
+        unexpected = [error for error in errors if error.code != _UNIQUE_VIOLATION]
+        if unexpected:
+            raise oracledb.DatabaseError(unexpected[0])
+
+    @staticmethod
+    def _link_params(pairs: List[Tuple[int, str]], keyword_ids: Dict[str, int]) -> List[dict]:
+        missing = {name for _, name in pairs if name not in keyword_ids}
+        if missing:
+            # MERGE 직후 조회에서 빠질 수 없음 (발생하면 색인 누락으로 기록)
+            logger.warning("키워드 ID 조회 실패", keywords=sorted(missing))
+        return [
+            {"keyword_id": keyword_ids[name], "analysis_data_id": analysis_data_id}
+            for analysis_data_id, name in pairs
+            if name in keyword_ids
+        ]
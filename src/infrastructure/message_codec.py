@@ -0,0 +1,107 @@
+"""
+분석 결과 메시지 코덱
+
+출력 스트림에 발행하는 AnalysisMessage의 직렬화 형식을 정의합니다.
+XADD 필드는 {"format": 형식, "data": 본문}이며, 소비자는 format으로 디코딩 방법을 고릅니다.
+
+- json/1: AnalysisMessage.to_dict()의 JSON (format 필드가 없는 기존 메시지와 같은 본문)
+- msgpack/1: MESSAGE_FIELDS 순서의 값 배열을 MessagePack으로 인코딩 (필드 이름을 싣지 않음)
+
+필드를 추가/변경할 때는 기존 형식을 바꾸지 않고 새 버전(예: msgpack/2)을 추가하여 소비자가 옮겨 갈 수 있게 합니다.
+msgpack 형식 본문은 UTF-8 문자열이 아니므로 소비자는 decode_responses=False로 읽어야 합니다.
+"""
+
+import json
+from typing import Dict, Union
+
+from src.models.analysis_message import AnalysisMessage
+
+try:
+    import msgpack
+except ImportError:  # REDIS_OUTPUT_FORMAT=msgpack일 때만 필요
+    msgpack = None
+
+FORMAT_JSON = "json/1"
+FORMAT_MSGPACK = "msgpack/1"
+
+# REDIS_OUTPUT_FORMAT 값 → 현재 버전 형식
+FORMATS = {
+    "json": FORMAT_JSON,
+    "msgpack": FORMAT_MSGPACK,
+}
+
+# msgpack/1 배열 순서 (AnalysisMessage.to_dict() 키)
+MESSAGE_FIELDS = (
+    "id",
+    "raw_data_id",
+    "semantic_summary",
+    "display_summary",
+    "keywords",
+    "prompt_version",
+    "channel",
+    "original_link",
+    "published_at",
+)
+
+
+def resolve_format(name: str) -> str:
+    """
+    설정 이름(json, msgpack) 또는 버전 형식(json/1 등) → 발행 형식
+
+    Raises:
+        ValueError: 알 수 없는 형식이거나 msgpack 패키지가 없는 경우
+    """
+    message_format = FORMATS.get(name, name)
+    if message_format not in FORMATS.values():
+        raise ValueError(f"지원하지 않는 메시지 형식: {name}")
+    if message_format == FORMAT_MSGPACK and msgpack is None:
+        raise ValueError("msgpack 형식을 사용하려면 msgpack 패키지가 필요합니다")
+    return message_format
+
+
+def encode_analysis_message(analysis_message: AnalysisMessage, message_format: str = FORMAT_JSON) -> Dict[str, Union[str, bytes]]:
+    """
+    AnalysisMessage → XADD 필드
+
+    Args:
+        analysis_message: 발행할 분석 메시지
+        message_format: resolve_format()으로 얻은 형식
+
+    Returns:
+        {"format": 형식, "data": 본문}
+    """
+    message = analysis_message.to_dict()
+    if message_format == FORMAT_MSGPACK:
+        data = msgpack.packb([message[field] for field in MESSAGE_FIELDS], use_bin_type=True)
+    else:
+        data = json.dumps(message, ensure_ascii=False)
+    return {"format": message_format, "data": data}
+
+
+def decode_analysis_message(fields: dict) -> dict:
+    """
+    XADD 필드 → 메시지 딕셔너리 (AnalysisMessage.to_dict() 형태)
+
+    decode_responses 설정과 관계없이 문자열/바이트 필드를 모두 받으며,
+    format 필드가 없는 메시지는 기존 JSON 메시지로 처리합니다.
+
+    Raises:
+        ValueError: 알 수 없는 형식인 경우
+    """
+    fields = {_to_str(key): value for key, value in fields.items()}
+    message_format = _to_str(fields.get("format", FORMAT_JSON))
+    data = fields["data"]
+
+    if message_format == FORMAT_JSON:
+        return json.loads(data)
+    if message_format == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack 형식을 읽으려면 msgpack 패키지가 필요합니다")
+        if isinstance(data, str):
+            raise ValueError("msgpack 형식은 decode_responses=False로 읽어야 합니다")
+        return dict(zip(MESSAGE_FIELDS, msgpack.unpackb(data, raw=False)))
+    raise ValueError(f"지원하지 않는 메시지 형식: {message_format}")
+
+
+def _to_str(value: Union[str, bytes]) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -4,16 +4,135 @@
 Redis Streams로 메시지를 발행합니다.
 """
 
-import json
+import threading
+import time
+from typing import List, Optional, Tuple
 
 import redis
 
 from config.redis import REDIS_CONFIG
+from config.worker import BACKPRESSURE_CONFIG
+from src.infrastructure.message_codec import encode_analysis_message, resolve_format
 from src.logger import get_logger
+from src.metrics import DOWNSTREAM_BACKLOG, DOWNSTREAM_BACKPRESSURE_STATE, STAGE_DURATION
 from src.models.analysis_message import AnalysisMessage
 
 logger = get_logger("message_publisher")
 
+# 하위 레이어 적체 기반 수신 상태
+DOWNSTREAM_NORMAL = "normal"
+DOWNSTREAM_SLOW = "slow"
+DOWNSTREAM_PAUSED = "paused"
+
+# 상태 → 메트릭 값
+_DOWNSTREAM_STATE_VALUES = {
+    DOWNSTREAM_NORMAL: 0,
+    DOWNSTREAM_SLOW: 1,
+    DOWNSTREAM_PAUSED: 2,
+}
+
+
+def stream_trim_options() -> dict:
+    """
+    출력 스트림 XADD 자르기 옵션
+
+    REDIS_OUTPUT_MAXLEN이 있으면 MAXLEN ~, REDIS_OUTPUT_RETENTION_SECONDS가 있으면
+    보관 시간 이전 ID를 MINID ~로 자릅니다. 근사(~) 자르기는 매크로 노드 단위로만 지우므로
+    XADD마다 드는 비용이 거의 없습니다.
+    """
+    if REDIS_CONFIG["output_maxlen"] > 0:
+        return {"maxlen": REDIS_CONFIG["output_maxlen"], "approximate": True}
+    if REDIS_CONFIG["output_retention_seconds"] > 0:
+        min_id = int((time.time() - REDIS_CONFIG["output_retention_seconds"]) * 1000)
+        return {"minid": f"{min_id}-0", "approximate": True}
+    return {}
+
+
+class DownstreamBackpressure:
+    """
+    하위 레이어 적체 기반 백프레셔 상태
+
+    출력 스트림 Consumer Group의 적체(lag + pending)를 워터마크와 비교합니다.
+    - high_watermark 이상: paused (수신 중지)
+    - low_watermark 이하: normal
+    - 그 사이: slow (수신마다 지연), paused에서 내려오는 중이면 low_watermark까지 paused 유지
+    XINFO GROUPS 조회는 발행자가 하며, 이 클래스는 조회 주기와 상태 전환만 관리합니다.
+    """
+
+    def __init__(
+        self,
+        consumer_group: Optional[str] = None,
+        low_watermark: Optional[int] = None,
+        high_watermark: Optional[int] = None,
+        sample_interval: Optional[float] = None,
+    ):
+        self._consumer_group = consumer_group or BACKPRESSURE_CONFIG["consumer_group"]
+        self._low_watermark = low_watermark if low_watermark is not None else BACKPRESSURE_CONFIG["low_watermark"]
+        self._high_watermark = high_watermark if high_watermark is not None else BACKPRESSURE_CONFIG["high_watermark"]
+        self._sample_interval = (
+            sample_interval if sample_interval is not None else BACKPRESSURE_CONFIG["sample_interval"]
+        )
+        self._state = DOWNSTREAM_NORMAL
+        self._next_sample_at = 0.0
+        self._lock = threading.Lock()
+        DOWNSTREAM_BACKPRESSURE_STATE.set(_DOWNSTREAM_STATE_VALUES[self._state])
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (normal, slow, paused)"""
+        return self._state
+
+    def due(self) -> bool:
+        """조회 주기가 지났는지 확인 (True를 돌려주면 다음 주기로 넘어감)"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_sample_at:
+                return False
+            self._next_sample_at = now + self._sample_interval
+            return True
+
+    def update(self, groups: List[dict]) -> str:
+        """
+        XINFO GROUPS 결과로 상태 갱신
+
+        Args:
+            groups: 출력 스트림의 XINFO GROUPS 결과
+
+        Returns:
+            갱신된 상태
+        """
+        lag, pending = self._backlog(groups)
+        DOWNSTREAM_BACKLOG.labels("lag").set(lag)
+        DOWNSTREAM_BACKLOG.labels("pending").set(pending)
+
+        backlog = lag + pending
+        with self._lock:
+            previous = self._state
+            if backlog >= self._high_watermark:
+                state = DOWNSTREAM_PAUSED
+            elif backlog <= self._low_watermark:
+                state = DOWNSTREAM_NORMAL
+            elif previous == DOWNSTREAM_PAUSED:
+                state = DOWNSTREAM_PAUSED
+            else:
+                state = DOWNSTREAM_SLOW
+            self._state = state
+
+        DOWNSTREAM_BACKPRESSURE_STATE.set(_DOWNSTREAM_STATE_VALUES[state])
+        if state != previous:
+            logger.info("하위 레이어 적체 상태 변경", previous=previous, state=state, lag=lag, pending=pending)
+        return state
+
+    def _backlog(self, groups: List[dict]) -> Tuple[int, int]:
+        """(lag, pending) - 기준 그룹이 없으면 적체가 가장 큰 그룹"""
+        backlogs = [
+            # lag은 Redis 7+에서만 제공되며, 계산할 수 없으면 None
+            (int(group.get("lag") or 0), int(group["pending"]))
+            for group in groups
+            if not self._consumer_group or group["name"] == self._consumer_group
+        ]
+        return max(backlogs, key=sum, default=(0, 0))
+
 
 class MessagePublisher:
     """
@@ -22,27 +141,37 @@ class MessagePublisher:
     분석 결과를 다음 레이어로 전달합니다.
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[redis.Redis] = None):
         host = REDIS_CONFIG["host"]
         port = REDIS_CONFIG["port"]
         db = REDIS_CONFIG["db"]
 
-        self._client = redis.Redis(
+        self._client = client or redis.Redis(
             host=host,
             port=port,
             db=db,
             decode_responses=True,
         )
         self._stream = REDIS_CONFIG["output_stream"]
+        self._format = resolve_format(REDIS_CONFIG["output_format"])
+        self._backpressure = DownstreamBackpressure() if BACKPRESSURE_CONFIG["enabled"] else None
 
         # 연결 테스트
         try:
             self._client.ping()
-            logger.info("MessagePublisher 연결 성공", host=host, port=port, db=db)
+            logger.info(
+                "MessagePublisher 연결 성공",
+                host=host,
+                port=port,
+                db=db,
+                message_format=self._format,
+                trim=stream_trim_options(),
+            )
         except redis.ConnectionError as e:
             logger.error("MessagePublisher 연결 실패", error=str(e))
             raise
 
+    @STAGE_DURATION.labels("publish").time()
     def publish(self, analysis_message: AnalysisMessage) -> str:
         """
         분석 결과 발행
@@ -54,8 +183,11 @@ class MessagePublisher:
             발행된 메시지 ID
         """
         try:
-            message_json = json.dumps(analysis_message.to_dict(), ensure_ascii=False)
-            message_id = self._client.xadd(self._stream, {"data": message_json})
+            message_id = self._client.xadd(
+                self._stream,
+                encode_analysis_message(analysis_message, self._format),
+                **stream_trim_options(),
+            )
 
             logger.debug(
                 "메시지 발행 완료",
@@ -77,6 +209,63 @@ class MessagePublisher:
             )
             raise
 
+    @STAGE_DURATION.labels("publish").time()
+    def publish_many(self, analysis_messages: List[AnalysisMessage]) -> List[str]:
+        """
+        분석 결과 일괄 발행
+
+        파이프라인으로 XADD를 모아 왕복 1회로 발행합니다.
+
+        Args:
+            analysis_messages: 발행할 분석 메시지 목록
+
+        Returns:
+            입력 순서와 동일한 발행 메시지 ID 목록
+        """
+        if not analysis_messages:
+            return []
+
+        try:
+            trim_options = stream_trim_options()
+            pipeline = self._client.pipeline(transaction=False)
+            for analysis_message in analysis_messages:
+                pipeline.xadd(self._stream, encode_analysis_message(analysis_message, self._format), **trim_options)
+            message_ids = pipeline.execute()
+
+            logger.debug("메시지 일괄 발행 완료", count=len(message_ids))
+
+            return message_ids
+
+        except redis.RedisError as e:
+            logger.error(
+                "메시지 일괄 발행 실패",
+                error=str(e),
+                analysis_ids=[analysis_message.id for analysis_message in analysis_messages],
+            )
+            raise
+
+    def downstream_state(self) -> str:
+        """
+        하위 레이어 적체 상태 조회
+
+        DOWNSTREAM_SAMPLE_INTERVAL마다 출력 스트림의 XINFO GROUPS를 조회하고, 그 사이에는 마지막 상태를 돌려줍니다.
+        백프레셔가 꺼져 있으면 항상 normal입니다.
+
+        Returns:
+            normal, slow, paused
+        """
+        if self._backpressure is None:
+            return DOWNSTREAM_NORMAL
+        if self._backpressure.due():
+            try:
+                self._backpressure.update(self._client.xinfo_groups(self._stream))
+            except redis.ResponseError:
+                # 출력 스트림이 아직 없음
+                self._backpressure.update([])
+            except redis.RedisError as e:
+                logger.warning("하위 레이어 적체 조회 실패", error=str(e), state=self._backpressure.state)
+        return self._backpressure.state
+
     def close(self):
         """연결 종료"""
         self._client.close()
@@ -6,16 +6,108 @@ Redis Streams에서 메시지를 수신합니다.
 
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Collection, Dict, List, Optional, Tuple
 
 import redis
 
 from config.redis import REDIS_CONFIG
 from src.logger import get_logger
+from src.metrics import MESSAGES_DEAD_LETTERED
 from src.models.raw_data import RawData
 
 logger = get_logger("message_subscriber")
 
+# dead-letter 사유
+DEAD_LETTER_MAX_DELIVERIES = "max_deliveries"
+DEAD_LETTER_INVALID_PAYLOAD = "invalid_payload"
+
+
+def parse_message(message_id: str, data: dict) -> RawData:
+    """메시지 데이터를 RawData로 변환"""
+    # data 필드가 JSON 문자열인 경우 파싱
+    if "data" in data:
+        parsed = json.loads(data["data"])
+    else:
+        parsed = data
+
+    # datetime 필드 변환 (Z -> +00:00 변환)
+    if "published_at" in parsed and isinstance(parsed["published_at"], str):
+        published_at_str = parsed["published_at"].replace("Z", "+00:00")
+        parsed["published_at"] = datetime.fromisoformat(published_at_str)
+
+    return RawData(message_id=message_id, **parsed)
+
+
+def parse_messages(stream_messages: List[tuple]) -> Tuple[List[RawData], List[tuple]]:
+    """
+    메시지를 하나씩 RawData로 변환
+
+    잘못된 메시지 하나 때문에 함께 받은 메시지까지 처리하지 못하는 일이 없도록,
+    변환에 실패한 메시지는 따로 모아 돌려줍니다 (호출자가 dead-letter 처리).
+
+    Args:
+        stream_messages: [(message_id, {field: value})]
+
+    Returns:
+        (변환한 메시지 목록, 변환에 실패한 [(message_id, {field: value})])
+    """
+    parsed, invalid = [], []
+    for message_id, data in stream_messages:
+        try:
+            parsed.append(parse_message(message_id, data))
+        except (ValueError, TypeError) as e:
+            logger.error("메시지 파싱 실패", message_id=message_id, error=str(e), error_type=type(e).__name__)
+            invalid.append((message_id, data))
+    return parsed, invalid
+
+
+def dead_letter_fields(message_id: str, data: dict, times_delivered: int, group: str, reason: str) -> dict:
+    """dead-letter 스트림 XADD 필드 (원본 필드 + 원본 메시지 ID, 전달 횟수, Consumer Group, 사유)"""
+    return {
+        **data,
+        "source_message_id": message_id,
+        "times_delivered": str(times_delivered),
+        "consumer_group": group,
+        "reason": reason,
+    }
+
+
+def next_claim_cursor(entries: List[dict], count: int) -> str:
+    """
+    XPENDING 범위 조회 다음 시작 ID
+
+    count건을 다 채웠으면 마지막 ID 바로 다음부터 이어서 조회하고,
+    덜 채웠으면 PEL 끝까지 본 것이므로 처음("0-0")으로 돌아갑니다.
+    """
+    if len(entries) < count:
+        return "0-0"
+    ms, _, sequence = entries[-1]["message_id"].partition("-")
+    return f"{ms}-{int(sequence or 0) + 1}"
+
+
+def split_exhausted(
+    stream_messages: List[tuple],
+    delivery_counts: Dict[str, int],
+    max_deliveries: int,
+) -> Tuple[List[tuple], List[tuple]]:
+    """
+    회수한 메시지를 (처리할 메시지, 최대 전달 횟수를 넘긴 메시지)로 나눔
+
+    Args:
+        stream_messages: [(message_id, {field: value})]
+        delivery_counts: 메시지 ID → XPENDING times_delivered (이번 회수 포함)
+        max_deliveries: 최대 전달 횟수 (0이면 제한 없음)
+    """
+    if max_deliveries <= 0:
+        return stream_messages, []
+    retry, exhausted = [], []
+    for message in stream_messages:
+        if delivery_counts.get(message[0], 0) > max_deliveries:
+            exhausted.append(message)
+        else:
+            retry.append(message)
+    return retry, exhausted
+
 
 class MessageSubscriber:
     """
@@ -24,8 +116,8 @@ class MessageSubscriber:
     Consumer Group을 사용하여 메시지를 수신하고 ACK 처리합니다.
     """
 
-    def __init__(self):
-        self._client = redis.Redis(
+    def __init__(self, consumer_name: Optional[str] = None, client: Optional[redis.Redis] = None):
+        self._client = client or redis.Redis(
             host=REDIS_CONFIG["host"],
             port=REDIS_CONFIG["port"],
             db=REDIS_CONFIG["db"],
@@ -33,8 +125,10 @@ class MessageSubscriber:
         )
         self._stream = REDIS_CONFIG["input_stream"]
         self._group = REDIS_CONFIG["consumer_group"]
-        self._consumer = REDIS_CONFIG["consumer_name"]
+        self._consumer = consumer_name or REDIS_CONFIG["consumer_name"]
         self._block_timeout = REDIS_CONFIG["block_timeout"]
+        self._dead_letter_stream = REDIS_CONFIG["dead_letter_stream"]
+        self._claim_cursor = "0-0"
 
         self._ensure_consumer_group()
         logger.info(
@@ -67,41 +161,217 @@ class MessageSubscriber:
         Returns:
             RawData: 수신된 메시지, 타임아웃 시 None
         """
+        raw_data_list = self.receive_batch(1)
+        return raw_data_list[0] if raw_data_list else None
+
+    def receive_batch(self, count: int) -> List[RawData]:
+        """
+        메시지 일괄 수신 (blocking)
+
+        XREADGROUP 1회로 최대 count건을 읽어 한 번에 파싱합니다.
+
+        Args:
+            count: 최대 수신 건수
+
+        Returns:
+            수신된 메시지 목록, 타임아웃 시 빈 리스트
+        """
         messages = self._client.xreadgroup(
             groupname=self._group,
             consumername=self._consumer,
             streams={self._stream: ">"},
-            count=1,
+            count=count,
             block=self._block_timeout,
         )
 
         if not messages:
-            return None
+            return []
 
         # messages: [(stream_name, [(message_id, {field: value})])]
         stream_name, stream_messages = messages[0]
-        message_id, data = stream_messages[0]
 
-        logger.debug("메시지 수신", message_id=message_id)
+        logger.debug(
+            "메시지 수신",
+            count=len(stream_messages),
+            message_ids=[message_id for message_id, _ in stream_messages],
+        )
 
-        # JSON 파싱 및 RawData 변환
-        raw_data = self._parse_message(message_id, data)
-        return raw_data
+        # JSON 파싱 및 RawData 변환 (변환할 수 없는 메시지는 dead-letter 처리)
+        raw_data_list, invalid = parse_messages(stream_messages)
+        if invalid:
+            self._dead_letter(invalid, {}, DEAD_LETTER_INVALID_PAYLOAD)
+        return raw_data_list
 
-    def _parse_message(self, message_id: str, data: dict) -> RawData:
-        """메시지 데이터를 RawData로 변환"""
-        # data 필드가 JSON 문자열인 경우 파싱
-        if "data" in data:
-            parsed = json.loads(data["data"])
-        else:
-            parsed = data
+    def pending_count(self) -> int:
+        """
+        Consumer Group 전체의 Pending 메시지 수 조회 (XPENDING 요약)
+
+        Returns:
+            ACK되지 않은 메시지 수
+        """
+        summary = self._client.xpending(self._stream, self._group)
+        return int(summary["pending"])
 
-        # datetime 필드 변환 (Z -> +00:00 변환)
-        if "published_at" in parsed and isinstance(parsed["published_at"], str):
-            published_at_str = parsed["published_at"].replace("Z", "+00:00")
-            parsed["published_at"] = datetime.fromisoformat(published_at_str)
+    def claim_stale(
+        self,
+        min_idle_ms: int,
+        count: int,
+        max_deliveries: int = 0,
+        exclude_ids: Collection[str] = (),
+    ) -> List[RawData]:
+        """
+        오래 방치된 Pending 메시지 회수 (XPENDING IDLE + XCLAIM)
 
-        return RawData(message_id=message_id, **parsed)
+        다른 Consumer(종료된 워커 포함)가 min_idle_ms 이상 ACK하지 않은 메시지를
+        현재 Consumer로 가져옵니다. 호출마다 PEL을 이어서 스캔하고,
+        끝까지 스캔하면 처음부터 다시 시작합니다.
+        XPENDING으로 후보를 먼저 조회하여 exclude_ids를 빼고 나머지만 XCLAIM하므로,
+        이 프로세스에서 처리 중인 메시지는 전달 횟수가 늘지 않습니다.
+        전달 횟수(XPENDING times_delivered)가 max_deliveries를 넘긴 메시지는 처리하지 않고
+        dead-letter 스트림에 기록한 뒤 ACK합니다 (처리할 때마다 실패하는 메시지가 계속 회수되지 않도록 함).
+
+        Args:
+            min_idle_ms: 회수 대상 최소 유휴 시간 (밀리초)
+            count: 최대 회수 건수
+            max_deliveries: 최대 전달 횟수 (0이면 제한 없음)
+            exclude_ids: 이 프로세스에서 처리 중이거나 ACK 대기 중인 메시지 ID (XCLAIM하지 않음)
+
+        Returns:
+            회수한 메시지 목록
+        """
+        entries = self._client.xpending_range(
+            self._stream,
+            self._group,
+            min=self._claim_cursor,
+            max="+",
+            count=count,
+            idle=min_idle_ms,
+        )
+        self._claim_cursor = next_claim_cursor(entries, count)
+
+        message_ids = [entry["message_id"] for entry in entries if entry["message_id"] not in exclude_ids]
+        if not message_ids:
+            return []
+
+        # XCLAIM도 min_idle_ms를 확인하므로, 그 사이 다른 워커가 가져간 메시지는 응답에서 빠짐
+        stream_messages = self._client.xclaim(
+            self._stream,
+            self._group,
+            self._consumer,
+            min_idle_time=min_idle_ms,
+            message_ids=message_ids,
+        )
+        # 스트림에서 이미 삭제된 메시지는 본문 없이 응답될 수 있음
+        stream_messages = [(message_id, data) for message_id, data in stream_messages if message_id is not None and data]
+
+        # 이번 XCLAIM으로 전달 횟수가 1 늘어남
+        delivery_counts = {entry["message_id"]: int(entry["times_delivered"]) + 1 for entry in entries}
+        stream_messages, exhausted = split_exhausted(stream_messages, delivery_counts, max_deliveries)
+        if exhausted:
+            self._dead_letter(exhausted, delivery_counts, DEAD_LETTER_MAX_DELIVERIES)
+
+        claimed, invalid = parse_messages(stream_messages)
+        if invalid:
+            self._dead_letter(invalid, delivery_counts, DEAD_LETTER_INVALID_PAYLOAD)
+
+        if claimed:
+            logger.info(
+                "Pending 메시지 회수",
+                count=len(claimed),
+                message_ids=[raw_data.message_id for raw_data in claimed],
+            )
+        return claimed
+
+    def _dead_letter(self, stream_messages: List[tuple], delivery_counts: Dict[str, int], reason: str):
+        """
+        처리하지 않을 메시지를 dead-letter 스트림에 기록하고 ACK
+
+        Args:
+            stream_messages: [(message_id, {field: value})]
+            delivery_counts: 메시지 ID → 전달 횟수 (없으면 1, XREADGROUP으로 처음 받은 메시지)
+            reason: dead-letter 사유 (max_deliveries, invalid_payload)
+        """
+        message_ids = [message_id for message_id, _ in stream_messages]
+        times_delivered = [delivery_counts.get(message_id, 1) for message_id in message_ids]
+        pipeline = self._client.pipeline(transaction=True)
+        if self._dead_letter_stream:
+            for (message_id, data), delivered in zip(stream_messages, times_delivered):
+                pipeline.xadd(
+                    self._dead_letter_stream,
+                    dead_letter_fields(message_id, data, delivered, self._group, reason),
+                )
+        pipeline.xack(self._stream, self._group, *message_ids)
+        pipeline.execute()
+
+        MESSAGES_DEAD_LETTERED.labels(reason).inc(len(message_ids))
+        logger.error(
+            "메시지 dead-letter 처리",
+            reason=reason,
+            message_ids=message_ids,
+            times_delivered=times_delivered,
+            dead_letter_stream=self._dead_letter_stream or None,
+        )
+
+    def touch(self, message_ids: List[str]):
+        """
+        처리 중인 Pending 메시지의 유휴 시간 초기화 (XCLAIM JUSTID)
+
+        오래 걸리는 처리(배치 작업 등) 중에 다른 워커의 claim_stale()이 메시지를 회수하지 않도록
+        현재 Consumer로 다시 가져와 유휴 시간을 0으로 만듭니다.
+
+        Args:
+            message_ids: 현재 Consumer가 처리 중인 메시지 ID 목록
+        """
+        if not message_ids:
+            return
+
+        self._client.xclaim(
+            self._stream,
+            self._group,
+            self._consumer,
+            min_idle_time=0,
+            message_ids=message_ids,
+            justid=True,
+        )
+        logger.debug("Pending 메시지 유휴 시간 초기화", count=len(message_ids))
+
+    def is_claim_scan_complete(self) -> bool:
+        """PEL 스캔이 한 바퀴 끝났는지 여부"""
+        return self._claim_cursor == "0-0"
+
+    def group_backlog(self) -> Tuple[int, int]:
+        """
+        Consumer Group 적체량 조회 (XINFO GROUPS)
+
+        Returns:
+            (lag: 아직 전달되지 않은 메시지 수, pending: ACK되지 않은 메시지 수)
+        """
+        for group in self._client.xinfo_groups(self._stream):
+            if group["name"] == self._group:
+                # lag은 Redis 7+에서만 제공되며, 계산할 수 없으면 None
+                lag = group.get("lag")
+                return int(lag or 0), int(group["pending"])
+        return 0, 0
+
+    def consumer_pending_counts(self) -> Dict[str, int]:
+        """
+        Consumer별 Pending 메시지 수 조회 (XINFO CONSUMERS)
+
+        Returns:
+            Consumer 이름 → Pending 메시지 수
+        """
+        consumers = self._client.xinfo_consumers(self._stream, self._group)
+        return {consumer["name"]: int(consumer["pending"]) for consumer in consumers}
+
+    def delete_consumer(self, consumer_name: str):
+        """
+        Consumer 삭제 (XGROUP DELCONSUMER)
+
+        Pending 메시지가 남아 있는 Consumer를 삭제하면 해당 메시지가 유실되므로,
+        호출 전 consumer_pending_counts()로 비어 있는지 확인해야 합니다.
+        """
+        self._client.xgroup_delconsumer(self._stream, self._group, consumer_name)
+        logger.info("Consumer 삭제", consumer=consumer_name)
 
     def ack(self, message_id: str):
         """
@@ -113,6 +383,21 @@ class MessageSubscriber:
         self._client.xack(self._stream, self._group, message_id)
         logger.debug("메시지 ACK", message_id=message_id)
 
+    def ack_many(self, message_ids: List[str]):
+        """
+        메시지 일괄 처리 완료 확인
+
+        다중 ID XACK 1회로 전체 메시지를 ACK합니다.
+
+        Args:
+            message_ids: 처리 완료된 메시지 ID 목록
+        """
+        if not message_ids:
+            return
+
+        self._client.xack(self._stream, self._group, *message_ids)
+        logger.debug("메시지 일괄 ACK", count=len(message_ids))
+
     def close(self):
         """연결 종료"""
         self._client.close()
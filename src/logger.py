@@ -2,26 +2,205 @@
 구조화된 로깅 설정
 
 structlog를 사용하여 구조화된 로그를 제공합니다.
-JSON 형식으로 출력하여 나중에 분석하기 쉽게 합니다.
+콘솔 한 줄 형식 또는 JSON 형식으로 출력하며, 기본적으로 큐를 거쳐 별도 스레드에서 기록하여
+호출 스레드(메시지 처리 경로)가 stdout 쓰기를 기다리지 않도록 합니다.
 """
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
 from datetime import datetime
+from typing import Dict, List, Optional
 from zoneinfo import ZoneInfo
+
 import structlog
 
+from config.logger import LOG_CONFIG
+
+# 비동기 출력 상태 (setup_logging 재호출 및 fork 시 교체)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_settings: dict = {}
+
+
+class CustomConsoleRenderer:
+    """커스텀 로그 포맷: YYYY-MM-DD HH:MM:SS [level][logger] message"""
+
+    KST = ZoneInfo("Asia/Seoul")
+
+    def __call__(self, logger, method_name, event_dict):
+        # datetime 객체를 KST 문자열로 변환
+        for key, value in list(event_dict.items()):
+            if isinstance(value, datetime):
+                if value.tzinfo is not None:
+                    event_dict[key] = value.astimezone(self.KST).isoformat()
+                else:
+                    event_dict[key] = value.isoformat()
+
+        timestamp = event_dict.pop("timestamp", "")
+        level = event_dict.pop("level", "info").upper()
+        logger_name = event_dict.pop("logger", "")
+        event = event_dict.pop("event", "")
+
+        # 기본 로그 라인
+        log_line = f"{timestamp} [{level}][{logger_name}] {event}"
+
+        # 추가 컨텍스트가 있으면 key=value 형식으로 추가
+        if event_dict:
+            extras = " ".join(f"{k}={v}" for k, v in event_dict.items())
+            log_line = f"{log_line} {extras}"
+
+        return log_line
+
+
+class FieldTruncator:
+    """긴 문자열 필드(본문, 요약 등)를 max_chars자로 축약"""
+
+    def __init__(self, fields: List[str], max_chars: int):
+        self._fields = tuple(fields)
+        self._max_chars = max_chars
+
+    def __call__(self, logger, method_name, event_dict):
+        if self._max_chars <= 0:
+            return event_dict
+
+        for field in self._fields:
+            value = event_dict.get(field)
+            if isinstance(value, str) and len(value) > self._max_chars:
+                event_dict[field] = f"{value[:self._max_chars]}...(+{len(value) - self._max_chars}자)"
+        return event_dict
+
+
+class EventSampler:
+    """
+    이벤트별 샘플링
+
+    이벤트 이름별 비율(없으면 DEBUG 기본 비율)로 일부만 남기고 나머지는 렌더링 전에 버립니다.
+    남긴 로그에는 sample_rate를 붙여 집계 시 보정할 수 있도록 합니다.
+    """
+
+    def __init__(self, sample_rates: Dict[str, float], debug_sample_rate: float):
+        self._sample_rates = dict(sample_rates)
+        self._debug_sample_rate = debug_sample_rate
+
+    def __call__(self, logger, method_name, event_dict):
+        rate = self._sample_rates.get(event_dict.get("event"))
+        if rate is None:
+            rate = self._debug_sample_rate if method_name == "debug" else 1.0
+
+        if rate < 1.0:
+            if random.random() >= rate:
+                raise structlog.DropEvent
+            event_dict["sample_rate"] = rate
+        return event_dict
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 호출 스레드를 막지 않고 로그를 버리는 QueueHandler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 출력 스레드가 처리하므로 복사/사전 포맷 없이 그대로 전달
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
 
-def setup_logging(level: str = "DEBUG"):
+def _json_dumps(event_dict, **kwargs) -> str:
+    """한글을 그대로 두는 JSON 직렬화 (datetime 등은 문자열로 변환)"""
+    return json.dumps(event_dict, ensure_ascii=False, default=str)
+
+
+def _stop_listener():
+    """
+    비동기 출력 스레드 종료 (큐에 남은 로그를 모두 기록)
+
+    종료 후에는 루트 로거가 출력 핸들러로 바로 기록하도록 되돌려, 이후 로그(atexit 이후 등)가
+    멈춘 큐에 쌓여 사라지지 않게 합니다. 큐 초과로 버려진 로그 수는 이 경로로 남깁니다.
+    """
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+
+    dropped = _queue_handler.dropped if _queue_handler is not None else 0
+    _listener = None
+    _queue_handler = None
+
+    if dropped:
+        get_logger("logger").warning("큐 초과로 버려진 로그", dropped=dropped)
+
+
+def _restart_after_fork():
+    """fork된 자식 프로세스에서 비동기 출력 스레드 재시작"""
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    # 부모의 출력 스레드는 자식에 없으므로 큐/스레드를 새로 만듦
+    _listener = None
+    _queue_handler = None
+    setup_logging(**_settings)
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    async_output: Optional[bool] = None,
+):
     """
     structlog 로깅 설정
 
     Args:
-        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL, 기본값 LOG_LEVEL)
+        log_format: 출력 형식 (console, json, 기본값 LOG_FORMAT)
+        async_output: 큐 + 별도 스레드 출력 여부 (기본값 LOG_ASYNC)
     """
-    # 표준 logging 레벨 설정
+    global _listener, _queue_handler, _settings
+
+    level = level or LOG_CONFIG["level"]
+    log_format = log_format or LOG_CONFIG["format"]
+    async_output = LOG_CONFIG["async"] if async_output is None else async_output
+    _settings = {"level": level, "log_format": log_format, "async_output": async_output}
+
+    _stop_listener()
+
+    # 표준 logging 레벨 및 출력 설정 (structlog가 렌더링한 문자열을 그대로 출력)
+    formatter = logging.Formatter("%(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    if async_output:
+        _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=LOG_CONFIG["queue_size"]))
+        _queue_handler.setFormatter(formatter)
+        _listener = logging.handlers.QueueListener(_queue_handler.queue, stream_handler)
+        _listener.start()
+        handler = _queue_handler
+    else:
+        handler = stream_handler
+
     logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
+        handlers=[handler],
         level=getattr(logging, level.upper()),
         force=True,  # 기존 설정 덮어쓰기
     )
@@ -30,51 +209,34 @@ def setup_logging(level: str = "DEBUG"):
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-    # 커스텀 포맷터 정의
-    class CustomConsoleRenderer:
-        """커스텀 로그 포맷: YYYY-MM-DD HH:MM:SS [level][logger] message"""
-
-        KST = ZoneInfo("Asia/Seoul")
-
-        def __call__(self, logger, method_name, event_dict):
-            # datetime 객체를 KST 문자열로 변환
-            for key, value in list(event_dict.items()):
-                if isinstance(value, datetime):
-                    if value.tzinfo is not None:
-                        event_dict[key] = value.astimezone(self.KST).isoformat()
-                    else:
-                        event_dict[key] = value.isoformat()
-
-            timestamp = event_dict.pop("timestamp", "")
-            level = event_dict.pop("level", "info").upper()
-            logger_name = event_dict.pop("logger", "")
-            event = event_dict.pop("event", "")
-
-            # 기본 로그 라인
-            log_line = f"{timestamp} [{level}][{logger_name}] {event}"
-
-            # 추가 컨텍스트가 있으면 key=value 형식으로 추가
-            if event_dict:
-                extras = " ".join(f"{k}={v}" for k, v in event_dict.items())
-                log_line = f"{log_line} {extras}"
-
-            return log_line
+    if log_format == "json":
+        timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
+        renderer = structlog.processors.JSONRenderer(serializer=_json_dumps)
+    else:
+        timestamper = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S %z", utc=False)
+        renderer = CustomConsoleRenderer()
 
     # structlog 설정
     structlog.configure(
         processors=[
+            # 레벨 미달 로그는 렌더링 전에 버림
+            structlog.stdlib.filter_by_level,
+            # 이벤트별 샘플링
+            EventSampler(LOG_CONFIG["sample_rates"], LOG_CONFIG["debug_sample_rate"]),
             # 로그 레벨 추가
             structlog.stdlib.add_log_level,
             # 로거 이름 추가
             structlog.stdlib.add_logger_name,
-            # 타임스탬프 추가 (간결한 포맷)
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S %z", utc=False),
+            # 긴 필드 축약
+            FieldTruncator(LOG_CONFIG["truncate_fields"], LOG_CONFIG["max_field_chars"]),
+            # 타임스탬프 추가
+            timestamper,
             # 스택 정보 추가 (에러 발생 시)
             structlog.processors.StackInfoRenderer(),
             # 예외 정보 포매팅
             structlog.processors.format_exc_info,
-            # 커스텀 포맷터
-            CustomConsoleRenderer(),
+            # 출력 형식
+            renderer,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -94,3 +256,8 @@ def get_logger(name: str = None):
         structlog.BoundLogger: 구조화된 로거 인스턴스
     """
     return structlog.get_logger(name)
+
+
+# 종료 시 큐에 남은 로그 기록, fork 시 자식 프로세스의 출력 스레드 재시작
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_after_fork)
@@ -0,0 +1,400 @@
+"""
+워커 메트릭
+
+단계별 지연 히스토그램과 처리 카운터를 프로세스 메모리에 모으고,
+Prometheus 텍스트 형식으로 노출하는 HTTP 엔드포인트를 제공합니다.
+"""
+
+import abc
+import bisect
+import threading
+import time
+from contextlib import ContextDecorator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.logger import get_logger
+
+logger = get_logger("metrics")
+
+# 지연 시간 버킷 (초): XREADGROUP 수 ms ~ Gemini 수십 초
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# LLM 요청/응답 크기 버킷 (바이트)
+PAYLOAD_BUCKETS = (256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+# 메시지 1건의 LLM 토큰 수 버킷
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = "") -> str:
+    """{name="value",...} 형식의 레이블 문자열"""
+    pairs = [
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in zip(labelnames, labelvalues)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(abc.ABC):
+    """
+    메트릭 공통 기반
+
+    레이블 값 조합마다 시계열 상태를 따로 보관합니다. 레이블이 없는 메트릭은
+    빈 조합 하나를 사용하고, labels()는 조합이 고정된 _BoundMetric을 돌려줍니다.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._bound: Dict[Tuple[str, ...], "_BoundMetric"] = {}
+        if not self.labelnames:
+            self._series[()] = self._new_state()
+
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *labelvalues: str) -> "_BoundMetric":
+        """레이블 값 조합에 고정된 메트릭 (처음 요청 시 생성)"""
+        key = tuple(str(value) for value in labelvalues)
+        bound = self._bound.get(key)
+        if bound is None:
+            with self._lock:
+                if key not in self._series:
+                    self._series[key] = self._new_state()
+                bound = self._bound.setdefault(key, _BoundMetric(self, key))
+        return bound
+
+    @abc.abstractmethod
+    def _new_state(self) -> list:
+        """레이블 조합 하나의 초기 상태"""
+
+    @abc.abstractmethod
+    def _samples(self, labelvalues: Tuple[str, ...], state: list) -> List[str]:
+        """레이블 조합 하나의 Prometheus 샘플 줄"""
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            series = [(labelvalues, list(state)) for labelvalues, state in self._series.items()]
+        for labelvalues, state in series:
+            lines.extend(self._samples(labelvalues, state))
+        return "\n".join(lines)
+
+
+class _BoundMetric:
+    """레이블 값 조합이 고정된 메트릭 (Metric.labels() 반환값)"""
+
+    def __init__(self, metric: _Metric, labelvalues: Tuple[str, ...]):
+        self._metric = metric
+        self._labelvalues = labelvalues
+
+    def inc(self, amount: float = 1.0):
+        self._metric._add(self._labelvalues, amount)
+
+    def dec(self, amount: float = 1.0):
+        self._metric._add(self._labelvalues, -amount)
+
+    def set(self, value: float):
+        self._metric._set(self._labelvalues, value)
+
+    def observe(self, value: float):
+        self._metric._observe(self._labelvalues, value)
+
+    def time(self) -> "_Timer":
+        return _Timer(self)
+
+
+class _Timer(ContextDecorator):
+    """Histogram.time()이 돌려주는 구간 측정기 (with 문 또는 데코레이터로 사용)"""
+
+    def __init__(self, target):
+        self._target = target
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._target.observe(time.perf_counter() - self._started)
+        return False
+
+    def _recreate_cm(self):
+        # 데코레이터로 쓰일 때 호출마다 새 측정기 사용 (스레드 간 시작 시각 공유 방지)
+        return _Timer(self._target)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def _new_state(self) -> list:
+        return [0.0]
+
+    def _add(self, labelvalues: Tuple[str, ...], amount: float):
+        with self._lock:
+            self._series[labelvalues][0] += amount
+
+    def inc(self, amount: float = 1.0):
+        """amount만큼 증가"""
+        self._add((), amount)
+
+    def value(self, *labelvalues: str) -> float:
+        """현재 값"""
+        return self._series[tuple(labelvalues)][0]
+
+    def _samples(self, labelvalues: Tuple[str, ...], state: list) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {state[0]}"]
+
+
+class Gauge(Counter):
+    """증감 가능한 현재 값"""
+
+    type_name = "gauge"
+
+    def _set(self, labelvalues: Tuple[str, ...], value: float):
+        with self._lock:
+            self._series[labelvalues][0] = value
+
+    def set(self, value: float):
+        self._set((), value)
+
+    def dec(self, amount: float = 1.0):
+        self._add((), -amount)
+
+
+class Histogram(_Metric):
+    """
+    누적 버킷 히스토그램
+
+    observe()는 버킷 위치 탐색(bisect)과 덧셈 두 번만 수행합니다.
+    상태는 [버킷별 개수..., +Inf 개수, 합계] 형태로 보관합니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry=None,
+    ):
+        self._buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_state(self) -> list:
+        return [0] * (len(self._buckets) + 1) + [0.0]
+
+    def _observe(self, labelvalues: Tuple[str, ...], value: float):
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            state = self._series[labelvalues]
+            state[index] += 1
+            state[-1] += value
+
+    def observe(self, value: float):
+        """값 1개 기록"""
+        self._observe((), value)
+
+    def time(self) -> _Timer:
+        """구간 소요 시간(초)을 기록하는 컨텍스트 매니저/데코레이터"""
+        return _Timer(self)
+
+    def count(self, *labelvalues: str) -> int:
+        """기록된 값 개수"""
+        return sum(self._series[tuple(labelvalues)][:-1])
+
+    def _samples(self, labelvalues: Tuple[str, ...], state: list) -> List[str]:
+        lines = []
+        cumulative = 0
+        bounds = [repr(float(bound)) for bound in self._buckets] + ["+Inf"]
+        for le, count in zip(bounds, state[:-1]):
+            cumulative += count
+            labels = _format_labels(self.labelnames, labelvalues, f'le="{le}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {state[-1]}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """프로세스 내 메트릭 목록"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        """등록된 모든 메트릭의 Prometheus 텍스트 형식 출력"""
+        with self._lock:
+            metrics = list(self._metrics)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# 워커 메트릭 정의
+
+STAGE_DURATION = Histogram(
+    "analysis_stage_duration_seconds",
+    "단계별 소요 시간 (receive, llm, db, publish, ack)",
+    labelnames=("stage",),
+)
+MESSAGES_PROCESSED = Counter(
+    "analysis_messages_processed_total",
+    "처리 완료(ACK 대상) 메시지 수",
+)
+MESSAGES_FAILED = Counter(
+    "analysis_messages_failed_total",
+    "처리 실패(ACK 보류) 메시지 수",
+)
+MESSAGES_DEAD_LETTERED = Counter(
+    "analysis_messages_dead_lettered_total",
+    "ACK 후 dead-letter 처리한 메시지 수 (max_deliveries: 최대 전달 횟수 초과, invalid_payload: 파싱 실패)",
+    labelnames=("reason",),
+)
+IN_FLIGHT = Gauge(
+    "analysis_in_flight_messages",
+    "처리 중인 메시지 수",
+)
+LLM_PAYLOAD_BYTES = Histogram(
+    "analysis_llm_payload_bytes",
+    "Gemini 요청/응답 본문 크기 (UTF-8 바이트)",
+    labelnames=("direction",),
+    buckets=PAYLOAD_BUCKETS,
+)
+LLM_TOKENS = Histogram(
+    "analysis_llm_tokens",
+    "메시지 1건 분석에 사용한 Gemini 입력/출력 토큰 수 (usage_metadata 기준)",
+    labelnames=("direction",),
+    buckets=TOKEN_BUCKETS,
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "analysis_llm_request_seconds",
+    "Gemini 요청 1건의 응답 시간 (primary: 첫 요청, hedge: 헤지 요청, 취소된 요청은 취소 시점까지)",
+    labelnames=("attempt",),
+)
+LLM_CALL_SECONDS = Histogram(
+    "analysis_llm_call_seconds",
+    "헤징 적용 후 호출자가 실제로 기다린 시간 (primary 분포와 비교하여 꼬리 지연 개선 확인)",
+)
+LLM_HEDGE_REQUESTS = Counter(
+    "analysis_llm_hedge_requests_total",
+    "헤지 요청 수 (fired: 추가 호출, won: 헤지 응답이 먼저 도착, budget_exhausted: 예산 부족으로 생략)",
+    labelnames=("result",),
+)
+LLM_MODEL_REQUESTS = Counter(
+    "analysis_llm_model_requests_total",
+    "모델별 Gemini 요청 결과 (success, failure: 시간 초과/5xx)",
+    labelnames=("model", "result"),
+)
+LLM_MODEL_FAILOVERS = Counter(
+    "analysis_llm_model_failovers_total",
+    "시간 초과/5xx로 대체 모델에 다시 요청한 횟수",
+    labelnames=("from_model", "to_model"),
+)
+LLM_RESPONSE_PARSES = Counter(
+    "analysis_llm_response_parses_total",
+    "Gemini 응답 검증 결과 (valid, repaired: 로컬 복구, reasked: 재요청 후 성공, failed)",
+    labelnames=("result",),
+)
+LLM_CHUNKED_MESSAGES = Counter(
+    "analysis_llm_chunked_messages_total",
+    "입력 토큰 상한을 넘어 구간별 요약 후 분석한 메시지 수",
+)
+CACHE_LOOKUPS = Counter(
+    "analysis_cache_lookups_total",
+    "분석 결과 캐시 조회 결과 (tier: local, redis / result: hit, miss - redis는 local 미스일 때만 조회)",
+    labelnames=("tier", "result"),
+)
+NEAR_DUPLICATE_CHECKS = Counter(
+    "analysis_near_duplicate_checks_total",
+    "유사 본문 필터 조회 결과 (hit: LLM 호출 생략, miss, skipped: 짧은 본문)",
+    labelnames=("result",),
+)
+BATCH_JOB_ITEMS = Counter(
+    "analysis_batch_job_items_total",
+    "배치 작업 항목 처리 결과 (batched: 배치 응답 사용, fallback: 단건 분석으로 대체, direct: 소량이라 바로 단건 분석, failed: ACK 보류)",
+    labelnames=("result",),
+)
+
+DOWNSTREAM_BACKPRESSURE_STATE = Gauge(
+    "analysis_downstream_backpressure_state",
+    "하위 레이어 적체 기반 수신 상태 (0: normal, 1: slow, 2: paused)",
+)
+DOWNSTREAM_BACKLOG = Gauge(
+    "analysis_downstream_backlog_messages",
+    "출력 스트림 Consumer Group 적체 (lag: 아직 전달되지 않은 메시지, pending: ACK되지 않은 메시지)",
+    labelnames=("kind",),
+)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 요청 처리"""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프마다 접근 로그를 남기지 않음
+        pass
+
+
+class MetricsServer:
+    """
+    메트릭 HTTP 엔드포인트
+
+    데몬 스레드에서 /metrics를 제공합니다. 처리 경로와 스레드를 공유하지 않으므로
+    스크레이프는 렌더링 중 메트릭 잠금을 잠깐 잡는 것 외에 워커에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, port: int, host: str = "0.0.0.0", registry: Optional[MetricsRegistry] = None):
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or REGISTRY})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+
+    @property
+    def port(self) -> int:
+        """실제 바인딩된 포트 (port=0이면 임의 포트)"""
+        return self._server.server_address[1]
+
+    def start(self):
+        """백그라운드 스레드로 서버 시작"""
+        self._thread.start()
+        logger.info("메트릭 엔드포인트 시작", port=self.port)
+
+    def close(self):
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+        logger.info("메트릭 엔드포인트 종료")
@@ -25,6 +25,7 @@ class AnalysisData(BaseModel):
     display_summary: str = Field(..., description="사용자용 한국어 요약")
     keywords: List[str] = Field(..., description="핵심 키워드 목록")
     prompt_version: str = Field(..., description="분석에 사용된 프롬프트 버전")
+    model_name: Optional[str] = Field(None, description="분석에 사용된 모델")
 
     def to_dict(self) -> dict:
         """메시지 발행용 딕셔너리 변환"""
@@ -5,11 +5,16 @@
 원본 데이터의 메타정보를 함께 전달합니다.
 """
 
+import json
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from src.models.analysis_data import AnalysisData
+from src.models.raw_data import RawData
+
 
 class AnalysisMessage(BaseModel):
     """
@@ -31,6 +36,21 @@ class AnalysisMessage(BaseModel):
     original_link: Optional[str] = Field(None, description="원본 링크")
     published_at: Optional[datetime] = Field(None, description="원본 발행 시각")
 
+    @classmethod
+    def from_analysis_data(cls, analysis_data: AnalysisData, raw_data: RawData) -> "AnalysisMessage":
+        """메시지 모델 생성 (DB 모델 + 원본 메타정보)"""
+        return cls(
+            id=analysis_data.id,
+            raw_data_id=analysis_data.raw_data_id,
+            semantic_summary=analysis_data.semantic_summary,
+            display_summary=analysis_data.display_summary,
+            keywords=analysis_data.keywords,
+            prompt_version=analysis_data.prompt_version,
+            channel=raw_data.channel,
+            original_link=raw_data.link,
+            published_at=raw_data.published_at,
+        )
+
     def to_dict(self) -> dict:
         """메시지 발행용 딕셔너리 변환"""
         return {
@@ -44,3 +64,45 @@ class AnalysisMessage(BaseModel):
             "original_link": self.original_link,
             "published_at": self.published_at.isoformat() if self.published_at else None,
         }
+
+
+class AnalysisMessageRecord(BaseModel):
+    """
+    저장된 분석 결과 조회 레코드
+
+    대량 조회(Database.iter_analysis_messages)용 모델입니다. keywords는 DB의 JSON 문자열 그대로 보관하고
+    처음 접근할 때 디코딩하므로, 키워드를 쓰지 않는 조회에서는 디코딩 비용이 들지 않습니다.
+    """
+
+    id: int = Field(..., description="분석 결과 고유 ID")
+    raw_data_id: int = Field(..., description="원본 데이터 ID")
+    semantic_summary: str = Field(..., description="중복 제거용 영어 요약")
+    display_summary: str = Field(..., description="사용자용 한국어 요약")
+    keywords_json: str = Field(..., description="핵심 키워드 목록 (JSON 배열 문자열)")
+    prompt_version: str = Field(..., description="분석에 사용된 프롬프트 버전")
+    model_name: Optional[str] = Field(None, description="분석에 사용된 모델")
+    created_at: Optional[datetime] = Field(None, description="분석 결과 생성 시각")
+
+    # 원본 데이터 정보
+    channel: Optional[str] = Field(None, description="수집 채널")
+    original_link: Optional[str] = Field(None, description="원본 링크")
+    published_at: Optional[datetime] = Field(None, description="원본 발행 시각")
+
+    @cached_property
+    def keywords(self) -> List[str]:
+        """핵심 키워드 목록 (첫 접근 시 디코딩)"""
+        return json.loads(self.keywords_json)
+
+    def to_analysis_message(self) -> AnalysisMessage:
+        """발행용 메시지 모델 변환"""
+        return AnalysisMessage(
+            id=self.id,
+            raw_data_id=self.raw_data_id,
+            semantic_summary=self.semantic_summary,
+            display_summary=self.display_summary,
+            keywords=self.keywords,
+            prompt_version=self.prompt_version,
+            channel=self.channel,
+            original_link=self.original_link,
+            published_at=self.published_at,
+        )
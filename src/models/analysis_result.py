@@ -4,9 +4,29 @@
 LLM 분석 결과를 담는 데이터 구조입니다.
 """
 
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# analysis_data.semantic_summary 컬럼 크기 (VARCHAR2(1000), 바이트 단위)
+SEMANTIC_SUMMARY_MAX_BYTES = 1000
+
+
+def clamp_text(text: str, max_bytes: int) -> str:
+    """
+    UTF-8 바이트 수 상한에 맞춰 텍스트 축약
+
+    상한을 넘으면 단어 경계(공백)에서 자릅니다.
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+
+    clamped = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    boundary = clamped.rfind(" ")
+    if boundary > len(clamped) // 2:
+        clamped = clamped[:boundary]
+    return clamped.rstrip()
 
 
 class AnalysisResult(BaseModel):
@@ -27,3 +47,12 @@ class AnalysisResult(BaseModel):
 
     # 프롬프트 버전
     prompt_version: str = Field(..., description="분석에 사용된 프롬프트 버전")
+
+    # 분석 모델 (캐시/유사 본문 재사용 결과는 원래 분석한 모델)
+    model_name: Optional[str] = Field(None, description="분석에 사용된 모델")
+
+    @field_validator("semantic_summary")
+    @classmethod
+    def _clamp_semantic_summary(cls, value: str) -> str:
+        # LLM이 길이 지시를 어기더라도 DB 컬럼 크기를 넘지 않도록 축약
+        return clamp_text(value, SEMANTIC_SUMMARY_MAX_BYTES)
@@ -0,0 +1,33 @@
+"""
+LLM 응답 모델
+
+Gemini 요청의 response_schema로 전달하고, 응답 JSON을 검증하는 데이터 구조입니다.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class AnalysisResponse(BaseModel):
+    """
+    단건 분석 응답
+
+    AnalysisResult에서 LLM이 생성하는 필드만 담습니다 (prompt_version은 서비스에서 채움).
+    """
+
+    semantic_summary: str = Field(..., description="English factual summary for duplicate detection, max 1000 chars")
+    display_summary: str = Field(..., description="Korean objective summary, 3-5 sentences")
+    keywords: List[str] = Field(..., description="Korean keywords, 1-5 items, excluding Trump himself")
+
+
+class BatchAnalysisItem(AnalysisResponse):
+    """묶음 분석 응답 항목"""
+
+    index: int = Field(..., description="Index of the input item this result belongs to")
+
+
+class ChunkNotes(BaseModel):
+    """긴 본문 구간 요약 응답"""
+
+    notes: str = Field(..., description="English factual notes for this section, max 1500 chars")
@@ -0,0 +1,118 @@
+"""
+Outbox Relay
+
+analysis_outbox에 기록된 미발행 메시지를 Redis Streams로 발행합니다.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from config.worker import OUTBOX_CONFIG
+from src.infrastructure.database import Database
+from src.infrastructure.message_publisher import MessagePublisher
+from src.logger import get_logger
+
+logger = get_logger("outbox_relay")
+
+
+class OutboxRelay:
+    """
+    Outbox Relay
+
+    Worker가 analysis_data와 같은 트랜잭션으로 기록한 outbox 행을 batch_size건씩 읽어
+    파이프라인으로 XADD한 뒤 발행 완료로 표시합니다.
+    - 미발행 행이 남아 있으면 쉬지 않고 다음 묶음을 발행합니다.
+    - Redis/DB 장애 시 행은 미발행 상태로 남고, 다음 주기에 다시 발행합니다.
+    - XADD 후 완료 표시 전에 종료되면 같은 메시지가 다시 발행될 수 있습니다 (at-least-once).
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        message_publisher: MessagePublisher,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self._database = database
+        self._message_publisher = message_publisher
+        self._batch_size = max(1, batch_size or OUTBOX_CONFIG["batch_size"])
+        self._poll_interval = poll_interval if poll_interval is not None else OUTBOX_CONFIG["poll_interval"]
+        self._retention_hours = OUTBOX_CONFIG["retention_hours"]
+        self._purge_interval = OUTBOX_CONFIG["purge_interval"]
+        self._next_purge_at = 0.0
+
+        self._shutdown = False
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        logger.info(
+            "OutboxRelay 초기화 완료",
+            batch_size=self._batch_size,
+            poll_interval=self._poll_interval,
+        )
+
+    def run(self):
+        """
+        발행 루프
+
+        종료 요청이 올 때까지 미발행 outbox를 발행하고, 종료 시 남은 행을 한 번 더 발행합니다.
+        """
+        logger.info("OutboxRelay 시작")
+
+        while not self._shutdown:
+            published = self._relay_once()
+            self._purge()
+            if published < self._batch_size:
+                # 밀린 행이 없으면 poll_interval 대기
+                self._wakeup.wait(self._poll_interval)
+
+        # 종료 직전 Worker가 커밋한 행 발행
+        while self._relay_once() == self._batch_size:
+            pass
+
+        logger.info("OutboxRelay 종료")
+
+    def _relay_once(self) -> int:
+        """
+        미발행 outbox 1묶음 발행
+
+        Returns:
+            발행한 건수 (실패 시 0)
+        """
+        try:
+            return self._database.publish_outbox(self._batch_size, self._message_publisher.publish_many)
+        except Exception as e:
+            # 실패한 행은 미발행 상태로 남아 다음 주기에 재시도
+            logger.warning("outbox 발행 실패, 재시도 예정", error=str(e), error_type=type(e).__name__)
+            self._wakeup.wait(self._poll_interval)
+            return 0
+
+    def _purge(self):
+        """purge_interval마다 보관 기간이 지난 발행 완료 행 삭제"""
+        now = time.monotonic()
+        if now < self._next_purge_at:
+            return
+        self._next_purge_at = now + self._purge_interval
+
+        try:
+            self._database.purge_outbox(self._retention_hours)
+        except Exception as e:
+            logger.warning("outbox 정리 실패", error=str(e), error_type=type(e).__name__)
+
+    def start(self):
+        """백그라운드 스레드로 발행 루프 시작"""
+        self._thread = threading.Thread(target=self.run, name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """종료 요청 후 백그라운드 스레드 종료 대기"""
+        self.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+
+    def shutdown(self):
+        """종료 요청"""
+        logger.info("OutboxRelay 종료 요청")
+        self._shutdown = True
+        self._wakeup.set()
@@ -0,0 +1,220 @@
+"""
+분석 결과 캐시
+
+동일한 본문에 대한 LLM 재호출을 막기 위해 분석 결과를 캐싱합니다.
+"""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import redis
+
+from config.llm import CACHE_CONFIG, LLM_CONFIG
+from config.redis import REDIS_CONFIG
+from src.logger import get_logger
+from src.metrics import CACHE_LOOKUPS
+from src.models.analysis_result import AnalysisResult
+from src.services.prompts import ANALYSIS_PROMPT
+
+logger = get_logger("analysis_cache")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_content(content: str) -> str:
+    """
+    캐시 키 생성용 본문 정규화
+
+    유니코드 정규화(NFKC) 후 연속 공백을 하나로 합치고 앞뒤 공백을 제거합니다.
+    """
+    normalized = unicodedata.normalize("NFKC", content)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+class AnalysisCache:
+    """
+    분석 결과 캐시
+
+    정규화된 본문, 프롬프트 버전, 모델명의 해시를 키로 사용합니다.
+    모델명은 호출자가 넘긴 모델(라우팅된 모델)이며, 넘기지 않으면 LLM_MODEL_NAME을 사용합니다.
+    프로세스 내 LRU(1차)와 Redis 공유 캐시(2차)의 2단 구조이며,
+    캐시 장애는 분석 흐름을 막지 않도록 미스로 처리합니다.
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None, shared_enabled: Optional[bool] = None):
+        self._model_name = LLM_CONFIG["model_name"]
+        self._prompt_version = ANALYSIS_PROMPT.VERSION
+
+        # 1차: 프로세스 내 LRU
+        self._local: "OrderedDict[str, Tuple[float, AnalysisResult]]" = OrderedDict()
+        self._local_max_size = CACHE_CONFIG["local_max_size"]
+        self._local_ttl = CACHE_CONFIG["local_ttl"]
+        self._lock = threading.Lock()
+
+        # 2차: Redis 공유 캐시
+        if shared_enabled is None:
+            shared_enabled = CACHE_CONFIG["shared_enabled"]
+        self._shared_ttl = CACHE_CONFIG["shared_ttl"]
+        self._key_prefix = REDIS_CONFIG["cache_key_prefix"]
+        self._client = None
+        if shared_enabled:
+            self._client = client or redis.Redis(
+                host=REDIS_CONFIG["host"],
+                port=REDIS_CONFIG["port"],
+                db=REDIS_CONFIG["db"],
+                decode_responses=True,
+            )
+
+        # 히트/미스 카운터
+        self._local_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._errors = 0
+
+        logger.info(
+            "AnalysisCache 초기화 완료",
+            local_max_size=self._local_max_size,
+            shared_enabled=self._client is not None,
+        )
+
+    def make_key(self, content: str, model_name: Optional[str] = None) -> str:
+        """본문 + 프롬프트 버전 + 모델명으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        for part in (model_name or self._model_name or "", self._prompt_version, normalize_content(content)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, content: str, model_name: Optional[str] = None) -> Optional[AnalysisResult]:
+        """
+        캐시 조회
+
+        Args:
+            content: 분석할 본문 내용
+            model_name: 이번에 분석할 모델 (None이면 기본 모델)
+
+        Returns:
+            캐시된 분석 결과, 없으면 None
+        """
+        key = self.make_key(content, model_name)
+
+        result = self._get_local(key)
+        if result is not None:
+            with self._lock:
+                self._local_hits += 1
+            CACHE_LOOKUPS.labels("local", "hit").inc()
+            logger.debug("캐시 히트 (local)", key=key[:16])
+            return result
+        CACHE_LOOKUPS.labels("local", "miss").inc()
+
+        result = self._get_shared(key)
+        if result is not None:
+            self._put_local(key, result)
+            with self._lock:
+                self._shared_hits += 1
+            CACHE_LOOKUPS.labels("redis", "hit").inc()
+            logger.debug("캐시 히트 (shared)", key=key[:16])
+            return result
+        if self._client is not None:
+            CACHE_LOOKUPS.labels("redis", "miss").inc()
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, content: str, result: AnalysisResult, model_name: Optional[str] = None):
+        """
+        캐시 저장
+
+        Args:
+            content: 분석한 본문 내용
+            result: 분석 결과
+            model_name: 분석한 모델 (None이면 result.model_name, 그것도 없으면 기본 모델)
+        """
+        key = self.make_key(content, model_name or result.model_name)
+        self._put_local(key, result)
+        self._put_shared(key, result)
+
+    def stats(self) -> dict:
+        """히트/미스 카운터 조회"""
+        with self._lock:
+            return {
+                "local_hits": self._local_hits,
+                "shared_hits": self._shared_hits,
+                "misses": self._misses,
+                "errors": self._errors,
+                "local_size": len(self._local),
+            }
+
+    def _get_local(self, key: str) -> Optional[AnalysisResult]:
+        """프로세스 내 LRU 조회 (만료 항목은 제거)"""
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+
+            self._local.move_to_end(key)
+            return result
+
+    def _put_local(self, key: str, result: AnalysisResult):
+        """프로세스 내 LRU 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._local[key] = (time.monotonic() + self._local_ttl, result)
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_size:
+                self._local.popitem(last=False)
+
+    def _get_shared(self, key: str) -> Optional[AnalysisResult]:
+        """Redis 공유 캐시 조회"""
+        if self._client is None:
+            return None
+
+        try:
+            cached = self._client.get(f"{self._key_prefix}:{key}")
+        except redis.RedisError as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning("공유 캐시 조회 실패", error=str(e))
+            return None
+
+        if cached is None:
+            return None
+
+        try:
+            return AnalysisResult.model_validate_json(cached)
+        except ValueError as e:
+            # 손상된 항목은 미스로 처리 (새 분석 결과로 덮어씀)
+            logger.warning("공유 캐시 항목 파싱 실패", error=str(e))
+            return None
+
+    def _put_shared(self, key: str, result: AnalysisResult):
+        """Redis 공유 캐시 저장"""
+        if self._client is None:
+            return
+
+        try:
+            self._client.set(
+                f"{self._key_prefix}:{key}",
+                result.model_dump_json(),
+                ex=self._shared_ttl,
+            )
+        except redis.RedisError as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning("공유 캐시 저장 실패", error=str(e))
+
+    def close(self):
+        """연결 종료"""
+        if self._client is not None:
+            self._client.close()
+        logger.info("AnalysisCache 종료", **self.stats())
@@ -0,0 +1,148 @@
+"""
+배치 작업 어댑터
+
+JSONL 요청 파일을 배치 예측 작업으로 제출하고, 상태를 조회하고, 결과 JSONL을 내려받습니다.
+실제 Gemini Batch API 대신 로컬에서 요청을 처리하는 어댑터로 바꿔 끼울 수 있습니다.
+
+요청 파일 한 줄: {"key": 메시지 ID, "request": GenerateContentRequest}
+결과 파일 한 줄: {"key": 메시지 ID, "response": GenerateContentResponse} 또는 {"key": ..., "error": {...}}
+"""
+
+import json
+import os
+import shutil
+import uuid
+from typing import Callable, Dict, Optional
+
+from google import genai
+from google.genai import types
+
+from config.llm import LLM_CONFIG
+from src.logger import get_logger
+
+logger = get_logger("batch_adapter")
+
+# 배치 작업 상태 (어댑터 공통)
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Gemini 작업 상태 → 공통 상태 (그 외 상태는 진행 중)
+_GEMINI_STATES = {
+    "JOB_STATE_SUCCEEDED": JOB_SUCCEEDED,
+    "JOB_STATE_PARTIALLY_SUCCEEDED": JOB_SUCCEEDED,
+    "JOB_STATE_FAILED": JOB_FAILED,
+    "JOB_STATE_CANCELLED": JOB_FAILED,
+    "JOB_STATE_EXPIRED": JOB_FAILED,
+}
+
+
+class BatchAdapter:
+    """배치 작업 어댑터 인터페이스"""
+
+    def submit(self, request_file: str, display_name: str) -> str:
+        """
+        요청 JSONL 파일로 배치 작업 제출
+
+        Returns:
+            작업 이름 (상태 조회/결과 다운로드에 사용)
+        """
+        raise NotImplementedError
+
+    def status(self, job_name: str) -> str:
+        """작업 상태 조회 (JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED)"""
+        raise NotImplementedError
+
+    def download(self, job_name: str, result_file: str):
+        """완료된 작업의 결과 JSONL을 result_file에 저장"""
+        raise NotImplementedError
+
+
+class GeminiBatchAdapter(BatchAdapter):
+    """
+    Gemini Batch API 어댑터
+
+    요청 파일을 File API로 올려 batches.create로 제출하고, 결과 파일을 File API로 내려받습니다.
+    """
+
+    def __init__(self, client: Optional[genai.Client] = None, model_name: Optional[str] = None):
+        self._client = client or genai.Client(api_key=LLM_CONFIG["api_key"])
+        self._model_name = model_name or LLM_CONFIG["model_name"]
+
+    def submit(self, request_file: str, display_name: str) -> str:
+        uploaded = self._client.files.upload(
+            file=request_file,
+            config=types.UploadFileConfig(display_name=display_name, mime_type="jsonl"),
+        )
+        job = self._client.batches.create(
+            model=self._model_name,
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name=display_name),
+        )
+        logger.info("Gemini 배치 작업 제출", job_name=job.name, request_file=request_file)
+        return job.name
+
+    def status(self, job_name: str) -> str:
+        job = self._client.batches.get(name=job_name)
+        state = job.state.name if job.state is not None else "JOB_STATE_UNSPECIFIED"
+        if state in ("JOB_STATE_FAILED", "JOB_STATE_EXPIRED") and job.error is not None:
+            logger.error("Gemini 배치 작업 실패", job_name=job_name, state=state, error=str(job.error))
+        return _GEMINI_STATES.get(state, JOB_RUNNING)
+
+    def download(self, job_name: str, result_file: str):
+        job = self._client.batches.get(name=job_name)
+        if job.dest is None or job.dest.file_name is None:
+            raise RuntimeError(f"배치 작업 결과 파일 없음: {job_name}")
+
+        content = self._client.files.download(file=job.dest.file_name)
+        with open(result_file, "wb") as f:
+            f.write(content)
+
+
+class LocalBatchAdapter(BatchAdapter):
+    """
+    로컬 배치 어댑터
+
+    제출 시 요청마다 handler를 호출하여 결과 파일을 바로 만듭니다 (테스트, 로컬 실행용).
+    handler가 예외를 발생시킨 요청은 error 줄로 기록합니다.
+    """
+
+    def __init__(self, handler: Callable[[dict], dict], work_dir: str):
+        self._handler = handler
+        self._work_dir = work_dir
+        self._submitted: Dict[str, int] = {}
+
+    def submit(self, request_file: str, display_name: str) -> str:
+        job_name = f"local-{display_name}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self._work_dir, exist_ok=True)
+
+        count = 0
+        with open(request_file, encoding="utf-8") as requests, \
+                open(self._result_path(job_name), "w", encoding="utf-8") as results:
+            for line in requests:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                try:
+                    output = {"key": entry["key"], "response": self._handler(entry["request"])}
+                except Exception as e:
+                    output = {"key": entry["key"], "error": {"message": str(e)}}
+                results.write(json.dumps(output, ensure_ascii=False) + "\n")
+                count += 1
+
+        self._submitted[job_name] = count
+        return job_name
+
+    def status(self, job_name: str) -> str:
+        return JOB_SUCCEEDED if os.path.exists(self._result_path(job_name)) else JOB_FAILED
+
+    def download(self, job_name: str, result_file: str):
+        shutil.copyfile(self._result_path(job_name), result_file)
+
+    @property
+    def submitted(self) -> Dict[str, int]:
+        """제출된 작업 이름 → 요청 수"""
+        return dict(self._submitted)
+
+    def _result_path(self, job_name: str) -> str:
+        return os.path.join(self._work_dir, f"{job_name}.results.jsonl")
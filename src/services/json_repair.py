@@ -0,0 +1,79 @@
+"""
+JSON 응답 복구
+
+형식이 조금 어긋난 LLM 응답(코드 펜스, 앞뒤 설명 문구, 후행 쉼표, 잘린 괄호)을
+재요청 없이 로컬에서 고쳐 봅니다.
+"""
+
+import re
+from typing import Optional
+
+_FENCE_PATTERN = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def repair_json(text: str) -> Optional[str]:
+    """
+    거의 올바른 JSON 문자열 복구
+
+    - 코드 펜스(```json ... ```) 제거
+    - 첫 '{' 또는 '[' 앞, 짝이 맞는 마지막 괄호 뒤의 문구 제거
+    - 닫는 괄호 앞의 후행 쉼표 제거
+    - 응답이 잘린 경우 열린 문자열/괄호를 닫음
+
+    Args:
+        text: LLM 응답 본문
+
+    Returns:
+        복구한 JSON 문자열 (JSON 시작 문자가 없으면 None). 결과가 유효한 JSON이라는 보장은 없습니다.
+    """
+    if not text:
+        return None
+
+    text = _FENCE_PATTERN.sub("", text.strip())
+    starts = [position for position in (text.find("{"), text.find("[")) if position >= 0]
+    if not starts:
+        return None
+    text = text[min(starts):]
+
+    # 문자열/이스케이프를 고려해 괄호 짝 추적
+    stack = []
+    in_string = False
+    escaped = False
+    end = None
+    for position, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+        elif char in "}]":
+            if stack and stack[-1] == char:
+                stack.pop()
+            if not stack:
+                end = position + 1
+                break
+
+    if end is not None:
+        # 최상위 값이 닫힌 뒤의 문구 제거
+        text = text[:end]
+    else:
+        # 잘린 응답: 열린 문자열과 괄호를 닫음
+        if escaped:
+            text = text[:-1]
+        if in_string:
+            text += '"'
+        text = text.rstrip().rstrip(",")
+        text += "".join(reversed(stack))
+
+    return _TRAILING_COMMA_PATTERN.sub(r"\1", text)
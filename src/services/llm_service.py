@@ -4,80 +4,953 @@ LLM 서비스
 Gemini API를 호출하여 분석을 수행합니다.
 """
 
+import asyncio
 import json
+import math
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from pydantic import BaseModel, ValidationError
 
-from config.llm import LLM_CONFIG
+from config.llm import BATCH_CONFIG, LLM_CONFIG, LONG_CONTENT_CONFIG, MODEL_ROUTING_CONFIG, RATE_LIMIT_CONFIG
 from src.logger import get_logger
+from src.metrics import (
+    LLM_CHUNKED_MESSAGES,
+    LLM_PAYLOAD_BYTES,
+    LLM_RESPONSE_PARSES,
+    LLM_TOKENS,
+    STAGE_DURATION,
+)
 from src.models.analysis_result import AnalysisResult
-from src.services.prompts import ANALYSIS_PROMPT
+from src.models.llm_response import AnalysisResponse, BatchAnalysisItem, ChunkNotes
+from src.services.analysis_cache import AnalysisCache
+from src.services.json_repair import repair_json
+from src.services.model_router import ModelRouter, is_failover_error
+from src.services.near_duplicate_filter import NearDuplicateFilter
+from src.services.prompts import (
+    ANALYSIS_PROMPT,
+    BATCH_ANALYSIS_PROMPT,
+    CHUNK_NOTES_HEADER,
+    CHUNK_SUMMARY_PROMPT,
+    REASK_PROMPT,
+)
+from src.services.rate_limiter import RateLimiter, is_rate_limit_error
+from src.services.request_hedger import RequestHedger
 
 logger = get_logger("llm_service")
 
+_PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+")
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    입력 토큰 수 추정
+
+    ASCII 문자는 약 4자당 1토큰, 그 외 문자(한글 등)는 1자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def split_content(text: str, max_tokens: int) -> List[str]:
+    """
+    긴 본문을 토큰 상한 이하의 구간으로 분할
+
+    문단(빈 줄) → 문장 → 글자 순으로 경계를 찾고, 상한 안에서 순서대로 이어 붙입니다.
+
+    Args:
+        text: 분할할 본문
+        max_tokens: 구간 1개의 최대 토큰 수 (추정치)
+
+    Returns:
+        원문 순서를 유지한 구간 목록
+    """
+    pieces = []
+    for paragraph in _PARAGRAPH_BOUNDARY.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+
+        for sentence in _SENTENCE_BOUNDARY.split(paragraph):
+            if estimate_tokens(sentence) <= max_tokens:
+                pieces.append(sentence)
+            else:
+                # 문장 경계가 없는 긴 덩어리는 글자 수로 자름 (1자 = 최대 1토큰)
+                pieces.extend(sentence[i:i + max_tokens] for i in range(0, len(sentence), max_tokens))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = estimate_tokens(piece)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current = []
+            current_tokens = 0
+        current.append(piece)
+        current_tokens += tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+class _AnalysisContext:
+    """메시지 1건(묶음 분석은 요청 1건) 분석 중의 호출 상태"""
+
+    def __init__(self, route: List[str]):
+        # 시도할 모델 순서 (시간 초과/5xx 시 다음 모델로 전환)
+        self.route = route
+        # 호출별 (입력, 출력) 토큰 수
+        self.usages: List[Tuple[int, int]] = []
+        # 마지막으로 응답한 모델
+        self.model_name: Optional[str] = None
+
 
 class LLMService:
     """
     LLM 분석 서비스
 
     Gemini API를 호출하여 콘텐츠를 분석합니다.
+    캐시가 주어지면 동일 본문은 LLM 호출 없이 캐시된 결과를 반환하고,
+    유사 본문 필터가 주어지면 리포스트처럼 거의 같은 본문도 이전 분석 결과를 재사용합니다.
+    속도 제한기가 주어지면 RPM/TPM 한도와 동시성 한도 안에서 호출하고,
+    헤징이 주어지면 응답이 늦은 요청에 같은 요청을 하나 더 보내 먼저 온 응답을 사용합니다.
+    입력 토큰 상한을 넘는 긴 본문은 구간별로 나눠 동시에 요약한 뒤, 요약을 모아 한 번 더 분석합니다.
+    모델 라우터가 주어지면 메시지마다 본문 길이/채널/모델 상태로 모델을 고르고,
+    시간 초과나 5xx 응답이면 대체 모델로 전환합니다.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[AnalysisCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        client: Optional[genai.Client] = None,
+        near_duplicate_filter: Optional[NearDuplicateFilter] = None,
+        request_hedger: Optional[RequestHedger] = None,
+        model_router: Optional[ModelRouter] = None,
+    ):
         self._model_name = LLM_CONFIG["model_name"]
-        self._client = genai.Client(api_key=LLM_CONFIG["api_key"])
+        self._client = client or genai.Client(api_key=LLM_CONFIG["api_key"])
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._near_duplicate_filter = near_duplicate_filter
+        self._request_hedger = request_hedger
+        self._model_router = model_router
 
         # API 키 유효성 확인
         self._verify_connection()
 
         logger.info("LLMService 초기화 완료", model=self._model_name)
 
+    @property
+    def cache(self) -> Optional[AnalysisCache]:
+        """주입된 분석 결과 캐시"""
+        return self._cache
+
+    @property
+    def near_duplicate_filter(self) -> Optional[NearDuplicateFilter]:
+        """주입된 유사 본문 필터"""
+        return self._near_duplicate_filter
+
+    @property
+    def request_hedger(self) -> Optional[RequestHedger]:
+        """주입된 요청 헤징"""
+        return self._request_hedger
+
+    @property
+    def model_router(self) -> Optional[ModelRouter]:
+        """주입된 모델 라우터"""
+        return self._model_router
+
+    def _route(self, content: str, channel: Optional[str] = None) -> List[str]:
+        """메시지 1건에 시도할 모델 순서 (라우터가 없으면 기본 모델만)"""
+        if self._model_router is None:
+            return [self._model_name]
+        return self._model_router.route(content, channel)
+
+    def _lookup(self, content: str, channel: Optional[str] = None) -> Optional[AnalysisResult]:
+        """
+        캐시 → 유사 본문 순으로 재사용할 분석 결과 조회
+
+        캐시는 지금 라우팅될 모델(시도 순서의 첫 모델)의 결과만 찾습니다.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(content, self._route(content, channel)[0])
+            if cached is not None:
+                return cached
+
+        if self._near_duplicate_filter is not None:
+            similar = self._near_duplicate_filter.find(content)
+            if similar is not None:
+                # 다음 동일 본문은 캐시에서 바로 찾도록 등록 (원래 분석한 모델 기준)
+                if self._cache is not None:
+                    self._cache.put(content, similar)
+                return similar
+
+        return None
+
+    def _remember(self, content: str, analysis_result: AnalysisResult):
+        """새로 분석한 결과를 캐시(실제 분석한 모델 기준)와 유사 본문 필터에 등록"""
+        if self._cache is not None:
+            self._cache.put(content, analysis_result)
+        if self._near_duplicate_filter is not None:
+            self._near_duplicate_filter.add(content, analysis_result)
+
     def _verify_connection(self):
-        """API 키 유효성 확인"""
+        """
+        API 키 유효성 확인
+
+        verify_mode가 get이면 사용할 모델 1건만 조회하고(요청 1회), list이면 전체 모델 목록을
+        모두 조회합니다. lazy이면 확인하지 않고 첫 분석 요청의 응답으로 대신합니다.
+        """
+        verify_mode = LLM_CONFIG["verify_mode"]
+        if verify_mode == "lazy":
+            logger.debug("Gemini API 연결 확인 생략 (첫 호출 시 확인)")
+            return
+
+        started = time.perf_counter()
         try:
-            list(self._client.models.list())
-            logger.debug("Gemini API 연결 확인 완료")
+            if verify_mode == "list":
+                list(self._client.models.list())
+            else:
+                self._client.models.get(model=self._model_name)
+            logger.debug(
+                "Gemini API 연결 확인 완료",
+                verify_mode=verify_mode,
+                elapsed=round(time.perf_counter() - started, 3),
+            )
         except Exception as e:
-            logger.error("Gemini API 연결 실패", error=str(e))
+            logger.error("Gemini API 연결 실패", error=str(e), verify_mode=verify_mode)
             raise
 
-    def analyze(self, content: str) -> AnalysisResult:
+    def analyze(self, content: str, channel: Optional[str] = None) -> AnalysisResult:
         """
         콘텐츠 분석
 
         Args:
             content: 분석할 본문 내용
+            channel: 수집 채널 (모델 라우팅에 사용)
+
+        Returns:
+            분석 결과
+        """
+        cached = self._lookup(content, channel)
+        if cached is not None:
+            return cached
+
+        analysis_result = self._generate(content, channel)
+        self._remember(content, analysis_result)
+
+        return analysis_result
+
+    async def analyze_async(self, content: str, channel: Optional[str] = None) -> AnalysisResult:
+        """
+        콘텐츠 분석 (asyncio)
+
+        비동기 Gemini 클라이언트(client.aio)를 사용하며, 동작은 analyze()와 같습니다.
+
+        Args:
+            content: 분석할 본문 내용
+            channel: 수집 채널 (모델 라우팅에 사용)
 
         Returns:
             분석 결과
         """
+        # 공유 캐시/인덱스(Redis) 조회가 이벤트 루프를 막지 않도록 스레드에서 실행
+        cached = await asyncio.to_thread(self._lookup, content, channel)
+        if cached is not None:
+            return cached
+
+        analysis_result = await self._generate_async(content, channel)
+
+        await asyncio.to_thread(self._remember, content, analysis_result)
+
+        return analysis_result
+
+    def _request_config(self, system_instruction: str, response_schema) -> types.GenerateContentConfig:
+        """
+        generate_content 요청 설정 (응답을 response_schema 형식의 JSON으로 제한)
+
+        모델 라우터가 있으면 요청 시간 제한을 두어, 응답이 없는 모델에서 대체 모델로 전환할 수 있게 합니다.
+        """
+        http_options = None
+        if self._model_router is not None:
+            http_options = types.HttpOptions(timeout=int(MODEL_ROUTING_CONFIG["request_timeout"] * 1000))
+
+        return types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            response_mime_type="application/json",
+            response_schema=response_schema,
+            http_options=http_options,
+        )
+
+    def _estimate_request_tokens(self, contents: str, system_instruction: str) -> int:
+        """요청 1회의 예상 토큰 수 (입력 + 예상 출력)"""
+        return (
+            estimate_tokens(system_instruction)
+            + estimate_tokens(contents)
+            + RATE_LIMIT_CONFIG["estimated_output_tokens"]
+        )
+
+    def _retry_delay(self, attempt: int) -> float:
+        """쿼터 초과 재시도 대기 시간 (지수 증가, 최대 60초)"""
+        return min(60.0, RATE_LIMIT_CONFIG["retry_base_delay"] * (2 ** attempt))
+
+    def _send(
+        self,
+        model_name: str,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+    ) -> types.GenerateContentResponse:
+        """
+        generate_content 요청 1회
+
+        헤징이 있으면 응답이 늦을 때 같은 요청을 하나 더 보냅니다. 헤지 요청은 속도 제한기의
+        예약을 따로 하지 않으며, 추가 호출 비율은 헤징 예산(budget_ratio)으로 제한합니다.
+        llm 단계 시간은 이 요청 구간만 기록합니다 (캐시 조회, 속도 제한 대기 제외).
+        """
+        config = self._request_config(system_instruction, response_schema)
+
+        def request() -> types.GenerateContentResponse:
+            return self._client.models.generate_content(model=model_name, contents=contents, config=config)
+
+        with STAGE_DURATION.labels("llm").time():
+            if self._request_hedger is None:
+                return request()
+            return self._request_hedger.call(request)
+
+    async def _send_async(
+        self,
+        model_name: str,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+    ) -> types.GenerateContentResponse:
+        """generate_content 요청 1회 (asyncio, 동작은 _send와 같음)"""
+        config = self._request_config(system_instruction, response_schema)
+
+        def request() -> Awaitable[types.GenerateContentResponse]:
+            return self._client.aio.models.generate_content(model=model_name, contents=contents, config=config)
+
+        with STAGE_DURATION.labels("llm").time():
+            if self._request_hedger is None:
+                return await request()
+            return await self._request_hedger.call_async(request)
+
+    def _call_model(
+        self,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+        context: _AnalysisContext,
+    ) -> types.GenerateContentResponse:
+        """
+        generate_content 호출 (모델 전환 포함)
+
+        context.route 순서대로 모델을 시도하며, 시간 초과/5xx이면 다음 모델로 전환합니다.
+        """
+        LLM_PAYLOAD_BYTES.labels("request").observe(len(contents.encode("utf-8")))
+
+        for position, model_name in enumerate(context.route):
+            started = time.monotonic()
+            try:
+                response = self._call_model_with_limits(model_name, contents, system_instruction, response_schema)
+            except Exception as e:
+                if not self._handle_model_failure(context, position, e, time.monotonic() - started):
+                    raise
+                continue
+
+            self._handle_model_success(context, model_name, time.monotonic() - started)
+            return response
+
+    async def _call_model_async(
+        self,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+        context: _AnalysisContext,
+    ) -> types.GenerateContentResponse:
+        """generate_content 호출 (asyncio, 동작은 _call_model과 같음)"""
+        LLM_PAYLOAD_BYTES.labels("request").observe(len(contents.encode("utf-8")))
+
+        for position, model_name in enumerate(context.route):
+            started = time.monotonic()
+            try:
+                response = await self._call_model_with_limits_async(
+                    model_name, contents, system_instruction, response_schema
+                )
+            except Exception as e:
+                if not self._handle_model_failure(context, position, e, time.monotonic() - started):
+                    raise
+                continue
+
+            self._handle_model_success(context, model_name, time.monotonic() - started)
+            return response
+
+    def _handle_model_success(self, context: _AnalysisContext, model_name: str, elapsed: float):
+        """모델 응답 성공 기록"""
+        context.model_name = model_name
+        if self._model_router is not None:
+            self._model_router.record(model_name, elapsed, succeeded=True)
+
+    def _handle_model_failure(self, context: _AnalysisContext, position: int, error: Exception, elapsed: float) -> bool:
+        """
+        모델 호출 실패 처리
+
+        Returns:
+            다음 모델로 전환하면 True, 예외를 그대로 발생시켜야 하면 False
+        """
+        if self._model_router is None or not is_failover_error(error):
+            return False
+
+        model_name = context.route[position]
+        self._model_router.record(model_name, elapsed, succeeded=False)
+        if position + 1 >= len(context.route):
+            return False
+
+        next_model = context.route[position + 1]
+        logger.warning(
+            "모델 응답 실패, 대체 모델로 전환",
+            model=model_name,
+            next_model=next_model,
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+        self._model_router.record_failover(model_name, next_model)
+        return True
+
+    def _call_model_with_limits(
+        self,
+        model_name: str,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+    ) -> types.GenerateContentResponse:
+        """
+        모델 1개에 generate_content 호출
+
+        속도 제한기가 있으면 한도 안에서 호출하고, 쿼터 초과(429) 응답은
+        지수 백오프로 max_retries회까지 재시도합니다.
+        """
+        if self._rate_limiter is None:
+            return self._send(model_name, contents, system_instruction, response_schema)
+
+        estimated_tokens = self._estimate_request_tokens(contents, system_instruction)
+        attempt = 0
+        while True:
+            try:
+                with self._rate_limiter.limit(estimated_tokens):
+                    return self._send(model_name, contents, system_instruction, response_schema)
+            except errors.APIError as e:
+                if not is_rate_limit_error(e) or attempt >= RATE_LIMIT_CONFIG["max_retries"]:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning("Gemini 쿼터 초과, 재시도 대기", attempt=attempt + 1, delay=delay)
+                time.sleep(delay)
+                attempt += 1
+
+    async def _call_model_with_limits_async(
+        self,
+        model_name: str,
+        contents: str,
+        system_instruction: str,
+        response_schema,
+    ) -> types.GenerateContentResponse:
+        """모델 1개에 generate_content 호출 (asyncio, 동작은 _call_model_with_limits와 같음)"""
+        if self._rate_limiter is None:
+            return await self._send_async(model_name, contents, system_instruction, response_schema)
+
+        estimated_tokens = self._estimate_request_tokens(contents, system_instruction)
+        attempt = 0
+        while True:
+            try:
+                async with self._rate_limiter.limit_async(estimated_tokens):
+                    return await self._send_async(model_name, contents, system_instruction, response_schema)
+            except errors.APIError as e:
+                if not is_rate_limit_error(e) or attempt >= RATE_LIMIT_CONFIG["max_retries"]:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning("Gemini 쿼터 초과, 재시도 대기", attempt=attempt + 1, delay=delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _response_text(self, response: types.GenerateContentResponse) -> str:
+        """응답 본문 (크기를 메트릭에 기록)"""
+        text = response.text or ""
+        LLM_PAYLOAD_BYTES.labels("response").observe(len(text.encode("utf-8")))
+        return text
+
+    def _usage(self, response: types.GenerateContentResponse) -> Tuple[int, int]:
+        """응답의 입력/출력 토큰 수 (usage_metadata가 없으면 0)"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return 0, 0
+        return usage.prompt_token_count or 0, usage.candidates_token_count or 0
+
+    def _record_usage(self, usages: List[Tuple[int, int]], items: int = 1):
+        """
+        메시지별 토큰 수 기록
+
+        구간 요약처럼 호출이 여러 번이면 합산하고, 묶음 분석처럼 호출 1회에 여러 메시지가
+        들어 있으면 메시지 수로 나눈 값을 메시지마다 기록합니다.
+        """
+        input_tokens = sum(usage[0] for usage in usages)
+        output_tokens = sum(usage[1] for usage in usages)
+        for _ in range(items):
+            LLM_TOKENS.labels("input").observe(input_tokens / items)
+            LLM_TOKENS.labels("output").observe(output_tokens / items)
+        logger.debug(
+            "LLM 토큰 사용량",
+            calls=len(usages),
+            items=items,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+
+    def _is_long(self, content: str) -> bool:
+        """단건 호출 입력 토큰 상한 초과 여부"""
+        return estimate_tokens(content) > LONG_CONTENT_CONFIG["input_token_budget"]
+
+    def _generate(self, content: str, channel: Optional[str] = None) -> AnalysisResult:
+        """Gemini API 호출 및 응답 파싱 (긴 본문은 구간별 요약 후 분석)"""
         logger.debug("LLM 분석 시작", content=content)
 
+        context = _AnalysisContext(self._route(content, channel))
+        if self._is_long(content):
+            content = self._condense(content, context)
+
         # API 호출
-        response = self._client.models.generate_content(
-            model=self._model_name,
-            contents=content,
-            config=types.GenerateContentConfig(
-                system_instruction=ANALYSIS_PROMPT.INSTRUCTION,
-                response_mime_type="application/json",
-            ),
+        response = self._call_and_parse(content, ANALYSIS_PROMPT.INSTRUCTION, AnalysisResponse, context)
+        analysis_result = self._to_result(response, context.model_name)
+
+        self._record_usage(context.usages)
+        return analysis_result
+
+    async def _generate_async(self, content: str, channel: Optional[str] = None) -> AnalysisResult:
+        """Gemini API 호출 및 응답 파싱 (asyncio, 동작은 _generate와 같음)"""
+        logger.debug("LLM 분석 시작", content=content)
+
+        context = _AnalysisContext(self._route(content, channel))
+        if self._is_long(content):
+            content = await self._condense_async(content, context)
+
+        # API 호출
+        response = await self._call_and_parse_async(content, ANALYSIS_PROMPT.INSTRUCTION, AnalysisResponse, context)
+        analysis_result = self._to_result(response, context.model_name)
+
+        self._record_usage(context.usages)
+        return analysis_result
+
+    def _condense(self, content: str, context: _AnalysisContext) -> str:
+        """
+        긴 본문을 구간별 요약으로 압축 (map 단계)
+
+        구간을 map_concurrency개씩 동시에 요약하고, 요약 합계가 여전히 입력 토큰 상한을 넘으면
+        요약을 다시 나눠 요약합니다 (최대 max_reduce_rounds회).
+
+        Returns:
+            최종 분석에 넘길 구간 요약 모음
+        """
+        LLM_CHUNKED_MESSAGES.inc()
+        notes = content
+        for round_index in range(LONG_CONTENT_CONFIG["max_reduce_rounds"]):
+            chunks = split_content(notes, LONG_CONTENT_CONFIG["chunk_tokens"])
+            logger.debug("긴 본문 구간 요약 시작", round=round_index + 1, chunks=len(chunks))
+
+            max_workers = max(1, min(LONG_CONTENT_CONFIG["map_concurrency"], len(chunks)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-map") as executor:
+                summaries = list(executor.map(lambda chunk: self._summarize_chunk(chunk, context), chunks))
+
+            notes = "\n\n".join(summaries)
+            if not self._is_long(notes):
+                break
+        else:
+            logger.warning("구간 요약 후에도 입력 토큰 상한 초과", estimated_tokens=estimate_tokens(notes))
+
+        return self._notes_content(notes)
+
+    async def _condense_async(self, content: str, context: _AnalysisContext) -> str:
+        """긴 본문을 구간별 요약으로 압축 (asyncio, 동작은 _condense와 같음)"""
+        LLM_CHUNKED_MESSAGES.inc()
+        semaphore = asyncio.Semaphore(max(1, LONG_CONTENT_CONFIG["map_concurrency"]))
+
+        async def summarize(chunk: str) -> str:
+            async with semaphore:
+                return await self._summarize_chunk_async(chunk, context)
+
+        notes = content
+        for round_index in range(LONG_CONTENT_CONFIG["max_reduce_rounds"]):
+            chunks = split_content(notes, LONG_CONTENT_CONFIG["chunk_tokens"])
+            logger.debug("긴 본문 구간 요약 시작", round=round_index + 1, chunks=len(chunks))
+
+            summaries = await asyncio.gather(*(summarize(chunk) for chunk in chunks))
+
+            notes = "\n\n".join(summaries)
+            if not self._is_long(notes):
+                break
+        else:
+            logger.warning("구간 요약 후에도 입력 토큰 상한 초과", estimated_tokens=estimate_tokens(notes))
+
+        return self._notes_content(notes)
+
+    def _summarize_chunk(self, chunk: str, context: _AnalysisContext) -> str:
+        """구간 1개 요약"""
+        response = self._call_and_parse(chunk, CHUNK_SUMMARY_PROMPT.INSTRUCTION, ChunkNotes, context)
+        return response.notes.strip()
+
+    async def _summarize_chunk_async(self, chunk: str, context: _AnalysisContext) -> str:
+        """구간 1개 요약 (asyncio)"""
+        response = await self._call_and_parse_async(chunk, CHUNK_SUMMARY_PROMPT.INSTRUCTION, ChunkNotes, context)
+        return response.notes.strip()
+
+    def _notes_content(self, notes: str) -> str:
+        """구간 요약 모음을 최종 분석 입력으로 변환"""
+        return f"{CHUNK_NOTES_HEADER}\n\n{notes}"
+
+    def _call_and_parse(
+        self,
+        contents: str,
+        system_instruction: str,
+        schema: Type[ResponseModel],
+        context: _AnalysisContext,
+    ) -> ResponseModel:
+        """
+        스키마를 지정한 호출 및 응답 검증
+
+        응답이 스키마와 맞지 않으면 로컬 복구를 먼저 시도하고, 그래도 실패한 경우에만
+        검증 오류를 알려 주며 max_reasks회까지 다시 요청합니다.
+
+        Raises:
+            ValidationError: 재요청 후에도 응답이 스키마와 맞지 않는 경우
+        """
+        response = self._call_model(contents, system_instruction, schema, context)
+        context.usages.append(self._usage(response))
+        text = self._response_text(response)
+        try:
+            return self._parse_response(text, schema, "valid")
+        except ValidationError as e:
+            error = e
+
+        for attempt in range(LLM_CONFIG["max_reasks"]):
+            logger.warning("응답 스키마 불일치, 재요청", attempt=attempt + 1, error=self._error_summary(error))
+            response = self._call_model(
+                self._reask_content(contents, text, error), system_instruction, schema, context
+            )
+            context.usages.append(self._usage(response))
+            text = self._response_text(response)
+            try:
+                return self._parse_response(text, schema, "reasked")
+            except ValidationError as e:
+                error = e
+
+        LLM_RESPONSE_PARSES.labels("failed").inc()
+        raise error
+
+    async def _call_and_parse_async(
+        self,
+        contents: str,
+        system_instruction: str,
+        schema: Type[ResponseModel],
+        context: _AnalysisContext,
+    ) -> ResponseModel:
+        """스키마를 지정한 호출 및 응답 검증 (asyncio, 동작은 _call_and_parse와 같음)"""
+        response = await self._call_model_async(contents, system_instruction, schema, context)
+        context.usages.append(self._usage(response))
+        text = self._response_text(response)
+        try:
+            return self._parse_response(text, schema, "valid")
+        except ValidationError as e:
+            error = e
+
+        for attempt in range(LLM_CONFIG["max_reasks"]):
+            logger.warning("응답 스키마 불일치, 재요청", attempt=attempt + 1, error=self._error_summary(error))
+            response = await self._call_model_async(
+                self._reask_content(contents, text, error), system_instruction, schema, context
+            )
+            context.usages.append(self._usage(response))
+            text = self._response_text(response)
+            try:
+                return self._parse_response(text, schema, "reasked")
+            except ValidationError as e:
+                error = e
+
+        LLM_RESPONSE_PARSES.labels("failed").inc()
+        raise error
+
+    def _parse_response(self, text: str, schema: Type[ResponseModel], outcome: str) -> ResponseModel:
+        """
+        응답 JSON 검증 (model_validate_json 1회, 실패 시 로컬 복구 후 1회 더)
+
+        Args:
+            outcome: 첫 검증에 성공했을 때 기록할 결과 (valid, reasked)
+        """
+        try:
+            parsed = schema.model_validate_json(text)
+            LLM_RESPONSE_PARSES.labels(outcome).inc()
+            return parsed
+        except ValidationError as e:
+            error = e
+
+        repaired = repair_json(text)
+        if repaired is None or repaired == text:
+            raise error
+
+        parsed = schema.model_validate_json(repaired)
+        LLM_RESPONSE_PARSES.labels("repaired").inc()
+        logger.debug("응답 JSON 로컬 복구", error=self._error_summary(error))
+        return parsed
+
+    def _error_summary(self, error: ValidationError) -> str:
+        """검증 오류 요약 (필드 위치: 메시지, 최대 5건)"""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or '$'}: {detail['msg']}"
+            for detail in error.errors()[:5]
         )
 
-        # JSON 파싱
-        result_dict = json.loads(response.text)
+    def _reask_content(self, contents: str, invalid_text: str, error: ValidationError) -> str:
+        """재요청 입력 (원래 입력 + 잘못된 응답 + 검증 오류)"""
+        return REASK_PROMPT.TEMPLATE.format(
+            contents=contents,
+            response=invalid_text[:REASK_PROMPT.MAX_RESPONSE_CHARS],
+            errors=self._error_summary(error),
+        )
 
-        # AnalysisResult 생성
+    def _to_result(self, response: AnalysisResponse, model_name: Optional[str]) -> AnalysisResult:
+        """단건 응답을 AnalysisResult로 변환"""
         analysis_result = AnalysisResult(
-            semantic_summary=result_dict["semantic_summary"],
-            display_summary=result_dict["display_summary"],
-            keywords=result_dict["keywords"],
+            semantic_summary=response.semantic_summary,
+            display_summary=response.display_summary,
+            keywords=response.keywords,
             prompt_version=ANALYSIS_PROMPT.VERSION,
+            model_name=model_name,
         )
 
         logger.debug("LLM 분석 완료",
                      semantic_summary=analysis_result.semantic_summary,
                      display_summary=analysis_result.display_summary,
-                     keywords=analysis_result.keywords)
+                     keywords=analysis_result.keywords,
+                     model=model_name)
 
         return analysis_result
+
+    def analyze_batch(
+        self,
+        contents: List[str],
+        channels: Optional[List[Optional[str]]] = None,
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        다건 묶음 분석
+
+        짧은 본문 여러 개를 요청 1회로 묶어 분석합니다. 묶음 요청이 실패했거나 응답이 깨졌거나
+        일부 항목이 빠진 경우 해당 항목만 단건 분석으로 대체합니다.
+        모델 라우터가 있으면 같은 모델 순서로 라우팅되는 항목끼리만 묶습니다.
+
+        Args:
+            contents: 분석할 본문 목록
+            channels: 본문별 수집 채널 (모델 라우팅에 사용)
+
+        Returns:
+            입력 순서와 동일한 분석 결과 목록. 단건 분석까지 실패한 항목은 None (해당 항목만 실패)
+        """
+        results: List[Optional[AnalysisResult]] = [None] * len(contents)
+        if channels is None:
+            channels = [None] * len(contents)
+
+        # 캐시/유사 본문 히트 항목 제외, 나머지는 모델 순서별로 분류
+        pending: Dict[Tuple[str, ...], List[Tuple[int, str]]] = {}
+        for index, content in enumerate(contents):
+            cached = self._lookup(content, channels[index])
+            if cached is not None:
+                results[index] = cached
+                continue
+            route = tuple(self._route(content, channels[index]))
+            pending.setdefault(route, []).append((index, content))
+
+        for route, items in pending.items():
+            for group in self._pack_batches(items):
+                if len(group) == 1:
+                    index, content = group[0]
+                    results[index] = self._generate_item(content, channels[index])
+                else:
+                    try:
+                        parsed = self._generate_batch([content for _, content in group], list(route))
+                    except Exception as e:
+                        logger.warning(
+                            "묶음 분석 실패, 단건 분석으로 대체",
+                            count=len(group),
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                        parsed = None
+                    for position, (index, content) in enumerate(group):
+                        analysis_result = parsed.get(position) if parsed is not None else None
+                        if analysis_result is None:
+                            if parsed is not None:
+                                logger.warning("묶음 응답 항목 누락, 단건 분석으로 대체", position=position)
+                            analysis_result = self._generate_item(content, channels[index])
+                        results[index] = analysis_result
+
+                for index, content in group:
+                    if results[index] is not None:
+                        self._remember(content, results[index])
+
+        return results
+
+    def _generate_item(self, content: str, channel: Optional[str]) -> Optional[AnalysisResult]:
+        """묶음 분석의 단건 대체 분석 (실패하면 None, 같은 묶음의 다른 항목은 계속 진행)"""
+        try:
+            return self._generate(content, channel)
+        except Exception as e:
+            logger.error("묶음 항목 단건 분석 실패", error=str(e), error_type=type(e).__name__)
+            return None
+
+    def _pack_batches(self, items: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """
+        묶음 분석 대상 분할
+
+        길이 제한을 넘는 항목은 단독으로, 나머지는 항목 수/토큰 제한 안에서 순서대로 묶습니다.
+        """
+        max_items = BATCH_CONFIG["max_items"]
+        max_item_chars = BATCH_CONFIG["max_item_chars"]
+        max_tokens = BATCH_CONFIG["max_tokens"]
+
+        groups = []
+        current = []
+        current_tokens = 0
+        for index, content in items:
+            if len(content) > max_item_chars:
+                groups.append([(index, content)])
+                continue
+
+            tokens = estimate_tokens(content)
+            if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+                groups.append(current)
+                current = []
+                current_tokens = 0
+
+            current.append((index, content))
+            current_tokens += tokens
+
+        if current:
+            groups.append(current)
+        return groups
+
+    def _generate_batch(self, contents: List[str], route: List[str]) -> Dict[int, AnalysisResult]:
+        """
+        묶음 Gemini API 호출 및 응답 파싱
+
+        Args:
+            route: 시도할 모델 순서
+
+        Returns:
+            요청 내 위치(index) → 분석 결과. 파싱에 실패한 항목은 포함하지 않습니다.
+        """
+        logger.debug("LLM 묶음 분석 시작", count=len(contents))
+
+        payload = json.dumps(
+            [{"index": index, "content": content} for index, content in enumerate(contents)],
+            ensure_ascii=False,
+        )
+
+        # API 호출
+        context = _AnalysisContext(route)
+        response = self._call_model(payload, BATCH_ANALYSIS_PROMPT.INSTRUCTION, list[BatchAnalysisItem], context)
+        context.usages.append(self._usage(response))
+        self._record_usage(context.usages, items=len(contents))
+
+        # JSON 파싱 (로컬 복구 후에도 실패하거나 배열이 아니면 전체를 단건 분석으로 대체)
+        text = self._response_text(response)
+        try:
+            items = json.loads(text)
+        except ValueError as e:
+            repaired = repair_json(text)
+            try:
+                items = json.loads(repaired) if repaired is not None else None
+            except ValueError:
+                items = None
+            if items is None:
+                logger.warning("묶음 응답 JSON 파싱 실패", error=str(e))
+                return {}
+
+        if not isinstance(items, list):
+            logger.warning("묶음 응답이 배열이 아님", response_type=type(items).__name__)
+            return {}
+
+        parsed = {}
+        for item in items:
+            try:
+                batch_item = BatchAnalysisItem.model_validate(item)
+            except ValidationError as e:
+                logger.warning("묶음 응답 항목 파싱 실패", error=self._error_summary(e))
+                continue
+
+            index = batch_item.index
+            analysis_result = AnalysisResult(
+                semantic_summary=batch_item.semantic_summary,
+                display_summary=batch_item.display_summary,
+                keywords=batch_item.keywords,
+                prompt_version=ANALYSIS_PROMPT.VERSION,
+                model_name=context.model_name,
+            )
+
+            if 0 <= index < len(contents) and index not in parsed:
+                parsed[index] = analysis_result
+
+        logger.debug("LLM 묶음 분석 완료", requested=len(contents), parsed=len(parsed))
+        return parsed
+
+    def build_batch_request(self, content: str) -> Optional[dict]:
+        """
+        배치 작업 요청 1건 생성 (JSONL 한 줄의 request)
+
+        단건 분석과 같은 프롬프트와 응답 스키마를 사용합니다.
+
+        Returns:
+            GenerateContentRequest 형식의 딕셔너리, 구간 요약이 필요한 긴 본문이면 None (analyze()로 처리)
+        """
+        if self._is_long(content):
+            return None
+
+        LLM_PAYLOAD_BYTES.labels("request").observe(len(content.encode("utf-8")))
+        return {
+            "contents": [{"role": "user", "parts": [{"text": content}]}],
+            "system_instruction": {"parts": [{"text": ANALYSIS_PROMPT.INSTRUCTION}]},
+            "generation_config": {
+                "response_mime_type": "application/json",
+                "response_json_schema": AnalysisResponse.model_json_schema(),
+            },
+        }
+
+    def parse_batch_response(self, response: dict) -> AnalysisResult:
+        """
+        배치 작업 응답 1건을 AnalysisResult로 변환 (JSONL 한 줄의 response)
+
+        Raises:
+            ValidationError: 응답이 스키마와 맞지 않고 로컬 복구도 실패한 경우
+        """
+        candidates = response.get("candidates") or [{}]
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        text = "".join(part.get("text", "") for part in parts)
+        LLM_PAYLOAD_BYTES.labels("response").observe(len(text.encode("utf-8")))
+
+        # REST 응답은 camelCase, SDK로 직렬화한 응답은 snake_case
+        usage = response.get("usageMetadata") or response.get("usage_metadata") or {}
+        self._record_usage([(
+            usage.get("promptTokenCount", usage.get("prompt_token_count")) or 0,
+            usage.get("candidatesTokenCount", usage.get("candidates_token_count")) or 0,
+        )])
+
+        parsed = self._parse_response(text, AnalysisResponse, "valid")
+        return self._to_result(parsed, self._model_name)
@@ -0,0 +1,161 @@
+"""
+Gemini 모델 라우팅
+
+본문 길이, 수집 채널, 모델별 최근 지연/오류 이동 평균으로 메시지마다 사용할 모델 순서를 정합니다.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import httpx
+from google.genai import errors
+
+from config.llm import LLM_CONFIG, MODEL_ROUTING_CONFIG
+from src.logger import get_logger
+from src.metrics import LLM_MODEL_FAILOVERS, LLM_MODEL_REQUESTS
+
+logger = get_logger("model_router")
+
+
+def is_failover_error(error: Exception) -> bool:
+    """다른 모델로 전환할 오류 여부 (시간 초과, 5xx)"""
+    return isinstance(error, (errors.ServerError, httpx.TimeoutException, TimeoutError))
+
+
+class ModelHealth:
+    """
+    모델 1개의 최근 지연/오류 지수 이동 평균
+
+    오류율이 error_threshold 이상이거나 평균 지연이 max_latency를 넘으면 비정상으로 보고,
+    마지막 기록 후 cooldown초가 지나면 다시 시도해 볼 수 있도록 정상으로 취급합니다.
+    """
+
+    def __init__(self, alpha: float):
+        self._alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.updated_at: Optional[float] = None
+
+    def record(self, latency: float, succeeded: bool):
+        if succeeded:
+            self.latency = latency if self.latency is None else self.latency + self._alpha * (latency - self.latency)
+        self.error_rate += self._alpha * ((0.0 if succeeded else 1.0) - self.error_rate)
+        self.updated_at = time.monotonic()
+
+    def is_healthy(self, error_threshold: float, max_latency: float, cooldown: float) -> bool:
+        degraded = self.error_rate >= error_threshold or (self.latency is not None and self.latency > max_latency)
+        if not degraded:
+            return True
+        return self.updated_at is not None and time.monotonic() - self.updated_at >= cooldown
+
+
+class ModelRouter:
+    """
+    모델 라우팅
+
+    - 선호 모델: 채널별 지정 모델 → 긴 본문용 모델 → 짧은 본문용 모델 → 기본 모델 순으로 결정
+    - 대체 모델: 나머지 모델을 정상 여부, 평균 지연 순으로 정렬 (지연 측정 전 모델은 뒤로)
+    - 선호 모델이 비정상이면 정상인 대체 모델을 앞에 둡니다
+    """
+
+    def __init__(self):
+        self._default_model = LLM_CONFIG["model_name"]
+        self._short_model = MODEL_ROUTING_CONFIG["short_model_name"] or self._default_model
+        self._long_model = MODEL_ROUTING_CONFIG["long_model_name"] or self._default_model
+        self._channel_models: Dict[str, str] = dict(MODEL_ROUTING_CONFIG["channel_models"])
+        self._short_max_chars = MODEL_ROUTING_CONFIG["short_max_chars"]
+        self._long_min_chars = MODEL_ROUTING_CONFIG["long_min_chars"]
+        self._error_threshold = MODEL_ROUTING_CONFIG["error_threshold"]
+        self._max_latency = MODEL_ROUTING_CONFIG["max_latency"]
+        self._cooldown = MODEL_ROUTING_CONFIG["cooldown"]
+
+        # 등록 순서를 유지한 전체 모델 목록 (중복 제거)
+        models = [
+            self._default_model,
+            self._short_model,
+            self._long_model,
+            *self._channel_models.values(),
+            *MODEL_ROUTING_CONFIG["fallback_model_names"],
+        ]
+        self._models = [model for model in dict.fromkeys(models) if model]
+        self._health = {model: ModelHealth(MODEL_ROUTING_CONFIG["ewma_alpha"]) for model in self._models}
+        self._lock = threading.Lock()
+
+        logger.info(
+            "ModelRouter 초기화 완료",
+            models=self._models,
+            short_model=self._short_model,
+            long_model=self._long_model,
+            channel_models=self._channel_models,
+        )
+
+    @property
+    def models(self) -> List[str]:
+        """라우팅 대상 모델 목록"""
+        return list(self._models)
+
+    def preferred_model(self, content: str, channel: Optional[str] = None) -> str:
+        """본문 길이와 채널로 정한 선호 모델"""
+        if channel is not None and channel in self._channel_models:
+            return self._channel_models[channel]
+        if len(content) >= self._long_min_chars:
+            return self._long_model
+        if len(content) <= self._short_max_chars:
+            return self._short_model
+        return self._default_model
+
+    def route(self, content: str, channel: Optional[str] = None) -> List[str]:
+        """
+        시도할 모델 순서
+
+        Args:
+            content: 분석할 본문 내용
+            channel: 수집 채널
+
+        Returns:
+            첫 번째가 사용할 모델, 나머지는 시간 초과/5xx 시 전환할 대체 모델
+        """
+        preferred = self.preferred_model(content, channel)
+        with self._lock:
+            healthy = {
+                model: health.is_healthy(self._error_threshold, self._max_latency, self._cooldown)
+                for model, health in self._health.items()
+            }
+            latencies = {model: health.latency for model, health in self._health.items()}
+
+        # 정상 → 지연 측정값 있음(짧은 순) → 측정 전 순서
+        alternates = sorted(
+            (model for model in self._models if model != preferred),
+            key=lambda model: (not healthy[model], latencies[model] is None, latencies[model] or 0.0),
+        )
+        if healthy.get(preferred, True) or not any(healthy[model] for model in alternates):
+            return [preferred, *alternates]
+
+        logger.debug("선호 모델 비정상, 대체 모델 우선", preferred=preferred, selected=alternates[0])
+        return [*alternates, preferred]
+
+    def record(self, model: str, latency: float, succeeded: bool):
+        """모델 호출 결과 기록"""
+        with self._lock:
+            health = self._health.get(model)
+            if health is None:
+                health = self._health[model] = ModelHealth(MODEL_ROUTING_CONFIG["ewma_alpha"])
+                self._models.append(model)
+            health.record(latency, succeeded)
+        LLM_MODEL_REQUESTS.labels(model, "success" if succeeded else "failure").inc()
+
+    def record_failover(self, from_model: str, to_model: str):
+        """대체 모델 전환 기록"""
+        LLM_MODEL_FAILOVERS.labels(from_model, to_model).inc()
+
+    def stats(self) -> dict:
+        """모델별 평균 지연/오류율 조회"""
+        with self._lock:
+            return {
+                model: {
+                    "latency": round(health.latency, 3) if health.latency is not None else None,
+                    "error_rate": round(health.error_rate, 3),
+                }
+                for model, health in self._health.items()
+            }
@@ -0,0 +1,317 @@
+"""
+유사 본문 필터
+
+리포스트(RT), 링크만 다른 게시물처럼 거의 같은 본문을 SimHash로 찾아
+이전 분석 결과를 재사용하여 LLM 호출을 줄입니다.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import redis
+
+from config.llm import NEAR_DUPLICATE_CONFIG
+from config.redis import REDIS_CONFIG
+from src.logger import get_logger
+from src.metrics import NEAR_DUPLICATE_CHECKS
+from src.models.analysis_result import AnalysisResult
+from src.services.analysis_cache import normalize_content
+from src.services.prompts import ANALYSIS_PROMPT
+
+logger = get_logger("near_duplicate_filter")
+
+FINGERPRINT_BITS = 64
+
+_URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
+_REPOST_PREFIX_PATTERN = re.compile(r"^(?:rt|repost)\b[^:]{0,50}:\s*")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(content: str) -> List[str]:
+    """
+    지문 계산용 토큰 추출
+
+    정규화(NFKC, 공백 정리) 후 소문자로 바꾸고 URL과 'RT @user:' 형태의 리포스트 접두어를 제거합니다.
+    """
+    text = normalize_content(content).lower()
+    text = _URL_PATTERN.sub(" ", text)
+    text = _REPOST_PREFIX_PATTERN.sub("", text.strip())
+    return _TOKEN_PATTERN.findall(text)
+
+
+def simhash(tokens: List[str], shingle_size: int = 2) -> int:
+    """
+    64비트 SimHash
+
+    연속 토큰 shingle_size개 묶음(shingle)의 해시를 비트별로 가산/감산하여 부호로 지문을 만듭니다.
+    본문이 조금 바뀌면 지문도 몇 비트만 달라집니다.
+    """
+    if len(tokens) <= shingle_size:
+        shingles = [" ".join(tokens)]
+    else:
+        shingles = [" ".join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)]
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            if value >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 다른 비트 수"""
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateFilter:
+    """
+    유사 본문 필터
+
+    최근 window_seconds 동안 분석한 본문의 SimHash를 LSH 밴드 인덱스로 보관합니다.
+    지문을 (max_distance + 1)개 밴드로 나누므로, 해밍 거리가 max_distance 이하인 지문은
+    적어도 한 밴드가 일치하여 후보로 조회됩니다 (비둘기집 원리).
+    - 1차: 프로세스 내 인덱스 (항목 수/시간 제한)
+    - 2차: Redis 공유 인덱스 (워커 프로세스 간 공유, 선택)
+    장애는 분석 흐름을 막지 않도록 미스로 처리합니다.
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None, shared_enabled: Optional[bool] = None):
+        self._max_distance = NEAR_DUPLICATE_CONFIG["max_distance"]
+        self._shingle_size = NEAR_DUPLICATE_CONFIG["shingle_size"]
+        self._min_tokens = NEAR_DUPLICATE_CONFIG["min_tokens"]
+        self._window_seconds = NEAR_DUPLICATE_CONFIG["window_seconds"]
+        self._max_entries = NEAR_DUPLICATE_CONFIG["max_entries"]
+
+        # LSH 밴드 구성 (64비트를 밴드 수로 나눔)
+        self._bands = min(FINGERPRINT_BITS, self._max_distance + 1)
+        self._band_bits = FINGERPRINT_BITS // self._bands
+
+        # 1차: 프로세스 내 인덱스 (fingerprint → (추가 시각, 분석 결과), 추가 순서 유지)
+        self._entries: "OrderedDict[int, Tuple[float, AnalysisResult]]" = OrderedDict()
+        self._band_index: List[Dict[int, Set[int]]] = [dict() for _ in range(self._bands)]
+        self._lock = threading.Lock()
+
+        # 2차: Redis 공유 인덱스 (프롬프트 버전이 바뀌면 다른 키 공간 사용)
+        if shared_enabled is None:
+            shared_enabled = NEAR_DUPLICATE_CONFIG["shared_enabled"]
+        self._key_prefix = f"{REDIS_CONFIG['near_duplicate_key_prefix']}:{ANALYSIS_PROMPT.VERSION}"
+        self._client = None
+        if shared_enabled:
+            self._client = client or redis.Redis(
+                host=REDIS_CONFIG["host"],
+                port=REDIS_CONFIG["port"],
+                db=REDIS_CONFIG["db"],
+                decode_responses=True,
+            )
+
+        # 카운터
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+        self._errors = 0
+
+        logger.info(
+            "NearDuplicateFilter 초기화 완료",
+            max_distance=self._max_distance,
+            bands=self._bands,
+            window_seconds=self._window_seconds,
+            shared_enabled=self._client is not None,
+        )
+
+    def fingerprint(self, content: str) -> Optional[int]:
+        """본문 지문 (토큰이 min_tokens보다 적으면 None - 짧은 본문은 지문이 불안정)"""
+        tokens = tokenize(content)
+        if len(tokens) < self._min_tokens:
+            return None
+        return simhash(tokens, self._shingle_size)
+
+    def find(self, content: str) -> Optional[AnalysisResult]:
+        """
+        유사 본문 조회
+
+        Args:
+            content: 분석할 본문 내용
+
+        Returns:
+            해밍 거리 max_distance 이내인 가장 가까운 본문의 분석 결과, 없으면 None
+        """
+        fingerprint = self.fingerprint(content)
+        if fingerprint is None:
+            with self._lock:
+                self._skipped += 1
+            NEAR_DUPLICATE_CHECKS.labels("skipped").inc()
+            return None
+
+        match = self._find_local(fingerprint) or self._find_shared(fingerprint)
+        if match is None:
+            with self._lock:
+                self._misses += 1
+            NEAR_DUPLICATE_CHECKS.labels("miss").inc()
+            return None
+
+        distance, result = match
+        with self._lock:
+            self._hits += 1
+        NEAR_DUPLICATE_CHECKS.labels("hit").inc()
+        logger.debug("유사 본문 히트, 이전 분석 결과 재사용", distance=distance, fingerprint=f"{fingerprint:016x}")
+        return result
+
+    def add(self, content: str, result: AnalysisResult):
+        """
+        분석 결과 등록
+
+        Args:
+            content: 분석한 본문 내용
+            result: 분석 결과
+        """
+        fingerprint = self.fingerprint(content)
+        if fingerprint is None:
+            return
+
+        self._add_local(fingerprint, result)
+        self._add_shared(fingerprint, result)
+
+    def stats(self) -> dict:
+        """히트/미스 카운터 조회"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "skipped": self._skipped,
+                "errors": self._errors,
+                "local_size": len(self._entries),
+            }
+
+    def _band_values(self, fingerprint: int) -> List[int]:
+        """지문을 밴드별 값으로 분할"""
+        mask = (1 << self._band_bits) - 1
+        return [(fingerprint >> (band * self._band_bits)) & mask for band in range(self._bands)]
+
+    def _find_local(self, fingerprint: int) -> Optional[Tuple[int, AnalysisResult]]:
+        """프로세스 내 인덱스 조회 (가장 가까운 후보)"""
+        with self._lock:
+            self._evict(time.monotonic())
+
+            candidates = set()
+            for band, value in enumerate(self._band_values(fingerprint)):
+                candidates |= self._band_index[band].get(value, set())
+
+            best = None
+            for candidate in candidates:
+                distance = hamming_distance(fingerprint, candidate)
+                if distance <= self._max_distance and (best is None or distance < best[0]):
+                    best = (distance, self._entries[candidate][1])
+            return best
+
+    def _add_local(self, fingerprint: int, result: AnalysisResult):
+        """프로세스 내 인덱스 등록"""
+        with self._lock:
+            now = time.monotonic()
+            if fingerprint in self._entries:
+                self._remove(fingerprint)
+            self._entries[fingerprint] = (now, result)
+            for band, value in enumerate(self._band_values(fingerprint)):
+                self._band_index[band].setdefault(value, set()).add(fingerprint)
+            self._evict(now)
+
+    def _evict(self, now: float):
+        """시간 창을 벗어났거나 최대 개수를 넘은 오래된 항목 제거 (잠금 안에서 호출)"""
+        while self._entries:
+            fingerprint, (added_at, _) = next(iter(self._entries.items()))
+            if now - added_at <= self._window_seconds and len(self._entries) <= self._max_entries:
+                break
+            self._remove(fingerprint)
+
+    def _remove(self, fingerprint: int):
+        """항목과 밴드 인덱스 제거 (잠금 안에서 호출)"""
+        del self._entries[fingerprint]
+        for band, value in enumerate(self._band_values(fingerprint)):
+            members = self._band_index[band].get(value)
+            if members is not None:
+                members.discard(fingerprint)
+                if not members:
+                    del self._band_index[band][value]
+
+    def _band_key(self, band: int, value: int) -> str:
+        return f"{self._key_prefix}:band:{band}:{value:x}"
+
+    def _result_key(self, fingerprint: int) -> str:
+        return f"{self._key_prefix}:result:{fingerprint:016x}"
+
+    def _find_shared(self, fingerprint: int) -> Optional[Tuple[int, AnalysisResult]]:
+        """
+        Redis 공유 인덱스 조회
+
+        밴드마다 시간 창 안의 지문을 ZSET(score=등록 시각)에서 읽어 후보를 모읍니다.
+        """
+        if self._client is None:
+            return None
+
+        try:
+            since = time.time() - self._window_seconds
+            pipeline = self._client.pipeline(transaction=False)
+            for band, value in enumerate(self._band_values(fingerprint)):
+                pipeline.zrangebyscore(self._band_key(band, value), since, "+inf")
+            candidates = {int(member, 16) for members in pipeline.execute() for member in members}
+
+            scored = sorted(
+                (hamming_distance(fingerprint, candidate), candidate)
+                for candidate in candidates
+                if hamming_distance(fingerprint, candidate) <= self._max_distance
+            )
+            for distance, candidate in scored:
+                cached = self._client.get(self._result_key(candidate))
+                if cached is None:
+                    continue
+                result = AnalysisResult.model_validate_json(cached)
+                self._add_local(candidate, result)
+                return distance, result
+            return None
+
+        except (redis.RedisError, ValueError) as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning("공유 유사 본문 인덱스 조회 실패", error=str(e))
+            return None
+
+    def _add_shared(self, fingerprint: int, result: AnalysisResult):
+        """Redis 공유 인덱스 등록 (밴드 ZSET + 결과, 시간 창만큼 유지)"""
+        if self._client is None:
+            return
+
+        try:
+            now = time.time()
+            ttl = int(self._window_seconds)
+            member = f"{fingerprint:016x}"
+            pipeline = self._client.pipeline(transaction=False)
+            for band, value in enumerate(self._band_values(fingerprint)):
+                key = self._band_key(band, value)
+                pipeline.zadd(key, {member: now})
+                pipeline.zremrangebyscore(key, "-inf", now - self._window_seconds)
+                pipeline.expire(key, ttl)
+            pipeline.set(self._result_key(fingerprint), result.model_dump_json(), ex=ttl)
+            pipeline.execute()
+
+        except redis.RedisError as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning("공유 유사 본문 인덱스 저장 실패", error=str(e))
+
+    def close(self):
+        """연결 종료"""
+        if self._client is not None:
+            self._client.close()
+        logger.info("NearDuplicateFilter 종료", **self.stats())
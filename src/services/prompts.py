@@ -38,3 +38,63 @@ Return a single JSON object:
 }
 """,
 )
+
+BATCH_ANALYSIS_PROMPT = SimpleNamespace(
+    INSTRUCTION=ANALYSIS_PROMPT.INSTRUCTION + """
+## Batch Input
+The input is a JSON array of items: [{"index": 0, "content": "..."}, ...]
+- Analyze each item independently, following the task above
+- Never mix facts or keywords between items
+
+## Batch Output Format (overrides the single-object format above)
+Return a JSON array with exactly one object per input item, keeping its "index":
+[
+  {"index": 0, "semantic_summary": "...", "display_summary": "...", "keywords": ["...", "..."]},
+  ...
+]
+""",
+)
+
+CHUNK_SUMMARY_PROMPT = SimpleNamespace(
+    INSTRUCTION="""
+You are given one section of a longer Trump-related document (news article, transcript, or announcement).
+The document is split into sections that are summarized separately and then analyzed together.
+
+## Task
+Write factual notes for this section only, in English:
+- Include: key facts, policy details, specific names, numbers, dates, direct quotes that carry news
+- Exclude: opinions, speculations, interpretations, boilerplate (bylines, ads, navigation text)
+- Do not guess about content outside this section
+- Keep the notes under 1500 characters
+
+## Output Format
+Return a single JSON object:
+{
+  "notes": "..."
+}
+""",
+)
+
+# 구간 요약을 모아 최종 분석(ANALYSIS_PROMPT)에 넘길 때의 머리말
+CHUNK_NOTES_HEADER = (
+    "The following are factual notes extracted, in order, from consecutive sections of one long document. "
+    "Analyze them as a single piece of content."
+)
+
+REASK_PROMPT = SimpleNamespace(
+    # 재요청 시 포함할 이전 응답의 최대 길이
+    MAX_RESPONSE_CHARS=4000,
+    TEMPLATE="""{contents}
+
+## Correction Request
+Your previous response to the input above did not match the required JSON schema.
+
+Previous response:
+{response}
+
+Validation errors:
+{errors}
+
+Fix only these problems and return the complete, corrected JSON. Keep every field concise so the response is not cut off.
+""",
+)
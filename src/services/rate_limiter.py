@@ -0,0 +1,229 @@
+"""
+Gemini 호출 속도 제한
+
+RPM/TPM 토큰 버킷과 AIMD 동시성 제어로 쿼터 한도 안에서 최대한 호출합니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+from google.genai import errors
+
+from config.llm import RATE_LIMIT_CONFIG
+from src.logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """429 / RESOURCE_EXHAUSTED 응답 여부"""
+    return isinstance(error, errors.APIError) and (
+        error.code == 429 or error.status == "RESOURCE_EXHAUSTED"
+    )
+
+
+class TokenBucket:
+    """
+    분당 한도 토큰 버킷
+
+    연속적으로 충전되며, reserve()는 토큰을 먼저 차감하고(음수 허용) 사용 가능해질 때까지의
+    대기 시간을 돌려줍니다. 호출자가 그 시간만큼 기다리면 분당 한도를 넘지 않습니다.
+    """
+
+    def __init__(self, per_minute: float):
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        토큰 예약
+
+        Args:
+            amount: 사용할 토큰 수
+
+        Returns:
+            토큰을 사용할 수 있을 때까지 기다려야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 동시성 제어
+
+    성공하면 동시 호출 한도를 조금씩 늘리고(+1/limit), 쿼터 초과 응답을 받으면 절반으로 줄입니다.
+    스레드(acquire)와 이벤트 루프(acquire_async)가 같은 한도를 공유하며, 슬롯이 반환되면 양쪽 대기자를 모두 깨웁니다.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = float(min(self._maximum, max(self._minimum, initial)))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        # acquire_async 대기자 (이벤트 루프, Future)
+        self._async_waiters = deque()
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 호출 한도"""
+        return int(self._limit)
+
+    def try_acquire(self) -> bool:
+        """한도 안이면 슬롯을 확보하고 True 반환"""
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self):
+        """슬롯이 빌 때까지 대기 후 확보"""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self):
+        """슬롯이 빌 때까지 대기 후 확보 (asyncio, 대기 중 취소되면 대기열에서만 빠짐)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def release(self, throttled: bool = False, succeeded: bool = True):
+        """
+        슬롯 반환 및 한도 조정
+
+        Args:
+            throttled: 쿼터 초과 응답 여부 (한도 절반 감소)
+            succeeded: 정상 응답 여부 (한도 가산 증가)
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self._limit = max(self._minimum, self._limit / 2)
+                logger.warning("쿼터 초과, 동시 호출 한도 감소", limit=int(self._limit))
+            elif succeeded:
+                self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+            while self._async_waiters:
+                loop, waiter = self._async_waiters.popleft()
+                loop.call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future):
+    """acquire_async 대기자 깨우기 (이미 취소된 대기자는 건너뜀)"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """
+    Gemini 호출 속도 제한기
+
+    호출마다 동시성 슬롯 확보 → RPM/TPM 토큰 예약(필요 시 대기) 순서로 진행하고,
+    호출 결과에 따라 동시성 한도를 조정합니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self._requests = TokenBucket(requests_per_minute or RATE_LIMIT_CONFIG["requests_per_minute"])
+        self._tokens = TokenBucket(tokens_per_minute or RATE_LIMIT_CONFIG["tokens_per_minute"])
+        self._concurrency = AdaptiveConcurrencyLimiter(
+            initial=RATE_LIMIT_CONFIG["initial_concurrency"],
+            minimum=RATE_LIMIT_CONFIG["min_concurrency"],
+            maximum=RATE_LIMIT_CONFIG["max_concurrency"],
+        )
+
+        logger.info(
+            "RateLimiter 초기화 완료",
+            requests_per_minute=requests_per_minute or RATE_LIMIT_CONFIG["requests_per_minute"],
+            tokens_per_minute=tokens_per_minute or RATE_LIMIT_CONFIG["tokens_per_minute"],
+            concurrency=self._concurrency.limit,
+        )
+
+    @property
+    def concurrency_limit(self) -> int:
+        """현재 동시 호출 한도"""
+        return self._concurrency.limit
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """RPM/TPM 토큰 예약 후 대기 시간 반환"""
+        return max(self._requests.reserve(1), self._tokens.reserve(estimated_tokens))
+
+    @contextmanager
+    def limit(self, estimated_tokens: int):
+        """
+        호출 구간 속도 제한
+
+        Args:
+            estimated_tokens: 요청 1회의 예상 토큰 수 (입력 + 출력)
+        """
+        self._concurrency.acquire()
+        throttled = succeeded = False
+        try:
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                logger.debug("속도 제한 대기", wait=round(wait, 2))
+                time.sleep(wait)
+            yield
+            succeeded = True
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            raise
+        finally:
+            # 취소(CancelledError) 등 Exception이 아닌 예외도 슬롯은 반환
+            self._concurrency.release(throttled=throttled, succeeded=succeeded)
+
+    @asynccontextmanager
+    async def limit_async(self, estimated_tokens: int):
+        """
+        호출 구간 속도 제한 (asyncio)
+
+        Args:
+            estimated_tokens: 요청 1회의 예상 토큰 수 (입력 + 출력)
+        """
+        await self._concurrency.acquire_async()
+        throttled = succeeded = False
+        try:
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                logger.debug("속도 제한 대기", wait=round(wait, 2))
+                await asyncio.sleep(wait)
+            yield
+            succeeded = True
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            raise
+        finally:
+            # 취소(CancelledError) 등 Exception이 아닌 예외도 슬롯은 반환
+            self._concurrency.release(throttled=throttled, succeeded=succeeded)
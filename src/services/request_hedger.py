@@ -0,0 +1,242 @@
+"""
+Gemini 요청 헤징
+
+최근 응답 시간의 상위 백분위수만큼 기다려도 응답이 없으면 같은 요청을 한 번 더 보내고,
+먼저 끝난 응답을 사용하여 꼬리 지연(tail latency)을 줄입니다.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from config.llm import HEDGE_CONFIG
+from config.worker import WORKER_CONFIG
+from src.logger import get_logger
+from src.metrics import LLM_CALL_SECONDS, LLM_HEDGE_REQUESTS, LLM_REQUEST_SECONDS
+
+logger = get_logger("request_hedger")
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """
+    요청 헤징
+
+    - 지연 기준: 최근 window개 요청 응답 시간의 percentile 백분위수 (min_delay 이상)
+    - 예산: 호출마다 budget_ratio만큼 적립, 헤지 1회에 1 소모 (추가 호출 비율 ≤ budget_ratio)
+    - 먼저 끝난 응답을 사용하고, 나머지는 취소(asyncio)하거나 결과를 버림(스레드)
+    - 스레드 풀 대기열에서 기다린 시간은 기준 시간에 넣지 않음 (풀이 붐벼도 불필요한 헤지를 보내지 않음)
+    한쪽이 실패하면 다른 쪽 결과를 기다리며, 둘 다 실패하면 먼저 보낸 요청의 예외를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        percentile: Optional[float] = None,
+        budget_ratio: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self._percentile = percentile if percentile is not None else HEDGE_CONFIG["percentile"]
+        self._budget_ratio = budget_ratio if budget_ratio is not None else HEDGE_CONFIG["budget_ratio"]
+        self._min_samples = HEDGE_CONFIG["min_samples"]
+        self._min_delay = HEDGE_CONFIG["min_delay"]
+        self._max_credits = HEDGE_CONFIG["max_burst"]
+
+        self._latencies = deque(maxlen=HEDGE_CONFIG["window"])
+        self._credits = 0.0
+        self._lock = threading.Lock()
+
+        # 스레드 기반 호출용 (첫 요청과 헤지 요청을 실행, 처리 중인 메시지마다 2개까지 대기 없이 실행)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or HEDGE_CONFIG["max_workers"] or WORKER_CONFIG["max_in_flight"] * 2,
+            thread_name_prefix="llm-hedge",
+        )
+
+        # 카운터
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+        logger.info(
+            "RequestHedger 초기화 완료",
+            percentile=self._percentile,
+            budget_ratio=self._budget_ratio,
+            min_samples=self._min_samples,
+        )
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 기준 시간 (초, 표본이 min_samples보다 적으면 None)"""
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return None
+            samples = sorted(self._latencies)
+
+        rank = max(0, math.ceil(len(samples) * self._percentile / 100) - 1)
+        return max(self._min_delay, samples[rank])
+
+    def stats(self) -> dict:
+        """헤징 카운터 조회"""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "budget_exhausted": self._budget_exhausted,
+                "hedge_ratio": round(self._hedged / self._calls, 4) if self._calls else 0.0,
+            }
+
+    def _start_call(self):
+        """호출 1회 시작 (예산 적립)"""
+        with self._lock:
+            self._calls += 1
+            self._credits = min(self._max_credits, self._credits + self._budget_ratio)
+
+    def _take_budget(self) -> bool:
+        """헤지 예산 1회 사용 (부족하면 False)"""
+        with self._lock:
+            if self._credits < 1.0:
+                self._budget_exhausted += 1
+                LLM_HEDGE_REQUESTS.labels("budget_exhausted").inc()
+                return False
+            self._credits -= 1.0
+            self._hedged += 1
+        LLM_HEDGE_REQUESTS.labels("fired").inc()
+        return True
+
+    def _record(self, attempt: str, elapsed: float):
+        """요청 1건의 응답 시간 기록"""
+        with self._lock:
+            self._latencies.append(elapsed)
+        LLM_REQUEST_SECONDS.labels(attempt).observe(elapsed)
+
+    def _record_winner(self, attempt: str, started: float):
+        """호출자가 실제로 기다린 시간 기록"""
+        LLM_CALL_SECONDS.observe(time.monotonic() - started)
+        if attempt == "hedge":
+            with self._lock:
+                self._hedge_wins += 1
+            LLM_HEDGE_REQUESTS.labels("won").inc()
+
+    def _timed(self, fn: Callable[[], T], attempt: str, started_event: Optional[threading.Event] = None) -> T:
+        if started_event is not None:
+            started_event.set()
+        started = time.monotonic()
+        try:
+            return fn()
+        finally:
+            self._record(attempt, time.monotonic() - started)
+
+    async def _timed_async(self, factory: Callable[[], Awaitable[T]], attempt: str) -> T:
+        started = time.monotonic()
+        try:
+            return await factory()
+        finally:
+            # 취소된 요청은 취소 시점까지의 시간 (실제 응답 시간의 하한)
+            self._record(attempt, time.monotonic() - started)
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        헤징 호출 (스레드)
+
+        Args:
+            fn: 요청 함수 (같은 요청을 두 번 호출해도 안전해야 함)
+
+        Returns:
+            먼저 성공한 요청의 결과
+        """
+        self._start_call()
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        if delay is None:
+            # 표본 수집 단계: 호출 스레드에서 바로 실행
+            result = self._timed(fn, "primary")
+            self._record_winner("primary", started)
+            return result
+
+        # 스레드 풀이 모두 사용 중이면 요청이 대기열에서 기다리므로, 기준 시간은 실제로 시작한 뒤부터 계산
+        primary_started = threading.Event()
+        primary = self._executor.submit(self._timed, fn, "primary", primary_started)
+        # 시작하지 못하고 취소된 경우(close())에도 대기가 풀리도록 함
+        primary.add_done_callback(lambda _: primary_started.set())
+        primary_started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_budget():
+            result = primary.result()
+            self._record_winner("primary", started)
+            return result
+
+        logger.debug("응답 지연, 헤지 요청 전송", delay=round(delay, 3))
+        hedge = self._executor.submit(self._timed, fn, "hedge")
+        attempts = {primary: "primary", hedge: "hedge"}
+
+        done, pending = wait(attempts, return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        if winner.exception() is not None and pending:
+            # 먼저 끝난 요청이 실패하면 나머지 요청 결과 사용
+            winner = pending.pop()
+            wait([winner])
+
+        loser = hedge if winner is primary else primary
+        if not loser.done():
+            loser.cancel()
+
+        if winner.exception() is not None:
+            # 둘 다 실패: 먼저 보낸 요청의 예외
+            raise primary.exception()
+
+        self._record_winner(attempts[winner], started)
+        return winner.result()
+
+    async def call_async(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        헤징 호출 (asyncio, 동작은 call과 같음, 늦은 요청은 취소)
+
+        Args:
+            factory: 요청 코루틴을 만드는 함수 (호출마다 새 코루틴)
+        """
+        self._start_call()
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        if delay is None:
+            result = await self._timed_async(factory, "primary")
+            self._record_winner("primary", started)
+            return result
+
+        primary = asyncio.ensure_future(self._timed_async(factory, "primary"))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._take_budget():
+                result = await primary
+                self._record_winner("primary", started)
+                return result
+
+            logger.debug("응답 지연, 헤지 요청 전송", delay=round(delay, 3))
+            hedge = asyncio.ensure_future(self._timed_async(factory, "hedge"))
+            attempts = {primary: "primary", hedge: "hedge"}
+
+            done, pending = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            winner = primary if primary in done else hedge
+            if winner.exception() is not None and pending:
+                winner = pending.pop()
+                await asyncio.wait({winner})
+
+            if winner.exception() is not None:
+                raise primary.exception()
+
+            self._record_winner(attempts[winner], started)
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def close(self):
+        """스레드 풀 종료 (진행 중인 늦은 요청은 기다리지 않음)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("RequestHedger 종료", **self.stats())
@@ -0,0 +1,255 @@
+"""
+워커 Supervisor
+
+워커 프로세스 여러 개를 실행하고, Consumer Group 적체량에 따라 프로세스 수를 조절합니다.
+"""
+
+import math
+import multiprocessing
+import threading
+import time
+from multiprocessing.process import BaseProcess
+from typing import Callable, Dict, Set
+
+from config.redis import REDIS_CONFIG
+from config.worker import SUPERVISOR_CONFIG
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import get_logger
+
+logger = get_logger("supervisor")
+
+
+class Supervisor:
+    """
+    워커 프로세스 관리자
+
+    슬롯 번호마다 고유한 Consumer 이름({CONSUMER_NAME}-{slot})으로 워커 프로세스를 띄웁니다.
+    워커 함수에는 Consumer 이름과 슬롯 번호를 넘깁니다 (슬롯별 메트릭 포트 등에 사용).
+    - 비정상 종료된 워커는 같은 이름으로 재시작합니다. min_uptime 안에 종료되면(시작 실패)
+      재시작 대기 시간을 restart_backoff부터 restart_backoff_max까지 두 배씩 늘립니다.
+    - XINFO GROUPS의 lag + pending을 기준으로 min/max 범위 안에서 프로세스 수를 조절합니다.
+    - 축소된 Consumer는 PEL이 비워진 뒤 XGROUP DELCONSUMER로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        message_subscriber: MessageSubscriber,
+        worker_target: Callable[[str, int], None],
+    ):
+        self._message_subscriber = message_subscriber
+        self._worker_target = worker_target
+        self._context = multiprocessing.get_context("fork")
+        self._base_name = REDIS_CONFIG["consumer_name"]
+
+        self._min_workers = max(1, SUPERVISOR_CONFIG["min_workers"])
+        self._max_workers = max(self._min_workers, SUPERVISOR_CONFIG["max_workers"])
+        self._check_interval = SUPERVISOR_CONFIG["check_interval"]
+        self._messages_per_worker = max(1, SUPERVISOR_CONFIG["messages_per_worker"])
+        self._scale_in_cooldown = SUPERVISOR_CONFIG["scale_in_cooldown"]
+        self._min_uptime = SUPERVISOR_CONFIG["min_uptime"]
+        self._restart_backoff = SUPERVISOR_CONFIG["restart_backoff"]
+        self._restart_backoff_max = max(self._restart_backoff, SUPERVISOR_CONFIG["restart_backoff_max"])
+        self._stop_timeout = SUPERVISOR_CONFIG["stop_timeout"]
+
+        self._processes: Dict[int, BaseProcess] = {}  # slot → 실행 중인 워커
+        self._retiring: Dict[int, BaseProcess] = {}  # slot → 축소로 종료 중인 워커
+        self._retired_consumers: Set[str] = set()  # PEL이 비기를 기다리는 Consumer
+        self._started_at: Dict[int, float] = {}  # slot → 워커 시작 시각
+        self._failures: Dict[int, int] = {}  # slot → 연속 시작 실패 횟수
+        self._restart_at: Dict[int, float] = {}  # slot → 재시작 예정 시각 (backoff 대기 중)
+        self._last_scale_in = 0.0
+
+        self._shutdown = False
+        self._wakeup = threading.Event()
+
+        logger.info(
+            "Supervisor 초기화 완료",
+            min_workers=self._min_workers,
+            max_workers=self._max_workers,
+        )
+
+    def run(self):
+        """
+        관리 루프
+
+        종료 요청이 올 때까지 워커 상태 확인 → 자동 확장/축소 → Consumer 정리를 반복합니다.
+        """
+        logger.info("Supervisor 시작")
+
+        for _ in range(self._min_workers):
+            self._start_worker()
+
+        try:
+            while not self._shutdown:
+                self._reap_workers()
+                self._autoscale()
+                self._cleanup_consumers()
+                self._wakeup.wait(self._next_wait())
+        finally:
+            self._stop_all()
+
+        logger.info("Supervisor 종료")
+
+    def _consumer_name(self, slot: int) -> str:
+        """슬롯 번호의 Consumer 이름"""
+        return f"{self._base_name}-{slot}"
+
+    def _start_worker(self):
+        """비어 있는 가장 작은 슬롯에 워커 프로세스 시작"""
+        slot = 1
+        while slot in self._processes or slot in self._retiring or slot in self._restart_at:
+            slot += 1
+        self._start_worker_at(slot)
+
+    def _start_worker_at(self, slot: int):
+        """지정한 슬롯에 워커 프로세스 시작"""
+        consumer_name = self._consumer_name(slot)
+        process = self._context.Process(
+            target=self._worker_target,
+            args=(consumer_name, slot),
+            name=consumer_name,
+        )
+        process.start()
+        self._processes[slot] = process
+        self._started_at[slot] = time.monotonic()
+        self._retired_consumers.discard(consumer_name)
+        logger.info("워커 프로세스 시작", consumer=consumer_name, pid=process.pid)
+
+    def _reap_workers(self):
+        """종료된 워커 정리 및 비정상 종료 워커 재시작 (시작 실패가 반복되면 backoff 후 재시작)"""
+        now = time.monotonic()
+        for slot, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+
+            process.join()
+            del self._processes[slot]
+            uptime = now - self._started_at.pop(slot, now)
+            if uptime < self._min_uptime:
+                self._failures[slot] = self._failures.get(slot, 0) + 1
+            else:
+                self._failures.pop(slot, None)
+
+            failures = self._failures.get(slot, 0)
+            delay = 0.0
+            if failures:
+                delay = min(self._restart_backoff_max, self._restart_backoff * 2 ** (failures - 1))
+            self._restart_at[slot] = now + delay
+            logger.error(
+                "워커 프로세스 종료 감지, 재시작",
+                consumer=self._consumer_name(slot),
+                exitcode=process.exitcode,
+                uptime=round(uptime, 1),
+                failures=failures,
+                restart_delay=delay,
+            )
+
+        for slot, restart_at in list(self._restart_at.items()):
+            if self._shutdown or restart_at > now:
+                continue
+            del self._restart_at[slot]
+            self._start_worker_at(slot)
+
+        for slot, process in list(self._retiring.items()):
+            if process.is_alive():
+                continue
+
+            process.join()
+            del self._retiring[slot]
+            self._retired_consumers.add(self._consumer_name(slot))
+            logger.info("축소 워커 종료 완료", consumer=self._consumer_name(slot))
+
+    def _autoscale(self):
+        """Consumer Group 적체량에 맞춰 워커 수 조절"""
+        try:
+            lag, pending = self._message_subscriber.group_backlog()
+        except Exception as e:
+            logger.warning("적체량 조회 실패", error=str(e), error_type=type(e).__name__)
+            return
+
+        desired = math.ceil((lag + pending) / self._messages_per_worker)
+        desired = min(self._max_workers, max(self._min_workers, desired))
+        # backoff 대기 중인 슬롯도 실행 중으로 셈 (대기 중에 새 슬롯으로 확장하지 않음)
+        current = len(self._processes) + len(self._restart_at)
+
+        if desired > current:
+            logger.info("워커 확장", lag=lag, pending=pending, current=current, desired=desired)
+            for _ in range(desired - current):
+                self._start_worker()
+
+        elif desired < current:
+            now = time.monotonic()
+            if now - self._last_scale_in < self._scale_in_cooldown:
+                return
+
+            # 급격한 축소를 막기 위해 한 번에 1개씩 축소 (재시작 대기 중인 슬롯부터)
+            if self._restart_at:
+                slot = max(self._restart_at)
+                del self._restart_at[slot]
+                self._failures.pop(slot, None)
+                self._retired_consumers.add(self._consumer_name(slot))
+            else:
+                slot = max(self._processes)
+                process = self._processes.pop(slot)
+                process.terminate()  # SIGTERM: 처리 중인 메시지를 마친 뒤 종료
+                self._retiring[slot] = process
+            self._last_scale_in = now
+            logger.info(
+                "워커 축소",
+                lag=lag,
+                pending=pending,
+                current=current,
+                desired=desired,
+                consumer=self._consumer_name(slot),
+            )
+
+    def _cleanup_consumers(self):
+        """축소된 Consumer 중 PEL이 비어 있는 Consumer 삭제"""
+        if not self._retired_consumers:
+            return
+
+        try:
+            pending_counts = self._message_subscriber.consumer_pending_counts()
+            for consumer_name in list(self._retired_consumers):
+                pending = pending_counts.get(consumer_name)
+                if pending:
+                    # 남은 메시지는 다른 워커가 XCLAIM으로 회수한 뒤 다시 확인
+                    continue
+                if pending is not None:
+                    self._message_subscriber.delete_consumer(consumer_name)
+                self._retired_consumers.discard(consumer_name)
+        except Exception as e:
+            logger.warning("Consumer 정리 실패", error=str(e), error_type=type(e).__name__)
+
+    def _next_wait(self) -> float:
+        """다음 관리 주기까지 대기 시간 (재시작 예정 시각이 더 이르면 그때까지)"""
+        if not self._restart_at:
+            return self._check_interval
+        return max(0.0, min(self._check_interval, min(self._restart_at.values()) - time.monotonic()))
+
+    def _stop_all(self):
+        """모든 워커에 종료 요청 후 대기 (stop_timeout 안에 끝나지 않으면 SIGKILL)"""
+        processes = list(self._processes.values()) + list(self._retiring.values())
+        logger.info("워커 프로세스 종료 대기", count=len(processes))
+
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self._stop_timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("워커 프로세스 종료 시간 초과, 강제 종료", consumer=process.name, pid=process.pid)
+                process.kill()
+                process.join()
+
+        self._processes.clear()
+        self._retiring.clear()
+        self._restart_at.clear()
+
+    def shutdown(self):
+        """종료 요청"""
+        logger.info("Supervisor 종료 요청")
+        self._shutdown = True
+        self._wakeup.set()
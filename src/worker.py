@@ -4,11 +4,21 @@
 메시지 처리 루프를 담당합니다.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
+
+from config.worker import BACKPRESSURE_CONFIG, WORKER_CONFIG
 from src.infrastructure.database import Database
-from src.infrastructure.message_publisher import MessagePublisher
+from src.infrastructure.message_publisher import DOWNSTREAM_PAUSED, DOWNSTREAM_SLOW, MessagePublisher
 from src.infrastructure.message_subscriber import MessageSubscriber
 from src.logger import get_logger
+from src.metrics import IN_FLIGHT, MESSAGES_FAILED, MESSAGES_PROCESSED, STAGE_DURATION
+from src.models.analysis_data import AnalysisData
 from src.models.analysis_message import AnalysisMessage
+from src.models.analysis_result import AnalysisResult
+from src.models.raw_data import RawData
 from src.services.llm_service import LLMService
 
 logger = get_logger("worker")
@@ -19,6 +29,14 @@ class Worker:
     분석 워커
 
     메시지 수신 → LLM 분석 → DB 저장 → 메시지 발행 흐름을 처리합니다.
+    max_in_flight가 1보다 크면 스레드 풀에서 여러 메시지를 동시에 처리하고,
+    batch_size가 1보다 크면 메시지를 일괄 수신하여 ACK도 모아서 처리하고,
+    batch_prompting이 켜져 있으면 일괄 수신한 메시지를 LLM 요청 1회로 묶어 분석합니다.
+    reclaim이 켜져 있으면 종료된 워커가 남긴 Pending 메시지를 주기적으로 회수하여
+    새 메시지와 함께 처리합니다.
+    outbox가 켜져 있으면 분석 결과와 발행 메시지를 한 트랜잭션으로 저장하고 바로 ACK하며,
+    Redis 발행은 OutboxRelay가 맡습니다.
+    하위 레이어 백프레셔가 켜져 있으면 출력 스트림 적체에 따라 수신을 늦추거나 멈춥니다.
     """
 
     def __init__(
@@ -27,13 +45,57 @@ class Worker:
         llm_service: LLMService,
         database: Database,
         message_publisher: MessagePublisher,
+        max_in_flight: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_prompting: Optional[bool] = None,
     ):
         self._message_subscriber = message_subscriber
         self._llm_service = llm_service
         self._database = database
         self._message_publisher = message_publisher
         self._shutdown = False
-        logger.info("Worker 초기화 완료")
+
+        # 동시 처리 설정
+        if max_in_flight is None:
+            max_in_flight = WORKER_CONFIG["max_in_flight"]
+        self._max_in_flight = max(1, max_in_flight)
+        self._in_flight = 0
+        self._in_flight_ids: Set[str] = set()  # 처리 중인 메시지 ID (회수 대상에서 제외)
+        self._in_flight_condition = threading.Condition()
+
+        # 일괄 수신/ACK 설정
+        if batch_size is None:
+            batch_size = WORKER_CONFIG["batch_size"]
+        self._batch_size = max(1, batch_size)
+        self._pending_acks: List[str] = []
+        self._ack_lock = threading.Lock()
+
+        # 묶음 분석 설정
+        if batch_prompting is None:
+            batch_prompting = WORKER_CONFIG["batch_prompting"]
+        self._batch_prompting = batch_prompting
+
+        # Pending 메시지 회수 설정
+        self._reclaim_enabled = WORKER_CONFIG["reclaim_enabled"]
+        self._reclaim_min_idle_ms = WORKER_CONFIG["reclaim_min_idle_ms"]
+        self._reclaim_interval = WORKER_CONFIG["reclaim_interval"]
+        self._reclaim_count = WORKER_CONFIG["reclaim_count"]
+        self._reclaim_max_deliveries = WORKER_CONFIG["reclaim_max_deliveries"]
+        self._next_reclaim_at = 0.0
+
+        # Outbox 설정
+        self._outbox_enabled = WORKER_CONFIG["outbox_enabled"]
+
+        # 하위 레이어 백프레셔 설정
+        self._downstream_slow_delay = BACKPRESSURE_CONFIG["slow_delay"]
+
+        logger.info(
+            "Worker 초기화 완료",
+            max_in_flight=self._max_in_flight,
+            batch_size=self._batch_size,
+            batch_prompting=self._batch_prompting,
+            outbox_enabled=self._outbox_enabled,
+        )
 
     def run(self):
         """
@@ -41,50 +103,380 @@ class Worker:
 
         종료 요청이 올 때까지 메시지를 처리합니다.
         """
-        logger.info("Worker 시작")
+        logger.info(
+            "Worker 시작",
+            max_in_flight=self._max_in_flight,
+            batch_size=self._batch_size,
+        )
+
+        try:
+            if self._max_in_flight > 1:
+                self._run_concurrent()
+            else:
+                self._run_sequential()
+        finally:
+            # 처리 완료했지만 아직 ACK하지 않은 메시지 정리
+            self._flush_acks()
+
+        logger.info("Worker 종료")
 
+    def _run_sequential(self):
+        """메시지를 순차 처리"""
         while not self._shutdown:
-            # 메시지 수신 (blocking)
+            # 하위 레이어 백프레셔: 적체가 풀릴 때까지 수신 중지
+            if not self._wait_for_downstream():
+                continue
+
+            # 방치된 메시지 회수, 없으면 새 메시지 수신 (blocking)
+            raw_data_list = self._reclaim(self._reclaim_count) or self._receive(self._batch_size)
+
+            for group in self._group(raw_data_list):
+                IN_FLIGHT.inc(len(group))
+                analyzed = group
+                try:
+                    analyzed, analysis_results, _ = self._split_failed(group, self._analyze(group))
+                    analysis_data_list = self._save(analyzed, analysis_results) if analyzed else []
+                    for raw_data, analysis_data in zip(analyzed, analysis_data_list):
+                        self._publish(raw_data, analysis_data)
+                        self._complete(raw_data.message_id)
+                except Exception:
+                    MESSAGES_FAILED.inc(len(analyzed))
+                    raise
+                finally:
+                    IN_FLIGHT.dec(len(group))
+
+            self._flush_acks()
+
+    def _run_concurrent(self):
+        """
+        메시지를 스레드 풀에서 동시 처리
+
+        처리 중인 메시지가 max_in_flight에 도달하면 슬롯이 빌 때까지 수신을 멈춥니다.
+        종료 요청 시 새 메시지 수신을 중단하고 처리 중인 메시지를 모두 마친 뒤 반환합니다.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_in_flight,
+            thread_name_prefix="analysis",
+        )
+        try:
+            while not self._shutdown:
+                self._flush_acks()
+
+                # 백프레셔: 처리 슬롯이 빌 때까지 대기
+                free_slots = self._wait_for_slots()
+                if free_slots == 0:
+                    continue
+
+                # 하위 레이어 백프레셔: 적체가 풀릴 때까지 수신 중지 (처리 중인 메시지는 계속 진행)
+                if not self._wait_for_downstream():
+                    continue
+
+                # 방치된 메시지 회수, 없으면 새 메시지 수신 (blocking) - 빈 슬롯 수만큼만 수신
+                raw_data_list = (
+                    self._reclaim(min(self._reclaim_count, free_slots))
+                    or self._receive(min(self._batch_size, free_slots))
+                )
+
+                if not raw_data_list:
+                    # 타임아웃 - 다음 루프로
+                    continue
+
+                with self._in_flight_condition:
+                    self._in_flight += len(raw_data_list)
+                    self._in_flight_ids.update(raw_data.message_id for raw_data in raw_data_list)
+                IN_FLIGHT.inc(len(raw_data_list))
+                for group in self._group(raw_data_list):
+                    executor.submit(self._process_in_pool, group)
+        finally:
+            logger.info("처리 중인 메시지 완료 대기", in_flight=self._in_flight)
+            executor.shutdown(wait=True)
+
+    def _wait_for_slots(self) -> int:
+        """
+        처리 슬롯 확보 대기
+
+        Returns:
+            비어 있는 슬롯 수 (종료 요청으로 대기를 멈췄으면 0일 수 있음)
+        """
+        with self._in_flight_condition:
+            while self._in_flight >= self._max_in_flight and not self._shutdown:
+                # 시그널 처리 및 종료 확인을 위해 주기적으로 깨어남
+                self._in_flight_condition.wait(timeout=1.0)
+            return max(0, self._max_in_flight - self._in_flight)
+
+    def _wait_for_downstream(self) -> bool:
+        """
+        하위 레이어 적체에 따른 수신 조절
+
+        slow면 slow_delay만큼 기다린 뒤 수신하고, paused면 잠시 기다린 뒤 다시 확인하도록 False를 돌려줍니다.
+
+        Returns:
+            지금 수신해도 되는지 여부
+        """
+        state = self._message_publisher.downstream_state()
+        if state == DOWNSTREAM_PAUSED:
+            # 시그널 처리 및 종료 확인을 위해 짧게 대기
+            time.sleep(1.0)
+            return False
+        if state == DOWNSTREAM_SLOW:
+            time.sleep(self._downstream_slow_delay)
+        return True
+
+    def _receive(self, count: int) -> List[RawData]:
+        """
+        메시지 수신 (blocking)
+
+        일괄 모드에서는 XREADGROUP 1회로 최대 count건을 수신합니다.
+
+        Returns:
+            수신된 메시지 목록, 타임아웃 시 빈 리스트
+        """
+        with STAGE_DURATION.labels("receive").time():
+            if self._batch_size > 1:
+                return self._message_subscriber.receive_batch(count)
+
             raw_data = self._message_subscriber.receive()
+            return [raw_data] if raw_data is not None else []
 
-            if raw_data is None:
-                # 타임아웃 - 다음 루프로
-                continue
+    def _reclaim(self, count: int) -> List[RawData]:
+        """
+        방치된 Pending 메시지 회수
+
+        reclaim_interval마다 최대 count건을 XCLAIM으로 가져옵니다.
+        PEL 스캔을 새로 시작할 때 XPENDING으로 Pending 메시지가 없으면 건너뜁니다.
+        이 워커에서 처리 중이거나 ACK 대기 중인 메시지는 제외하고,
+        최대 전달 횟수를 넘긴 메시지는 dead-letter 처리합니다.
+
+        Returns:
+            회수한 메시지 목록 (회수 시점이 아니거나 대상이 없으면 빈 리스트)
+        """
+        if not self._reclaim_enabled:
+            return []
 
+        now = time.monotonic()
+        if now < self._next_reclaim_at:
+            return []
+        self._next_reclaim_at = now + self._reclaim_interval
+
+        try:
+            if (
+                self._message_subscriber.is_claim_scan_complete()
+                and self._message_subscriber.pending_count() == 0
+            ):
+                return []
+            with self._in_flight_condition:
+                exclude_ids = set(self._in_flight_ids)
+            with self._ack_lock:
+                exclude_ids.update(self._pending_acks)
+            return self._message_subscriber.claim_stale(
+                self._reclaim_min_idle_ms,
+                count,
+                max_deliveries=self._reclaim_max_deliveries,
+                exclude_ids=exclude_ids,
+            )
+        except Exception as e:
+            # 회수 실패는 새 메시지 처리를 막지 않음
+            logger.warning("Pending 메시지 회수 실패", error=str(e), error_type=type(e).__name__)
+            return []
+
+    def _complete(self, message_id: str):
+        """
+        처리 완료 메시지 ACK
+
+        일괄 모드에서는 ACK를 모아 두었다가 batch_size만큼 쌓이면 한 번에 처리합니다.
+        ACK에 실패한 메시지는 모아 둔 목록으로 돌려 다음 _flush_acks()에서 다시 시도합니다.
+        """
+        MESSAGES_PROCESSED.inc()
+
+        if self._batch_size == 1:
+            self._ack([message_id])
+            return
+
+        with self._ack_lock:
+            self._pending_acks.append(message_id)
+            if len(self._pending_acks) < self._batch_size:
+                return
+            message_ids, self._pending_acks = self._pending_acks, []
+
+        self._ack(message_ids)
+
+    def _flush_acks(self):
+        """모아 둔 ACK 일괄 처리 (실패하면 다시 모아 두고 예외를 올리지 않음)"""
+        with self._ack_lock:
+            message_ids, self._pending_acks = self._pending_acks, []
+
+        if message_ids:
+            self._ack(message_ids)
+
+    def _ack(self, message_ids: List[str]):
+        """
+        메시지 ACK
+
+        실패하면 메시지를 모아 둔 목록 앞에 돌려 두고 로그만 남깁니다 (워커는 계속 실행).
+        종료 시 마지막 재시도까지 실패한 메시지는 Pending으로 남습니다.
+        """
+        try:
+            with STAGE_DURATION.labels("ack").time():
+                if len(message_ids) == 1 and self._batch_size == 1:
+                    self._message_subscriber.ack(message_ids[0])
+                else:
+                    self._message_subscriber.ack_many(message_ids)
+        except Exception as e:
+            with self._ack_lock:
+                self._pending_acks[:0] = message_ids
+            logger.error(
+                "메시지 ACK 실패 (다음에 재시도)",
+                count=len(message_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    def _group(self, raw_data_list: List[RawData]) -> List[List[RawData]]:
+        """
+        분석 단위로 메시지 묶기
+
+        묶음 분석 모드에서는 수신한 메시지 전체를, 아니면 메시지 1건씩을 한 단위로 합니다.
+        """
+        if self._batch_prompting and len(raw_data_list) > 1:
+            return [raw_data_list]
+        return [[raw_data] for raw_data in raw_data_list]
+
+    def _release(self, raw_data_list: List[RawData]):
+        """처리 슬롯 반환"""
+        with self._in_flight_condition:
+            self._in_flight -= len(raw_data_list)
+            self._in_flight_ids.difference_update(raw_data.message_id for raw_data in raw_data_list)
+            self._in_flight_condition.notify()
+        IN_FLIGHT.dec(len(raw_data_list))
+
+    def _process_in_pool(self, raw_data_list: List[RawData]):
+        """
+        스레드 풀에서 분석 단위 처리
+
+        실패한 메시지는 ACK하지 않고 Pending 상태로 남겨 재처리 대상이 되도록 합니다.
+        """
+        try:
+            raw_data_list, analysis_results, failed = self._split_failed(raw_data_list, self._analyze(raw_data_list))
+            if failed:
+                self._release(failed)
+            analysis_data_list = self._save(raw_data_list, analysis_results) if raw_data_list else []
+        except Exception as e:
+            logger.error(
+                "메시지 분석/저장 실패 (ACK 보류)",
+                message_ids=[raw_data.message_id for raw_data in raw_data_list],
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            MESSAGES_FAILED.inc(len(raw_data_list))
+            self._release(raw_data_list)
+            return
+
+        for raw_data, analysis_data in zip(raw_data_list, analysis_data_list):
+            try:
+                self._publish(raw_data, analysis_data)
+                self._complete(raw_data.message_id)
+            except Exception as e:
+                logger.error(
+                    "메시지 처리 실패 (ACK 보류)",
+                    message_id=raw_data.message_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                MESSAGES_FAILED.inc()
+            finally:
+                self._release([raw_data])
+
+    def _analyze(self, raw_data_list: List[RawData]) -> List[AnalysisResult]:
+        """
+        LLM 분석
+
+        메시지가 여러 건이면 묶음 분석, 1건이면 단건 분석을 수행합니다.
+
+        Args:
+            raw_data_list: 분석할 원본 데이터 목록
+
+        Returns:
+            입력 순서와 동일한 분석 결과 목록 (묶음 분석에서 실패한 항목은 None)
+        """
+        for raw_data in raw_data_list:
             logger.info(
                 "메시지 처리 시작",
                 message_id=raw_data.message_id,
             )
 
-            # LLM 분석
-            analysis_result = self._llm_service.analyze(raw_data.content)
-
-            # DB 저장
-            analysis_data = self._database.save_analysis_data(raw_data.id, analysis_result)
-
-            # 메시지 모델 생성 (DB 모델 + 원본 메타정보)
-            analysis_message = AnalysisMessage(
-                id=analysis_data.id,
-                raw_data_id=analysis_data.raw_data_id,
-                semantic_summary=analysis_data.semantic_summary,
-                display_summary=analysis_data.display_summary,
-                keywords=analysis_data.keywords,
-                prompt_version=analysis_data.prompt_version,
-                channel=raw_data.channel,
-                original_link=raw_data.link,
-                published_at=raw_data.published_at,
+        if len(raw_data_list) > 1:
+            return self._llm_service.analyze_batch(
+                [raw_data.content for raw_data in raw_data_list],
+                [raw_data.channel for raw_data in raw_data_list],
             )
 
-            # 메시지 발행
-            self._message_publisher.publish(analysis_message)
+        return [self._llm_service.analyze(raw_data_list[0].content, raw_data_list[0].channel)]
 
-            # 처리 완료 ACK
-            self._message_subscriber.ack(raw_data.message_id)
-            logger.info("메시지 처리 완료", message_id=raw_data.message_id)
+    def _split_failed(
+        self,
+        raw_data_list: List[RawData],
+        analysis_results: List[Optional[AnalysisResult]],
+    ) -> Tuple[List[RawData], List[AnalysisResult], List[RawData]]:
+        """
+        분석에 실패한 항목(None) 분리
 
-        logger.info("Worker 종료")
+        실패한 메시지는 ACK하지 않고 Pending 상태로 남기며, 나머지는 그대로 저장/발행합니다.
+
+        Returns:
+            (분석한 메시지 목록, 분석 결과 목록, 실패한 메시지 목록)
+        """
+        analyzed = [(raw_data, result) for raw_data, result in zip(raw_data_list, analysis_results) if result is not None]
+        failed = [raw_data for raw_data, result in zip(raw_data_list, analysis_results) if result is None]
+        if failed:
+            logger.error("메시지 분석 실패 (ACK 보류)", message_ids=[raw_data.message_id for raw_data in failed])
+            MESSAGES_FAILED.inc(len(failed))
+        return [raw_data for raw_data, _ in analyzed], [result for _, result in analyzed], failed
+
+    def _save(
+        self,
+        raw_data_list: List[RawData],
+        analysis_results: List[AnalysisResult],
+    ) -> List[AnalysisData]:
+        """
+        분석 결과 DB 저장
+
+        여러 건이면 단일 커밋으로 일괄 저장합니다.
+        outbox 모드에서는 발행 메시지도 같은 트랜잭션으로 저장합니다.
+
+        Returns:
+            입력 순서와 동일한 AnalysisData 목록
+        """
+        if self._outbox_enabled:
+            return self._database.save_analysis_data_with_outbox(list(zip(raw_data_list, analysis_results)))
+
+        if len(raw_data_list) > 1:
+            return self._database.save_analysis_data_batch(
+                [(raw_data.id, analysis_result) for raw_data, analysis_result in zip(raw_data_list, analysis_results)]
+            )
+
+        return [self._database.save_analysis_data(raw_data_list[0].id, analysis_results[0])]
+
+    def _publish(self, raw_data: RawData, analysis_data: AnalysisData):
+        """
+        분석 결과 발행
+
+        ACK는 호출자가 발행 성공 후 _complete()로 처리합니다.
+        outbox 모드에서는 저장 시 이미 outbox에 기록되었으므로 발행하지 않습니다.
+
+        Args:
+            raw_data: 수신된 원본 데이터
+            analysis_data: 저장된 분석 데이터
+        """
+        if not self._outbox_enabled:
+            # 메시지 모델 생성 (DB 모델 + 원본 메타정보) 후 발행
+            analysis_message = AnalysisMessage.from_analysis_data(analysis_data, raw_data)
+            self._message_publisher.publish(analysis_message)
+
+        logger.info("메시지 처리 완료", message_id=raw_data.message_id)
 
     def shutdown(self):
         """종료 요청"""
         logger.info("Worker 종료 요청")
         self._shutdown = True
+        with self._in_flight_condition:
+            self._in_flight_condition.notify_all()
@@ -0,0 +1,271 @@
+"""
+테스트 공용 fixture
+
+Redis, Oracle, Gemini는 benchmarks.fakes의 메모리 대역을 사용하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from benchmarks.fakes import FakeGenaiClient, FakeOraclePool, FakeRedis
+from config.redis import REDIS_CONFIG
+from src.async_worker import AsyncWorker
+from src.infrastructure.database import Database
+from src.infrastructure.message_publisher import MessagePublisher
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.services.llm_service import LLMService
+from src.worker import Worker
+
+
+def wait_until(condition, timeout: float = 10.0):
+    """조건이 참이 될 때까지 대기 (시간 초과 시 실패)"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class CountingSubscriber(MessageSubscriber):
+    """ACK된 메시지 ID별 횟수를 기록하고, ack/ack_many를 지정한 횟수만큼 실패시키는 MessageSubscriber"""
+
+    def __init__(self, client: FakeRedis, ack_failures: int = 0):
+        super().__init__(client=client)
+        self._block_timeout = 50
+        self.ack_failures = ack_failures
+        self.acks = Counter()
+
+    def ack(self, message_id):
+        self._fail_if_requested()
+        super().ack(message_id)
+        self.acks[message_id] += 1
+
+    def ack_many(self, message_ids):
+        self._fail_if_requested()
+        super().ack_many(message_ids)
+        self.acks.update(message_ids)
+
+    def _fail_if_requested(self):
+        if self.ack_failures > 0:
+            self.ack_failures -= 1
+            raise ConnectionError("redis unavailable")
+
+
+class AsyncSubscriberAdapter:
+    """MessageSubscriber를 AsyncMessageSubscriber 인터페이스로 감싼 대역"""
+
+    def __init__(self, subscriber: MessageSubscriber):
+        self.subscriber = subscriber
+
+    async def receive_batch(self, count: int):
+        return await asyncio.to_thread(self.subscriber.receive_batch, count)
+
+    async def ack_many(self, message_ids):
+        self.subscriber.ack_many(message_ids)
+
+    async def pending_count(self) -> int:
+        return self.subscriber.pending_count()
+
+    async def claim_stale(self, min_idle_ms: int, count: int, **options):
+        return self.subscriber.claim_stale(min_idle_ms, count, **options)
+
+    def is_claim_scan_complete(self) -> bool:
+        return self.subscriber.is_claim_scan_complete()
+
+
+class AsyncDatabaseAdapter:
+    """Database를 AsyncDatabase 인터페이스로 감싼 대역"""
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def save_analysis_data(self, raw_data_id, analysis_result):
+        return await asyncio.to_thread(self.database.save_analysis_data, raw_data_id, analysis_result)
+
+
+class AsyncPublisherAdapter:
+    """MessagePublisher를 AsyncMessagePublisher 인터페이스로 감싼 대역"""
+
+    def __init__(self, publisher: MessagePublisher):
+        self.publisher = publisher
+
+    async def publish(self, analysis_message):
+        return self.publisher.publish(analysis_message)
+
+    async def downstream_state(self) -> str:
+        return self.publisher.downstream_state()
+
+
+class CountingLLM:
+    """LLMService.analyze/analyze_async를 감싸 동시 호출 수를 기록하고, 지정한 본문은 실패시키는 대역"""
+
+    def __init__(self, llm_service: LLMService, fail_marker: str = None):
+        self._analyze = llm_service.analyze
+        self._analyze_async = llm_service.analyze_async
+        self._fail_marker = fail_marker
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        llm_service.analyze = self.analyze
+        llm_service.analyze_async = self.analyze_async
+
+    def analyze(self, content, channel=None):
+        self._enter(content)
+        try:
+            return self._analyze(content, channel)
+        finally:
+            self._exit()
+
+    async def analyze_async(self, content, channel=None):
+        self._enter(content)
+        try:
+            return await self._analyze_async(content, channel)
+        finally:
+            self._exit()
+
+    def _enter(self, content):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        if self._fail_marker is not None and self._fail_marker in content:
+            self._exit()
+            raise RuntimeError("analysis failed")
+
+    def _exit(self):
+        with self._lock:
+            self.running -= 1
+
+
+class WorkerHarness:
+    """
+    Worker 또는 AsyncWorker를 백그라운드 스레드에서 실행하고 ACK/동시 처리 수를 기록하는 테스트 도우미
+
+    engine="async"이면 동기 대역을 비동기 인터페이스로 감싸 AsyncWorker에 주입하고,
+    스레드 안에서 asyncio.run()으로 실행합니다.
+    """
+
+    def __init__(
+        self,
+        client: FakeRedis,
+        engine: str = "sync",
+        ack_failures: int = 0,
+        llm_latency: float = 0.0,
+        fail_marker: str = None,
+        database: Database = None,
+        **options,
+    ):
+        self.subscriber = CountingSubscriber(client, ack_failures)
+        self.llm_service = LLMService(client=FakeGenaiClient(latency=llm_latency, jitter=0.0))
+        self.llm = CountingLLM(self.llm_service, fail_marker)
+        self.engine = engine
+        database = database or Database(pool=FakeOraclePool(commit_latency=0.0))
+        message_publisher = MessagePublisher(client=client)
+
+        if engine == "async":
+            self.worker = AsyncWorker(
+                message_subscriber=AsyncSubscriberAdapter(self.subscriber),
+                llm_service=self.llm_service,
+                database=AsyncDatabaseAdapter(database),
+                message_publisher=AsyncPublisherAdapter(message_publisher),
+                **options,
+            )
+        else:
+            self.worker = Worker(
+                message_subscriber=self.subscriber,
+                llm_service=self.llm_service,
+                database=database,
+                message_publisher=message_publisher,
+                **options,
+            )
+        self._thread = None
+
+    @property
+    def acks(self) -> Counter:
+        return self.subscriber.acks
+
+    @property
+    def in_flight(self) -> int:
+        if self.engine == "async":
+            return len(self.worker._tasks)
+        return self.worker._in_flight
+
+    def flush_acks(self):
+        """모아 둔 ACK 일괄 처리 (워커를 실행하지 않은 상태에서 호출)"""
+        if self.engine == "async":
+            asyncio.run(self.worker._flush_acks())
+        else:
+            self.worker._flush_acks()
+
+    def start(self):
+        if self.engine == "async":
+            self._thread = threading.Thread(target=asyncio.run, args=(self.worker.run(),))
+        else:
+            self._thread = threading.Thread(target=self.worker.run)
+        self._thread.start()
+
+    def stop(self):
+        """종료 요청 후 run()이 반환될 때까지 대기"""
+        if self._thread is None:
+            return
+        self.worker.shutdown()
+        self._thread.join(10)
+        assert not self._thread.is_alive()
+        self._thread = None
+
+
+@pytest.fixture(params=["sync", "async"])
+def engine(request) -> str:
+    """워커 엔진 (Worker/AsyncWorker 양쪽에서 같은 시나리오 실행)"""
+    return request.param
+
+
+@pytest.fixture
+def redis_client() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def genai_client() -> FakeGenaiClient:
+    return FakeGenaiClient(latency=0.0, jitter=0.0)
+
+
+@pytest.fixture
+def add_messages(redis_client):
+    """입력 스트림에 원본 데이터 메시지 추가 (개수 또는 본문 목록, 원본 ID는 1부터 차례로 부여)"""
+    added = 0
+
+    def add(contents):
+        nonlocal added
+        if isinstance(contents, int):
+            contents = [f"We will put tariffs on imported goods #{added + index + 1}." for index in range(contents)]
+        for content in contents:
+            added += 1
+            redis_client.xadd(REDIS_CONFIG["input_stream"], {"data": json.dumps({
+                "id": added,
+                "content": content,
+                "link": f"https://truthsocial.com/@realDonaldTrump/posts/{added}",
+                "published_at": datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat(),
+                "channel": "truth_social",
+            })})
+
+    return add
+
+
+@pytest.fixture
+def make_worker(redis_client):
+    """WorkerHarness 생성 (테스트가 끝나면 실행 중인 워커를 종료)"""
+    harnesses = []
+
+    def make(**options) -> WorkerHarness:
+        harness = WorkerHarness(redis_client, **options)
+        harnesses.append(harness)
+        return harness
+
+    yield make
+    for harness in harnesses:
+        harness.stop()
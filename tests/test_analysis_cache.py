@@ -0,0 +1,119 @@
+"""
+AnalysisCache 테스트
+
+프로세스 내 LRU 캐시만 사용하므로 Redis 없이 실행되며,
+LLMService 연동은 benchmarks.fakes의 FakeGenaiClient를 사용합니다.
+"""
+
+import pytest
+
+from config.llm import MODEL_ROUTING_CONFIG
+from src.logger import setup_logging, get_logger
+from src.metrics import CACHE_LOOKUPS
+from src.models.analysis_result import AnalysisResult
+from src.services.analysis_cache import AnalysisCache, normalize_content
+from src.services.llm_service import LLMService
+from src.services.model_router import ModelRouter
+
+setup_logging()
+logger = get_logger("test_analysis_cache")
+
+
+def _make_result(summary: str) -> AnalysisResult:
+    return AnalysisResult(
+        semantic_summary=summary,
+        display_summary="요약",
+        keywords=["관세"],
+        prompt_version="test",
+    )
+
+
+def test_normalize_content():
+    """공백/유니코드 변형은 같은 본문으로 정규화"""
+    assert normalize_content("  Tariffs   on\nChina  ") == "Tariffs on China"
+    assert normalize_content("ＮＡＴＯ") == "NATO"
+
+
+def test_local_cache_hit_and_miss():
+    """동일 본문 재요청 시 캐시 히트"""
+    cache = AnalysisCache(shared_enabled=False)
+    content = "We will impose 25% tariffs on China."
+
+    assert cache.get(content) is None
+
+    cache.put(content, _make_result("tariffs"))
+    cached = cache.get("We will  impose 25% tariffs on China.\n")
+
+    assert cached is not None
+    assert cached.semantic_summary == "tariffs"
+
+    stats = cache.stats()
+    logger.info("캐시 통계", **stats)
+    assert stats["local_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_local_cache_eviction():
+    """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = AnalysisCache(shared_enabled=False)
+    cache._local_max_size = 2
+
+    cache.put("a", _make_result("a"))
+    cache.put("b", _make_result("b"))
+    cache.get("a")
+    cache.put("c", _make_result("c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_lookup_counters_per_tier(redis_client):
+    """local 미스일 때만 redis를 조회하고, 두 계층의 히트/미스를 각각 셈"""
+    series = [(tier, result) for tier in ("local", "redis") for result in ("hit", "miss")]
+    for labelvalues in series:
+        CACHE_LOOKUPS.labels(*labelvalues)
+    before = {labelvalues: CACHE_LOOKUPS.value(*labelvalues) for labelvalues in series}
+
+    def delta():
+        return {labelvalues: CACHE_LOOKUPS.value(*labelvalues) - before[labelvalues] for labelvalues in series}
+
+    content = "We will impose 25% tariffs on China."
+    writer = AnalysisCache(client=redis_client, shared_enabled=True)
+    reader = AnalysisCache(client=redis_client, shared_enabled=True)
+
+    assert reader.get(content) is None
+    assert delta() == {("local", "hit"): 0, ("local", "miss"): 1, ("redis", "hit"): 0, ("redis", "miss"): 1}
+
+    # 다른 프로세스가 저장한 결과는 redis 히트 후 local에 채워져 다음 조회는 local 히트
+    writer.put(content, _make_result("tariffs"))
+    assert reader.get(content) is not None
+    assert reader.get(content) is not None
+    assert delta() == {("local", "hit"): 1, ("local", "miss"): 2, ("redis", "hit"): 1, ("redis", "miss"): 1}
+
+    # 공유 캐시를 끄면 redis 계층은 세지 않음
+    assert AnalysisCache(shared_enabled=False).get(content) is None
+    assert delta() == {("local", "hit"): 1, ("local", "miss"): 3, ("redis", "hit"): 1, ("redis", "miss"): 1}
+
+
+def test_cache_is_keyed_on_routed_model(genai_client, monkeypatch):
+    """다른 모델로 라우팅되는 같은 본문은 캐시를 공유하지 않음"""
+    monkeypatch.setitem(MODEL_ROUTING_CONFIG, "short_model_name", "short-model")
+    monkeypatch.setitem(MODEL_ROUTING_CONFIG, "channel_models", {"truth_social": "channel-model"})
+    cache = AnalysisCache(shared_enabled=False)
+    llm_service = LLMService(cache=cache, client=genai_client, model_router=ModelRouter())
+    content = "We will impose 25% tariffs on China."
+
+    assert llm_service.analyze(content).model_name == "short-model"
+    assert llm_service.analyze(content).model_name == "short-model"
+    assert genai_client.models.calls == 1
+
+    # 채널 지정 모델로 라우팅되면 다시 분석하고, 결과는 그 모델 키로 저장
+    assert llm_service.analyze(content, "truth_social").model_name == "channel-model"
+    assert genai_client.models.calls == 2
+    assert cache.get(content, "channel-model").model_name == "channel-model"
+    assert cache.get(content, "short-model").model_name == "short-model"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,114 @@
+"""
+재분석(backfill) 테스트
+
+Oracle은 테스트용 메모리 대역을, Gemini는 benchmarks.fakes의 FakeGenaiClient를 사용하므로
+외부 서비스 없이 실행됩니다.
+"""
+
+import json
+
+import pytest
+
+from config.llm import LLM_CONFIG
+from src.backfill import Backfill
+from src.logger import setup_logging, get_logger
+from src.models.raw_data import RawData
+from src.services.llm_service import LLMService
+from src.services.prompts import ANALYSIS_PROMPT
+
+setup_logging()
+logger = get_logger("test_backfill")
+
+FAILING_CONTENT = "failing content"
+
+
+class _FakeDatabase:
+    """재분석 대상 조회/반영만 흉내내는 Database 대역"""
+
+    def __init__(self, contents):
+        # analysis_data.id → (프롬프트 버전, 원본 본문)
+        self.rows = {index + 1: ("v0", content) for index, content in enumerate(contents)}
+        self.fetched_after = []
+
+    def iter_reanalysis_targets(self, prompt_version, after_id=0, fetch_size=500):
+        self.fetched_after.append(after_id)
+        targets = [
+            (analysis_data_id, RawData(message_id="", id=analysis_data_id, content=content,
+                                       link="https://example.com", published_at="2025-01-01T00:00:00Z",
+                                       channel="truth_social"))
+            for analysis_data_id, (version, content) in sorted(self.rows.items())
+            if version != prompt_version and analysis_data_id > after_id
+        ]
+        for start in range(0, len(targets), fetch_size):
+            yield targets[start:start + fetch_size]
+
+    def update_analysis_data_batch(self, items):
+        for analysis_data_id, result in items:
+            self.rows[analysis_data_id] = (result.prompt_version, self.rows[analysis_data_id][1])
+        return len(items)
+
+
+class _FailingLLMService:
+    """FAILING_CONTENT만 분석에 실패하는 LLMService 대역"""
+
+    def __init__(self, llm_service: LLMService):
+        self._llm_service = llm_service
+
+    def analyze(self, content, channel=None):
+        if content == FAILING_CONTENT:
+            raise RuntimeError("analysis failed")
+        return self._llm_service.analyze(content, channel)
+
+
+@pytest.fixture
+def llm_service(genai_client, monkeypatch) -> LLMService:
+    monkeypatch.setitem(LLM_CONFIG, "verify_mode", "lazy")
+    return LLMService(client=genai_client)
+
+
+@pytest.fixture
+def checkpoint_file(tmp_path) -> str:
+    return str(tmp_path / "checkpoint.json")
+
+
+def test_backfill_resumes_from_checkpoint(llm_service, checkpoint_file):
+    """limit으로 중단한 뒤 다시 실행하면 체크포인트 다음 행부터 처리"""
+    database = _FakeDatabase([f"Tariffs on item {index}." for index in range(7)])
+    backfill = Backfill(
+        database,
+        llm_service,
+        checkpoint_file=checkpoint_file,
+        concurrency=2,
+        fetch_size=3,
+        write_batch_size=2,
+    )
+
+    first = backfill.run(limit=4)
+
+    with open(checkpoint_file) as f:
+        assert json.load(f)["last_id"] == 4
+    assert first["processed"] == 4
+
+    second = backfill.run()
+
+    assert database.fetched_after == [0, 4]
+    assert second["processed"] == 7
+    assert second["updated"] == 7
+    assert all(version == ANALYSIS_PROMPT.VERSION for version, _ in database.rows.values())
+
+
+def test_backfill_skips_failed_rows(llm_service, checkpoint_file):
+    """분석에 실패한 행은 이전 버전으로 남기고 다음 행을 계속 처리"""
+    database = _FakeDatabase(["Tariffs on steel.", FAILING_CONTENT, "Tariffs on cars."])
+    backfill = Backfill(database, _FailingLLMService(llm_service), checkpoint_file=checkpoint_file, write_batch_size=2)
+
+    checkpoint = backfill.run()
+
+    assert checkpoint["last_id"] == 3
+    assert checkpoint["failed"] == 1
+    assert database.rows[2][0] == "v0"
+    assert database.rows[3][0] == ANALYSIS_PROMPT.VERSION
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
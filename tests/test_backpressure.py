@@ -0,0 +1,87 @@
+"""
+하위 레이어 적체 기반 백프레셔 테스트
+
+Redis는 benchmarks.fakes의 FakeRedis를 사용하므로 외부 서비스 없이 실행됩니다.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from config.worker import BACKPRESSURE_CONFIG
+from src.infrastructure.message_publisher import (
+    DOWNSTREAM_NORMAL,
+    DOWNSTREAM_PAUSED,
+    DOWNSTREAM_SLOW,
+    DownstreamBackpressure,
+    MessagePublisher,
+)
+from src.logger import setup_logging, get_logger
+from src.metrics import DOWNSTREAM_BACKLOG, DOWNSTREAM_BACKPRESSURE_STATE
+from src.models.analysis_message import AnalysisMessage
+
+setup_logging()
+logger = get_logger("test_backpressure")
+
+DOWNSTREAM_GROUP = "deduplication-workers"
+
+
+def _group(lag: int, pending: int, name: str = DOWNSTREAM_GROUP) -> dict:
+    return {"name": name, "consumers": 1, "pending": pending, "lag": lag}
+
+
+def _message(message_id: int) -> AnalysisMessage:
+    return AnalysisMessage(
+        id=message_id,
+        raw_data_id=message_id,
+        semantic_summary="Tariffs on steel.",
+        display_summary="철강 관세",
+        keywords=["관세"],
+        prompt_version="1.0.1",
+        published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_watermarks_with_hysteresis():
+    """상한 이상이면 paused, 하한까지 내려와야 normal, 그 사이는 slow (paused에서 내려오는 중이면 유지)"""
+    backpressure = DownstreamBackpressure(low_watermark=10, high_watermark=100, sample_interval=0.0)
+
+    assert backpressure.update([_group(5, 0)]) == DOWNSTREAM_NORMAL
+    assert backpressure.update([_group(30, 20)]) == DOWNSTREAM_SLOW
+    assert backpressure.update([_group(80, 20)]) == DOWNSTREAM_PAUSED
+    assert backpressure.update([_group(40, 10)]) == DOWNSTREAM_PAUSED
+    assert backpressure.update([_group(5, 5)]) == DOWNSTREAM_NORMAL
+
+    # 기준 그룹이 없으면 적체가 가장 큰 그룹, lag을 계산할 수 없으면(None) pending만 사용
+    assert backpressure.update([_group(0, 0, "other"), _group(None, 200, "slow-group")]) == DOWNSTREAM_PAUSED
+    assert DOWNSTREAM_BACKPRESSURE_STATE.value() == 2
+    assert DOWNSTREAM_BACKLOG.value("pending") == 200
+
+
+def test_publisher_samples_downstream_group(redis_client, monkeypatch):
+    """발행자가 출력 스트림의 XINFO GROUPS로 하위 그룹 적체를 조회"""
+    for key, value in dict(
+        enabled=True,
+        consumer_group=DOWNSTREAM_GROUP,
+        low_watermark=2,
+        high_watermark=5,
+        sample_interval=0.0,
+    ).items():
+        monkeypatch.setitem(BACKPRESSURE_CONFIG, key, value)
+    stream = REDIS_CONFIG["output_stream"]
+    publisher = MessagePublisher(client=redis_client)
+    assert publisher.downstream_state() == DOWNSTREAM_NORMAL
+
+    redis_client.xgroup_create(stream, DOWNSTREAM_GROUP, id="0", mkstream=True)
+    publisher.publish_many([_message(index) for index in range(6)])
+    assert publisher.downstream_state() == DOWNSTREAM_PAUSED
+
+    # 하위 레이어가 따라잡으면 다시 정상 수신
+    entries = redis_client.xreadgroup(DOWNSTREAM_GROUP, "dedup-1", {stream: ">"}, count=10)
+    redis_client.xack(stream, DOWNSTREAM_GROUP, *[message_id for message_id, _ in entries[0][1]])
+    assert publisher.downstream_state() == DOWNSTREAM_NORMAL
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
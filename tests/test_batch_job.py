@@ -0,0 +1,126 @@
+"""
+배치 작업 모드 테스트
+
+Redis/Oracle/Gemini는 benchmarks.fakes의 메모리 대역을, 배치 작업은 LocalBatchAdapter를 사용하므로
+외부 서비스 없이 실행됩니다.
+"""
+
+import json
+import os
+
+import pytest
+
+from benchmarks.fakes import FakeOraclePool
+from config.llm import LLM_CONFIG
+from config.redis import REDIS_CONFIG
+from src.batch_job import CHECKPOINT_FILE, STAGE_SUBMITTED, BatchJobRunner
+from src.infrastructure.database import Database
+from src.infrastructure.message_publisher import MessagePublisher
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import setup_logging, get_logger
+from src.metrics import BATCH_JOB_ITEMS
+from src.services.batch_adapter import LocalBatchAdapter
+from src.services.llm_service import LLMService
+
+setup_logging()
+logger = get_logger("test_batch_job")
+
+INVALID_CONTENT = "invalid response"
+
+
+def _respond(request: dict) -> dict:
+    """요청 본문을 요약으로 돌려주는 배치 응답 (INVALID_CONTENT는 스키마에 맞지 않는 응답)"""
+    content = request["contents"][0]["parts"][0]["text"]
+    if content == INVALID_CONTENT:
+        text = '{"semantic_summary": "missing fields"}'
+    else:
+        text = json.dumps({"semantic_summary": content, "display_summary": "요약", "keywords": ["관세"]})
+    return {
+        "candidates": [{"content": {"parts": [{"text": text}]}}],
+        "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5},
+    }
+
+
+def _counter(result: str) -> float:
+    try:
+        return BATCH_JOB_ITEMS.value(result)
+    except KeyError:
+        return 0.0
+
+
+@pytest.fixture
+def pool() -> FakeOraclePool:
+    return FakeOraclePool(commit_latency=0.0)
+
+
+@pytest.fixture
+def work_dir(tmp_path) -> str:
+    return str(tmp_path / "job")
+
+
+@pytest.fixture
+def adapter(tmp_path) -> LocalBatchAdapter:
+    return LocalBatchAdapter(_respond, str(tmp_path / "adapter"))
+
+
+@pytest.fixture
+def make_runner(redis_client, genai_client, pool, work_dir, adapter, monkeypatch):
+    """테스트용 BatchJobRunner 생성 (같은 Redis/Oracle/작업 디렉터리를 공유)"""
+    monkeypatch.setitem(LLM_CONFIG, "verify_mode", "lazy")
+
+    def make() -> BatchJobRunner:
+        subscriber = MessageSubscriber(consumer_name="batch", client=redis_client)
+        subscriber._block_timeout = 10
+        return BatchJobRunner(
+            message_subscriber=subscriber,
+            llm_service=LLMService(client=genai_client),
+            database=Database(pool=pool),
+            message_publisher=MessagePublisher(client=redis_client),
+            adapter=adapter,
+            work_dir=work_dir,
+            min_items=1,
+            poll_interval=0.0,
+        )
+
+    return make
+
+
+def test_batch_job_saves_publishes_and_acks(redis_client, add_messages, pool, work_dir, make_runner):
+    """배치 응답을 저장/발행/ACK하고, 스키마에 맞지 않는 항목은 단건 분석으로 대체"""
+    runner = make_runner()
+    add_messages(["Tariffs on steel.", "Tariffs on cars.", INVALID_CONTENT])
+    batched, fallback = _counter("batched"), _counter("fallback")
+
+    runner._run_job(runner._create_job(runner._collect()))
+
+    assert redis_client.xpending(REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"])["pending"] == 0
+    assert redis_client.xlen(REDIS_CONFIG["output_stream"]) == 3
+    assert len(pool.rows) == 3
+    assert _counter("batched") - batched == 2
+    assert _counter("fallback") - fallback == 1
+    assert os.listdir(work_dir) == []
+
+
+def test_batch_job_resumes_without_resubmitting(redis_client, add_messages, pool, work_dir, adapter, make_runner):
+    """제출 후 종료되면 재시작 시 같은 작업을 이어서 처리"""
+    add_messages(["Tariffs on steel.", "Tariffs on cars."])
+
+    first = make_runner()
+    checkpoint = first._create_job(first._collect())
+    first.shutdown()
+    first._run_job(checkpoint)
+
+    with open(os.path.join(work_dir, CHECKPOINT_FILE)) as f:
+        assert json.load(f)["stage"] == STAGE_SUBMITTED
+    assert len(pool.rows) == 0
+
+    second = make_runner()
+    second._run_job(second._load_checkpoint())
+
+    assert len(adapter.submitted) == 1
+    assert len(pool.rows) == 2
+    assert redis_client.xpending(REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"])["pending"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,152 @@
+"""
+묶음 분석(batched prompting) 테스트
+
+Gemini는 benchmarks.fakes의 FakeGenaiClient를 사용하며, 묶음 응답의 일부 항목을 빼거나
+응답 전체를 깨뜨리거나 요청을 실패시켜 단건 분석 대체를 확인합니다.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from src.logger import setup_logging, get_logger
+from src.services.llm_service import LLMService
+from tests.conftest import wait_until
+
+setup_logging()
+logger = get_logger("test_batch_prompting")
+
+
+class _DamagingModels:
+    """
+    묶음 응답에서 지정한 위치의 항목을 빼거나(drop) 응답 전체를 깨뜨리는(broken) genai models 대역
+
+    batch_error이면 묶음 요청이 예외를 발생시키고, fail_marker가 들어간 단건 요청도 예외를 발생시킵니다.
+    """
+
+    def __init__(self, models, drop=(), broken: bool = False, batch_error: bool = False, fail_marker: str = None):
+        self._models = models
+        self._drop = set(drop)
+        self._broken = broken
+        self._batch_error = batch_error
+        self._fail_marker = fail_marker
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def get(self, model: str):
+        return self._models.get(model)
+
+    def list(self):
+        return self._models.list()
+
+    def generate_content(self, model: str, contents: str, config=None):
+        response = self._models.generate_content(model=model, contents=contents, config=config)
+        if not contents.startswith("["):
+            self.single_calls += 1
+            if self._fail_marker is not None and self._fail_marker in contents:
+                raise RuntimeError("generate_content failed")
+            return response
+
+        self.batch_calls += 1
+        if self._batch_error:
+            raise RuntimeError("batch request failed")
+        if self._broken:
+            text = "not json"
+        else:
+            text = json.dumps([item for item in json.loads(response.text) if item["index"] not in self._drop])
+        return SimpleNamespace(text=text, usage_metadata=response.usage_metadata)
+
+
+def _make_service(genai_client, **options):
+    genai_client.models = _DamagingModels(genai_client.models, **options)
+    return LLMService(client=genai_client), genai_client.models
+
+
+def _contents(count: int):
+    return [f"Post {index}: We will put tariffs on imported goods." for index in range(count)]
+
+
+def test_analyze_batch_single_request_in_input_order(genai_client):
+    """짧은 본문 여러 건은 요청 1회로 분석하고 결과는 입력 순서대로 반환"""
+    llm_service, models = _make_service(genai_client)
+    contents = _contents(4)
+
+    results = llm_service.analyze_batch(contents)
+
+    assert models.batch_calls == 1 and models.single_calls == 0
+    assert [result.semantic_summary for result in results] == contents
+
+
+def test_analyze_batch_falls_back_per_missing_item(genai_client):
+    """묶음 응답에서 빠진 항목만 단건 분석으로 대체"""
+    llm_service, models = _make_service(genai_client, drop={1, 3})
+    contents = _contents(4)
+
+    results = llm_service.analyze_batch(contents)
+
+    assert models.batch_calls == 1 and models.single_calls == 2
+    assert [result.semantic_summary for result in results] == contents
+
+
+def test_analyze_batch_falls_back_when_response_is_broken(genai_client):
+    """묶음 응답을 파싱할 수 없으면 모든 항목을 단건 분석으로 대체"""
+    llm_service, models = _make_service(genai_client, broken=True)
+    contents = _contents(3)
+
+    results = llm_service.analyze_batch(contents)
+
+    assert models.batch_calls == 1 and models.single_calls == 3
+    assert [result.semantic_summary for result in results] == contents
+
+
+def test_analyze_batch_falls_back_when_batch_call_raises(genai_client):
+    """묶음 요청이 예외를 발생시키면 단건 분석으로 대체하고, 단건 분석 실패는 해당 항목만 None"""
+    llm_service, models = _make_service(genai_client, batch_error=True, fail_marker="Post 2:")
+    contents = _contents(4)
+
+    results = llm_service.analyze_batch(contents)
+
+    assert models.batch_calls == 1 and models.single_calls == 4
+    assert results[2] is None
+    assert [result.semantic_summary for result in results if result is not None] == contents[:2] + contents[3:]
+
+
+def test_worker_batch_prompting_acks_each_message_once(redis_client, add_messages, make_worker):
+    """Worker 묶음 분석 모드: 묶음 1회 분석 후 메시지마다 한 번씩 ACK"""
+    harness = make_worker(batch_size=4, batch_prompting=True)
+    models = _DamagingModels(harness.llm_service._client.models, drop={2})
+    harness.llm_service._client.models = models
+    add_messages(4)
+
+    harness.start()
+    wait_until(lambda: len(harness.acks) == 4)
+    harness.stop()
+
+    assert models.batch_calls == 1 and models.single_calls == 1
+    assert set(harness.acks.values()) == {1}
+    assert redis_client.xpending(REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"])["pending"] == 0
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 4])
+def test_worker_batch_failure_keeps_only_failed_item_pending(redis_client, add_messages, make_worker, max_in_flight):
+    """묶음 요청이 실패해도 단건 분석에 성공한 메시지는 ACK, 실패한 메시지만 Pending으로 남음"""
+    harness = make_worker(batch_size=4, batch_prompting=True, max_in_flight=max_in_flight)
+    models = _DamagingModels(harness.llm_service._client.models, batch_error=True, fail_marker="#2.")
+    harness.llm_service._client.models = models
+    add_messages(4)
+
+    harness.start()
+    wait_until(lambda: len(harness.acks) == 3)
+    harness.stop()
+
+    assert models.batch_calls == 1 and models.single_calls == 4
+    assert set(harness.acks.values()) == {1}
+    pending = redis_client.xpending(REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"])
+    assert pending["pending"] == 1 and pending["min"] not in harness.acks
+    assert harness.in_flight == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
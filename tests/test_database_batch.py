@@ -0,0 +1,122 @@
+"""
+Database.save_analysis_data_batch 테스트
+
+benchmarks.fakes의 Oracle 대역을 사용하므로 Oracle 없이 실행됩니다.
+ID를 역순으로 할당하여 RETURNING 배열 바인딩 결과를 입력 순서대로 매핑하는지 확인합니다.
+"""
+
+import json
+
+import oracledb
+import pytest
+
+from benchmarks.fakes import FakeOracleConnection, FakeOracleCursor, FakeOraclePool
+from config.redis import REDIS_CONFIG
+from src.infrastructure.database import Database
+from src.logger import setup_logging, get_logger
+from src.models.analysis_result import AnalysisResult
+from tests.conftest import wait_until
+
+setup_logging()
+logger = get_logger("test_database_batch")
+
+
+class _ReversePool(FakeOraclePool):
+    """ID를 큰 값부터 거꾸로 할당하고 executemany/커밋 횟수를 세는 Connection Pool 대역"""
+
+    def __init__(self, fail_insert: bool = False):
+        super().__init__(commit_latency=0.0)
+        self._next_id = 1000
+        self.fail_insert = fail_insert
+        self.executemany_calls = 0
+        self.commits = 0
+
+    def acquire(self):
+        return _CountingConnection(self)
+
+    def allocate_ids(self, count: int):
+        with self._lock:
+            ids = list(range(self._next_id, self._next_id - count, -1))
+            self._next_id -= count
+            return ids
+
+
+class _CountingConnection(FakeOracleConnection):
+    def cursor(self):
+        return _CountingCursor(self)
+
+    def commit(self):
+        super().commit()
+        self._pool.commits += 1
+
+
+class _CountingCursor(FakeOracleCursor):
+    def executemany(self, statement, parameters):
+        if "INSERT INTO analysis_data" in statement:
+            self._connection._pool.executemany_calls += 1
+            if self._connection._pool.fail_insert:
+                raise oracledb.DatabaseError("ORA-12899: value too large for column")
+        super().executemany(statement, parameters)
+
+
+def _result(index: int) -> AnalysisResult:
+    return AnalysisResult(
+        semantic_summary=f"summary {index}",
+        display_summary=f"요약 {index}",
+        keywords=["관세"],
+        prompt_version="1.0.1",
+    )
+
+
+def test_batch_insert_maps_returning_ids_in_input_order():
+    """executemany 1회 + 커밋 1회, RETURNING ID는 입력 순서대로 각 행에 매핑"""
+    pool = _ReversePool()
+    database = Database(pool=pool)
+    items = [(raw_data_id, _result(raw_data_id)) for raw_data_id in (501, 502, 503, 504, 505)]
+
+    saved = database.save_analysis_data_batch(items)
+
+    assert pool.executemany_calls == 1 and pool.commits == 1
+    assert [analysis_data.raw_data_id for analysis_data in saved] == [501, 502, 503, 504, 505]
+    assert [analysis_data.id for analysis_data in saved] == [1000, 999, 998, 997, 996]
+    rows = {row["id"]: row for row in pool.rows}
+    for analysis_data in saved:
+        assert rows[analysis_data.id]["raw_data_id"] == analysis_data.raw_data_id
+        assert rows[analysis_data.id]["semantic_summary"] == analysis_data.semantic_summary
+
+    assert database.save_analysis_data_batch([]) == []
+    assert pool.executemany_calls == 1
+
+
+def test_batch_insert_failure_rolls_back():
+    """INSERT 실패 시 롤백하고 예외를 올림 (저장된 행 없음)"""
+    pool = _ReversePool(fail_insert=True)
+    database = Database(pool=pool)
+
+    with pytest.raises(oracledb.DatabaseError):
+        database.save_analysis_data_batch([(1, _result(1)), (2, _result(2))])
+
+    assert pool.rows == [] and pool.commits == 0
+
+
+def test_worker_publishes_batch_ids_per_message(redis_client, add_messages, make_worker):
+    """Worker 일괄 저장: 발행 메시지의 analysis_data ID가 같은 원본의 저장 행과 일치하고 메시지마다 한 번 ACK"""
+    pool = _ReversePool()
+    harness = make_worker(database=Database(pool=pool), batch_size=4, batch_prompting=True)
+    add_messages(4)
+
+    harness.start()
+    wait_until(lambda: len(harness.acks) == 4)
+    harness.stop()
+
+    assert pool.executemany_calls == 1
+    assert set(harness.acks.values()) == {1}
+    rows = {row["id"]: row for row in pool.rows}
+    published = [json.loads(fields["data"]) for _, fields in redis_client.xrange(REDIS_CONFIG["output_stream"])]
+    assert [message["raw_data_id"] for message in published] == [1, 2, 3, 4]
+    for message in published:
+        assert rows[message["id"]]["raw_data_id"] == message["raw_data_id"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
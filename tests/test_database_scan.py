@@ -0,0 +1,102 @@
+"""
+Database.iter_analysis_messages 테스트
+
+키셋 페이지 쿼리에 답하는 메모리 대역 Connection Pool을 사용하므로 Oracle 없이 실행됩니다.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from src.infrastructure.database import Database
+from src.logger import setup_logging, get_logger
+
+setup_logging()
+logger = get_logger("test_database_scan")
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _ScanPool:
+    """키셋 페이지 쿼리(after_id, until, batch_size)에 답하는 Connection Pool 대역"""
+
+    def __init__(self, count: int):
+        self.rows = [
+            (
+                record_id, record_id + 1000, f"summary {record_id}", f"요약 {record_id}",
+                json.dumps([f"키워드{record_id}"], ensure_ascii=False), "1.0.1", "fake-model",
+                BASE_TIME + timedelta(minutes=record_id),
+                "truth_social", f"https://example.com/{record_id}", BASE_TIME,
+            )
+            for record_id in range(1, count + 1)
+        ]
+        self.queries = []
+
+    def acquire(self):
+        return _ScanConnection(self)
+
+    def close(self):
+        pass
+
+
+class _ScanConnection:
+    def __init__(self, pool: _ScanPool):
+        self._pool = pool
+
+    def cursor(self):
+        return _ScanCursor(self._pool)
+
+    def close(self):
+        pass
+
+
+class _ScanCursor:
+    def __init__(self, pool: _ScanPool):
+        self._pool = pool
+        self._result = []
+        self.arraysize = 100
+        self.prefetchrows = 2
+
+    def execute(self, statement: str, parameters: dict):
+        self._pool.queries.append(dict(parameters, arraysize=self.arraysize))
+        until = parameters["until"]
+        matched = [
+            row for row in self._pool.rows
+            if row[0] > parameters["after_id"] and (until is None or row[7] < until)
+        ]
+        self._result = matched[:parameters["batch_size"]]
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+def test_iter_analysis_messages_pages_by_keyset():
+    """batch_size행씩 직전 페이지의 마지막 id 다음부터 조회"""
+    pool = _ScanPool(7)
+    database = Database(pool=pool)
+
+    records = list(database.iter_analysis_messages(since_id=1, batch_size=3))
+
+    assert [record.id for record in records] == [2, 3, 4, 5, 6, 7]
+    assert [query["after_id"] for query in pool.queries] == [1, 4, 7]
+    assert all(query["arraysize"] == 3 for query in pool.queries)
+    assert records[0].keywords == ["키워드2"]
+    assert records[0].to_analysis_message().original_link == "https://example.com/2"
+
+
+def test_iter_analysis_messages_until():
+    """until 이전에 생성된 행만 조회하고, 마지막 페이지가 batch_size보다 작으면 종료"""
+    pool = _ScanPool(10)
+    database = Database(pool=pool)
+
+    records = list(database.iter_analysis_messages(until=BASE_TIME + timedelta(minutes=5), batch_size=2))
+
+    assert [record.id for record in records] == [1, 2, 3, 4]
+    assert [query["after_id"] for query in pool.queries] == [0, 2, 4]
+
+
+if __name__ == "__main__":
+    test_iter_analysis_messages_pages_by_keyset()
+    test_iter_analysis_messages_until()
@@ -0,0 +1,45 @@
+"""
+JSON 응답 복구 테스트
+
+LLM 응답 문자열만 다루므로 Gemini 없이 실행됩니다.
+"""
+
+from src.logger import setup_logging, get_logger
+from src.models.llm_response import AnalysisResponse
+from src.services.json_repair import repair_json
+
+setup_logging()
+logger = get_logger("test_json_repair")
+
+VALID = '{"semantic_summary": "Tariffs on steel.", "display_summary": "철강 관세.", "keywords": ["관세", "철강"]}'
+
+
+def test_repair_fence_and_surrounding_text():
+    """코드 펜스와 앞뒤 설명 문구 제거"""
+    for text in (f"```json\n{VALID}\n```", f"Here is the analysis:\n{VALID}\nLet me know!"):
+        response = AnalysisResponse.model_validate_json(repair_json(text))
+        assert response.keywords == ["관세", "철강"]
+
+
+def test_repair_trailing_comma_and_truncation():
+    """후행 쉼표 제거, 잘린 문자열/괄호 닫기"""
+    assert repair_json('{"keywords": ["관세", "철강",],}') == '{"keywords": ["관세", "철강"]}'
+
+    truncated = '{"semantic_summary": "Tariffs on steel.", "display_summary": "철강 관세.", "keywords": ["관세", "철'
+    repaired = repair_json(truncated)
+    logger.info("잘린 응답 복구", repaired=repaired)
+    assert AnalysisResponse.model_validate_json(repaired).keywords == ["관세", "철"]
+
+
+def test_repair_keeps_braces_inside_strings():
+    """문자열 안의 괄호는 짝 추적에서 제외"""
+    assert repair_json('{"semantic_summary": "Use {braces} and [brackets]"} trailing') == (
+        '{"semantic_summary": "Use {braces} and [brackets]"}'
+    )
+    assert repair_json("no json here") is None
+
+
+if __name__ == "__main__":
+    test_repair_fence_and_surrounding_text()
+    test_repair_trailing_comma_and_truncation()
+    test_repair_keeps_braces_inside_strings()
@@ -0,0 +1,170 @@
+"""
+키워드 색인 테스트
+
+benchmarks.fakes의 Oracle 대역에 키워드 사전/연결 테이블 처리를 더한 대역을 사용하므로 Oracle 없이 실행됩니다.
+"""
+
+from benchmarks.fakes import FakeOracleConnection, FakeOracleCursor, FakeOraclePool
+from config.database import KEYWORD_INDEX_CONFIG
+from src.infrastructure.database import Database
+from src.infrastructure.keyword_index import (
+    INSERT_ANALYSIS_KEYWORD_SQL,
+    MERGE_KEYWORD_SQL,
+    KeywordIndex,
+    canonicalize_keyword,
+)
+from src.logger import setup_logging, get_logger
+from src.models.analysis_result import AnalysisResult
+
+setup_logging()
+logger = get_logger("test_keyword_index")
+
+
+class _KeywordPool(FakeOraclePool):
+    """keyword_dict MERGE/SELECT와 analysis_keyword INSERT를 흉내내는 Connection Pool 대역"""
+
+    def __init__(self):
+        super().__init__(commit_latency=0.0)
+        self.keywords = {}
+        self.links = []
+        self.merged = []
+        self.next_keyword_id = 0
+
+    def acquire(self):
+        return _KeywordConnection(self)
+
+
+class _KeywordConnection(FakeOracleConnection):
+    """키워드와 연결 모두 커밋 전까지 이 연결에만 보이고, 롤백하면 버려짐"""
+
+    def __init__(self, pool: _KeywordPool):
+        super().__init__(pool)
+        self.staged_keywords = {}
+        self.staged_links = []
+
+    def cursor(self):
+        return _KeywordCursor(self)
+
+    def commit(self):
+        super().commit()
+        self._pool.keywords.update(self.staged_keywords)
+        self._pool.links.extend(self.staged_links)
+        self.staged_keywords = {}
+        self.staged_links = []
+
+    def rollback(self):
+        super().rollback()
+        self.staged_keywords = {}
+        self.staged_links = []
+
+    def visible_keywords(self) -> dict:
+        return {**self._pool.keywords, **self.staged_keywords}
+
+
+class _KeywordCursor(FakeOracleCursor):
+    def __init__(self, connection: _KeywordConnection):
+        super().__init__(connection)
+        self._result = []
+
+    def execute(self, statement, parameters=None):
+        if "FROM keyword_dict" in statement:
+            keywords = self._connection.visible_keywords()
+            self._result = [(keywords[name], name) for name in parameters.values() if name in keywords]
+            return
+        super().execute(statement, parameters)
+
+    def executemany(self, statement, parameters, batcherrors=False):
+        pool = self._connection._pool
+        if statement == MERGE_KEYWORD_SQL:
+            for params in parameters:
+                pool.merged.append(params["name"])
+                if params["name"] not in self._connection.visible_keywords():
+                    pool.next_keyword_id += 1
+                    self._connection.staged_keywords[params["name"]] = pool.next_keyword_id
+        elif statement == INSERT_ANALYSIS_KEYWORD_SQL:
+            self._connection.staged_links.extend(
+                (params["keyword_id"], params["analysis_data_id"]) for params in parameters
+            )
+        else:
+            super().executemany(statement, parameters)
+
+    def getbatcherrors(self):
+        return []
+
+    def fetchall(self):
+        return self._result
+
+
+def _result(keywords) -> AnalysisResult:
+    return AnalysisResult(
+        semantic_summary="Tariffs on steel.",
+        display_summary="철강 관세",
+        keywords=keywords,
+        prompt_version="1.0.1",
+    )
+
+
+def test_canonicalize_keyword():
+    """표기 차이(공백, 대소문자, 따옴표, 전각 문자)와 별칭을 같은 키워드로 정규화"""
+    assert canonicalize_keyword(" 무역  전쟁 ") == canonicalize_keyword("무역전쟁") == "무역전쟁"
+    assert canonicalize_keyword("NATO") == canonicalize_keyword("'Nato'") == canonicalize_keyword("ＮＡＴＯ") == "nato"
+    assert canonicalize_keyword("#관세") == "관세"
+    assert canonicalize_keyword("White  House") == "white house"
+
+    keyword_index = KeywordIndex(aliases={"나토": "NATO"})
+    assert keyword_index.canonicalize("나토") == keyword_index.canonicalize("NATO") == "nato"
+    assert keyword_index.pairs([(1, ["관세", " 관세", "#관세", ""])]) == [(1, "관세")]
+
+
+def test_save_writes_keyword_index_in_same_transaction():
+    """저장 시 키워드 연결을 같은 커밋으로 기록하고, 이미 본 키워드는 캐시로 ID를 찾음"""
+    original = KEYWORD_INDEX_CONFIG["enabled"]
+    KEYWORD_INDEX_CONFIG["enabled"] = True
+    try:
+        pool = _KeywordPool()
+        database = Database(pool=pool, keyword_index=KeywordIndex(aliases={"나토": "NATO"}))
+
+        saved = database.save_analysis_data_batch([(1, _result(["관세", "NATO"])), (2, _result(["나토", "관세 "]))])
+        assert sorted(pool.merged) == ["nato", "관세"]
+        assert sorted(pool.links) == sorted(
+            (pool.keywords[name], analysis_data.id)
+            for analysis_data in saved
+            for name in ("관세", "nato")
+        )
+
+        database.save_analysis_data(3, _result(["Nato", "무역 전쟁"]))
+        assert sorted(pool.merged) == ["nato", "관세", "무역전쟁"]
+        assert len(pool.links) == 6
+    finally:
+        KEYWORD_INDEX_CONFIG["enabled"] = original
+
+
+def test_rolled_back_keyword_ids_are_not_cached():
+    """write() 후 롤백하면 새 키워드 ID를 캐시하지 않아 다음 기록에서 다시 MERGE함"""
+    pool = _KeywordPool()
+    keyword_index = KeywordIndex(aliases={})
+
+    connection = pool.acquire()
+    keyword_ids = keyword_index.write(connection, [(1, ["관세"])])
+    assert list(keyword_ids) == ["관세"]
+    connection.rollback()
+
+    connection = pool.acquire()
+    keyword_ids = keyword_index.write(connection, [(2, ["관세"])])
+    assert pool.merged == ["관세", "관세"]
+    connection.commit()
+    keyword_index.remember(keyword_ids)
+    assert pool.links == [(pool.keywords["관세"], 2)]
+
+    # 커밋 후 캐시한 ID는 MERGE 없이 사용
+    connection = pool.acquire()
+    keyword_index.write(connection, [(3, ["관세"])])
+    connection.commit()
+    assert pool.merged == ["관세", "관세"]
+    assert pool.links[-1] == (pool.keywords["관세"], 3)
+
+
+if __name__ == "__main__":
+    test_canonicalize_keyword()
+    test_save_writes_keyword_index_in_same_transaction()
+    test_rolled_back_keyword_ids_are_not_cached()
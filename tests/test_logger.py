@@ -0,0 +1,81 @@
+"""
+로깅 설정 테스트
+
+structlog 프로세서(필드 축약, 이벤트 샘플링)와 비동기 출력 큐를 검증하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import logging
+import queue
+
+import pytest
+import structlog
+
+from src import logger as logger_module
+from src.logger import DroppingQueueHandler, EventSampler, FieldTruncator, setup_logging, get_logger
+
+setup_logging()
+logger = get_logger("test_logger")
+
+
+@pytest.fixture
+def restore_logging():
+    """테스트가 바꾼 로깅 설정을 기본값으로 되돌림"""
+    yield
+    setup_logging()
+
+
+def test_field_truncator():
+    """지정한 문자열 필드만 max_chars자로 축약하고 남은 글자 수를 표시"""
+    truncator = FieldTruncator(["content"], max_chars=5)
+
+    event_dict = truncator(None, "info", {"content": "abcdefgh", "summary": "abcdefgh", "count": 12345678})
+    assert event_dict == {"content": "abcde...(+3자)", "summary": "abcdefgh", "count": 12345678}
+
+    assert truncator(None, "info", {"content": "abcde"}) == {"content": "abcde"}
+    assert FieldTruncator(["content"], max_chars=0)(None, "info", {"content": "abcdefgh"}) == {"content": "abcdefgh"}
+
+
+def test_event_sampler_drops_and_tags(monkeypatch):
+    """비율이 0이면 버리고, 남긴 샘플에는 sample_rate를 붙이며, 비율 1.0 이벤트는 그대로 둠"""
+    sampler = EventSampler({"noisy": 0.0, "half": 0.5}, debug_sample_rate=0.0)
+
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "noisy"})
+    # 이벤트별 비율이 없으면 DEBUG만 기본 비율 적용
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "debug", {"event": "other"})
+    assert sampler(None, "info", {"event": "other"}) == {"event": "other"}
+
+    monkeypatch.setattr(logger_module.random, "random", lambda: 0.3)
+    assert sampler(None, "info", {"event": "half"}) == {"event": "half", "sample_rate": 0.5}
+    monkeypatch.setattr(logger_module.random, "random", lambda: 0.7)
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "half"})
+
+
+def test_dropping_queue_handler_counts_overflow():
+    """큐가 가득 차면 호출 스레드를 막지 않고 버린 건수만 셈"""
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+    for index in range(5):
+        handler.handle(logging.LogRecord("test", logging.INFO, __file__, 0, f"log {index}", None, None))
+
+    assert handler.dropped == 3
+    assert [handler.queue.get_nowait().getMessage() for _ in range(2)] == ["log 0", "log 1"]
+
+
+def test_stop_listener_logs_dropped_count(capsys, restore_logging):
+    """출력 스레드를 멈출 때 버려진 로그 수를 로거로 남기고, 이후 로그는 바로 출력"""
+    setup_logging(level="INFO", log_format="console", async_output=True)
+    logger_module._queue_handler.dropped = 3
+
+    logger_module._stop_listener()
+    get_logger("test_logger").info("종료 후 로그")
+
+    output = capsys.readouterr().out
+    assert "[WARNING][logger] 큐 초과로 버려진 로그 dropped=3" in output
+    assert "종료 후 로그" in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
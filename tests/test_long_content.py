@@ -0,0 +1,51 @@
+"""
+긴 본문 처리 테스트
+
+구간 분할과 semantic_summary 축약만 확인하므로 Gemini 없이 실행됩니다.
+"""
+
+from src.logger import setup_logging, get_logger
+from src.models.analysis_result import SEMANTIC_SUMMARY_MAX_BYTES, AnalysisResult
+from src.services.llm_service import estimate_tokens, split_content
+
+setup_logging()
+logger = get_logger("test_long_content")
+
+
+def test_split_content_respects_budget_and_order():
+    """구간은 토큰 상한 이하이며 원문 순서를 유지"""
+    paragraphs = [f"Paragraph {index}. " + "Tariffs on steel will rise next month. " * 20 for index in range(10)]
+    content = "\n\n".join(paragraphs)
+
+    chunks = split_content(content, max_tokens=500)
+    logger.info("구간 분할 결과", chunks=len(chunks), tokens=[estimate_tokens(chunk) for chunk in chunks])
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "").replace(" ", "") == content.replace("\n", "").replace(" ", "")
+
+
+def test_split_content_without_boundaries():
+    """문단/문장 경계가 없는 긴 덩어리도 상한 이하로 분할"""
+    chunks = split_content("가" * 2500, max_tokens=1000)
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_semantic_summary_clamped_to_column_size():
+    """semantic_summary는 DB 컬럼 크기(바이트)를 넘지 않도록 단어 경계에서 축약"""
+    result = AnalysisResult(
+        semantic_summary="Tariffs on imported steel. " * 100,
+        display_summary="요약",
+        keywords=["관세"],
+        prompt_version="test",
+    )
+
+    assert len(result.semantic_summary.encode("utf-8")) <= SEMANTIC_SUMMARY_MAX_BYTES
+    assert result.semantic_summary.endswith("steel.")
+
+
+if __name__ == "__main__":
+    test_split_content_respects_budget_and_order()
+    test_split_content_without_boundaries()
+    test_semantic_summary_clamped_to_column_size()
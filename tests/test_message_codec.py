@@ -0,0 +1,92 @@
+"""
+출력 메시지 코덱 및 스트림 자르기 테스트
+
+Redis는 benchmarks.fakes의 FakeRedis를 사용하므로 외부 서비스 없이 실행됩니다.
+msgpack 형식 테스트는 msgpack 패키지가 설치된 경우에만 확인합니다.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from src.infrastructure import message_codec
+from src.infrastructure.message_codec import (
+    FORMAT_JSON,
+    FORMAT_MSGPACK,
+    decode_analysis_message,
+    encode_analysis_message,
+    resolve_format,
+)
+from src.infrastructure.message_publisher import MessagePublisher, stream_trim_options
+from src.logger import setup_logging, get_logger
+from src.models.analysis_message import AnalysisMessage
+
+setup_logging()
+logger = get_logger("test_message_codec")
+
+
+def _message(message_id: int = 1) -> AnalysisMessage:
+    return AnalysisMessage(
+        id=message_id,
+        raw_data_id=100 + message_id,
+        semantic_summary="Trump announced new tariffs on steel imports.",
+        display_summary="트럼프가 철강 수입품에 새 관세를 발표했습니다.",
+        keywords=["관세", "철강"],
+        prompt_version="1.0.1",
+        channel="truth_social",
+        original_link="https://example.com/1",
+        published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_json_round_trip_and_legacy_message():
+    """json/1은 기존 본문과 같고, format 필드가 없는 기존 메시지도 읽음"""
+    message = _message()
+    fields = encode_analysis_message(message, FORMAT_JSON)
+
+    assert fields["format"] == FORMAT_JSON
+    assert decode_analysis_message(fields) == message.to_dict()
+    assert decode_analysis_message({"data": json.dumps(message.to_dict())}) == message.to_dict()
+    assert decode_analysis_message({b"format": b"json/1", b"data": fields["data"].encode()}) == message.to_dict()
+
+
+def test_msgpack_round_trip():
+    """msgpack/1은 필드 이름 없이 인코딩하여 JSON보다 작고, 같은 딕셔너리로 복원"""
+    if message_codec.msgpack is None:
+        logger.info("msgpack 미설치 - 확인 생략")
+        try:
+            resolve_format("msgpack")
+        except ValueError:
+            return
+        raise AssertionError("msgpack 없이 msgpack 형식을 선택함")
+
+    message = _message()
+    fields = encode_analysis_message(message, resolve_format("msgpack"))
+
+    assert fields["format"] == FORMAT_MSGPACK
+    assert len(fields["data"]) < len(encode_analysis_message(message)["data"].encode())
+    assert decode_analysis_message(fields) == message.to_dict()
+
+
+def test_publisher_trims_output_stream(redis_client, monkeypatch):
+    """REDIS_OUTPUT_MAXLEN이 있으면 XADD마다 출력 스트림을 자름"""
+    monkeypatch.setitem(REDIS_CONFIG, "output_maxlen", 3)
+    monkeypatch.setitem(REDIS_CONFIG, "output_retention_seconds", 0)
+    publisher = MessagePublisher(client=redis_client)
+    publisher.publish(_message(1))
+    publisher.publish_many([_message(index) for index in range(2, 6)])
+
+    entries = redis_client.xrange(REDIS_CONFIG["output_stream"])
+    assert [decode_analysis_message(fields)["id"] for _, fields in entries] == [3, 4, 5]
+
+    monkeypatch.setitem(REDIS_CONFIG, "output_maxlen", 0)
+    monkeypatch.setitem(REDIS_CONFIG, "output_retention_seconds", 60)
+    min_id = int(stream_trim_options()["minid"].split("-")[0])
+    assert abs(min_id - (time.time() - 60) * 1000) < 5000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""
+메트릭 테스트
+
+메트릭 집계와 Prometheus 텍스트 출력, /metrics 엔드포인트를 검증하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import asyncio
+import urllib.request
+
+import pytest
+
+from src.logger import setup_logging, get_logger
+from src.metrics import STAGE_DURATION, Counter, Gauge, Histogram, MetricsRegistry, MetricsServer, _Metric
+from src.services.llm_service import LLMService
+
+setup_logging()
+logger = get_logger("test_metrics")
+
+
+def test_histogram_buckets():
+    """값이 해당 버킷부터 누적 집계되고 합계/개수가 기록됨"""
+    registry = MetricsRegistry()
+    histogram = Histogram(
+        "test_duration_seconds", "테스트", labelnames=("stage",), buckets=(0.1, 1.0), registry=registry
+    )
+
+    histogram.labels("llm").observe(0.05)
+    histogram.labels("llm").observe(0.5)
+    histogram.labels("llm").observe(5.0)
+    with histogram.labels("db").time():
+        pass
+
+    text = registry.render()
+    logger.info("히스토그램 출력", text=text)
+
+    assert 'test_duration_seconds_bucket{stage="llm",le="0.1"} 1' in text
+    assert 'test_duration_seconds_bucket{stage="llm",le="1.0"} 2' in text
+    assert 'test_duration_seconds_bucket{stage="llm",le="+Inf"} 3' in text
+    assert 'test_duration_seconds_sum{stage="llm"} 5.55' in text
+    assert histogram.count("db") == 1
+
+
+def test_counter_and_gauge():
+    """카운터는 누적, 게이지는 증감"""
+    registry = MetricsRegistry()
+    counter = Counter("test_processed_total", "테스트", registry=registry)
+    gauge = Gauge("test_in_flight", "테스트", registry=registry)
+
+    counter.inc()
+    counter.inc(2)
+    gauge.inc(3)
+    gauge.dec()
+
+    assert counter.value() == 3
+    assert gauge.value() == 2
+    assert "# TYPE test_processed_total counter" in registry.render()
+
+
+def test_metrics_server():
+    """/metrics 요청에 Prometheus 텍스트 형식으로 응답"""
+    registry = MetricsRegistry()
+    Counter("test_requests_total", "테스트", registry=registry).inc()
+
+    server = MetricsServer(port=0, host="127.0.0.1", registry=registry)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.close()
+
+    assert content_type.startswith("text/plain")
+    assert "test_requests_total 1.0" in body
+
+
+def test_metric_requires_samples():
+    """_new_state/_samples를 구현하지 않은 메트릭은 만들 수 없음"""
+
+    class Incomplete(_Metric):
+        type_name = "untyped"
+
+        def _new_state(self) -> list:
+            return [0.0]
+
+    with pytest.raises(TypeError):
+        Incomplete("test_incomplete", "테스트", registry=MetricsRegistry())
+
+
+def test_llm_stage_times_each_generate_content(genai_client):
+    """llm 단계는 analyze/analyze_async마다 generate_content 구간을 1회씩 기록"""
+    llm_service = LLMService(client=genai_client)
+    STAGE_DURATION.labels("llm")
+    before = STAGE_DURATION.count("llm")
+
+    llm_service.analyze("We will put tariffs on imported goods.")
+    asyncio.run(llm_service.analyze_async("We will put tariffs on imported cars."))
+
+    assert STAGE_DURATION.count("llm") == before + 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
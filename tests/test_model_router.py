@@ -0,0 +1,81 @@
+"""
+ModelRouter 테스트
+
+모델 이름과 응답 시간만 기록하므로 Gemini 없이 실행됩니다.
+"""
+
+from config.llm import LLM_CONFIG, MODEL_ROUTING_CONFIG
+from src.logger import setup_logging, get_logger
+from src.services.model_router import ModelRouter
+
+setup_logging()
+logger = get_logger("test_model_router")
+
+DEFAULT_MODEL = LLM_CONFIG["model_name"]
+
+
+def _make_router(**overrides) -> ModelRouter:
+    """짧은 본문/긴 본문/채널별 모델을 지정한 ModelRouter"""
+    config = {
+        "short_model_name": "short-model",
+        "long_model_name": "long-model",
+        "channel_models": {"truth_social": "channel-model"},
+        "fallback_model_names": [],
+        "short_max_chars": 100,
+        "long_min_chars": 1000,
+        "error_threshold": 0.5,
+        "max_latency": 30.0,
+        "cooldown": 60.0,
+        "ewma_alpha": 0.5,
+        **overrides,
+    }
+    original = {key: MODEL_ROUTING_CONFIG[key] for key in config}
+    MODEL_ROUTING_CONFIG.update(config)
+    try:
+        return ModelRouter()
+    finally:
+        MODEL_ROUTING_CONFIG.update(original)
+
+
+def test_preferred_model_by_length_and_channel():
+    """채널 지정 모델 → 긴 본문 → 짧은 본문 → 기본 모델 순으로 선택"""
+    router = _make_router()
+
+    assert router.preferred_model("짧은 본문") == "short-model"
+    assert router.preferred_model("가" * 500) == DEFAULT_MODEL
+    assert router.preferred_model("가" * 2000) == "long-model"
+    assert router.preferred_model("짧은 본문", "truth_social") == "channel-model"
+
+    route = router.route("짧은 본문")
+    assert route[0] == "short-model"
+    assert sorted(route) == sorted(router.models)
+
+
+def test_unhealthy_model_is_demoted():
+    """오류가 이어진 선호 모델은 정상 모델 뒤로 밀림"""
+    router = _make_router()
+    for _ in range(3):
+        router.record("short-model", 1.0, succeeded=False)
+    router.record("long-model", 0.5, succeeded=True)
+    router.record(DEFAULT_MODEL, 2.0, succeeded=True)
+    logger.info("모델 상태", stats=router.stats())
+
+    route = router.route("짧은 본문")
+
+    assert route[0] == "long-model"
+    assert route[-1] == "short-model"
+
+
+def test_unhealthy_model_retried_after_cooldown():
+    """cooldown이 지나면 비정상 모델도 다시 선호 모델로 사용"""
+    router = _make_router(cooldown=0.0)
+    for _ in range(3):
+        router.record("short-model", 1.0, succeeded=False)
+
+    assert router.route("짧은 본문")[0] == "short-model"
+
+
+if __name__ == "__main__":
+    test_preferred_model_by_length_and_channel()
+    test_unhealthy_model_is_demoted()
+    test_unhealthy_model_retried_after_cooldown()
@@ -0,0 +1,74 @@
+"""
+NearDuplicateFilter 테스트
+
+프로세스 내 인덱스만 사용하므로 Redis 없이 실행됩니다.
+"""
+
+from src.logger import setup_logging, get_logger
+from src.models.analysis_result import AnalysisResult
+from src.services.near_duplicate_filter import NearDuplicateFilter, hamming_distance, simhash, tokenize
+
+setup_logging()
+logger = get_logger("test_near_duplicate_filter")
+
+ORIGINAL = (
+    "China has been taking advantage of the United States for decades. "
+    "Starting next month we will impose a 25% tariff on all steel and aluminum imports!"
+)
+
+
+def _make_result(summary: str) -> AnalysisResult:
+    return AnalysisResult(
+        semantic_summary=summary,
+        display_summary="요약",
+        keywords=["관세"],
+        prompt_version="test",
+    )
+
+
+def test_tokenize_strips_repost_prefix_and_urls():
+    """리포스트 접두어와 URL은 지문 계산에서 제외"""
+    assert tokenize("RT @realDonaldTrump: Make America Great Again https://t.co/abc") == [
+        "make", "america", "great", "again",
+    ]
+
+
+def test_near_duplicate_variants_hit():
+    """리포스트, 링크 추가, 말미 수정 본문은 이전 분석 결과 재사용"""
+    near_duplicate_filter = NearDuplicateFilter(shared_enabled=False)
+    near_duplicate_filter.add(ORIGINAL, _make_result("tariffs"))
+
+    variants = [
+        f"RT @WhiteHouse: {ORIGINAL}",
+        f"{ORIGINAL} https://truthsocial.com/@realDonaldTrump/posts/1",
+        ORIGINAL.replace("imports!", "imports!!!").upper(),
+        f"{ORIGINAL} Thank you!",
+    ]
+    for variant in variants:
+        logger.info("변형 본문 거리", distance=hamming_distance(simhash(tokenize(ORIGINAL)), simhash(tokenize(variant))))
+        result = near_duplicate_filter.find(variant)
+        assert result is not None
+        assert result.semantic_summary == "tariffs"
+
+
+def test_different_content_miss():
+    """내용이 다른 본문, 숫자가 바뀐 본문, 짧은 본문은 미스"""
+    near_duplicate_filter = NearDuplicateFilter(shared_enabled=False)
+    near_duplicate_filter.add(ORIGINAL, _make_result("tariffs"))
+
+    assert near_duplicate_filter.find(
+        "The Fake News Media refuses to report the incredible job numbers released today by the Department of Labor."
+    ) is None
+    assert near_duplicate_filter.find(ORIGINAL.replace("25%", "50%")) is None
+    assert near_duplicate_filter.find("Thank you!") is None
+
+    stats = near_duplicate_filter.stats()
+    logger.info("필터 통계", **stats)
+    assert stats["misses"] == 2
+    assert stats["skipped"] == 1
+
+
+if __name__ == "__main__":
+    test_tokenize_strips_repost_prefix_and_urls()
+    test_near_duplicate_variants_hit()
+    test_different_content_miss()
@@ -0,0 +1,126 @@
+"""
+RateLimiter 테스트
+
+토큰 버킷과 AIMD 동시성 제어 로직만 검증하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import asyncio
+
+import pytest
+from google.genai import errors
+
+from config.llm import RATE_LIMIT_CONFIG
+from src.logger import setup_logging, get_logger
+from src.services.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    is_rate_limit_error,
+)
+
+setup_logging()
+logger = get_logger("test_rate_limiter")
+
+
+def test_token_bucket_reserve():
+    """한도 안에서는 대기 없음, 초과분은 충전 속도만큼 대기"""
+    bucket = TokenBucket(per_minute=60)  # 초당 1토큰
+
+    assert bucket.reserve(60) == 0.0
+
+    wait = bucket.reserve(2)
+    logger.info("초과 예약 대기 시간", wait=wait)
+    assert 1.9 < wait <= 2.0
+
+
+def test_adaptive_concurrency_aimd():
+    """성공 시 가산 증가, 쿼터 초과 시 절반 감소"""
+    limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8)
+
+    assert limiter.try_acquire()
+    limiter.release(throttled=True, succeeded=False)
+    assert limiter.limit == 2
+
+    for _ in range(20):
+        assert limiter.try_acquire()
+        limiter.release()
+    logger.info("성공 후 동시 호출 한도", limit=limiter.limit)
+    assert 2 < limiter.limit <= 8
+
+
+def test_concurrency_slots_exhausted():
+    """한도만큼 확보하면 추가 확보 불가"""
+    limiter = AdaptiveConcurrencyLimiter(initial=2, minimum=1, maximum=2)
+
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_rate_limiter_backs_off_on_429():
+    """429 응답이면 동시 호출 한도를 줄이고 예외는 그대로 전달"""
+    rate_limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=100000)
+    before = rate_limiter.concurrency_limit
+    error = errors.ClientError(429, {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED", "message": "quota"}})
+    assert is_rate_limit_error(error)
+
+    try:
+        with rate_limiter.limit(estimated_tokens=100):
+            raise error
+    except errors.ClientError:
+        pass
+
+    assert rate_limiter.concurrency_limit == max(1, before // 2)
+
+
+def test_cancelled_holder_releases_slot(monkeypatch):
+    """슬롯을 가진 호출이 취소되어도 슬롯을 반환하고, 대기 중이던 호출이 이어서 확보 (한도는 그대로)"""
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, "initial_concurrency", 1)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, "min_concurrency", 1)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, "max_concurrency", 1)
+    rate_limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=100000)
+
+    async def hold(entered: asyncio.Event):
+        async with rate_limiter.limit_async(estimated_tokens=100):
+            entered.set()
+            await asyncio.sleep(60)
+
+    async def scenario():
+        entered = asyncio.Event()
+        holder = asyncio.create_task(hold(entered))
+        await entered.wait()
+
+        waiter = asyncio.create_task(rate_limiter._concurrency.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        holder.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await holder
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    asyncio.run(scenario())
+    assert rate_limiter.concurrency_limit == 1
+    assert not rate_limiter._concurrency.try_acquire()
+
+
+def test_cancelled_waiter_leaves_queue():
+    """대기 중에 취소된 acquire_async는 슬롯을 차지하지 않음"""
+    limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=1)
+
+    async def scenario():
+        await limiter.acquire_async()
+        waiter = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+    asyncio.run(scenario())
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
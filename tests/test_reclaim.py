@@ -0,0 +1,93 @@
+"""
+Pending 메시지 회수 테스트
+
+Redis는 benchmarks.fakes의 FakeRedis를 사용하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import json
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import setup_logging, get_logger
+
+setup_logging()
+logger = get_logger("test_reclaim")
+
+
+def test_claim_stale_dead_letters_after_max_deliveries(redis_client, add_messages):
+    """전달 횟수가 최대값을 넘긴 메시지는 ACK 후 dead-letter 스트림에 기록하고 처리 대상에서 뺌"""
+    stream, group = REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"]
+    subscriber = MessageSubscriber(client=redis_client)
+    add_messages(2)
+
+    # 종료된 워커가 받아 두고 ACK하지 않은 메시지
+    (_, received), = redis_client.xreadgroup(group, "worker-dead", {stream: ">"}, count=2)
+    received_ids = [message_id for message_id, _ in received]
+
+    # 1회 전달 + 회수 2회 = 3회까지는 처리 대상
+    for _ in range(2):
+        claimed = subscriber.claim_stale(0, 10, max_deliveries=3)
+        assert [raw_data.message_id for raw_data in claimed] == received_ids
+
+    # 4번째 전달에서 dead-letter 처리
+    assert subscriber.claim_stale(0, 10, max_deliveries=3) == []
+    assert subscriber.pending_count() == 0
+
+    dead_letters = redis_client.xrange(REDIS_CONFIG["dead_letter_stream"])
+    assert [fields["source_message_id"] for _, fields in dead_letters] == received_ids
+    assert all(fields["times_delivered"] == "4" and fields["consumer_group"] == group for _, fields in dead_letters)
+    assert {fields["reason"] for _, fields in dead_letters} == {"max_deliveries"}
+    assert json.loads(dead_letters[0][1]["data"])["id"] == 1
+    assert redis_client.xlen(stream) == 2
+
+
+def test_claim_stale_skips_local_in_flight_messages(redis_client, add_messages):
+    """이 프로세스에서 처리 중인 메시지는 회수 결과에서 제외"""
+    subscriber = MessageSubscriber(client=redis_client)
+    add_messages(3)
+    received = subscriber.receive_batch(3)
+
+    in_flight = {received[0].message_id}
+    claimed = subscriber.claim_stale(0, 10, exclude_ids=in_flight)
+    assert [raw_data.message_id for raw_data in claimed] == [raw_data.message_id for raw_data in received[1:]]
+
+    # 제외한 메시지는 XCLAIM하지 않으므로 전달 횟수가 늘지 않음
+    stream, group = REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"]
+    entries = redis_client.xpending_range(stream, group, min="-", max="+", count=10)
+    assert {entry["message_id"]: entry["times_delivered"] for entry in entries} == {
+        received[0].message_id: 1,
+        received[1].message_id: 2,
+        received[2].message_id: 2,
+    }
+
+
+def test_invalid_payload_is_dead_lettered_alone(redis_client, add_messages):
+    """파싱할 수 없는 메시지만 dead-letter 처리하고, 함께 받은 메시지는 정상 처리"""
+    stream, group = REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"]
+    subscriber = MessageSubscriber(client=redis_client)
+    add_messages(1)
+    redis_client.xadd(stream, {"data": "{not json"})
+    redis_client.xadd(stream, {"data": json.dumps({"id": 3})})
+    add_messages(1)
+
+    received = subscriber.receive_batch(10)
+    assert [raw_data.id for raw_data in received] == [1, 2]
+    assert subscriber.pending_count() == 2
+
+    dead_letters = redis_client.xrange(REDIS_CONFIG["dead_letter_stream"])
+    assert [fields["data"] for _, fields in dead_letters] == ["{not json", json.dumps({"id": 3})]
+    assert all(fields["reason"] == "invalid_payload" and fields["times_delivered"] == "1" for _, fields in dead_letters)
+
+    # 회수 경로도 같은 방식으로 처리
+    redis_client.xadd(stream, {"data": "[]"})
+    redis_client.xreadgroup(group, "worker-dead", {stream: ">"}, count=10)
+    claimed = subscriber.claim_stale(0, 10, exclude_ids={raw_data.message_id for raw_data in received})
+    assert claimed == []
+    assert subscriber.pending_count() == 2
+    assert redis_client.xrange(REDIS_CONFIG["dead_letter_stream"])[-1][1]["times_delivered"] == "2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,117 @@
+"""
+RequestHedger 테스트
+
+sleep으로 응답 시간을 흉내 낸 함수만 호출하므로 Gemini 없이 실행됩니다.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+from src.logger import setup_logging, get_logger
+from src.services.request_hedger import RequestHedger
+
+setup_logging()
+logger = get_logger("test_request_hedger")
+
+
+def _make_hedger(
+    budget_ratio: float = 1.0,
+    percentile: float = 95,
+    max_workers: int = 4,
+    latency: float = 0.02,
+) -> RequestHedger:
+    """기준 시간 latency(기본 약 20ms)로 바로 헤징하는 RequestHedger"""
+    hedger = RequestHedger(percentile=percentile, budget_ratio=budget_ratio, max_workers=max_workers)
+    hedger._min_samples = 10
+    hedger._min_delay = 0.0
+    hedger._latencies.extend([latency] * 10)
+    return hedger
+
+
+def test_slow_primary_is_hedged():
+    """첫 요청이 늦으면 헤지 요청 결과를 사용"""
+    hedger = _make_hedger()
+    attempts = itertools.count()
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            attempt = next(attempts)
+        time.sleep(1.0 if attempt == 0 else 0.01)
+        return attempt
+
+    started = time.monotonic()
+    result = hedger.call(request)
+    elapsed = time.monotonic() - started
+
+    logger.info("헤징 결과", result=result, elapsed=round(elapsed, 3), **hedger.stats())
+    assert result == 1
+    assert elapsed < 0.5
+    assert hedger.stats()["hedge_wins"] == 1
+    hedger.close()
+
+
+def test_budget_limits_extra_calls():
+    """예산(budget_ratio)을 넘는 헤지 요청은 보내지 않음"""
+    # 최솟값(20ms)을 기준으로 삼아 모든 호출이 헤지 대상이 되도록 함
+    hedger = _make_hedger(budget_ratio=0.25, percentile=0)
+
+    for _ in range(8):
+        hedger.call(lambda: time.sleep(0.05))
+
+    stats = hedger.stats()
+    logger.info("예산 제한 결과", **stats)
+    assert stats["hedged"] == 2
+    assert stats["budget_exhausted"] == 6
+    hedger.close()
+
+
+def test_async_loser_is_cancelled():
+    """asyncio 호출은 늦은 요청을 취소"""
+    hedger = _make_hedger()
+    cancelled = []
+    attempts = itertools.count()
+
+    async def request():
+        attempt = next(attempts)
+        try:
+            await asyncio.sleep(1.0 if attempt == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    async def run():
+        result = await hedger.call_async(request)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == 1
+    assert cancelled == [0]
+    hedger.close()
+
+
+def test_pool_queue_time_does_not_trigger_hedge():
+    """호출자가 스레드 수보다 많아 대기열이 생겨도, 빠른 요청은 헤징하지 않음"""
+    hedger = _make_hedger(max_workers=2, latency=0.05)
+
+    callers = [threading.Thread(target=hedger.call, args=(lambda: time.sleep(0.01),)) for _ in range(16)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join(10)
+
+    stats = hedger.stats()
+    logger.info("대기열 헤징 결과", **stats)
+    assert stats["calls"] == 16
+    assert stats["hedged"] == 0
+    hedger.close()
+
+
+if __name__ == "__main__":
+    test_slow_primary_is_hedged()
+    test_budget_limits_extra_calls()
+    test_async_loser_is_cancelled()
+    test_pool_queue_time_does_not_trigger_hedge()
@@ -0,0 +1,106 @@
+"""
+워커 기동 테스트
+
+컴포넌트 병렬 생성과 Gemini 연결 확인 방식(verify_mode)을 검증합니다.
+Gemini는 benchmarks.fakes의 FakeGenaiClient를 사용하므로 외부 서비스 없이 실행됩니다.
+"""
+
+import threading
+
+import pytest
+
+from config.llm import LLM_CONFIG
+from main import initialize_components
+from src.logger import setup_logging, get_logger
+from src.services.llm_service import LLMService
+
+setup_logging()
+logger = get_logger("test_startup")
+
+
+class _Component:
+    """close() 호출 여부를 기록하는 컴포넌트 대역"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _CountingModels:
+    """models.list()/get() 호출을 기록하는 genai models 대역"""
+
+    def __init__(self, models):
+        self._models = models
+        self.calls = []
+
+    def list(self):
+        self.calls.append("list")
+        return self._models.list()
+
+    def get(self, model: str):
+        self.calls.append("get")
+        return self._models.get(model)
+
+    def generate_content(self, model: str, contents: str, config=None):
+        return self._models.generate_content(model=model, contents=contents, config=config)
+
+
+def test_initialize_components_builds_in_parallel():
+    """생성 함수를 동시에 실행하고 이름별로 결과를 돌려줌"""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def factory():
+        # 세 생성 함수가 모두 시작해야 통과 (순차 실행이면 시간 초과)
+        barrier.wait()
+        return _Component()
+
+    components = initialize_components({"redis": factory, "oracle": factory, "gemini": factory})
+
+    assert set(components) == {"redis", "oracle", "gemini"}
+    assert not any(component.closed for component in components.values())
+
+
+def test_initialize_components_closes_built_components_on_failure():
+    """하나라도 실패하면 이미 생성된 컴포넌트를 닫고 그 예외를 다시 발생시킴"""
+    built = [_Component(), _Component()]
+    components = iter(built)
+
+    def fail():
+        raise ConnectionError("oracle unavailable")
+
+    with pytest.raises(ConnectionError, match="oracle unavailable"):
+        initialize_components({
+            "redis": lambda: next(components),
+            "oracle": fail,
+            "gemini": lambda: next(components),
+            # close()가 없는 컴포넌트는 건너뜀
+            "plain": object,
+        })
+
+    assert all(component.closed for component in built)
+
+
+@pytest.mark.parametrize("verify_mode, expected_calls", [
+    ("lazy", []),
+    ("get", ["get"]),
+    ("list", ["list"]),
+])
+def test_verify_mode(genai_client, monkeypatch, verify_mode, expected_calls):
+    """lazy는 확인 요청 없음, get은 모델 1건 조회, list는 전체 모델 목록 조회"""
+    monkeypatch.setitem(LLM_CONFIG, "verify_mode", verify_mode)
+    models = _CountingModels(genai_client.models)
+    genai_client.models = models
+
+    llm_service = LLMService(client=genai_client)
+
+    assert models.calls == expected_calls
+
+    # lazy여도 첫 분석 요청은 정상 처리
+    llm_service.analyze("We will put tariffs on imported goods.")
+    assert models.calls == expected_calls
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,151 @@
+"""
+Supervisor 테스트
+
+Redis는 benchmarks.fakes의 FakeRedis를 사용하고, 워커는 잠시 대기만 하는 프로세스로 대신합니다.
+"""
+
+import signal
+import sys
+import time
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from config.worker import SUPERVISOR_CONFIG
+from src.infrastructure.message_subscriber import MessageSubscriber
+from src.logger import setup_logging, get_logger
+from src.supervisor import Supervisor
+
+setup_logging()
+logger = get_logger("test_supervisor")
+
+
+def _idle_worker(consumer_name: str, slot: int):
+    """SIGTERM을 받을 때까지 대기하는 워커"""
+    time.sleep(30)
+
+
+def _failing_worker(consumer_name: str, slot: int):
+    """시작하자마자 실패하는 워커"""
+    sys.exit(1)
+
+
+def _stuck_worker(consumer_name: str, slot: int):
+    """SIGTERM을 무시하는 워커"""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    time.sleep(30)
+
+
+@pytest.fixture
+def make_supervisor(redis_client, monkeypatch):
+    """테스트용 설정으로 Supervisor 생성 (테스트가 끝나면 워커를 모두 종료)"""
+    supervisors = []
+
+    def make(worker_target, **config) -> Supervisor:
+        options = dict(
+            min_workers=1,
+            max_workers=3,
+            messages_per_worker=2,
+            scale_in_cooldown=0.0,
+            min_uptime=60.0,
+            restart_backoff=10.0,
+            restart_backoff_max=15.0,
+            stop_timeout=5.0,
+        )
+        options.update(config)
+        for key, value in options.items():
+            monkeypatch.setitem(SUPERVISOR_CONFIG, key, value)
+        supervisor = Supervisor(MessageSubscriber(client=redis_client), worker_target)
+        supervisors.append(supervisor)
+        return supervisor
+
+    yield make
+    for supervisor in supervisors:
+        supervisor._stop_all()
+
+
+def _wait_for_retired(supervisor: Supervisor):
+    for process in list(supervisor._retiring.values()):
+        process.join(5)
+    supervisor._reap_workers()
+
+
+def test_scale_out_scale_in_and_delete_consumer(redis_client, add_messages, make_supervisor):
+    """적체에 맞춰 확장하고, 축소된 Consumer는 PEL이 빈 뒤에만 삭제"""
+    stream, group = REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"]
+    supervisor = make_supervisor(_idle_worker)
+    last_consumer = supervisor._consumer_name(3)
+
+    supervisor._start_worker()
+    add_messages(5)
+
+    # lag 5 / 워커당 2건 → 3개 (max_workers)
+    supervisor._autoscale()
+    assert sorted(supervisor._processes) == [1, 2, 3]
+
+    # 슬롯 3의 Consumer가 1건을 Pending으로 남기고, 나머지는 처리 완료
+    (_, [(pending_id, _)]), = redis_client.xreadgroup(group, last_consumer, {stream: ">"}, count=1)
+    (_, messages), = redis_client.xreadgroup(group, supervisor._consumer_name(1), {stream: ">"}, count=10)
+    redis_client.xack(stream, group, *[message_id for message_id, _ in messages])
+
+    # 적체 1건 → 1개로 가되 한 번에 1개씩, 가장 큰 슬롯부터 축소
+    supervisor._autoscale()
+    assert sorted(supervisor._processes) == [1, 2]
+    _wait_for_retired(supervisor)
+    assert supervisor._retiring == {}
+    assert last_consumer in supervisor._retired_consumers
+
+    # PEL이 남아 있으면 삭제하지 않음
+    supervisor._cleanup_consumers()
+    assert last_consumer in supervisor._message_subscriber.consumer_pending_counts()
+
+    redis_client.xack(stream, group, pending_id)
+    supervisor._cleanup_consumers()
+    assert last_consumer not in supervisor._message_subscriber.consumer_pending_counts()
+    assert supervisor._retired_consumers == set()
+
+    supervisor._stop_all()
+    assert supervisor._processes == {}
+
+
+def test_restart_backoff_after_startup_failure(make_supervisor):
+    """min_uptime 안에 종료된 워커는 바로 재시작하지 않고, 실패할 때마다 대기 시간을 늘림"""
+    supervisor = make_supervisor(_failing_worker)
+    supervisor._start_worker()
+    supervisor._processes[1].join(5)
+
+    supervisor._reap_workers()
+    assert supervisor._processes == {}
+    assert supervisor._failures[1] == 1
+    assert 9.0 < supervisor._restart_at[1] - time.monotonic() <= 10.0
+
+    # 재시작 대기 중인 슬롯도 워커 수에 포함 (새 슬롯으로 확장하지 않음)
+    supervisor._autoscale()
+    assert supervisor._processes == {}
+
+    # 대기 시간이 지나면 같은 슬롯으로 재시작, 다시 실패하면 두 배 (최대값 제한)
+    supervisor._restart_at[1] = 0.0
+    supervisor._reap_workers()
+    assert list(supervisor._processes) == [1]
+    supervisor._processes[1].join(5)
+    supervisor._reap_workers()
+    assert supervisor._failures[1] == 2
+    assert 14.0 < supervisor._restart_at[1] - time.monotonic() <= 15.0
+
+
+def test_stop_all_kills_after_timeout(make_supervisor):
+    """SIGTERM 후 stop_timeout 안에 끝나지 않는 워커는 SIGKILL"""
+    supervisor = make_supervisor(_stuck_worker, stop_timeout=0.5)
+    supervisor._start_worker()
+    process = supervisor._processes[1]
+    time.sleep(0.2)  # 워커가 SIGTERM 무시를 설정할 때까지 대기
+
+    started = time.monotonic()
+    supervisor._stop_all()
+    assert time.monotonic() - started < 5
+    assert process.exitcode == -signal.SIGKILL
+    assert supervisor._processes == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""
+Worker/AsyncWorker 테스트
+
+Redis, Oracle, Gemini는 benchmarks.fakes의 메모리 대역을 사용하므로 외부 서비스 없이 실행됩니다.
+engine fixture로 같은 시나리오를 두 엔진에서 실행합니다.
+"""
+
+import pytest
+
+from config.redis import REDIS_CONFIG
+from src.logger import setup_logging, get_logger
+from tests.conftest import wait_until
+
+setup_logging()
+logger = get_logger("test_worker")
+
+
+def test_flush_acks_keeps_ids_on_failure(engine, add_messages, make_worker):
+    """ACK 실패 시 예외를 올리지 않고 모아 둔 목록에 돌려 두었다가 다음 flush에서 ACK"""
+    harness = make_worker(engine=engine, ack_failures=1, batch_size=2)
+    add_messages(2)
+    message_ids = [raw_data.message_id for raw_data in harness.subscriber.receive_batch(2)]
+
+    harness.worker._pending_acks = list(message_ids)
+    harness.flush_acks()
+    assert harness.worker._pending_acks == message_ids
+    assert harness.acks == {}
+
+    harness.flush_acks()
+    assert harness.worker._pending_acks == []
+    assert harness.acks == {message_id: 1 for message_id in message_ids}
+
+
+def test_complete_acks_in_batches(add_messages, make_worker):
+    """batch_size만큼 모이면 ACK, 실패한 ACK는 다음 배치와 함께 처리"""
+    harness = make_worker(ack_failures=1, batch_size=2)
+    worker, subscriber = harness.worker, harness.subscriber
+    add_messages(3)
+    message_ids = [raw_data.message_id for raw_data in subscriber.receive_batch(3)]
+
+    # batch_size만큼 쌓여 ACK를 시도했지만 실패 → 목록에 남음
+    worker._complete(message_ids[0])
+    worker._complete(message_ids[1])
+    assert worker._pending_acks == message_ids[:2]
+    assert harness.acks == {}
+
+    worker._complete(message_ids[2])
+    assert worker._pending_acks == []
+    assert set(harness.acks) == set(message_ids)
+
+
+def test_single_ack_failure_is_retried(add_messages, make_worker):
+    """batch_size=1에서도 ACK 실패는 다음 _flush_acks()에서 재시도"""
+    harness = make_worker(ack_failures=1)
+    worker, subscriber = harness.worker, harness.subscriber
+    add_messages(1)
+    message_id = subscriber.receive().message_id
+
+    worker._complete(message_id)
+    assert worker._pending_acks == [message_id]
+    assert harness.acks == {}
+
+    worker._flush_acks()
+    assert worker._pending_acks == []
+    assert harness.acks == {message_id: 1}
+
+
+def test_concurrent_processing_is_bounded_and_acks_once(engine, redis_client, add_messages, make_worker):
+    """동시 처리는 max_in_flight 이하, 성공한 메시지는 한 번만 ACK, 실패한 메시지는 Pending으로 남음"""
+    harness = make_worker(engine=engine, llm_latency=0.05, fail_marker="#4.", max_in_flight=3, batch_size=2)
+    add_messages(10)
+
+    harness.start()
+    wait_until(lambda: len(harness.acks) == 9)
+    harness.stop()
+
+    assert 2 <= harness.llm.max_running <= 3
+    assert set(harness.acks.values()) == {1}
+    pending = redis_client.xpending(REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"])
+    assert pending["pending"] == 1 and pending["min"] not in harness.acks
+    assert harness.in_flight == 0
+    assert harness.worker._in_flight_ids == set()
+
+
+def test_shutdown_drains_in_flight_messages(engine, redis_client, add_messages, make_worker):
+    """종료 요청 시 새 메시지는 받지 않고, 처리 중인 메시지는 끝까지 처리하여 ACK"""
+    stream, group = REDIS_CONFIG["input_stream"], REDIS_CONFIG["consumer_group"]
+    harness = make_worker(engine=engine, llm_latency=0.3, max_in_flight=4, batch_size=4)
+    add_messages(6)
+
+    harness.start()
+    wait_until(lambda: harness.in_flight == 4)
+    harness.stop()
+
+    # 처리 중이던 4건은 ACK, 나머지 2건은 전달되지 않은 채 남음
+    assert len(harness.acks) == 4 and set(harness.acks.values()) == {1}
+    assert redis_client.xpending(stream, group)["pending"] == 0
+    (_, undelivered), = redis_client.xreadgroup(group, "checker", {stream: ">"}, count=10)
+    assert len(undelivered) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])